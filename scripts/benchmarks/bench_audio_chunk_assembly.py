@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark AudioHandler chunk assembly on dense diarization chunks.
+
+Builds a synthetic 16 kHz talk and a chunk of N short segments (alternating
+real gaps and silenced gaps) and times `AudioHandler._assemble_segments`
+against the previous fold of `assembled + slice` / `assembled + silence`,
+which re-copies the accumulated audio on every append. Both paths must
+produce identical PCM and `audio_map_start` offsets.
+
+Usage:
+    python scripts/benchmarks/bench_audio_chunk_assembly.py [--segments 500] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import List, Optional
+
+from tnh_scholar.audio_processing.diarization.audio.handler import AudioHandler
+from tnh_scholar.audio_processing.diarization.models import DiarizationChunk, DiarizedSegment
+from tnh_scholar.utils import TimeMs
+from tnh_scholar.utils import TNHAudioSegment as AudioSegment
+
+FRAME_RATE = 16_000
+SEGMENT_MS = 1_200
+GAP_MS = 300
+
+
+def build_chunk(segment_count: int) -> DiarizationChunk:
+    segments = []
+    for i in range(segment_count):
+        start = i * (SEGMENT_MS + GAP_MS)
+        segments.append(
+            DiarizedSegment(
+                speaker=f"SPEAKER_{i % 3}",
+                start=TimeMs(start),
+                end=TimeMs(start + SEGMENT_MS),
+                audio_map_start=None,
+                gap_before=i % 2 == 1,
+                spacing_time=TimeMs(GAP_MS // 2),
+            )
+        )
+    return DiarizationChunk(start_time=0, end_time=segments[-1].end, segments=segments)
+
+
+def build_audio(duration_ms: int) -> AudioSegment:
+    frames = FRAME_RATE * duration_ms // 1000
+    pcm = bytes(i % 251 for i in range(2 * frames))
+    return AudioSegment.from_raw(pcm, sample_width=2, frame_rate=FRAME_RATE, channels=1)
+
+
+def legacy_assemble(chunk: DiarizationChunk, base_audio: AudioSegment) -> tuple[AudioSegment, List[int]]:
+    """The previous assembly loop: concatenate onto the growing segment."""
+    assembled = AudioSegment.empty()
+    offsets: List[int] = []
+    offset = 0
+    prev_end: Optional[int] = None
+    audio_length = len(base_audio)
+
+    def clamped(start: int, end: int) -> AudioSegment | None:
+        start, end = max(0, min(start, audio_length)), max(0, min(end, audio_length))
+        return base_audio[start:end] if end > start else None
+
+    for segment in chunk.segments:
+        seg_start, seg_end = int(segment.start), int(segment.end)
+        if prev_end is not None:
+            if segment.gap_before:
+                if segment.spacing_time and segment.spacing_time > 0:
+                    assembled = assembled + AudioSegment.silent(duration=segment.spacing_time)
+                    offset += segment.spacing_time
+            elif seg_start > prev_end and (gap := clamped(prev_end, seg_start)) is not None:
+                assembled = assembled + gap
+                offset += len(gap)
+        offsets.append(offset)
+        if (piece := clamped(seg_start, seg_end)) is not None:
+            assembled = assembled + piece
+            offset += len(piece)
+        prev_end = seg_end
+    return assembled, offsets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=500, help="segments in the chunk")
+    parser.add_argument("--repeat", type=int, default=3, help="assemblies per measurement")
+    args = parser.parse_args()
+
+    chunk = build_chunk(args.segments)
+    base_audio = build_audio(chunk.end_time + 1_000)
+    handler = AudioHandler()
+
+    assembled = handler._assemble_segments(chunk, base_audio)
+    offsets = [segment.audio_map_start for segment in chunk.segments]
+    legacy, legacy_offsets = legacy_assemble(chunk, base_audio)
+    assert assembled.raw_data == legacy.raw_data, "assembled PCM differs"
+    assert offsets == legacy_offsets, "audio_map_start offsets differ"
+
+    planned = timeit.timeit(lambda: handler._assemble_segments(chunk, base_audio), number=args.repeat)
+    folded = timeit.timeit(lambda: legacy_assemble(chunk, base_audio), number=args.repeat)
+    print(f"segments={args.segments} output={len(assembled) / 1000:.1f}s identical PCM and offsets")
+    print(f"planned assembly: {planned / args.repeat * 1e3:9.1f} ms")
+    print(f"legacy concat:    {folded / args.repeat * 1e3:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
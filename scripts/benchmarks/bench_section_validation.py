@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Benchmark NumPy section boundary validation against the previous Python loops.
+
+Times `NumberedText.validate_section_boundaries` and `get_coverage_report`
+over long texts for AI-style sectionings (one start every LINES_PER_SECTION
+lines, shuffled, with a duplicate and two out-of-bounds starts) and for
+per-line sectionings, which validate without errors. The legacy classes below are verbatim
+copies of the previous implementations; `--check` also asserts that both
+produce identical errors and reports on randomized inputs.
+
+Usage:
+    python scripts/benchmarks/bench_section_validation.py [--repeat N] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+from typing import Any, Dict, List, Optional, Set
+
+from tnh_scholar.text_processing import NumberedText
+from tnh_scholar.text_processing.numbered_text import SectionValidationError
+from tnh_scholar.utils.math_utils import fraction_to_percent
+
+LINE_COUNTS = (1_000, 10_000, 100_000)
+LINES_PER_SECTION = 40
+
+
+class LegacyValidator:
+    """The previous per-section loop behind validate_section_boundaries."""
+
+    def __init__(self, owner: NumberedText, section_start_lines: List[int]) -> None:
+        self.owner = owner
+        self.section_start_lines = section_start_lines
+        self.errors: List[SectionValidationError] = []
+        self.prev_start: Optional[int] = None
+        self.first_valid_seen = False
+
+    def run(self) -> List[SectionValidationError]:
+        if not self.section_start_lines:
+            return self.owner._errors_for_no_sections()
+
+        sorted_with_idx = sorted(enumerate(self.section_start_lines), key=lambda t: t[1])
+
+        for section_index, (input_idx, start_line) in enumerate(sorted_with_idx):
+            if self.owner._is_out_of_bounds(start_line):
+                self.errors.append(self.owner._error_out_of_bounds(section_index, input_idx, start_line))
+                continue
+
+            if not self.first_valid_seen:
+                self._handle_first(section_index, input_idx, start_line)
+                continue
+
+            self._handle_body(section_index, input_idx, start_line)
+
+        if not self.first_valid_seen and self.owner.size > 0:
+            first_idx, first_start = sorted_with_idx[0]
+            self.errors.append(self.owner._error_first_gap(0, first_idx, first_start, no_in_bounds=True))
+
+        return self.errors
+
+    def _handle_first(self, section_index: int, input_idx: int, start_line: int) -> None:
+        self.errors.extend(self.owner._errors_for_first_section(section_index, input_idx, start_line))
+        self.first_valid_seen = True
+        self.prev_start = start_line
+
+    def _handle_body(self, section_index: int, input_idx: int, start_line: int) -> None:
+        assert self.prev_start is not None
+        if start_line <= self.prev_start:
+            self.errors.append(
+                self.owner._error_overlap(section_index, input_idx, self.prev_start, start_line)
+            )
+        elif start_line > self.prev_start + 1:
+            self.errors.append(self.owner._error_gap(section_index, input_idx, self.prev_start, start_line))
+        self.prev_start = start_line
+
+
+class LegacyCoverageReporter:
+    """The previous set-based get_coverage_report implementation."""
+
+    def __init__(self, owner: NumberedText, section_start_lines: List[int]) -> None:
+        self.owner = owner
+        self.section_start_lines = section_start_lines
+        self.covered: Set[int] = set()
+        self.overlaps: List[Dict[str, Any]] = []
+        self.gaps: List[tuple[int, int]] = []
+        self.sorted_starts = sorted(section_start_lines)
+        self.prev_valid_start: Optional[int] = None
+
+    def run(self) -> Dict[str, Any]:
+        if self.owner.size == 0:
+            return self._empty_report()
+        if not self.section_start_lines:
+            return self._no_sections_report()
+
+        self._seed_initial_gap()
+        self._walk_sections()
+        self._fill_gaps_from_coverage()
+        self._merge_gaps()
+
+        covered_lines = len(self.covered)
+        coverage_pct = fraction_to_percent(covered_lines, self.owner.size)
+
+        return {
+            "total_lines": self.owner.size,
+            "covered_lines": covered_lines,
+            "coverage_pct": coverage_pct,
+            "gaps": self.gaps,
+            "overlaps": self.overlaps,
+        }
+
+    def _empty_report(self) -> Dict[str, Any]:
+        return {"total_lines": 0, "covered_lines": 0, "coverage_pct": 0.0, "gaps": [], "overlaps": []}
+
+    def _no_sections_report(self) -> Dict[str, Any]:
+        return {
+            "total_lines": self.owner.size,
+            "covered_lines": 0,
+            "coverage_pct": 0.0,
+            "gaps": [(self.owner.start, self.owner.end)],
+            "overlaps": [],
+        }
+
+    def _seed_initial_gap(self) -> None:
+        first_valid_start = next(
+            (s for s in self.sorted_starts if self.owner.start <= s <= self.owner.end),
+            None,
+        )
+        if first_valid_start is None:
+            self.gaps.append((self.owner.start, self.owner.end))
+        elif first_valid_start > self.owner.start:
+            self.gaps.append((self.owner.start, first_valid_start - 1))
+
+    def _walk_sections(self) -> None:
+        for i, start in enumerate(self.sorted_starts):
+            if start < self.owner.start or start > self.owner.end:
+                continue
+
+            end = self._compute_end(i, start)
+            self._maybe_add_gap_between_sections(start)
+            self._update_overlaps_and_coverage(i, start, end)
+            self.prev_valid_start = start
+
+    def _compute_end(self, index: int, start: int) -> int:
+        end = self.sorted_starts[index + 1] - 1 if index < len(self.sorted_starts) - 1 else self.owner.end
+        return max(end, start)
+
+    def _maybe_add_gap_between_sections(self, start: int) -> None:
+        if self.prev_valid_start is None:
+            return
+        expected_start = self.prev_valid_start + 1
+        if start > expected_start:
+            self.gaps.append((expected_start, start - 1))
+
+    def _update_overlaps_and_coverage(self, section_index: int, start: int, end: int) -> None:
+        section_lines = set(range(start, end + 1))
+        if overlap_lines := self.covered & section_lines:
+            self.overlaps.append({"section_index": section_index, "lines": sorted(overlap_lines)})
+        self.covered.update(section_lines)
+
+    def _fill_gaps_from_coverage(self) -> None:
+        all_lines = set(range(self.owner.start, self.owner.end + 1))
+        gap_lines = sorted(all_lines - self.covered)
+        if not gap_lines:
+            return
+        gap_start = gap_lines[0]
+        gap_end = gap_lines[0]
+        for line in gap_lines[1:]:
+            if line == gap_end + 1:
+                gap_end = line
+            else:
+                self.gaps.append((gap_start, gap_end))
+                gap_start = gap_end = line
+        self.gaps.append((gap_start, gap_end))
+
+    def _merge_gaps(self) -> None:
+        if not self.gaps:
+            return
+        self.gaps = sorted(self.gaps)
+        merged: List[tuple[int, int]] = []
+        for start, end in self.gaps:
+            if not merged or start > merged[-1][1] + 1:
+                merged.append((start, end))
+            else:
+                prev_start, prev_end = merged[-1]
+                merged[-1] = (prev_start, max(prev_end, end))
+        self.gaps = merged
+
+
+def sample_starts(line_count: int, rng: random.Random) -> List[int]:
+    starts = list(range(1, line_count + 1, LINES_PER_SECTION))
+    starts += [rng.choice(starts), line_count + 5, 0]
+    rng.shuffle(starts)
+    return starts
+
+
+def check_equivalence(trials: int, rng: random.Random) -> None:
+    for _ in range(trials):
+        size = rng.randint(0, 30)
+        text = NumberedText("\n".join(f"line {i}" for i in range(size)), start=rng.randint(1, 3))
+        starts = [rng.randint(-2, size + 4) for _ in range(rng.randint(0, 12))]
+        assert text.validate_section_boundaries(starts) == LegacyValidator(text, starts).run(), starts
+        assert text.get_coverage_report(starts) == LegacyCoverageReporter(text, starts).run(), starts
+    print(f"checked {trials} random sectionings: identical output")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="calls per measurement")
+    parser.add_argument("--check", action="store_true", help="verify identical output first")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    if args.check:
+        check_equivalence(5_000, rng)
+
+    header = ("lines", "sectioning", "validate_ms", "legacy_ms", "coverage_ms", "legacy_ms")
+    print("".join(f"{name:>13}" for name in header))
+    for count in LINE_COUNTS:
+        text = NumberedText("\n".join(f"line {i}" for i in range(1, count + 1)))
+        for label, starts in (("ai", sample_starts(count, rng)), ("per-line", list(range(1, count + 1)))):
+            timings = [
+                timeit.timeit(call, number=args.repeat) / args.repeat * 1e3
+                for call in (
+                    lambda: text.validate_section_boundaries(starts),
+                    lambda: LegacyValidator(text, starts).run(),
+                    lambda: text.get_coverage_report(starts),
+                    lambda: LegacyCoverageReporter(text, starts).run(),
+                )
+            ]
+            print(f"{count:>13}{label:>13}" + "".join(f"{value:>13.3f}" for value in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for TextObject.transform across section counts.
+
+transform() shares the section list and takes a copy-on-write metadata
+snapshot, so its cost should stay flat as sections and process history grow.
+The deep-copy column reproduces the previous behavior for comparison.
+
+Usage:
+    python scripts/benchmarks/bench_text_object_transform.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from copy import deepcopy
+
+from tnh_scholar.ai_text_processing.text_object import SectionObject, SectionRange, TextObject
+from tnh_scholar.metadata.metadata import Metadata, ProcessMetadata
+from tnh_scholar.text_processing import NumberedText
+
+SECTION_COUNTS = (10, 100, 1_000, 10_000)
+HISTORY_ENTRIES = 50
+
+
+def build_text_object(section_count: int) -> TextObject:
+    num_text = NumberedText("\n".join(f"line {i}" for i in range(1, section_count + 1)))
+    sections = [
+        SectionObject(f"Section {i}", SectionRange(i, i + 1), Metadata({"summary": f"section {i}"}))
+        for i in range(1, section_count + 1)
+    ]
+    metadata = Metadata({"title": "Benchmark", "tags": ["dharma", "talk"]})
+    for step in range(HISTORY_ENTRIES):
+        metadata.add_process_info(ProcessMetadata(step=f"step-{step}", processor="bench"))
+    return TextObject(num_text, language="en", sections=sections, metadata=metadata, validate_on_init=False)
+
+
+def deep_copy_transform(obj: TextObject) -> TextObject:
+    """The pre-copy-on-write transform body: deep-copy sections and metadata."""
+    return TextObject(
+        num_text=obj.num_text,
+        language=obj.language,
+        sections=deepcopy(obj.sections),
+        metadata=deepcopy(obj.metadata),
+        validate_on_init=False,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="transforms per measurement")
+    args = parser.parse_args()
+
+    process = ProcessMetadata(step="translate", processor="bench")
+    print(f"{'sections':>10}{'transform_us':>15}{'deepcopy_us':>15}")
+    for count in SECTION_COUNTS:
+        obj = build_text_object(count)
+        shared = timeit.timeit(lambda: obj.transform(process_metadata=process), number=args.repeat)
+        copied_repeat = max(1, args.repeat // max(1, count // 100))
+        copied = timeit.timeit(lambda: deep_copy_transform(obj), number=copied_repeat)
+        print(f"{count:>10}{shared / args.repeat * 1e6:>15.1f}{copied / copied_repeat * 1e6:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Benchmark TimelineMapper segment lookup on word-level transcripts.
+
+Builds a synthetic chunk of M diarized segments laid out back to back in the
+chunk audio (as AudioHandler maps them, with small spacing gaps) and a
+word-level TimedText of N words, some falling in the gaps. Times
+`TimelineMapper._TimeUnitMapper.map_timed_text` with the bisect index against
+the previous linear scan over every segment for every word. Both must make
+identical mapping choices.
+
+`--spanning` adds one segment, first in the list, whose mapped interval covers
+the whole chunk: every word overlaps it, which is the worst case for an
+overlap search that scans back from the query.
+
+`--check` additionally compares the two on random, overlapping, and tied
+segment layouts.
+
+Usage:
+    python scripts/benchmarks/bench_timeline_mapper.py [--segments 500] [--words 5000] [--spanning] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+from typing import List, Optional, Tuple
+
+from tnh_scholar.audio_processing.diarization.models import DiarizedSegment
+from tnh_scholar.audio_processing.diarization.timeline_mapper import TimelineMapper, TimelineMapperConfig
+from tnh_scholar.audio_processing.timed_object.timed_text import Granularity, TimedText, TimedTextUnit
+from tnh_scholar.utils import TimeMs
+
+SEGMENT_MS = 3_000
+SPACING_MS = 200
+
+_Mapper = TimelineMapper._TimeUnitMapper
+
+
+class LegacyUnitMapper(_Mapper):
+    """The previous per-unit scans over every segment."""
+
+    def _find_overlapping_segments(self, unit: TimedTextUnit) -> List[DiarizedSegment]:
+        return [
+            segment
+            for segment in self.map_segments
+            if (segment.mapped_start <= unit.end_ms and segment.mapped_end >= unit.start_ms)
+        ]
+
+    def _find_proximal_segments(
+        self, unit: TimedTextUnit
+    ) -> Tuple[Optional[DiarizedSegment], Optional[DiarizedSegment]]:
+        before = None
+        before_end = float("-inf")
+        after = None
+        after_start = float("inf")
+
+        for segment in self.map_segments:
+            if segment.mapped_end <= unit.start_ms and segment.mapped_end > before_end:
+                before = segment
+                before_end = segment.mapped_end
+            if segment.mapped_start >= unit.end_ms and segment.mapped_start < after_start:
+                after = segment
+                after_start = segment.mapped_start
+
+        if not (before or after):
+            raise ValueError("Before or after segments not found.")
+
+        return before, after
+
+
+def _segment(index: int, start: int, end: int, audio_map_start: int) -> DiarizedSegment:
+    return DiarizedSegment(
+        speaker=f"SPEAKER_{index % 4}",
+        start=TimeMs(start),
+        end=TimeMs(end),
+        audio_map_start=audio_map_start,
+        gap_before=False,
+        spacing_time=TimeMs(0),
+    )
+
+
+def build_segments(count: int) -> List[DiarizedSegment]:
+    """Back-to-back mapped segments separated by spacing gaps."""
+    segments = []
+    for i in range(count):
+        original_start = i * (SEGMENT_MS + 1_000)
+        segments.append(
+            _segment(i, original_start, original_start + SEGMENT_MS, i * (SEGMENT_MS + SPACING_MS))
+        )
+    return segments
+
+
+def with_spanning_segment(segments: List[DiarizedSegment]) -> List[DiarizedSegment]:
+    """Prepend a segment mapped over the whole chunk (e.g. one long speaker turn)."""
+    chunk_ms = segments[-1].mapped_end
+    return [_segment(len(segments), 0, chunk_ms, 0), *segments]
+
+
+def build_words(count: int, chunk_ms: int, rng: random.Random) -> TimedText:
+    words = []
+    for i in range(count):
+        start = rng.randrange(chunk_ms)
+        words.append(
+            TimedTextUnit(
+                text=f"w{i}",
+                start_ms=start,
+                end_ms=start + rng.randint(1, 600),
+                granularity=Granularity.WORD,
+            )
+        )
+    return TimedText(words=words)
+
+
+def random_layout(rng: random.Random) -> Tuple[List[DiarizedSegment], TimedText]:
+    """Small layouts with overlaps, nesting, duplicates, and touching edges."""
+    segments = []
+    for i in range(rng.randint(1, 12)):
+        start = rng.randrange(0, 60) * 50
+        length = rng.choice([1, 50, 100, 500, 2_000])
+        segments.append(_segment(i, start, start + length, rng.choice([start, rng.randrange(0, 60) * 50])))
+    return segments, build_words(rng.randint(1, 40), 3_500, rng)
+
+
+def mapped(mapper: _Mapper, timed_text: TimedText) -> List[Tuple[int, int, Optional[str]]]:
+    return [(unit.start_ms, unit.end_ms, unit.speaker) for unit in mapper.map_timed_text(timed_text).words]
+
+
+def check_random_layouts(cases: int) -> None:
+    rng = random.Random(7)
+    config = TimelineMapperConfig()
+    for case in range(cases):
+        segments, timed_text = random_layout(rng)
+        expected = mapped(LegacyUnitMapper(segments, config), timed_text)
+        assert mapped(_Mapper(segments, config), timed_text) == expected, f"case {case} differs"
+    print(f"random layouts: {cases} cases identical")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=500, help="diarized segments in the chunk")
+    parser.add_argument("--words", type=int, default=5_000, help="word units to remap")
+    parser.add_argument("--repeat", type=int, default=1, help="remaps per measurement")
+    parser.add_argument("--spanning", action="store_true", help="add one segment spanning the chunk")
+    parser.add_argument("--check", action="store_true", help="also compare on random layouts")
+    args = parser.parse_args()
+
+    if args.check:
+        check_random_layouts(2_000)
+
+    segments = build_segments(args.segments)
+    if args.spanning:
+        segments = with_spanning_segment(segments)
+    timed_text = build_words(args.words, segments[-1].mapped_end + SPACING_MS, random.Random(0))
+    config = TimelineMapperConfig()
+
+    indexed_mapper = _Mapper(segments, config)
+    legacy_mapper = LegacyUnitMapper(segments, config)
+    assert mapped(indexed_mapper, timed_text) == mapped(legacy_mapper, timed_text), "mappings differ"
+
+    indexed = timeit.timeit(lambda: indexed_mapper.map_timed_text(timed_text), number=args.repeat)
+    scanned = timeit.timeit(lambda: legacy_mapper.map_timed_text(timed_text), number=args.repeat)
+    layout = " with spanning segment" if args.spanning else ""
+    print(f"segments={args.segments}{layout} words={args.words} identical mappings")
+    print(f"bisect index: {indexed / args.repeat * 1e3:10.1f} ms")
+    print(f"linear scan:  {scanned / args.repeat * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
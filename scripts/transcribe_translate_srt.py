@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from tnh_scholar.audio_processing.multilingual_models import (
+    DEFAULT_MAX_INFLIGHT_AUDIO_BYTES,
     MultilingualTranscriptionRequest,
     TranscriptionProvider,
 )
@@ -14,12 +15,16 @@ from tnh_scholar.audio_processing.multilingual_service import (
 )
 from tnh_scholar.logging_config import setup_logging
 
+BYTES_PER_MB = 1024 * 1024
+
 
 @dataclass(frozen=True)
 class SubtitleWorkflowDefaults:
     provider: TranscriptionProvider = TranscriptionProvider.WHISPER
     target_language: str = "en"
     chars_per_caption: int = 42
+    block_workers: int = 1
+    max_inflight_audio_mb: int = DEFAULT_MAX_INFLIGHT_AUDIO_BYTES // BYTES_PER_MB
 
 
 @dataclass(frozen=True)
@@ -36,6 +41,8 @@ class SubtitleWorkflowConfig:
     metadata_file: Path | None
     chars_per_caption: int
     use_speaker_blocks: bool
+    max_block_workers: int
+    max_inflight_audio_bytes: int
     debug: bool
 
 
@@ -72,6 +79,8 @@ class SubtitleWorkflow:
             chars_per_caption=self._config.chars_per_caption,
             skip_translation=self._config.translated_srt_output is None,
             use_speaker_blocks=self._config.use_speaker_blocks,
+            max_block_workers=self._config.max_block_workers,
+            max_inflight_audio_bytes=self._config.max_inflight_audio_bytes,
         )
 
     def _write_text(self, output_path: Path, content: str) -> None:
@@ -155,6 +164,18 @@ class SubtitleWorkflowCli:
             action="store_true",
             help="Run the opt-in speaker-block language-routing path.",
         )
+        parser.add_argument(
+            "--block-workers",
+            type=int,
+            default=self._defaults.block_workers,
+            help="Speaker blocks processed concurrently with --use-speaker-blocks.",
+        )
+        parser.add_argument(
+            "--max-inflight-audio-mb",
+            type=int,
+            default=self._defaults.max_inflight_audio_mb,
+            help="Cap on decoded block audio held in memory at once, in MiB.",
+        )
         parser.add_argument(
             "--source-srt-output",
             type=Path,
@@ -194,6 +215,8 @@ class SubtitleWorkflowCli:
             metadata_file=args.metadata_file.resolve() if args.metadata_file else None,
             chars_per_caption=args.chars_per_caption,
             use_speaker_blocks=args.use_speaker_blocks,
+            max_block_workers=args.block_workers,
+            max_inflight_audio_bytes=args.max_inflight_audio_mb * BYTES_PER_MB,
             debug=args.debug,
         )
 
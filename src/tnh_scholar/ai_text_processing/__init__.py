@@ -16,8 +16,15 @@ from typing import TYPE_CHECKING, Any
 __all__ = [
     "OpenAIProcessor",
     "SectionParser",
+    "SectionPlanner",
     "SectionProcessor",
+    "SectionSink",
+    "TextSectionSink",
+    "XMLDocumentSink",
+    "JSONLSectionSink",
+    "write_sections",
     "find_sections",
+    "plan_sections",
     "process_text",
     "process_text_by_paragraphs",
     "process_text_by_sections",
@@ -45,6 +52,15 @@ _LAZY_ATTRS = {
     "process_text_by_paragraphs": "tnh_scholar.ai_text_processing.ai_text_processing",
     "process_text_by_sections": "tnh_scholar.ai_text_processing.ai_text_processing",
     "get_pattern": "tnh_scholar.ai_text_processing.ai_text_processing",
+    # section_planner.py
+    "SectionPlanner": "tnh_scholar.ai_text_processing.section_planner",
+    "plan_sections": "tnh_scholar.ai_text_processing.section_planner",
+    # section_sink.py
+    "SectionSink": "tnh_scholar.ai_text_processing.section_sink",
+    "TextSectionSink": "tnh_scholar.ai_text_processing.section_sink",
+    "XMLDocumentSink": "tnh_scholar.ai_text_processing.section_sink",
+    "JSONLSectionSink": "tnh_scholar.ai_text_processing.section_sink",
+    "write_sections": "tnh_scholar.ai_text_processing.section_sink",
     # lightweight helpers
     "translate_text_by_lines": "tnh_scholar.ai_text_processing.line_translator",
     "openai_process_text": "tnh_scholar.ai_text_processing.openai_process_interface",
@@ -96,6 +112,14 @@ if TYPE_CHECKING:  # pragma: no cover
         Prompt,
         PromptCatalog,
     )
+    from .section_planner import SectionPlanner, plan_sections  # noqa: F401
+    from .section_sink import (  # noqa: F401
+        JSONLSectionSink,
+        SectionSink,
+        TextSectionSink,
+        XMLDocumentSink,
+        write_sections,
+    )
     from .text_object import (  # noqa: F401
         AIResponse,
         LogicalSection,
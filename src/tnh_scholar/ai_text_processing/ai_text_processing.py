@@ -3,22 +3,25 @@
 # external package imports
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generator, Optional, Tuple, Type, cast
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterable, Optional, Tuple, Type, cast
 
 from pydantic import BaseModel
 
-from tnh_scholar.gen_ai_service.utils.token_utils import token_count
 from tnh_scholar.logging_config import get_child_logger
 from tnh_scholar.metadata.metadata import ProcessMetadata
 from tnh_scholar.text_processing import (
     NumberedText,
 )
+from tnh_scholar.utils.concurrency_utils import ordered_map
 from tnh_scholar.utils.lang import (
     get_language_from_code,
 )
 
+from .checkpoint import ProcessingCheckpoint
 from .openai_process_interface import openai_process_text
 from .prompts import LocalPromptManager, Prompt
+from .section_planner import SectionPlanner
 from .text_object import AIResponse, TextObject
 
 # internal package imports
@@ -50,6 +53,7 @@ class ProcessedSection:
     original_str: str
     processed_str: str
     metadata: Dict = field(default_factory=dict)
+    error: Optional[str] = None
 
 
 class TextProcessor(ABC):
@@ -124,8 +128,8 @@ def _calculate_segment_size(num_text: NumberedText, target_segment_tokens: int)
 
     Example:
     """
-    text = num_text.content
-    tokens = token_count(text)
+    # Per-line counts are cached on num_text, so later range queries are O(1)
+    tokens = num_text.token_count_lines(num_text.start, num_text.end) if num_text.size else 0
     # Calculate average tokens per line
     avg_tokens_per_line = tokens / num_text.size
     logger.debug(f"Average tokens per line: {avg_tokens_per_line}")
@@ -160,6 +164,7 @@ class SectionParser:
         section_count_target: Optional[int] = None,
         segment_size_target: Optional[int] = None,
         template_dict: Optional[Dict[str, str]] = None,
+        planner: Optional[SectionPlanner] = None,
     ) -> TextObject:
         """
         Generate section breakdown of input text. The text must be split up by newlines.
@@ -171,6 +176,9 @@ class SectionParser:
                 (if section_count_target is specified,
                 this value will be set to generate correct segments)
             template_dict: Optional additional template variables
+            planner: Optional local pre-pass; when given, the model receives the
+                planner's block outline (one numbered preview line per block)
+                instead of the full numbered text
 
         Returns:
             TextObject containing section breakdown
@@ -216,10 +224,17 @@ class SectionParser:
 
         logger.info(f"Finding sections for {source_language} text (target sections: {section_count_target})")
 
+        if planner is not None:
+            scan_input = planner.outline(num_text)
+            logger.info(
+                f"Sending planner outline ({len(scan_input)} chars) instead of full text "
+                f"({len(num_text.content)} chars)"
+            )
+        else:
+            scan_input = num_text.numbered_content
+
         # Process text with structured output
-        result = self.section_scanner.process_text(
-            num_text.numbered_content, instructions, response_format=AIResponse
-        )
+        result = self.section_scanner.process_text(scan_input, instructions, response_format=AIResponse)
 
         ai_response = cast(AIResponse, result)
         text_result = TextObject.from_response(ai_response, current_metadata, num_text)
@@ -253,6 +268,7 @@ def find_sections(
     section_count: Optional[int] = None,
     review_count: int = DEFAULT_REVIEW_COUNT,
     template_dict: Optional[Dict[str, str]] = None,
+    planner: Optional[SectionPlanner] = None,
 ) -> TextObject:
     """
     High-level function for generating text sections.
@@ -266,6 +282,7 @@ def find_sections(
         section_count: Target number of sections
         review_count: Number of review passes
         template_dict: Optional additional template variables
+        planner: Optional SectionPlanner used to shrink the text sent to the model
 
     Returns:
         TextObject containing section breakdown
@@ -296,11 +313,23 @@ def find_sections(
         text,
         section_count_target=section_count,
         template_dict=template_dict,
+        planner=planner,
     )
     result_text.transform(process_metadata=process_metadata)
     return result_text
 
 
+@dataclass(frozen=True)
+class _SectionJob:
+    """One pending processor call, prepared in document order."""
+
+    unit: str
+    title: str
+    original_str: str
+    instructions: str
+    metadata: Dict = field(default_factory=dict)
+
+
 class SectionProcessor:
     """Handles section-based XML text processing with configurable output handling."""
 
@@ -310,6 +339,9 @@ class SectionProcessor:
         pattern: Prompt,
         template_dict: Dict,
         wrap_in_document: bool = True,
+        max_workers: int = 1,
+        checkpoint: Optional[ProcessingCheckpoint] = None,
+        capture_errors: bool = False,
     ):
         """
         Initialize the XML section processor.
@@ -319,11 +351,25 @@ class SectionProcessor:
             pattern: Pattern object containing processing instructions
             template_dict: Dictionary for template substitution
             wrap_in_document: Whether to wrap output in <document> tags
+            max_workers: Sections processed concurrently (default 1). Results
+                always arrive in document order. Workers share the process-wide
+                GenAIService rate limiter (`RATE_LIMIT_TIER`), so raising this
+                does not exceed the configured RPM/TPM.
+            checkpoint: Optional store that persists each completed section and
+                replays it on a resumed run instead of calling the processor.
+            capture_errors: By default the first failed section raises, whatever
+                `max_workers` is. Set to True to accept partial results: a failed
+                section is yielded with `error` set and an empty `processed_str`.
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
         self.processor = processor
         self.pattern = pattern
         self.template_dict = template_dict
         self.wrap_in_document = wrap_in_document
+        self.max_workers = max_workers
+        self.checkpoint = checkpoint
+        self.capture_errors = capture_errors
 
     def process_sections(
         self,
@@ -346,33 +392,34 @@ class SectionProcessor:
         # transcript is now stored in the TextObject
         sections = text_object.sections
 
-        logger.info(f"Processing {len(sections)} sections with pattern: {self.pattern.name}")
-
-        for section_entry in text_object:
-            logger.info(f"Processing section {section_entry.number} '{section_entry.title}':")
+        logger.info(
+            f"Processing {len(sections)} sections with pattern: {self.pattern.name} "
+            f"(max_workers={self.max_workers})"
+        )
+        yield from self._run_jobs(self._section_jobs(text_object))
 
-            # Get text segment for section
-            text_segment = section_entry.content
+    def _section_jobs(self, text_object: TextObject) -> Generator[_SectionJob, None, None]:
+        metadata_yaml = text_object.metadata.to_yaml()
+        source_language = get_language_from_code(text_object.language)
 
+        for section_entry in text_object:
             # Prepare template variables
             template_values = {
-                "metadata": text_object.metadata.to_yaml(),
+                "metadata": metadata_yaml,
                 "section_title": section_entry.title,
-                "source_language": get_language_from_code(text_object.language),
+                "source_language": source_language,
                 "review_count": DEFAULT_REVIEW_COUNT,
             }
 
             if self.template_dict:
                 template_values |= self.template_dict
 
-            # Get and apply processing instructions
-            instructions = self.pattern.apply_template(template_values)
-            processed_str = self.processor.process_text(text_segment, instructions)
-
-            yield ProcessedSection(
+            yield _SectionJob(
+                unit=f"section-{section_entry.number}",
                 title=section_entry.title,
-                original_str=text_segment,
-                processed_str=processed_str,
+                original_str=section_entry.content,
+                instructions=self.pattern.apply_template(template_values),
+                metadata={"section_number": section_entry.number},
             )
 
     def process_paragraphs(
@@ -393,28 +440,66 @@ class SectionProcessor:
                 - processed_str: Processed paragraph text
                 - metadata: Optional metadata dict
         """
-        num_text = text.num_text
+        logger.info(
+            f"Processing lines as paragraphs with pattern: {self.pattern.name} "
+            f"(max_workers={self.max_workers})"
+        )
+        yield from self._run_jobs(self._paragraph_jobs(text))
 
-        logger.info(f"Processing lines as paragraphs with pattern: {self.pattern.name}")
+    def _paragraph_jobs(self, text: TextObject) -> Generator[_SectionJob, None, None]:
+        instructions = self.pattern.apply_template(self.template_dict)
+        logger.debug(f"Process instructions (paragraphs):\n{instructions}")
 
-        for i, line in num_text:
+        for i, line in text.num_text:
             # If line is empty or whitespace, continue
             if not line.strip():
                 continue
 
-            instructions = self.pattern.apply_template(self.template_dict)
-
-            if i <= 1:
-                logger.debug(f"Process instructions (first paragraph):\n{instructions}")
-
-            processed_str = self.processor.process_text(line, instructions)
-            yield ProcessedSection(
+            yield _SectionJob(
+                unit=f"paragraph-{i}",
                 title=f"Paragraph {i}",
                 original_str=line,
-                processed_str=processed_str,
+                instructions=instructions,
                 metadata={"paragraph_number": i},
             )
 
+    def _run_jobs(self, jobs: Iterable[_SectionJob]) -> Generator[ProcessedSection, None, None]:
+        """Dispatch jobs with up to `max_workers` in flight, yielding in document order."""
+        results = ordered_map(
+            self._process_job,
+            jobs,
+            max_workers=self.max_workers,
+            capture_errors=self.capture_errors,
+            thread_name_prefix="section-processor",
+        )
+        for result in results:
+            job = result.item
+            if result.error is not None:
+                logger.error(f"Processing failed for '{job.title}': {result.error}")
+            yield ProcessedSection(
+                title=job.title,
+                original_str=job.original_str,
+                processed_str=cast(str, result.value) if result.ok else "",
+                metadata=dict(job.metadata),
+                error=None if result.ok else f"{type(result.error).__name__}: {result.error}",
+            )
+
+    def _process_job(self, job: _SectionJob) -> ProcessorResult:
+        if self.checkpoint is None:
+            logger.info(f"Processing '{job.title}'")
+            return self.processor.process_text(job.original_str, job.instructions)
+
+        fingerprint = ProcessingCheckpoint.fingerprint(job.original_str, job.instructions)
+        if (stored := self.checkpoint.get(job.unit, fingerprint)) is not None:
+            logger.info(f"Reusing checkpointed result for '{job.title}'")
+            return stored["processed_str"]
+
+        logger.info(f"Processing '{job.title}'")
+        processed = self.processor.process_text(job.original_str, job.instructions)
+        if isinstance(processed, str):
+            self.checkpoint.put(job.unit, {"processed_str": processed}, fingerprint)
+        return processed
+
 
 class GeneralProcessor:
     def __init__(
@@ -503,11 +588,38 @@ def process_text(
     return text
 
 
+def _open_checkpoint(
+    text: TextObject,
+    step: str,
+    pattern: Prompt,
+    model: Optional[str],
+    template_dict: Optional[Dict],
+    checkpoint_dir: Optional[Path],
+    resume: bool,
+) -> Optional[ProcessingCheckpoint]:
+    """Open a run checkpoint when `checkpoint_dir` or `resume` asks for one."""
+    if checkpoint_dir is None and not resume:
+        return None
+    return ProcessingCheckpoint.for_run(
+        text,
+        step=step,
+        prompt_name=pattern.name,
+        model=model,
+        root=checkpoint_dir,
+        resume=resume,
+        template_dict=template_dict,
+    )
+
+
 def process_text_by_sections(
     text_object: TextObject,
     template_dict: Dict,
     pattern: Prompt,
     model: Optional[str] = None,
+    max_workers: int = 1,
+    checkpoint_dir: Optional[Path] = None,
+    resume: bool = False,
+    capture_errors: bool = False,
 ) -> Generator[ProcessedSection, None, None]:
     """
     High-level function for processing text sections with configurable output handling.
@@ -517,13 +629,37 @@ def process_text_by_sections(
         pattern: Pattern object containing processing instructions
         template_dict: Dictionary for template substitution
         model: Optional model identifier for processor
+        max_workers: Sections processed concurrently (see SectionProcessor)
+        checkpoint_dir: Persist each completed section under this directory
+        resume: Skip sections already checkpointed by an earlier run of the same
+            text, prompt, and model (uses the default checkpoint directory when
+            `checkpoint_dir` is not given)
+        capture_errors: Yield failed sections with `error` set instead of
+            raising (see SectionProcessor)
 
     Returns:
-        Generator for ProcessedSections
+        Generator for ProcessedSections; pass it to `section_sink.write_sections`
+        to stream results to disk instead of collecting them
     """
     processor = OpenAIProcessor(model)
 
-    section_processor = SectionProcessor(processor, pattern, template_dict)
+    checkpoint = _open_checkpoint(
+        text_object,
+        "process_text_by_sections",
+        pattern,
+        processor.model,
+        template_dict,
+        checkpoint_dir,
+        resume,
+    )
+    section_processor = SectionProcessor(
+        processor,
+        pattern,
+        template_dict,
+        max_workers=max_workers,
+        checkpoint=checkpoint,
+        capture_errors=capture_errors,
+    )
 
     process_metadata = ProcessMetadata(
         step="process_text_by_sections",
@@ -544,6 +680,10 @@ def process_text_by_paragraphs(
     template_dict: Dict[str, str],
     pattern: Optional[Prompt] = None,
     model: Optional[str] = None,
+    max_workers: int = 1,
+    checkpoint_dir: Optional[Path] = None,
+    resume: bool = False,
+    capture_errors: bool = False,
 ) -> Generator[ProcessedSection, None, None]:
     """
     High-level function for processing text paragraphs, yielding ProcessedSection objects.
@@ -555,16 +695,39 @@ def process_text_by_paragraphs(
         template_dict: Dictionary for template substitution
         pattern: Pattern object containing processing instructions
         model: Optional model identifier for processor
+        max_workers: Paragraphs processed concurrently (see SectionProcessor)
+        checkpoint_dir: Persist each completed paragraph under this directory
+        resume: Skip paragraphs already checkpointed by an earlier run (see
+            process_text_by_sections)
+        capture_errors: Yield failed paragraphs with `error` set instead of
+            raising (see SectionProcessor)
 
     Returns:
-        Generator for ProcessedSection objects (one per paragraph)
+        Generator for ProcessedSection objects (one per paragraph); see
+        `section_sink.write_sections` for bounded-memory output
     """
     processor = OpenAIProcessor(model)
 
     if not pattern:
         pattern = get_pattern(DEFAULT_PARAGRAPH_FORMAT_PATTERN)
 
-    section_processor = SectionProcessor(processor, pattern, template_dict)
+    checkpoint = _open_checkpoint(
+        text,
+        "process_text_by_paragraphs",
+        pattern,
+        processor.model,
+        template_dict,
+        checkpoint_dir,
+        resume,
+    )
+    section_processor = SectionProcessor(
+        processor,
+        pattern,
+        template_dict,
+        max_workers=max_workers,
+        checkpoint=checkpoint,
+        capture_errors=capture_errors,
+    )
 
     process_metadata = ProcessMetadata(
         step="process_text_by_paragraphs",
@@ -0,0 +1,172 @@
+"""Resumable checkpoints for long AI text processing runs.
+
+A `ProcessingCheckpoint` is an append-only JSONL file holding the result of
+each completed unit of work (a processed section, paragraph, or translated
+line segment). The file name is derived from the input `TextObject` content
+hash, the prompt name, the model, and any other output-affecting parameters,
+so a restarted run over the same transcript finds the units it already paid
+for and skips them.
+
+Each record also carries a fingerprint of the unit's input; a stored result
+whose fingerprint no longer matches (e.g. section boundaries moved) is
+treated as missing. A truncated final line left by a crash is cut off when
+the checkpoint is reopened, so later appends start on a fresh line.
+
+Connected modules:
+  - ai_text_processing.SectionProcessor
+  - line_translator.LineTranslator
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from platformdirs import user_cache_dir
+
+from tnh_scholar.logging_config import get_child_logger
+
+from .text_object import TextObject
+
+logger = get_child_logger(__name__)
+
+__all__ = [
+    "ProcessingCheckpoint",
+    "checkpoint_key",
+    "default_checkpoint_dir",
+]
+
+
+def default_checkpoint_dir() -> Path:
+    """Default checkpoint location under the per-user cache directory."""
+    return Path(user_cache_dir("tnh-scholar")) / "checkpoints"
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def checkpoint_key(
+    text: TextObject,
+    *,
+    step: str,
+    prompt_name: str,
+    model: Optional[str],
+    **params: Any,
+) -> str:
+    """Build a deterministic run key from the input text, prompt, model, and parameters."""
+    material = {
+        "content": _digest(text.content),
+        "step": step,
+        "prompt": prompt_name,
+        "model": model,
+        "params": params,
+    }
+    canonical = json.dumps(material, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return _digest(canonical)[:32]
+
+
+class ProcessingCheckpoint:
+    """Thread-safe, append-only store of completed units for one processing run."""
+
+    def __init__(self, path: Path, *, resume: bool = True) -> None:
+        """
+        Open a checkpoint file.
+
+        Args:
+            path: JSONL file holding completed units.
+            resume: Reuse units already in the file. When False, any existing
+                file is discarded and the run starts from scratch.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._units: Dict[str, Dict[str, Any]] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume:
+            self._load()
+        else:
+            self.path.unlink(missing_ok=True)
+
+    @classmethod
+    def for_run(
+        cls,
+        text: TextObject,
+        *,
+        step: str,
+        prompt_name: str,
+        model: Optional[str],
+        root: Optional[Path] = None,
+        resume: bool = True,
+        **params: Any,
+    ) -> ProcessingCheckpoint:
+        """Open the checkpoint for a run, named by `checkpoint_key`."""
+        key = checkpoint_key(text, step=step, prompt_name=prompt_name, model=model, **params)
+        path = (root or default_checkpoint_dir()) / f"{step}-{key}.jsonl"
+        checkpoint = cls(path, resume=resume)
+        if checkpoint._units:
+            logger.info(f"Resuming {step} from {path} ({len(checkpoint)} completed units)")
+        return checkpoint
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        complete_bytes = 0
+        truncated = False
+        with self.path.open("rb") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.endswith(b"\n"):
+                    truncated = True
+                    break
+                complete_bytes += len(line)
+                try:
+                    record = json.loads(line)
+                    self._units[record["unit"]] = record
+                except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                    logger.warning(f"Skipping unreadable checkpoint line {line_number} in {self.path}")
+        if truncated:
+            # A crash mid-write left a partial line; drop it so the next append
+            # is not glued onto it (which would lose that unit on every resume).
+            logger.warning(f"Discarding truncated final checkpoint line in {self.path}")
+            with self.path.open("r+b") as handle:
+                handle.truncate(complete_bytes)
+
+    @staticmethod
+    def fingerprint(*parts: str) -> str:
+        """Fingerprint a unit's inputs so stale results are not replayed."""
+        return _digest("\x00".join(parts))
+
+    def get(self, unit: str, fingerprint: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the stored result for `unit`, or None if missing or stale."""
+        with self._lock:
+            record = self._units.get(unit)
+        if record is None:
+            return None
+        if fingerprint is not None and record.get("fingerprint") != fingerprint:
+            logger.debug(f"Checkpoint entry for {unit} is stale; reprocessing")
+            return None
+        return record["result"]
+
+    def put(self, unit: str, result: Dict[str, Any], fingerprint: Optional[str] = None) -> None:
+        """Persist a completed unit; the line is flushed before returning."""
+        record = {"unit": unit, "fingerprint": fingerprint, "result": result}
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+            self._units[unit] = record
+
+    def clear(self) -> None:
+        """Forget all completed units and delete the checkpoint file."""
+        with self._lock:
+            self._units.clear()
+            self.path.unlink(missing_ok=True)
+
+    def __contains__(self, unit: object) -> bool:
+        return unit in self._units
+
+    def __len__(self) -> int:
+        return len(self._units)
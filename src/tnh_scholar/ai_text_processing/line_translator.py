@@ -1,11 +1,14 @@
 # external package imports
-from typing import Dict, Optional
+from functools import partial
+from pathlib import Path
+from typing import Dict, Optional, cast
 
 from tnh_scholar.logging_config import get_child_logger
 from tnh_scholar.metadata.metadata import Metadata, ProcessMetadata
 from tnh_scholar.text_processing import (
     NumberedText,
 )
+from tnh_scholar.utils.concurrency_utils import ordered_map
 from tnh_scholar.utils.lang import (
     get_language_from_code,
 )
@@ -17,6 +20,7 @@ from .ai_text_processing import (
     _calculate_segment_size,
     get_pattern,
 )
+from .checkpoint import ProcessingCheckpoint
 from .prompts import Prompt
 from .text_object import TextObject
 
@@ -46,6 +50,8 @@ class LineTranslator:
         style: str = DEFAULT_TRANSLATE_STYLE,
         # Number of context lines before/after
         context_lines: int = DEFAULT_TRANSLATE_CONTEXT_LINES,
+        max_workers: int = 1,
+        checkpoint: Optional[ProcessingCheckpoint] = None,
     ):
         """
         Initialize line translator.
@@ -56,12 +62,21 @@ class LineTranslator:
             review_count: Number of review passes
             style: Translation style to apply
             context_lines: Number of context lines to include before/after
+            max_workers: Segments translated concurrently. Each segment keeps its
+                own validation retries, so only failing segments are re-sent.
+                Calls are throttled by the shared GenAIService rate limiter.
+            checkpoint: Optional store that persists each translated segment and
+                replays it on a resumed run.
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
         self.processor = processor
         self.pattern = pattern
         self.review_count = review_count
         self.style = style
         self.context_lines = context_lines
+        self.max_workers = max_workers
+        self.checkpoint = checkpoint
 
     def translate_segment(
         self,
@@ -233,6 +248,9 @@ class LineTranslator:
             target_language: Target language code (default: en for English)
             template_dict: Optional additional template values
 
+        Segments are translated with up to `max_workers` in flight and
+        reassembled in line order.
+
         Returns:
             Complete translated text with line numbers preserved
         """
@@ -250,22 +268,44 @@ class LineTranslator:
         if not segment_size:
             segment_size = _calculate_segment_size(num_text, DEFAULT_TRANSLATION_TARGET_TOKENS)
 
-        translated_segments = []
-
-        logger.debug(f"Total lines to translate: {total_lines}  | Translation segment size: {segment_size}.")
-        # Process text in segments using segment iteration
-        for start_idx, end_idx in num_text.iter_segments(segment_size, min_segment_size=MIN_SEGMENT_SIZE):
-            translated_content = self.translate_segment(
-                num_text=num_text,
-                start_line=start_idx,
-                end_line=end_idx,
-                metadata=metadata,
-                source_language=source_language,
-                target_language=target_language,
-                template_dict=template_dict,
-            )
+        logger.debug(
+            f"Total lines to translate: {total_lines}  | Translation segment size: {segment_size} "
+            f"| max_workers: {self.max_workers}."
+        )
 
-            translated_segments.append(translated_content)
+        translate = partial(
+            self.translate_segment,
+            num_text=num_text,
+            metadata=metadata,
+            source_language=source_language,
+            target_language=target_language,
+            template_dict=template_dict,
+        )
+
+        def _translate(segment: NumberedText.LineSegment) -> str:
+            start_idx, end_idx = segment
+            if self.checkpoint is None:
+                return translate(start_line=start_idx, end_line=end_idx)
+
+            unit = f"lines-{start_idx}-{end_idx}"
+            fingerprint = ProcessingCheckpoint.fingerprint(num_text.get_numbered_segment(start_idx, end_idx))
+            if (stored := self.checkpoint.get(unit, fingerprint)) is not None:
+                logger.info(f"Reusing checkpointed translation (lines {start_idx}-{end_idx})")
+                return stored["text"]
+            translated = translate(start_line=start_idx, end_line=end_idx)
+            self.checkpoint.put(unit, {"text": translated}, fingerprint)
+            return translated
+
+        # Segments only read from num_text, so they can be translated independently;
+        # results come back in line order.
+        results = ordered_map(
+            _translate,
+            num_text.iter_segments(segment_size, min_segment_size=MIN_SEGMENT_SIZE),
+            max_workers=self.max_workers,
+            capture_errors=False,
+            thread_name_prefix="line-translator",
+        )
+        translated_segments = [cast(str, result.value) for result in results]
 
         new_text = "\n".join(translated_segments).strip()
 
@@ -383,7 +423,18 @@ def translate_text_by_lines(
     context_lines: Optional[int] = None,
     review_count: Optional[int] = None,
     template_dict: Optional[Dict] = None,
+    max_workers: int = 1,
+    checkpoint_dir: Optional[Path] = None,
+    resume: bool = False,
 ) -> TextObject:
+    """
+    Translate a TextObject line by line with the default OpenAI processor.
+
+    When `checkpoint_dir` is set (or `resume` is True, which falls back to the
+    default checkpoint directory), each translated segment is persisted as it
+    completes; with `resume`, segments already translated by an earlier run of
+    the same text, pattern, model, and settings are reused instead of re-sent.
+    """
     if source_language is None:
         source_language = text.language
 
@@ -398,8 +449,26 @@ def translate_text_by_lines(
         style=style or DEFAULT_TRANSLATE_STYLE,
         context_lines=context_lines or DEFAULT_TRANSLATE_CONTEXT_LINES,
         review_count=review_count or DEFAULT_REVIEW_COUNT,
+        max_workers=max_workers,
     )
 
+    if checkpoint_dir is not None or resume:
+        translator.checkpoint = ProcessingCheckpoint.for_run(
+            text,
+            step="translation",
+            prompt_name=pattern.name,
+            model=processor.model,
+            root=checkpoint_dir,
+            resume=resume,
+            source_language=source_language,
+            target_language=target_language,
+            segment_size=segment_size,
+            context_lines=translator.context_lines,
+            review_count=translator.review_count,
+            style=translator.style,
+            template_dict=template_dict,
+        )
+
     process_metadata = ProcessMetadata(
         step="translation",
         processor="LineTranslator",
@@ -1,8 +1,13 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Optional, Type, Union, cast
 
 from pydantic import BaseModel
 
-from tnh_scholar.gen_ai_service.adapters.simple_completion import simple_completion
+from tnh_scholar.gen_ai_service.adapters.simple_completion import POLICY, simple_completion
+from tnh_scholar.gen_ai_service.batch_runner import BatchRunner, batch_request_line, write_batch_file
+from tnh_scholar.gen_ai_service.models.domain import Message, Role
+from tnh_scholar.gen_ai_service.models.transport import ProviderRequest
 from tnh_scholar.gen_ai_service.utils.token_utils import token_count
 from tnh_scholar.logging_config import get_child_logger
 
@@ -62,17 +67,36 @@ def _run_batch_process_text(
         logger.warning(
             f"Response object can't be processed in batch mode. Response format ignored:\n\t{response_format}"
         )
-    logger.info("Processing batch sequentially via simple_completion (temporary migration fallback).")
-    responses = []
-    for idx, prompt in enumerate(user_prompts):
-        logger.debug("Processing batch item %s/%s", idx + 1, len(user_prompts))
-        response = simple_completion(
-            system_message=system_message,
-            user_message=prompt,
-            model=model_name,
-            max_tokens=max_tokens,
+    model = POLICY.default_model if model_name == "default" else model_name
+    lines = [
+        batch_request_line(
+            f"request-{idx + 1}",
+            ProviderRequest(
+                provider=POLICY.default_provider,
+                model=model,
+                system=system_message,
+                messages=[Message(role=Role.user, content=prompt)],
+                temperature=POLICY.default_temperature,
+                max_output_tokens=max_tokens,
+            ),
         )
-        responses.append(response)
+        for idx, prompt in enumerate(user_prompts)
+    ]
+    logger.info(f"Submitting {len(lines)} request(s) to the batch API with model '{model}'.")
+    with TemporaryDirectory() as tmp_dir:
+        jsonl_path = write_batch_file(lines, Path(tmp_dir) / "batch_requests.jsonl")
+        results = _batch_runner().run(jsonl_path, description="openai_process_text")
+
+    responses = []
+    for item in results:
+        if item.text is None:
+            raise RuntimeError(f"Batch request {item.custom_id} failed: {item.error}")
+        responses.append(item.text)
 
     logger.info("Processing completed.")
     return cast(Union[BaseModel, str], responses[0] if responses else "")
+
+
+def _batch_runner() -> BatchRunner:
+    """Build the batch runner used for batch mode (patched in tests)."""
+    return BatchRunner.from_settings()
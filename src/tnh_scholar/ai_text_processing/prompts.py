@@ -11,10 +11,10 @@ import yaml
 from git import Actor, Commit, Repo
 from git.exc import GitCommandError, InvalidGitRepositoryError
 from jinja2 import Environment, StrictUndefined, TemplateError
-from jinja2.meta import find_undeclared_variables
 
 from tnh_scholar.gen_ai_service.config.settings import GenAISettings
 from tnh_scholar.logging_config import get_child_logger
+from tnh_scholar.prompt_system.service.template_cache import TemplatePolicy, get_template_cache
 from tnh_scholar.utils.file_utils import read_str_from_file, write_str_to_file
 
 # Custom type for markdown content
@@ -24,6 +24,14 @@ logger = get_child_logger(__name__)
 
 MANAGER_UPDATE_MESSAGE = "PromptManager Update:"
 
+# Matches Prompt._create_environment; used to key the shared compiled-template cache.
+_PROMPT_TEMPLATE_POLICY = TemplatePolicy(
+    strict_undefined=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    autoescape=True,
+)
+
 
 class Prompt:
     """
@@ -168,21 +176,18 @@ class Prompt:
         Raises:
             ValueError: If required template variables are missing
         """
-        # Parse for validation
-        parsed_content = self._env.parse(instructions)
-        required_vars = find_undeclared_variables(parsed_content)
+        # Compiled templates are shared process-wide, so repeated renders skip parsing
+        compiled = get_template_cache().get(instructions, _PROMPT_TEMPLATE_POLICY)
 
         # Validate variables
-        missing_vars = required_vars - set(template_values.keys())
+        missing_vars = compiled.undeclared_variables - set(template_values.keys())
         if missing_vars and not self._allow_empty_vars:
             raise ValueError(
                 f"Missing required template variables in prompt '{self.name}': "
                 f"{', '.join(sorted(missing_vars))}"
             )
 
-        # Create and render template
-        template = self._env.from_string(instructions)
-        return template.render(**template_values)
+        return compiled.template.render(**template_values)
 
     def extract_frontmatter(self) -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,215 @@
+"""Deterministic, token-aware section planning.
+
+`SectionPlanner` splits a `NumberedText` into token-balanced sections without
+calling a model. Per-line token counts come from
+`NumberedText.token_prefix_sums` (computed once and cached), so the sum of any
+line range is O(1). Section markers found by
+`match_section.find_section_boundaries` always start a new section; within
+each marker-delimited span the planner picks breaks nearest the ideal token
+positions, preferring lines that start a paragraph (follow a blank line).
+
+The planner can stand in for `SectionParser` at no cost (`plan_sections`), or
+act as a pre-pass: `outline` renders one short numbered preview per planned
+block, and `SectionParser.find_sections(..., planner=...)` sends that outline
+to the model instead of the full text.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Callable, List, Optional, Sequence
+
+from tnh_scholar.logging_config import get_child_logger
+from tnh_scholar.metadata.metadata import ProcessMetadata
+from tnh_scholar.text_processing import NumberedText
+from tnh_scholar.text_processing.match_section import SectionConfig, find_section_boundaries
+
+from .text_object import LogicalSection, TextObject
+
+logger = get_child_logger(__name__)
+
+DEFAULT_PLANNED_SECTION_TOKENS = 650
+DEFAULT_OUTLINE_PREVIEW_CHARS = 160
+MAX_TITLE_CHARS = 60
+
+TokenCounter = Callable[[Sequence[str], str], List[int]]
+
+
+class SectionPlanner:
+    """Plans token-balanced section boundaries from per-line token counts."""
+
+    def __init__(
+        self,
+        target_tokens: int = DEFAULT_PLANNED_SECTION_TOKENS,
+        config: Optional[SectionConfig] = None,
+        token_model: Optional[str] = None,
+        counter: Optional[TokenCounter] = None,
+    ):
+        """
+        Initialize the planner.
+
+        Args:
+            target_tokens: Desired tokens per section
+            config: Optional section markers; every matching line starts a section
+            token_model: Tokenizer model for line counts (GenAI default if None)
+            counter: Optional batch counter ``(lines, model) -> counts`` (see
+                NumberedText.token_prefix_sums)
+        """
+        if target_tokens < 1:
+            raise ValueError(f"target_tokens must be >= 1, got {target_tokens}")
+        self.target_tokens = target_tokens
+        self.config = config
+        self.token_model = token_model
+        self.counter = counter
+
+    def plan(self, num_text: NumberedText, target_tokens: Optional[int] = None) -> List[LogicalSection]:
+        """
+        Return section starts (with titles) covering the whole text.
+
+        Args:
+            num_text: Text to plan
+            target_tokens: Override for the planner's target section size
+        """
+        if num_text.size == 0:
+            return []
+        target = target_tokens or self.target_tokens
+        prefix = num_text.token_prefix_sums(self.token_model, counter=self.counter)
+        markers = self._marker_lines(num_text)
+        paragraph_starts = _paragraph_starts(num_text)
+
+        starts: List[int] = []
+        span_edges = [num_text.start, *markers, num_text.end + 1]
+        for span_start, span_end in zip(span_edges, span_edges[1:], strict=False):
+            starts.append(span_start)
+            starts.extend(_balanced_breaks(num_text, prefix, span_start, span_end, target, paragraph_starts))
+
+        logger.debug(
+            f"Planned {len(starts)} sections over {num_text.size} lines "
+            f"({prefix[-1]} tokens, target {target}, {len(markers)} markers)"
+        )
+        return [LogicalSection(start_line=start, title=_title_for(num_text, start)) for start in starts]
+
+    def apply(self, text: TextObject, target_tokens: Optional[int] = None) -> TextObject:
+        """Return a new TextObject with planned sections."""
+        planned = self.plan(text.num_text, target_tokens)
+        result = text.transform()
+        # Planned starts are contiguous and in range by construction, so the
+        # per-start boundary validation that transform(sections=...) runs is skipped.
+        result.sections = TextObject._build_section_objects(planned, text.num_text.size)
+        return result
+
+    def outline(
+        self,
+        num_text: NumberedText,
+        block_tokens: Optional[int] = None,
+        preview_chars: int = DEFAULT_OUTLINE_PREVIEW_CHARS,
+    ) -> str:
+        """
+        Condensed numbered view for model-based sectioning.
+
+        Plans fine-grained blocks (default a quarter of `target_tokens`) and
+        renders the first line of each, truncated to `preview_chars`, with its
+        original line number, so the model can choose section starts among
+        block boundaries while reading a fraction of the text.
+        """
+        blocks = self.plan(num_text, block_tokens or max(1, self.target_tokens // 4))
+        separator = num_text.separator
+        return "\n".join(
+            f"{block.start_line}{separator}{num_text[block.start_line][:preview_chars]}" for block in blocks
+        )
+
+    def _marker_lines(self, num_text: NumberedText) -> List[int]:
+        if self.config is None:
+            return []
+        offset = num_text.start - 1
+        return sorted(
+            {
+                line + offset
+                for line in find_section_boundaries(num_text.content, self.config)
+                if line + offset > num_text.start
+            }
+        )
+
+
+def plan_sections(
+    text: TextObject,
+    target_tokens: int = DEFAULT_PLANNED_SECTION_TOKENS,
+    config: Optional[SectionConfig] = None,
+    token_model: Optional[str] = None,
+) -> TextObject:
+    """
+    High-level function for local, model-free sectioning.
+
+    Args:
+        text: Input TextObject
+        target_tokens: Desired tokens per section
+        config: Optional section marker configuration
+        token_model: Tokenizer model for line counts
+
+    Returns:
+        New TextObject with token-balanced sections
+    """
+    planner = SectionPlanner(target_tokens=target_tokens, config=config, token_model=token_model)
+    process_metadata = ProcessMetadata(
+        step="plan_sections",
+        processor="SectionPlanner",
+        target_tokens=target_tokens,
+        config=config.name if config else None,
+    )
+    return planner.apply(text).transform(process_metadata=process_metadata)
+
+
+def _paragraph_starts(num_text: NumberedText) -> List[int]:
+    """Non-blank lines that follow a blank line, in order."""
+    starts: List[int] = []
+    previous_blank = False
+    for line_num, line in num_text:
+        blank = not line.strip()
+        if previous_blank and not blank:
+            starts.append(line_num)
+        previous_blank = blank
+    return starts
+
+
+def _balanced_breaks(
+    num_text: NumberedText,
+    prefix: List[int],
+    span_start: int,
+    span_end: int,
+    target: int,
+    paragraph_starts: List[int],
+) -> List[int]:
+    """Break lines inside [span_start, span_end) that split it into ~target-token parts."""
+    base = num_text.start
+    span_tokens = prefix[span_end - base] - prefix[span_start - base]
+    parts = max(1, round(span_tokens / target))
+    if parts == 1:
+        return []
+
+    low = bisect_left(paragraph_starts, span_start + 1)
+    high = bisect_left(paragraph_starts, span_end)
+    candidates = paragraph_starts[low:high]
+    if len(candidates) < parts - 1:
+        candidates = list(range(span_start + 1, span_end))
+    positions = [prefix[line - base] for line in candidates]
+
+    breaks: List[int] = []
+    for part in range(1, parts):
+        ideal = prefix[span_start - base] + span_tokens * part / parts
+        index = bisect_left(positions, ideal)
+        # Take the nearer of the candidates on either side of the ideal position
+        if index > 0 and (
+            index == len(positions) or ideal - positions[index - 1] <= positions[index] - ideal
+        ):
+            index -= 1
+        if index < len(candidates) and (not breaks or candidates[index] > breaks[-1]):
+            breaks.append(candidates[index])
+    return breaks
+
+
+def _title_for(num_text: NumberedText, start: int) -> str:
+    """First non-blank line at or after `start` (markdown header marks removed)."""
+    for line_num in range(start, min(num_text.end, start + 5) + 1):
+        if title := num_text[line_num].strip().lstrip("#").strip():
+            return title if len(title) <= MAX_TITLE_CHARS else f"{title[: MAX_TITLE_CHARS - 3]}..."
+    return f"Line {start}"
@@ -0,0 +1,237 @@
+"""Write-as-you-go output for processed sections.
+
+`SectionProcessor.process_sections` / `process_paragraphs` yield one
+`ProcessedSection` at a time; collecting them in a list before writing keeps
+the original and processed text of the whole document in memory. A
+`SectionSink` instead writes each section to its file the moment it arrives,
+flushes it, and keeps only a small `SectionRecord` (title, byte offset, byte
+length, error) per section. Memory stays flat regardless of document length,
+and an interrupted run leaves every completed section on disk.
+
+A section that failed upstream (`ProcessedSection.error` set) raises by
+default, so a text or XML file never silently drops content. With
+`allow_errors=True` the text and XML sinks write a visible failure marker in
+its place; the JSONL sink always records the error field instead.
+
+Sinks:
+  - `TextSectionSink`: processed text joined by a separator
+  - `XMLDocumentSink`: processed text wrapped in `<document>` tags
+  - `JSONLSectionSink`: one JSON object per section (title, metadata, error,
+    processed and optionally original text)
+
+Usage:
+    with XMLDocumentSink(output_path, overwrite=True) as sink:
+        index = write_sections(process_text_by_sections(text, {}, pattern), sink)
+
+Connected modules:
+  - ai_text_processing.SectionProcessor
+  - xml_processing.join_xml_data_to_doc
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, List, Optional
+
+from tnh_scholar.logging_config import get_child_logger
+
+if TYPE_CHECKING:
+    from .ai_text_processing import ProcessedSection
+
+logger = get_child_logger(__name__)
+
+__all__ = [
+    "JSONLSectionSink",
+    "SectionRecord",
+    "SectionSink",
+    "TextSectionSink",
+    "XMLDocumentSink",
+    "write_sections",
+]
+
+
+@dataclass(frozen=True)
+class SectionRecord:
+    """Location of one written section; `offset` and `length` are in bytes."""
+
+    title: str
+    offset: int
+    length: int
+    error: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class SectionSink(ABC):
+    """Append-only section writer that keeps an index instead of the content."""
+
+    def __init__(self, path: Path, overwrite: bool = False, allow_errors: bool = False) -> None:
+        """
+        Open the output file.
+
+        Args:
+            path: Output file; parent directories are created.
+            overwrite: Replace an existing file instead of raising.
+            allow_errors: Write failed sections (see `render_failure`) instead
+                of raising on them.
+
+        Raises:
+            FileExistsError: If `path` exists and `overwrite` is False.
+        """
+        self.path = Path(path)
+        self.allow_errors = allow_errors
+        if self.path.exists() and not overwrite:
+            raise FileExistsError(f"The file {self.path} already exists and overwrite is not set.")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.index: List[SectionRecord] = []
+        self._handle: Optional[BinaryIO] = self.path.open("wb")
+        self._position = 0
+        self._write_bytes(self.header())
+
+    def header(self) -> str:
+        """Text written once when the sink opens."""
+        return ""
+
+    def footer(self) -> str:
+        """Text written once when the sink closes."""
+        return ""
+
+    @abstractmethod
+    def render(self, section: ProcessedSection, index: int) -> str:
+        """Serialize one section (including any separator before it)."""
+
+    def render_failure(self, section: ProcessedSection, index: int) -> str:
+        """Serialize a section whose processing failed; only used with `allow_errors`."""
+        return self.render(section, index)
+
+    def write(self, section: ProcessedSection) -> SectionRecord:
+        """
+        Write and flush one section, returning its index record.
+
+        Raises:
+            ValueError: If the section failed upstream and `allow_errors` is False.
+        """
+        offset = self._position
+        if section.error:
+            if not self.allow_errors:
+                raise ValueError(
+                    f"Section '{section.title}' failed ({section.error}); "
+                    f"pass allow_errors=True to write partial output to {self.path}"
+                )
+            logger.warning(f"Writing '{section.title}' with error: {section.error}")
+            self._write_bytes(self.render_failure(section, len(self.index)))
+        else:
+            self._write_bytes(self.render(section, len(self.index)))
+        record = SectionRecord(
+            title=section.title,
+            offset=offset,
+            length=self._position - offset,
+            error=section.error,
+            metadata=dict(section.metadata),
+        )
+        self.index.append(record)
+        return record
+
+    def close(self) -> List[SectionRecord]:
+        """Write the footer, close the file, and return the section index."""
+        if self._handle is not None:
+            self._write_bytes(self.footer())
+            self._handle.close()
+            self._handle = None
+            logger.info(f"Wrote {len(self.index)} sections to {self.path} ({self._position} bytes)")
+        return self.index
+
+    def _write_bytes(self, text: str) -> None:
+        if not text:
+            return
+        if self._handle is None:
+            raise ValueError(f"Section sink for {self.path} is closed")
+        data = text.encode("utf-8")
+        self._handle.write(data)
+        self._handle.flush()
+        self._position += len(data)
+
+    def __enter__(self) -> SectionSink:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class TextSectionSink(SectionSink):
+    """Processed text of each section, joined by `separator`."""
+
+    def __init__(
+        self,
+        path: Path,
+        overwrite: bool = False,
+        separator: str = "\n\n",
+        allow_errors: bool = False,
+    ) -> None:
+        self.separator = separator
+        super().__init__(path, overwrite=overwrite, allow_errors=allow_errors)
+
+    def render(self, section: ProcessedSection, index: int) -> str:
+        prefix = self.separator if index else ""
+        return f"{prefix}{section.processed_str}"
+
+    def render_failure(self, section: ProcessedSection, index: int) -> str:
+        prefix = self.separator if index else ""
+        return f"{prefix}[FAILED SECTION: {section.title}: {section.error}]"
+
+    def footer(self) -> str:
+        return "\n" if self.index else ""
+
+
+class XMLDocumentSink(SectionSink):
+    """Processed (XML-tagged) sections wrapped in a single `<document>` element."""
+
+    def header(self) -> str:
+        return "<document>\n"
+
+    def render(self, section: ProcessedSection, index: int) -> str:
+        return f"{section.processed_str}\n"
+
+    def render_failure(self, section: ProcessedSection, index: int) -> str:
+        # "--" may not appear inside an XML comment
+        detail = f"{section.title}: {section.error}".replace("--", "- -")
+        return f"<!-- FAILED SECTION: {detail} -->\n"
+
+    def footer(self) -> str:
+        return "</document>\n"
+
+
+class JSONLSectionSink(SectionSink):
+    """One JSON object per line, so a partial file is readable record by record.
+
+    Failed sections are always written, with their `error` field set.
+    """
+
+    def __init__(self, path: Path, overwrite: bool = False, include_original: bool = False) -> None:
+        self.include_original = include_original
+        super().__init__(path, overwrite=overwrite, allow_errors=True)
+
+    def render(self, section: ProcessedSection, index: int) -> str:
+        record: Dict[str, Any] = {
+            "title": section.title,
+            "metadata": section.metadata,
+            "error": section.error,
+            "processed_str": section.processed_str,
+        }
+        if self.include_original:
+            record["original_str"] = section.original_str
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def write_sections(sections: Iterable[ProcessedSection], sink: SectionSink) -> List[SectionRecord]:
+    """
+    Drain a section generator into `sink`, one section at a time.
+
+    The sink is left open so callers can use it as a context manager; only the
+    index is returned, never the section content.
+    """
+    for section in sections:
+        sink.write(section)
+    return sink.index
@@ -1,9 +1,8 @@
-from copy import deepcopy
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Literal, NamedTuple, Optional, TypeAlias, Union
+from typing import Any, Dict, Iterator, List, Literal, NamedTuple, Optional, Sequence, Tuple, TypeAlias, Union
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -12,8 +11,8 @@ from tnh_scholar.logging_config import get_child_logger
 from tnh_scholar.metadata.metadata import Frontmatter, Metadata, ProcessMetadata
 from tnh_scholar.text_processing import NumberedText
 from tnh_scholar.text_processing.numbered_text import SectionValidationError
-from tnh_scholar.utils.file_utils import read_str_from_file, write_str_to_file
-from tnh_scholar.utils.lang import get_language_code_from_text
+from tnh_scholar.utils.file_utils import iter_lines_from_file, read_str_from_file, write_str_to_file
+from tnh_scholar.utils.lang import DEFAULT_SAMPLE_WORDS, detect_language_code
 
 logger = get_child_logger(__name__)
 
@@ -68,15 +67,14 @@ class _MetadataMerger:
         provenance = self.target.get("_provenance", [])
         if not isinstance(provenance, list):
             provenance = []
-        provenance.append(
-            {
-                "timestamp": datetime.now(UTC).isoformat(),
-                "source": source,
-                "strategy": strategy.value,
-                "keys_added": list(self.incoming.keys()),
-            }
-        )
-        self.target["_provenance"] = provenance
+        entry = {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "source": source,
+            "strategy": strategy.value,
+            "keys_added": list(self.incoming.keys()),
+        }
+        # New list rather than append: the target may share it with a Metadata snapshot
+        self.target["_provenance"] = [*provenance, entry]
         # NOTE: Provenance is intentionally unbounded for this interim implementation to unblock tnh-gen.
         # Future work should consider capping or deduplicating provenance entries to avoid unbounded growth.
 
@@ -91,6 +89,7 @@ class _MetadataMerger:
     def _deep_merge(self) -> None:
         merged_dict = self._deep_merge_dicts(self.target._data, self.incoming._data)
         self.target._data = merged_dict
+        self.target._shared = False
 
     def _fail_on_conflict(self) -> None:
         if conflicts := set(self.target.keys()) & set(self.incoming.keys()):
@@ -212,13 +211,16 @@ class AIResponse(BaseModel):
     sections: List[LogicalSection]
 
 
-@dataclass
+@dataclass(frozen=True)
 class SectionObject:
     """Represents a section of text with computed boundaries and optional metadata.
 
     SectionObject is used internally by TextObject to track section ranges.
     Unlike LogicalSection (which only has start_line), SectionObject includes
-    the computed end boundary.
+    the computed end boundary. Instances are immutable so transformed
+    TextObjects can share them: metadata is stored as a read-only
+    `Metadata.frozen()` snapshot (use `dataclasses.replace` to change it).
+    Nested metadata values are not frozen and must not be modified in place.
 
     Attributes:
         title: Descriptive title of the section
@@ -230,6 +232,10 @@ class SectionObject:
     section_range: SectionRange
     metadata: Optional[Metadata]
 
+    def __post_init__(self) -> None:
+        if self.metadata is not None:
+            object.__setattr__(self, "metadata", self.metadata.frozen())
+
     @classmethod
     def from_logical_section(
         cls, logical_section: LogicalSection, end_line: int, metadata: Optional[Metadata] = None
@@ -355,8 +361,10 @@ class TextObject:
 
     Attributes:
         num_text: Line-numbered text content manager
-        language: ISO 639-1 language code for the text content
-        sections: List of text sections with boundaries
+        language: ISO 639-1 language code for the text content. When not given,
+            it is detected on first access from a bounded sample of lines
+            (`language_sample_words` words at the start, 1/3 and 2/3 points).
+        sections: Tuple of text sections with boundaries
         metadata: Processing and content metadata container
 
     Example:
@@ -364,21 +372,34 @@ class TextObject:
         >>> obj = TextObject(content, language="en")
     """
 
+    language_sample_words: int = DEFAULT_SAMPLE_WORDS
+
     def __init__(
         self,
         num_text: NumberedText,
         language: Optional[str] = None,
-        sections: Optional[List[SectionObject]] = None,
+        sections: Optional[Sequence[SectionObject]] = None,
         metadata: Optional[Metadata] = None,
         validate_on_init: bool = True,
     ):
         self.num_text = num_text
-        self.language = language or get_language_code_from_text(num_text.content)
-        self.sections = sections or []
+        self._language = language or None
+        # Text to detect from when no language was given (transform() keeps the source's).
+        self._language_text = num_text
+        self.sections = sections
         self.metadata = metadata or Metadata()
         if validate_on_init and self.sections:
             self.validate_sections()
 
+    @property
+    def sections(self) -> Tuple[SectionObject, ...]:
+        """Sections in text order; a tuple so transformed objects can share it."""
+        return self._sections
+
+    @sections.setter
+    def sections(self, sections: Optional[Sequence[SectionObject]]) -> None:
+        self._sections = tuple(sections or ())
+
     def __iter__(self) -> Iterator[SectionEntry]:  # type: ignore[override]
         """Iterate through sections, yielding full section information.
 
@@ -645,7 +666,8 @@ class TextObject:
     def from_text_file(cls, file: Path) -> "TextObject":
         """Create TextObject from a text file.
 
-        Reads the file and extracts any frontmatter metadata.
+        Streams the file, extracting any frontmatter metadata, so the content is
+        held in memory once (see `NumberedText.from_stream`).
 
         Args:
             file: Path to text file
@@ -656,8 +678,15 @@ class TextObject:
         Example:
             >>> obj = TextObject.from_text_file(Path("document.txt"))
         """
-        text_str = read_str_from_file(file)
-        return cls.from_str(text_str)
+        frontmatter: Dict[str, Metadata] = {}
+
+        def _content_lines() -> Iterator[str]:
+            metadata, lines = Frontmatter.extract_from_lines(iter_lines_from_file(file))
+            frontmatter["metadata"] = metadata
+            yield from lines
+
+        num_text = NumberedText.from_stream(_content_lines)
+        return cls(num_text=num_text, metadata=frontmatter.get("metadata"))
 
     @classmethod
     def from_section_file(cls, section_file: Path, source: Optional[str] = None) -> "TextObject":
@@ -789,34 +818,56 @@ class TextObject:
         language: Optional[str] = None,
         metadata: Optional[Metadata] = None,
         process_metadata: Optional[ProcessMetadata] = None,
-        sections: Optional[List[SectionObject]] = None,
+        sections: Optional[Sequence[SectionObject]] = None,
     ) -> "TextObject":
         """
         Return a **new** TextObject with requested changes; does not mutate the original.
 
+        Unchanged parts are shared rather than copied: the section tuple (of frozen
+        SectionObjects) is reused, metadata is a copy-on-write `snapshot()`, and
+        section boundaries are re-validated only when the text or sections change,
+        so cost does not grow with section count or metadata history.
+
         Args:
             data_str: Optional new text content
             language: Optional new language code
             metadata: Metadata to merge into the new object
             process_metadata: Identifier/details for the process performed
-            sections: Optional replacement list of sections
+            sections: Optional replacement sequence of sections
         """
         new_num_text = NumberedText(data_str) if data_str is not None else self.num_text
-        new_language = language or self.language
-        new_sections = deepcopy(sections) if sections is not None else deepcopy(self.sections)
-        new_metadata = deepcopy(self.metadata)
+        new_language = language or self._language
+        new_sections = sections if sections is not None else self.sections
+        new_metadata = self.metadata.snapshot()
         if metadata:
             merger = _MetadataMerger(new_metadata, metadata)
             merger.merge(MergeStrategy.UPDATE)
         if process_metadata:
             new_metadata.add_process_info(process_metadata)
 
-        return TextObject(
+        new_obj = TextObject(
             num_text=new_num_text,
             language=new_language,
             sections=new_sections,
             metadata=new_metadata,
+            # Boundaries only need re-checking when the text or the sections change
+            validate_on_init=data_str is not None or sections is not None,
         )
+        # An undetected language stays deferred and is still taken from this object's text.
+        new_obj._language_text = self._language_text
+        return new_obj
+
+    @property
+    def language(self) -> str:
+        """ISO 639-1 language code, detected lazily when not supplied."""
+        if self._language is None:
+            sample = _language_sample(self._language_text, self.language_sample_words)
+            self._language = detect_language_code(sample)
+        return self._language
+
+    @language.setter
+    def language(self, value: str) -> None:
+        self._language = value
 
     @property
     def section_count(self) -> int:
@@ -872,3 +923,27 @@ class TextObject:
               2 | Second line
         """
         return str(self.num_text.numbered_content)
+
+
+def _language_sample(num_text: NumberedText, words_per_sample: int) -> str:
+    """
+    Up to `words_per_sample` words from the lines at the start, 1/3 and 2/3 points.
+
+    Reads only the lines needed, so cost is independent of document length.
+
+    Raises:
+        ValueError: If the text has no words to sample.
+    """
+    max_chars = words_per_sample * 32  # bound work on very long single lines
+    windows: List[str] = []
+    for offset in sorted({0, num_text.size // 3, 2 * num_text.size // 3}):
+        words: List[str] = []
+        line_num = num_text.start + offset
+        while line_num <= num_text.end and len(words) < words_per_sample:
+            words.extend(num_text[line_num][:max_chars].split())
+            line_num += 1
+        if words:
+            windows.append(" ".join(words[:words_per_sample]))
+    if not windows:
+        raise ValueError("Input text cannot be empty")
+    return " ... ".join(windows)
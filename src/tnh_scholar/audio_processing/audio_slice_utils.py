@@ -3,8 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from tnh_scholar.audio_processing.diarization.audio.handler import AudioHandler
-from tnh_scholar.utils import TNHAudioSegment as AudioSegment
+from tnh_scholar.audio_processing.diarization.audio.handler import AudioHandler, BaseAudio
 
 
 def resolve_audio_format(audio_file: Path) -> str:
@@ -14,12 +13,16 @@ def resolve_audio_format(audio_file: Path) -> str:
 
 
 def slice_audio_bytes(
-    base_audio: AudioSegment,
+    base_audio: BaseAudio,
     start_ms: int,
     end_ms: int,
     audio_file: Path,
 ) -> Any:
-    """Export a byte stream for a bounded audio slice."""
+    """Export a byte stream for a bounded audio slice.
+
+    `base_audio` may be a loaded segment or a `DecodedAudio` source, which
+    copies out only the slice's frames.
+    """
     block_audio = base_audio[start_ms:end_ms]
     return AudioHandler().export_audio_bytes(
         block_audio,
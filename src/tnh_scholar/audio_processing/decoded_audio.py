@@ -0,0 +1,247 @@
+"""
+Decode-once audio source.
+
+`DecodedAudio` decodes an audio file to PCM a single time and memory-maps
+the result, so any number of slices can be cut from it without re-running
+ffmpeg. PCM WAV input is mapped in place; anything else is decoded once by
+ffmpeg to a temporary 16-bit WAV, which is removed on `close()`.
+
+Slicing mirrors `TNHAudioSegment`: ``source[start_ms:end_ms]`` returns a
+`TNHAudioSegment` holding only that slice's frames, with pydub's position
+rounding and end-of-data padding. Only the requested byte range is copied
+out of the map, and reads are thread-safe.
+
+Usage:
+    with DecodedAudio.open(audio_file) as source:
+        for chunk in chunks:
+            handler.build_audio_chunk(chunk, audio_file, source=source)
+
+Connected modules:
+  - diarization.audio.handler.AudioHandler
+  - audio_slice_utils.slice_audio_bytes
+  - diarization.strategies.language_probe.LanguageProbe
+  - multilingual_service
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from pydub import AudioSegment as _AudioSegment
+
+from tnh_scholar.logging_config import get_child_logger
+from tnh_scholar.utils import TNHAudioSegment as AudioSegment
+
+logger = get_child_logger(__name__)
+
+__all__ = [
+    "DecodedAudio",
+]
+
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# pydub reads 8-bit WAV as unsigned and re-biases it; leave that (rare) case to ffmpeg
+_SUPPORTED_SAMPLE_WIDTHS = (2, 4)
+# Padding allowance for rounding at the end of the data (matches pydub's limit)
+_MAX_PADDING_MS = 2
+
+
+@dataclass(frozen=True)
+class _PcmLayout:
+    """Where the PCM frames live in a WAV file and how they are shaped."""
+
+    data_offset: int
+    data_size: int
+    channels: int
+    sample_width: int
+    frame_rate: int
+
+    @property
+    def frame_width(self) -> int:
+        return self.channels * self.sample_width
+
+
+class DecodedAudio:
+    """Read-only PCM audio, memory-mapped and sliceable in milliseconds."""
+
+    def __init__(self, path: Path, layout: _PcmLayout, temp_file: bool = False) -> None:
+        self.path = path
+        self.channels = layout.channels
+        self.sample_width = layout.sample_width
+        self.frame_rate = layout.frame_rate
+        self._layout = layout
+        self._temp_file = temp_file
+        self._handle: Optional[BinaryIO] = path.open("rb")
+        self._map: Optional[mmap.mmap] = (
+            mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ) if layout.data_size else None
+        )
+        self._frame_count = layout.data_size // layout.frame_width
+
+    @classmethod
+    def open(cls, audio_file: Path, temp_dir: Optional[Path] = None) -> DecodedAudio:
+        """
+        Decode `audio_file` once and map its PCM frames.
+
+        Args:
+            audio_file: Source audio in any format ffmpeg can read.
+            temp_dir: Directory for the decoded WAV (system temp dir if None).
+
+        Raises:
+            RuntimeError: If ffmpeg fails or produces unreadable output.
+        """
+        audio_file = Path(audio_file)
+        if (layout := _read_pcm_layout(audio_file)) is not None:
+            logger.debug(f"Mapping PCM WAV {audio_file} without decoding")
+            return cls(audio_file, layout)
+
+        decoded = _decode_to_wav(audio_file, temp_dir)
+        if (layout := _read_pcm_layout(decoded)) is None:
+            decoded.unlink(missing_ok=True)
+            raise RuntimeError(f"Decoded audio for {audio_file} is not PCM WAV")
+        return cls(decoded, layout, temp_file=True)
+
+    @property
+    def frame_width(self) -> int:
+        return self._layout.frame_width
+
+    def frame_count(self, ms: Optional[float] = None) -> float:
+        """Frames in the whole source, or in `ms` milliseconds (pydub semantics)."""
+        if ms is None:
+            return float(self._frame_count)
+        return ms * (self.frame_rate / 1000.0)
+
+    def __len__(self) -> int:
+        """Duration in milliseconds."""
+        return round(1000 * (self._frame_count / self.frame_rate))
+
+    def __getitem__(self, key: slice) -> AudioSegment:
+        if not isinstance(key, slice) or key.step:
+            raise TypeError("DecodedAudio supports [start_ms:end_ms] slices only")
+        length = len(self)
+        start = min(key.start if key.start is not None else 0, length)
+        end = min(key.stop if key.stop is not None else length, length)
+
+        first = self._position(start) * self.frame_width
+        last = self._position(end) * self.frame_width
+        data = self._read(first, last)
+
+        missing_frames = (last - first - len(data)) // self.frame_width
+        if missing_frames > 0 and data:
+            if missing_frames > self.frame_count(ms=_MAX_PADDING_MS):
+                raise ValueError(f"Slice {start}:{end} ms is missing {missing_frames} frames")
+            data += bytes(self.frame_width * missing_frames)
+        return self._segment(data)
+
+    def _position(self, ms: int) -> int:
+        if ms < 0:
+            ms = len(self) - abs(ms)
+        return int(self.frame_count(ms=ms))
+
+    def _read(self, first: int, last: int) -> bytes:
+        if self._handle is None:
+            raise ValueError(f"DecodedAudio for {self.path} is closed")
+        last = min(last, self._layout.data_size)
+        if self._map is None or last <= first:
+            return b""
+        offset = self._layout.data_offset
+        return self._map[offset + first : offset + last]
+
+    def _segment(self, data: bytes) -> AudioSegment:
+        return AudioSegment.from_raw(data, self.sample_width, self.frame_rate, self.channels)
+
+    def close(self) -> None:
+        """Release the map and delete the decoded temp file, if any."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            if self._temp_file:
+                self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> DecodedAudio:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _decode_to_wav(audio_file: Path, temp_dir: Optional[Path]) -> Path:
+    """Run ffmpeg once to turn `audio_file` into a 16-bit PCM WAV temp file."""
+    with tempfile.NamedTemporaryFile(suffix=".wav", dir=temp_dir, delete=False) as handle:
+        target = Path(handle.name)
+    command = [
+        _AudioSegment.converter,
+        "-nostdin",
+        "-v",
+        "error",
+        "-y",
+        "-i",
+        str(audio_file),
+        "-vn",
+        "-acodec",
+        "pcm_s16le",
+        "-f",
+        "wav",
+        str(target),
+    ]
+    logger.info(f"Decoding {audio_file} once to {target}")
+    try:
+        subprocess.run(command, check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError) as exc:
+        target.unlink(missing_ok=True)
+        stderr = getattr(exc, "stderr", b"") or b""
+        raise RuntimeError(
+            f"Failed to decode {audio_file}: {stderr.decode(errors='replace') or exc}"
+        ) from exc
+    return target
+
+
+def _read_pcm_layout(path: Path) -> Optional[_PcmLayout]:
+    """Locate the `fmt ` and `data` chunks of a PCM WAV file; None for anything else."""
+    file_size = path.stat().st_size
+    with path.open("rb") as handle:
+        riff = handle.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            return None
+        fmt = b""
+        while len(header := handle.read(8)) == 8:
+            chunk_id, chunk_size = header[:4], struct.unpack("<I", header[4:])[0]
+            if chunk_id == b"data":
+                # Streamed or >4 GB WAVs may carry a placeholder size; trust the file length
+                data_size = min(chunk_size, file_size - handle.tell())
+                return _layout_from_fmt(fmt, handle.tell(), data_size)
+            padded = chunk_size + (chunk_size & 1)
+            if chunk_id == b"fmt ":
+                fmt = handle.read(padded)
+            else:
+                handle.seek(padded, 1)
+    return None
+
+
+def _layout_from_fmt(fmt: bytes, data_offset: int, data_size: int) -> Optional[_PcmLayout]:
+    if len(fmt) < 16:
+        return None
+    format_tag, channels, frame_rate, _, _, bits_per_sample = struct.unpack("<HHIIHH", fmt[:16])
+    if format_tag == _WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        format_tag = struct.unpack("<H", fmt[24:26])[0]
+    sample_width, partial_byte = divmod(bits_per_sample, 8)
+    if format_tag != _WAVE_FORMAT_PCM or partial_byte or sample_width not in _SUPPORTED_SAMPLE_WIDTHS:
+        return None
+    if not channels or not frame_rate:
+        return None
+    frame_width = channels * sample_width
+    return _PcmLayout(
+        data_offset=data_offset,
+        data_size=data_size - data_size % frame_width,
+        channels=channels,
+        sample_width=sample_width,
+        frame_rate=frame_rate,
+    )
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional, Sequence, Union
 
 from tnh_scholar.exceptions import ConfigurationError
 from tnh_scholar.logging_config import get_child_logger
@@ -26,8 +26,55 @@ from ..chunker import DiarizationChunk
 from ..models import AudioChunk
 from .config import AudioHandlerConfig
 
+if TYPE_CHECKING:
+    from tnh_scholar.audio_processing.decoded_audio import DecodedAudio
+
 logger = get_child_logger(__name__)
 
+# Anything sliceable in milliseconds into AudioSegments
+BaseAudio = Union[AudioSegment, "DecodedAudio"]
+# A planned piece of assembled audio: a slice, or a silence duration in ms
+AudioPart = Union[AudioSegment, int]
+
+
+def render_audio_parts(parts: Sequence[AudioPart]) -> AudioSegment:
+    """Join planned slices and silences into one segment with a single buffer copy.
+
+    Produces the same audio as folding ``AudioSegment.empty() + part`` over the
+    parts: silences are converted to the slices' PCM format exactly as pydub's
+    concatenation would. If the first part is not a slice, or the slices are
+    below pydub's silence format (so concatenation would resample audio already
+    assembled), the parts are concatenated the pydub way instead.
+    """
+    if not parts:
+        return AudioSegment.empty()
+    template = parts[0]
+    silence_format = AudioSegment.silent(duration=0).pcm_format
+    if isinstance(template, int) or not all(
+        mine >= theirs for mine, theirs in zip(template.pcm_format, silence_format, strict=True)
+    ):
+        return _concatenate_audio_parts(parts)
+
+    empty = template[0:0]
+    silences: dict[int, bytes] = {}
+    buffers: List[bytes] = []
+    for part in parts:
+        if isinstance(part, int):
+            if part not in silences:
+                silences[part] = (empty + AudioSegment.silent(duration=part)).raw_data
+            buffers.append(silences[part])
+        else:
+            buffers.append(part.raw_data)
+    sample_width, frame_rate, channels = template.pcm_format
+    return AudioSegment.from_raw(b"".join(buffers), sample_width, frame_rate, channels)
+
+
+def _concatenate_audio_parts(parts: Sequence[AudioPart]) -> AudioSegment:
+    assembled = AudioSegment.empty()
+    for part in parts:
+        assembled += AudioSegment.silent(duration=part) if isinstance(part, int) else part
+    return assembled
+
 
 class AudioHandler:
     """Isolates audio operations and external dependencies (pydub, ffmpeg)."""
@@ -39,11 +86,20 @@ class AudioHandler:
         self.output_format: Optional[str] = config.output_format
         self.input_format: Optional[str] = None
 
-    def build_audio_chunk(self, chunk: DiarizationChunk, audio_file: Path) -> AudioChunk:
-        """builds and sets the internal chunk.audio to be the new AudioChunk"""
+    def build_audio_chunk(
+        self,
+        chunk: DiarizationChunk,
+        audio_file: Path,
+        source: Optional[DecodedAudio] = None,
+    ) -> AudioChunk:
+        """builds and sets the internal chunk.audio to be the new AudioChunk
+
+        Pass a `DecodedAudio` opened once for `audio_file` as `source` when
+        building many chunks; otherwise the whole file is decoded per call.
+        """
 
         self._set_io_format(audio_file)
-        base_audio = self._load_audio(audio_file)
+        base_audio: BaseAudio = source if source is not None else self._load_audio(audio_file)
         self._validate_segments(chunk)
 
         audio_segment = self._assemble_segments(chunk, base_audio)
@@ -91,49 +147,45 @@ class AudioHandler:
         """Clamp audio slice bounds to the available audio length."""
         return max(0, min(start, audio_length)), max(0, min(end, audio_length))
 
-    def _append_audio_slice(
+    def _plan_audio_slice(
         self,
-        assembled: AudioSegment,
-        base_audio: AudioSegment,
+        parts: List[AudioPart],
+        base_audio: BaseAudio,
         start: int,
         end: int,
         audio_length: int,
-    ) -> tuple[AudioSegment, int]:
-        """Append a clamped audio slice and return updated audio plus appended length."""
+    ) -> int:
+        """Plan a clamped audio slice and return its length."""
         start, end = self._clamp_bounds(start, end, audio_length)
         if end <= start:
-            return assembled, 0
+            return 0
         interval_audio: AudioSegment = base_audio[start:end]
-        return assembled + interval_audio, len(interval_audio)
+        parts.append(interval_audio)
+        return len(interval_audio)
 
-    def _append_gap_content(
+    def _plan_gap_content(
         self,
-        assembled: AudioSegment,
+        parts: List[AudioPart],
         segment: DiarizationChunk | object,
         prev_end: int,
         seg_start: int,
-        base_audio: AudioSegment,
+        base_audio: BaseAudio,
         audio_length: int,
-    ) -> tuple[AudioSegment, int]:
-        """Append either silence or the real audio between two diarized segments."""
+    ) -> int:
+        """Plan either silence or the real audio between two diarized segments."""
         if self.config.silence_all_intervals or getattr(segment, "gap_before", False):
             spacing_time = getattr(segment, "spacing_time", 0)
             if spacing_time <= 0:
-                return assembled, 0
-            return assembled + AudioSegment.silent(duration=spacing_time), spacing_time
+                return 0
+            parts.append(spacing_time)
+            return spacing_time
         if seg_start <= prev_end:
-            return assembled, 0
-        return self._append_audio_slice(
-            assembled,
-            base_audio,
-            prev_end,
-            seg_start,
-            audio_length,
-        )
+            return 0
+        return self._plan_audio_slice(parts, base_audio, prev_end, seg_start, audio_length)
 
-    def _assemble_segments(self, chunk: DiarizationChunk, base_audio: AudioSegment) -> AudioSegment:
-        """Assemble audio for the given diarization chunk using gap information."""
-        assembled: AudioSegment = AudioSegment.empty()
+    def _plan_segments(self, chunk: DiarizationChunk, base_audio: BaseAudio) -> List[AudioPart]:
+        """Lay out the chunk's slices and silences, setting each segment's audio_map_start."""
+        parts: List[AudioPart] = []
         offset = 0
         prev_end: Optional[int] = None
         audio_length = len(base_audio)
@@ -143,29 +195,25 @@ class AudioHandler:
             seg_end = int(segment.end)
 
             if prev_end is not None:
-                assembled, added_gap = self._append_gap_content(
-                    assembled,
-                    segment,
-                    prev_end,
-                    seg_start,
-                    base_audio,
-                    audio_length,
+                offset += self._plan_gap_content(
+                    parts, segment, prev_end, seg_start, base_audio, audio_length
                 )
-                offset += added_gap
 
             segment.audio_map_start = offset
-            assembled, added_segment = self._append_audio_slice(
-                assembled,
-                base_audio,
-                seg_start,
-                seg_end,
-                audio_length,
-            )
-            offset += added_segment
+            offset += self._plan_audio_slice(parts, base_audio, seg_start, seg_end, audio_length)
 
             prev_end = seg_end
 
-        return assembled
+        return parts
+
+    def _assemble_segments(self, chunk: DiarizationChunk, base_audio: BaseAudio) -> AudioSegment:
+        """Assemble audio for the given diarization chunk using gap information.
+
+        The layout is planned first and its PCM joined into one buffer, so
+        assembly is linear in the chunk length rather than re-copying the
+        accumulated audio on every append.
+        """
+        return render_audio_parts(self._plan_segments(chunk, base_audio))
 
     # TODO: in _export_audio:
     # handle needed parameters for various export formats (can use kwargs for options)
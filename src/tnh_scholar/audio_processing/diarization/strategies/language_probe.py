@@ -5,7 +5,7 @@ Lightweight language-detection helpers pluggable into chunkers.
 
 from __future__ import annotations
 
-from typing import Optional, cast
+from typing import TYPE_CHECKING, Optional, cast
 
 from tnh_scholar.audio_processing.transcription import patch_whisper_options
 from tnh_scholar.logging_config import get_child_logger
@@ -17,6 +17,9 @@ from ..config import DiarizationConfig
 from ..models import AugDiarizedSegment
 from ..protocols import LanguageDetector
 
+if TYPE_CHECKING:
+    from tnh_scholar.audio_processing.decoded_audio import DecodedAudio
+
 logger = get_child_logger(__name__)
 
 
@@ -56,19 +59,26 @@ class LanguageProbe:
     def segment_language(
         self,
         aug_segment: AugDiarizedSegment,
+        source: Optional[DecodedAudio] = None,
     ) -> str:
         """
         Get segment ISO-639 language code from an Augmented Diarize Segment which contains audio.
 
         The probe window is always relative to the segment audio (0=start, duration=end).
+        When a decoded `source` for the original audio is given, the window is cut
+        from it directly (offset by the segment start) and the segment's own audio
+        is not needed.
         """
         probe_start, probe_end = self._calculate_probe_window(aug_segment)
 
-        if aug_segment.audio is None:
+        if source is not None:
+            offset = int(aug_segment.start)
+            audio_segment = source[offset + probe_start : offset + probe_end]
+        elif aug_segment.audio is None:
             raise ValueError(f"Segment Audio has not been set: {aug_segment}")
-
-        # All slicing is relative to the segment audio (0 to duration)
-        audio_segment = aug_segment.audio[probe_start:probe_end]
+        else:
+            # All slicing is relative to the segment audio (0 to duration)
+            audio_segment = aug_segment.audio[probe_start:probe_end]
         language = self.detector.detect(audio_segment, self.export_format)
 
         if language is not None:
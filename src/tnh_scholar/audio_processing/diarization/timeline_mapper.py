@@ -4,10 +4,14 @@ coordinates to original audio coordinates.
 
 This module enables mapping transcript segments back to their original positions
 in the source audio after processing chunked audio.
+
+Segment lookups go through `_MappedSegmentIndex`, built once per chunk, so each
+unit is matched by binary search instead of a scan over every segment.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from typing import List, Optional, Tuple
 
 from pydantic import BaseModel, Field
@@ -29,6 +33,71 @@ class TimelineMapperConfig(BaseModel):
     )
 
 
+class _MappedSegmentIndex:
+    """Sorted views of segments' mapped (chunk-relative) intervals.
+
+    Answers the mapper's queries in O(log M) (plus O(log M) per overlapping
+    candidate), with the same tie-breaking as a scan in segment order: among
+    equals, the earliest segment in the list wins.
+
+    Overlaps are found with a max-end segment tree over the segments sorted by
+    start, which skips whole runs of segments ending before the query, so one
+    long early segment does not force a scan of everything after it.
+    """
+
+    def __init__(self, segments: List[DiarizedSegment]):
+        self.segments = segments
+        intervals = [(segment.mapped_start, segment.mapped_end) for segment in segments]
+
+        self._by_start = sorted(range(len(segments)), key=lambda i: (intervals[i][0], i))
+        self._starts = [intervals[i][0] for i in self._by_start]
+
+        # Implicit binary tree: node k has children 2k and 2k+1, leaves start at _leaf_base
+        # (one per start-sorted segment), and each node holds the furthest end below it.
+        self._leaf_base = 1 << max(len(segments) - 1, 0).bit_length()
+        self._max_end = [float("-inf")] * (2 * self._leaf_base)
+        for position, i in enumerate(self._by_start):
+            self._max_end[self._leaf_base + position] = intervals[i][1]
+        for node in range(self._leaf_base - 1, 0, -1):
+            self._max_end[node] = max(self._max_end[2 * node], self._max_end[2 * node + 1])
+
+        self._by_end = sorted(range(len(segments)), key=lambda i: (intervals[i][1], i))
+        self._ends = [intervals[i][1] for i in self._by_end]
+
+    def overlapping(self, start: int, end: int) -> List[DiarizedSegment]:
+        """Segments with mapped_start <= end and mapped_end >= start, in list order."""
+        # Only the first `limit` segments by start begin at or before `end`
+        limit = bisect_right(self._starts, end)
+        hits: List[int] = []
+        stack = [(1, 0, self._leaf_base)]  # (node, first position covered, positions covered)
+        while stack:
+            node, first, width = stack.pop()
+            if first >= limit or self._max_end[node] < start:
+                continue
+            if width == 1:
+                hits.append(self._by_start[first])
+                continue
+            half = width // 2
+            stack.append((2 * node + 1, first + half, half))
+            stack.append((2 * node, first, half))
+        return [self.segments[i] for i in sorted(hits)]
+
+    def latest_ending_by(self, time: int) -> Optional[DiarizedSegment]:
+        """Segment with the greatest mapped_end <= time (first in list order on ties)."""
+        position = bisect_right(self._ends, time)
+        if position == 0:
+            return None
+        first_tied = bisect_left(self._ends, self._ends[position - 1])
+        return self.segments[self._by_end[first_tied]]
+
+    def earliest_starting_from(self, time: int) -> Optional[DiarizedSegment]:
+        """Segment with the smallest mapped_start >= time (first in list order on ties)."""
+        position = bisect_left(self._starts, time)
+        if position == len(self._starts):
+            return None
+        return self.segments[self._by_start[position]]
+
+
 class TimelineMapper:
     """Maps timestamps from chunk-relative coordinates to original audio coordinates."""
 
@@ -82,6 +151,7 @@ class TimelineMapper:
         def __init__(self, map_segments: List[DiarizedSegment], config: TimelineMapperConfig):
             self.map_segments = map_segments
             self.config = config
+            self.index = _MappedSegmentIndex(map_segments)
 
         def map_timed_text(self, tt: TimedText) -> TimedText:
             """Map timestamps in all TimedTextUnit collections contained in the TimedText object."""
@@ -144,11 +214,7 @@ class TimelineMapper:
 
         def _find_overlapping_segments(self, unit: TimedTextUnit) -> List[DiarizedSegment]:
             """Find all segments that overlap with the given unit."""
-            return [
-                segment
-                for segment in self.map_segments
-                if (segment.mapped_start <= unit.end_ms and segment.mapped_end >= unit.start_ms)
-            ]
+            return self.index.overlapping(unit.start_ms, unit.end_ms)
 
         def _choose_best_overlap(
             self, unit: TimedTextUnit, candidates: List[DiarizedSegment]
@@ -176,21 +242,8 @@ class TimelineMapper:
             self, unit: TimedTextUnit
         ) -> Tuple[Optional[DiarizedSegment], Optional[DiarizedSegment]]:
             """Find the nearest segments before and after the unit."""
-            before = None
-            before_end = float("-inf")
-            after = None
-            after_start = float("inf")
-
-            for segment in self.map_segments:
-                # Check if segment ends before unit starts
-                if segment.mapped_end <= unit.start_ms and segment.mapped_end > before_end:
-                    before = segment
-                    before_end = segment.mapped_end
-
-                # Check if segment starts after unit ends
-                if segment.mapped_start >= unit.end_ms and segment.mapped_start < after_start:
-                    after = segment
-                    after_start = segment.mapped_start
+            before = self.index.latest_ending_by(unit.start_ms)
+            after = self.index.earliest_starting_from(unit.end_ms)
 
             if not (before or after):
                 raise ValueError("Before or after segments not found.")
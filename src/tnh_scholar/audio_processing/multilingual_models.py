@@ -8,6 +8,8 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from tnh_scholar.audio_processing.diarization.models import DiarizedSegment
 
+DEFAULT_MAX_INFLIGHT_AUDIO_BYTES = 128 * 1024 * 1024
+
 
 class TranscriptionProvider(str, Enum):
     """Supported transcription providers for the multilingual workflow."""
@@ -98,3 +100,7 @@ class MultilingualTranscriptionRequest(BaseModel):
     skip_translation: bool = False
     use_speaker_blocks: bool = False
     diarization_segments: list[DiarizedSegment] | None = None
+    # Speaker blocks transcribed/translated concurrently, and the PCM bytes they may hold at once;
+    # translation calls from all blocks draw on the one GenAIService rate limiter
+    max_block_workers: int = Field(default=1, ge=1)
+    max_inflight_audio_bytes: int = Field(default=DEFAULT_MAX_INFLIGHT_AUDIO_BYTES, ge=1)
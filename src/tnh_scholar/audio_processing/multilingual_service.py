@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Callable, cast
+from typing import Any, Callable, Iterator, cast
 
 from tnh_scholar.ai_text_processing import Prompt, get_pattern
 from tnh_scholar.audio_processing.audio_slice_utils import (
     resolve_audio_format,
     slice_audio_bytes,
 )
+from tnh_scholar.audio_processing.decoded_audio import DecodedAudio
 from tnh_scholar.audio_processing.diarization.config import DiarizationConfig
 from tnh_scholar.audio_processing.diarization.models import (
     AugDiarizedSegment,
@@ -48,12 +50,20 @@ from tnh_scholar.audio_processing.transcription.transcription_service import (
 from tnh_scholar.cli_tools.srt_translate.srt_translate import SrtTranslator
 from tnh_scholar.logging_config import get_logger
 from tnh_scholar.metadata.metadata import Frontmatter, Metadata
-from tnh_scholar.utils import TimeMs
-from tnh_scholar.utils import TNHAudioSegment as AudioSegment
+from tnh_scholar.utils import ByteBudget, TimeMs, ordered_map
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class _BlockWork:
+    """A speaker block with its sliced audio, ready for a transcription worker."""
+
+    block: SpeakerLanguageBlock
+    segment_request: SegmentTranscriptionRequest
+    audio_bytes: int
+
+
 class ProviderBackedSegmentTranscriptionService(SegmentTranscriptionServiceProtocol):
     """Bridge to the existing provider transcription services."""
 
@@ -194,8 +204,8 @@ class SpeakerBlockLanguageSegmentationService(LanguageSegmentationServiceProtoco
             return [
                 self._build_fixed_language_block(block, request.source_language) for block in grouped_blocks
             ]
-        base_audio = AudioSegment.from_file(request.audio_file)
-        return [self._build_detected_block(block, base_audio) for block in grouped_blocks]
+        with DecodedAudio.open(request.audio_file) as source:
+            return [self._build_detected_block(block, source) for block in grouped_blocks]
 
     def _resolve_segments(
         self,
@@ -227,10 +237,9 @@ class SpeakerBlockLanguageSegmentationService(LanguageSegmentationServiceProtoco
     def _build_detected_block(
         self,
         block: SpeakerBlock,
-        base_audio: AudioSegment,
+        source: DecodedAudio,
     ) -> SpeakerLanguageBlock:
-        block_audio = base_audio[int(block.start) : int(block.end)]
-        language_code = self._probe_language(block, block_audio)
+        language_code = self._probe_language(block, source)
         is_uncertain = language_code is None
         return self._build_block(
             block,
@@ -267,7 +276,7 @@ class SpeakerBlockLanguageSegmentationService(LanguageSegmentationServiceProtoco
     def _probe_language(
         self,
         block: SpeakerBlock,
-        block_audio: AudioSegment,
+        source: DecodedAudio,
     ) -> str | None:
         probe_segment = AugDiarizedSegment(
             speaker=block.speaker,
@@ -278,9 +287,10 @@ class SpeakerBlockLanguageSegmentationService(LanguageSegmentationServiceProtoco
             spacing_time=None,
             gap_before_new=False,
             spacing_time_new=TimeMs(0),
-            audio=block_audio,
+            audio=None,
         )
-        language = str(self._probe.segment_language(probe_segment))
+        # The probe window is cut straight from the source; the block audio is never materialized
+        language = str(self._probe.segment_language(probe_segment, source=source))
         if language == "unknown":
             return None
         normalized_language = normalize_language_code(language)
@@ -423,47 +433,82 @@ class MultilingualTranscriptionService:
         if not blocks:
             return self.generate_subtitles(request.model_copy(update={"use_speaker_blocks": False}))
         translation_service = self._create_translation_service(request)
-        base_audio = AudioSegment.from_file(request.audio_file)
-        results = [
-            self._transcribe_block(request, block, translation_service, base_audio) for block in blocks
-        ]
+        budget = ByteBudget(request.max_inflight_audio_bytes)
+        # Blocks are sliced in order on this thread and handed to the workers, so
+        # slicing, transcription, and translation of different blocks overlap.
+        with DecodedAudio.open(request.audio_file) as source:
+            results = [
+                outcome.value
+                for outcome in ordered_map(
+                    lambda work: self._transcribe_block(work, translation_service, budget),
+                    self._iter_block_work(request, blocks, source, budget),
+                    max_workers=request.max_block_workers,
+                    capture_errors=False,
+                    thread_name_prefix="multilingual-block",
+                )
+            ]
         merge_service = self._create_merge_service(request.artifact_retention)
-        return merge_service.merge(results)
+        return merge_service.merge(cast(list[SegmentTranscriptionResult], results))
 
-    def _transcribe_block(
+    def _iter_block_work(
         self,
         request: MultilingualTranscriptionRequest,
-        block: SpeakerLanguageBlock,
+        blocks: list[SpeakerLanguageBlock],
+        source: DecodedAudio,
+        budget: ByteBudget,
+    ) -> Iterator[_BlockWork]:
+        """Slice each block once its PCM size fits in the in-flight audio budget."""
+        audio_file_extension = resolve_audio_format(request.audio_file)
+        for block in blocks:
+            audio_bytes = self._estimate_audio_bytes(block, source)
+            budget.acquire(audio_bytes)
+            try:
+                segment_request = SegmentTranscriptionRequest(
+                    audio_file=self._slice_audio(request.audio_file, block, source),
+                    audio_file_extension=audio_file_extension,
+                    provider=request.provider,
+                    source_language=block.detection.language_code,
+                    target_language=request.target_language,
+                    transcription_model=request.transcription_model,
+                    chars_per_caption=request.chars_per_caption,
+                )
+            except Exception:
+                budget.release(audio_bytes)
+                raise
+            yield _BlockWork(block=block, segment_request=segment_request, audio_bytes=audio_bytes)
+
+    def _transcribe_block(
+        self,
+        work: _BlockWork,
         translation_service: SegmentTranslationServiceProtocol,
-        base_audio: AudioSegment,
+        budget: ByteBudget,
     ) -> SegmentTranscriptionResult:
-        segment_request = SegmentTranscriptionRequest(
-            audio_file=self._slice_audio(request.audio_file, block, base_audio),
-            audio_file_extension=resolve_audio_format(request.audio_file),
-            provider=request.provider,
-            source_language=block.detection.language_code,
-            target_language=request.target_language,
-            transcription_model=request.transcription_model,
-            chars_per_caption=request.chars_per_caption,
-        )
-        transcribed = self._transcription_service.transcribe_segment(segment_request)
+        try:
+            transcribed = self._transcription_service.transcribe_segment(work.segment_request)
+        finally:
+            # Translation only needs the SRT, so free the audio budget for the next block
+            budget.release(work.audio_bytes)
         translated = translation_service.translate_segment(
             transcribed.model_copy(
                 update={
-                    "segment_start_ms": block.start_ms,
-                    "source_language": block.detection.language_code,
+                    "segment_start_ms": work.block.start_ms,
+                    "source_language": work.block.detection.language_code,
                 }
             )
         )
         return translated
 
+    def _estimate_audio_bytes(self, block: SpeakerLanguageBlock, source: DecodedAudio) -> int:
+        duration_ms = max(0, block.end_ms - block.start_ms)
+        return int(source.frame_count(ms=duration_ms)) * source.frame_width
+
     def _slice_audio(
         self,
         audio_file: Path,
         block: SpeakerLanguageBlock,
-        base_audio: AudioSegment,
+        source: DecodedAudio,
     ) -> Any:
-        return slice_audio_bytes(base_audio, block.start_ms, block.end_ms, audio_file)
+        return slice_audio_bytes(source, block.start_ms, block.end_ms, audio_file)
 
     def _should_use_speaker_blocks(
         self,
@@ -58,6 +58,7 @@ DEFAULT_MODEL = "whisper-1"
 DEFAULT_RESPONSE_FORMAT = "text"
 DEFAULT_CHUNK_DURATION = 120
 DEFAULT_MIN_CHUNK = 10
+DEFAULT_WORKERS = 1
 VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".mkv", ".wmv"}
 
 
@@ -102,6 +103,8 @@ class AudioTranscribeApp:
         self.start_time = config.start_time
         self.end_time = config.end_time
         self.prompt = config.prompt
+        self.workers = config.workers
+        self.requests_per_minute = config.requests_per_minute
         ensure_directory_exists(self.output_path.parent)
         ensure_directory_exists(self.temp_dir)
         self.audio_file: Path = self._resolve_audio_source()
@@ -123,6 +126,8 @@ class AudioTranscribeApp:
             diarization_config=self.diarization_config,
             transcriber=self.service,
             transcription_options=self.transcription_options,
+            max_workers=self.workers,
+            requests_per_minute=self.requests_per_minute,
         )
         self._echo_settings()
         transcript_texts = _normalize_transcript_texts(pipeline.run())
@@ -171,6 +176,8 @@ class AudioTranscribeApp:
         click.echo(f"  Min Chunk:           {self.min_chunk.to_seconds()} sec")
         click.echo(f"  Start Time:          {self.start_time}")
         click.echo(f"  End Time:            {self.end_time}")
+        click.echo(f"  Workers:             {self.workers}")
+        click.echo(f"  Requests/Minute:     {self.requests_per_minute or 'unlimited'}")
         click.echo(f"  Audio File:          {self.audio_file}")
         click.echo(f"  Prompt:              '{self.prompt}'")
 
@@ -401,6 +408,19 @@ def _log_invalid_transcript_text(transcript_text: Any) -> None:
 @click.option("--start_time", type=str, help="Start time offset for the input media (HH:MM:SS).")
 @click.option("--end_time", type=str, help="End time offset for the input media (HH:MM:SS).")
 @click.option("--prompt", type=str, default="", help="Prompt or keywords to guide the transcription.")
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    help="Number of chunks to transcribe concurrently (default: 1).",
+)
+@click.option(
+    "--requests_per_minute",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum transcription requests per minute across all workers (default: no limit).",
+)
 @click.option(
     "-n",
     "--no_transcribe",
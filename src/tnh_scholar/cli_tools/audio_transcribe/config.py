@@ -42,6 +42,12 @@ class AudioTranscribeConfig(BaseSettings):
     start_time: str | None = Field(default=None, description="Start time offset")
     end_time: str | None = Field(default=None, description="End time offset")
     prompt: str = Field(default="", description="Prompt or keywords")
+    workers: int = Field(default=1, ge=1, description="Chunks transcribed concurrently")
+    requests_per_minute: int | None = Field(
+        default=None,
+        ge=1,
+        description="Local cap on transcription requests per minute (no cap if None)",
+    )
 
     no_transcribe: bool = Field(
         default=False,
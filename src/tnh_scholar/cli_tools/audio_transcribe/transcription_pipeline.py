@@ -1,7 +1,10 @@
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
+from tnh_scholar.audio_processing.decoded_audio import DecodedAudio
 from tnh_scholar.audio_processing.diarization.audio import AudioHandler
 from tnh_scholar.audio_processing.diarization.config import DiarizationConfig
 from tnh_scholar.audio_processing.diarization.schemas import (
@@ -16,9 +19,30 @@ from tnh_scholar.audio_processing.transcription import (
     TranscriptionServiceFactory,
     patch_whisper_options,
 )
+from tnh_scholar.gen_ai_service.infra.rate_limit import TokenBucket
+from tnh_scholar.utils.concurrency_utils import ordered_map
 from tnh_scholar.utils.file_utils import ensure_directory_writable
 
 
+class RequestThrottle:
+    """Thread-safe requests-per-minute limit shared by concurrent transcription workers."""
+
+    def __init__(self, requests_per_minute: int, sleep: Callable[[float], None] = time.sleep):
+        if requests_per_minute < 1:
+            raise ValueError(f"requests_per_minute must be >= 1, got {requests_per_minute}")
+        self._bucket = TokenBucket.per_minute(requests_per_minute)
+        self._lock = threading.Lock()
+        self._sleep = sleep
+
+    def wait(self) -> float:
+        """Block until one more request may be sent; return the seconds waited."""
+        with self._lock:
+            wait_s = self._bucket.reserve(1)
+        if wait_s > 0:
+            self._sleep(wait_s)
+        return wait_s
+
+
 class TranscriptionPipeline:
     def __init__(
         self,
@@ -30,6 +54,8 @@ class TranscriptionPipeline:
         diarization_kwargs: Optional[Dict[str, Any]] = None,
         save_diarization: bool = True,
         logger: Optional[logging.Logger] = None,
+        max_workers: int = 1,
+        requests_per_minute: Optional[int] = None,
     ):
         """
         Initialize the TranscriptionPipeline.
@@ -43,7 +69,17 @@ class TranscriptionPipeline:
             diarization_kwargs (Optional[Dict[str, Any]]): Additional diarization arguments.
             save_diarization (bool): Whether to save raw diarization JSON results.
             logger (Optional[logging.Logger]): Logger for pipeline events.
+            max_workers (int): Chunks transcribed concurrently. With more than one
+                worker, audio for upcoming chunks is extracted while earlier
+                chunks are being transcribed.
+            requests_per_minute (Optional[int]): Local cap on transcription requests
+                across all workers; None disables the limit.
+
+        Raises:
+            ValueError: If max_workers or requests_per_minute is less than 1.
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
         self.logger = logger or logging.getLogger(__name__)
         self._validate_audio_file(audio_file)
         self._validate_output_dir(output_dir)
@@ -60,6 +96,8 @@ class TranscriptionPipeline:
             self.transcription_options = transcription_options
         self.diarization_kwargs = diarization_kwargs or {}
         self.save_diarization = save_diarization
+        self.max_workers = max_workers
+        self.throttle = RequestThrottle(requests_per_minute) if requests_per_minute is not None else None
 
         if self.save_diarization:
             self.diarization_dir = self.output_dir / f"{self.audio_file.stem}_diarization"
@@ -132,10 +170,8 @@ class TranscriptionPipeline:
             if not chunk_list:
                 self.logger.warning("No chunks produced from segments.")
                 return []
-            self.logger.info("Extracting audio chunks.")
-            self._extract_audio_chunks(chunk_list)
-            self.logger.info("Transcribing chunks.")
-            return self._transcribe_chunks(chunk_list)
+            self.logger.info(f"Extracting and transcribing {len(chunk_list)} chunks.")
+            return self._extract_and_transcribe_chunks(chunk_list)
         except Exception as exc:
             self._handle_pipeline_error(exc)
             return None
@@ -220,51 +256,66 @@ class TranscriptionPipeline:
             self.logger.error(f"Chunking segments failed: {exc}")
             raise RuntimeError(f"Chunking segments failed: {exc}") from exc
 
-    def _extract_audio_chunks(self, chunk_list: List[Any]) -> None:
+    def _extract_and_transcribe_chunks(self, chunk_list: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Stream chunks from audio extraction straight into transcription.
+
+        The source is decoded once and every chunk slices from the same mapped
+        PCM. Chunks whose extraction fails are logged and dropped.
         """
-        Extract audio chunks with error handling.
-        Remove failed chunks from the list and add error metadata for traceability.
+        with DecodedAudio.open(self.audio_file) as source:
+            return self._transcribe_chunks(self._iter_extracted_chunks(chunk_list, source))
+
+    def _iter_extracted_chunks(self, chunk_list: Iterable[Any], source: DecodedAudio) -> Iterator[Any]:
+        """
+        Yield each chunk once its audio is built; consumed lazily by the transcription pool.
         """
         audio_handler = AudioHandler()
-        successful_chunks: List[Any] = []
         for chunk in chunk_list:
             try:
-                audio_handler.build_audio_chunk(chunk, audio_file=self.audio_file)
-                successful_chunks.append(chunk)
+                audio_handler.build_audio_chunk(chunk, audio_file=self.audio_file, source=source)
             except Exception as exc:
                 self.logger.error(f"Audio chunk extraction failed for chunk {chunk}: {exc}")
-                # Do not add chunk to successful_chunks, effectively removing it from further processing
-        # Update chunk_list in place to only include successful chunks
-        chunk_list[:] = successful_chunks
+                continue
+            yield chunk
 
-    def _transcribe_chunks(self, chunk_list: List[Any]) -> List[Dict[str, Any]]:
+    def _transcribe_chunks(self, chunks: Iterable[Any]) -> List[Dict[str, Any]]:
         """
         Transcribe audio chunks with error handling.
+
+        Up to `max_workers` chunks are in flight at once; records are returned
+        in chunk order. Chunks without audio are skipped.
         """
         ts_service = TranscriptionServiceFactory.create_service(provider=self.transcriber)
         transcripts: List[Dict[str, Any]] = []
-        for chunk in chunk_list:
-            transcript_text = None
+        results = ordered_map(
+            lambda chunk: self._transcribe_chunk(ts_service, chunk),
+            self._iter_chunks_with_audio(chunks),
+            max_workers=self.max_workers,
+            thread_name_prefix="chunk-transcriber",
+        )
+        for result in results:
             error_detail = None
-            try:
-                audio = chunk.audio
-                if not audio:
-                    self.logger.warning(f"No audio data for chunk {chunk}. Skipping transcription.")
-                    continue
-                audio_obj = audio.data
-                transcript = ts_service.transcribe(
-                    audio_obj,
-                    self.transcription_options,
-                )
-                transcript_text = transcript.text
-                error_detail = None
-            except Exception as exc:
-                self.logger.error(f"Transcription failed for chunk {chunk}: {exc}")
-                transcript_text = None
-                error_detail = str(exc)
-            transcripts.append({"chunk": chunk, "transcript": transcript_text, "error": error_detail})
+            if result.error is not None:
+                self.logger.error(f"Transcription failed for chunk {result.item}: {result.error}")
+                error_detail = str(result.error)
+            transcripts.append({"chunk": result.item, "transcript": result.value, "error": error_detail})
         return transcripts
 
+    def _iter_chunks_with_audio(self, chunks: Iterable[Any]) -> Iterator[Any]:
+        for chunk in chunks:
+            if not chunk.audio:
+                self.logger.warning(f"No audio data for chunk {chunk}. Skipping transcription.")
+                continue
+            yield chunk
+
+    def _transcribe_chunk(self, ts_service: Any, chunk: Any) -> Optional[str]:
+        """Transcribe one chunk's audio, waiting on the request throttle if set."""
+        if self.throttle is not None:
+            self.throttle.wait()
+        transcript = ts_service.transcribe(chunk.audio.data, self.transcription_options)
+        return transcript.text
+
     def _handle_pipeline_error(self, exc: Exception) -> None:
         """
         Handle pipeline errors in a modular way.
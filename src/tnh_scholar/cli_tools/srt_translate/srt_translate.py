@@ -56,13 +56,19 @@ class SrtTranslator:
         pattern: Optional[Prompt] = None,
         model: Optional[str] = None,
         metadata: Optional[Metadata] = None,
+        max_workers: int = 1,
+        checkpoint_dir: Optional[Path] = None,
+        resume: bool = False,
     ):
-        """Initialize translator with language, model settings, and metadata."""
+        """Initialize translator with language, model settings, metadata, concurrency, and checkpointing."""
         self.source_language = source_language
         self.target_language = target_language
         self.pattern = pattern
         self.model = model
         self.metadata = metadata
+        self.max_workers = max_workers
+        self.checkpoint_dir = checkpoint_dir
+        self.resume = resume
 
     def parse_srt(self, content: str) -> List[SrtEntry]:
         """Parse SRT content into structured entries."""
@@ -99,6 +105,9 @@ class SrtTranslator:
             target_language=self.target_language,
             pattern=self.pattern,
             model=self.model,
+            max_workers=self.max_workers,
+            checkpoint_dir=self.checkpoint_dir,
+            resume=self.resume,
         )
         logger.debug(f"Text generated: \n{text_obj}")
         return text_obj
@@ -216,6 +225,24 @@ def load_metadata_from_file(metadata_file: Optional[Path]) -> Optional[Metadata]
 @click.option("-t", "--target-language", default="en", help="Target language code (default: en)")
 @click.option("-m", "--model", help="Optional model name to use for translation")
 @click.option("-p", "--pattern", help="Optional translation pattern name")
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of translation segments to send concurrently",
+)
+@click.option(
+    "--checkpoint-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Persist each translated segment under this directory so an interrupted run can resume",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Reuse segments checkpointed by an earlier interrupted run (default checkpoint dir if none given)",
+)
 @click.option("-g", "--debug", is_flag=True, help="Option to show debug output.")
 @click.option(
     "-d",
@@ -230,6 +257,9 @@ def srt_translate(
     target_language: str = "en",
     model: Optional[str] = None,
     pattern: Optional[str] = None,
+    workers: int = 1,
+    checkpoint_dir: Optional[Path] = None,
+    resume: bool = False,
     debug: Optional[bool] = False,
     metadata: Optional[Path] = None,
 ) -> None:
@@ -255,6 +285,9 @@ def srt_translate(
             pattern=pattern_obj,
             model=model,
             metadata=metadata_obj,
+            max_workers=workers,
+            checkpoint_dir=checkpoint_dir,
+            resume=resume,
         )
         translator.translate_and_save(input_file, output_path)
 
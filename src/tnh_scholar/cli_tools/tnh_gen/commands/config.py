@@ -8,6 +8,7 @@ from uuid import uuid4
 import typer
 
 from tnh_scholar.cli_tools.tnh_gen.config_loader import (
+    CLIConfig,
     available_keys,
     load_config,
     load_config_overrides,
@@ -47,8 +48,10 @@ def _coerce_for_set(key: ConfigKey, raw: str) -> str | float | int:
     Returns:
         Value coerced into the expected type for the key.
     """
-    if key == "prompt_catalog_dir":
+    if key in {"prompt_catalog_dir", "prompt_catalog_index_path"}:
         return str(Path(raw))
+    if key == "prompt_catalog_persistent_index":
+        return raw.strip().lower() in {"1", "true", "yes", "on"}
     if key in {"max_dollars", "default_temperature"}:
         return float(raw)
     return int(raw) if key == "max_input_chars" else raw
@@ -130,11 +133,18 @@ def _render_show_config(trace_id: str, format_override: OutputFormat | None) ->
     return _render_show_config_with_health(trace_id, format_override, catalog_health=False)
 
 
-def _catalog_health_payload(prompts_base: Path | None) -> dict[str, object]:
-    if prompts_base is None:
+def _catalog_health_payload(config: CLIConfig) -> dict[str, object]:
+    if config.prompt_catalog_dir is None:
         raise ValueError("No prompt catalog directory configured (set TNH_PROMPT_DIR or config).")
-    adapter = PromptsAdapter(prompts_base=prompts_base.expanduser())
-    health = adapter.scan_catalog_health()
+    adapter = PromptsAdapter(
+        prompts_base=config.prompt_catalog_dir.expanduser(),
+        persistent_index=config.prompt_catalog_persistent_index,
+        index_path=config.prompt_catalog_index_path,
+    )
+    try:
+        health = adapter.scan_catalog_health()
+    finally:
+        adapter.close()
     return {
         "errors": [issue.model_dump(mode="json") for issue in health.errors],
         "warnings": [issue.model_dump(mode="json") for issue in health.warnings],
@@ -161,7 +171,7 @@ def _render_show_config_with_health(
     human_payload: object = overrides
     text_fallback = _format_config_text(overrides)
     if catalog_health:
-        health_payload = _catalog_health_payload(config.prompt_catalog_dir)
+        health_payload = _catalog_health_payload(config)
         api_payload["catalog_health"] = health_payload
         api_payload["catalog_errors"] = health_payload["error_count"]
         human_payload = api_payload
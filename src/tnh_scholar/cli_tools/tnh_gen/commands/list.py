@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Iterable, cast
 from uuid import uuid4
 
 import typer
 
-from tnh_scholar.cli_tools.tnh_gen.config_loader import load_config
+from tnh_scholar.cli_tools.tnh_gen.config_loader import CLIConfig, load_config
 from tnh_scholar.cli_tools.tnh_gen.errors import exit_with_error
 from tnh_scholar.cli_tools.tnh_gen.output.formatter import format_table, render_output
 from tnh_scholar.cli_tools.tnh_gen.output.human_formatter import format_human_friendly_list
@@ -27,11 +26,12 @@ _EXPECTED_FRONTMATTER = (
 )
 
 
-def _build_adapter(prompts_base: Path | None) -> PromptsAdapter:
+def _build_adapter(config: CLIConfig) -> PromptsAdapter:
     """Build a prompts adapter rooted at the configured prompt directory.
 
     Args:
-        prompts_base: Base path for prompt catalog content.
+        config: Effective CLI config; its prompt catalog index settings decide
+            whether parsed prompts are reused across invocations.
 
     Returns:
         PromptsAdapter configured for the provided directory.
@@ -39,11 +39,15 @@ def _build_adapter(prompts_base: Path | None) -> PromptsAdapter:
     Raises:
         ValueError: If no prompt directory is configured.
     """
-    if prompts_base is None:
+    if config.prompt_catalog_dir is None:
         raise ValueError("No prompt catalog directory configured (set TNH_PROMPT_DIR or config).")
-    base = prompts_base.expanduser()
+    base = config.prompt_catalog_dir.expanduser()
     base.mkdir(parents=True, exist_ok=True)
-    return PromptsAdapter(prompts_base=base)
+    return PromptsAdapter(
+        prompts_base=base,
+        persistent_index=config.prompt_catalog_persistent_index,
+        index_path=config.prompt_catalog_index_path,
+    )
 
 
 def _apply_filters(
@@ -208,9 +212,12 @@ def _list_prompts_impl(
     format_override: ListOutputFormat | None,
 ) -> None:
     config, meta = load_config(ctx.config_path)
-    adapter = _build_adapter(config.prompt_catalog_dir)
-    prompts = list(_apply_filters(adapter.list_all(), tag, search))
-    catalog_health = adapter.catalog_health()
+    adapter = _build_adapter(config)
+    try:
+        prompts = list(_apply_filters(adapter.list_all(), tag, search))
+        catalog_health = adapter.catalog_health()
+    finally:
+        adapter.close()
     _emit_catalog_health_summary(catalog_health)
     if keys_only:
         _render_list(
@@ -41,6 +41,7 @@ from tnh_scholar.gen_ai_service.models.domain import (
 )
 from tnh_scholar.gen_ai_service.models.errors import SafetyBlocked
 from tnh_scholar.gen_ai_service.protocols import GenAIServiceProtocol
+from tnh_scholar.gen_ai_service.streaming import CompletionStream
 from tnh_scholar.metadata import Frontmatter, Metadata
 from tnh_scholar.prompt_system.domain.models import PromptMetadata, PromptOutputMode
 
@@ -96,7 +97,17 @@ class TnhGenCLIOptions:
         None, "--format", help="Output format: json or yaml (API mode only).", case_sensitive=False
     )
     NO_PROVENANCE = typer.Option(False, "--no-provenance", help="Omit provenance block in files.")
-    STREAMING = typer.Option(False, "--streaming", help="Enable streaming output (not implemented).")
+    STREAMING = typer.Option(
+        False,
+        "--stream",
+        "--streaming",
+        help="Write completion text to stdout/--output-file as it arrives (human mode only).",
+    )
+    CACHE = typer.Option(
+        None,
+        "--cache/--no-cache",
+        help="Reuse or bypass the on-disk completion cache (default: COMPLETION_CACHE_ENABLED).",
+    )
 
 
 # ---- Data Models ----
@@ -246,6 +257,7 @@ def _initialize_service(
     no_max_tokens_limit: bool,
     temperature: float | None,
     reasoning_effort: str | None,
+    completion_cache: bool | None = None,
 ) -> GenAIServiceProtocol:
     """Build GenAI service with config and overrides.
 
@@ -257,6 +269,7 @@ def _initialize_service(
         no_max_tokens_limit: Whether to resolve output tokens to the model maximum.
         temperature: Optional temperature override.
         reasoning_effort: Optional reasoning effort override.
+        completion_cache: Optional completion cache toggle (None keeps settings default).
 
     Returns:
         A configured GenAI service instance.
@@ -269,6 +282,7 @@ def _initialize_service(
         ),
         temperature=temperature,
         reasoning_effort=reasoning_effort,
+        completion_cache=completion_cache,
     )
     return factory.create_genai_service(config, overrides)
 
@@ -289,6 +303,7 @@ def _prepare_run_context(
     no_provenance: bool,
     trace_id: str,
     prompt_dir: Path | None = None,
+    completion_cache: bool | None = None,
 ) -> RunContext:
     """Prepare all context needed for prompt execution.
 
@@ -308,6 +323,7 @@ def _prepare_run_context(
         output_format: Preferred CLI output format for stdout.
         no_provenance: Whether to skip provenance header when writing files.
         trace_id: Unique trace identifier for this invocation.
+        completion_cache: Optional completion cache toggle from `--cache/--no-cache`.
 
     Returns:
         RunContext populated with config, service, metadata, and variables.
@@ -341,6 +357,7 @@ def _prepare_run_context(
         no_max_tokens_limit,
         temperature,
         reasoning_effort,
+        completion_cache=completion_cache,
     )
 
     # Get prompt metadata
@@ -646,6 +663,7 @@ def _emit_run_output(
     envelope: CompletionEnvelope,
     payload: RunOutcomePayload,
     api: bool,
+    streamed: bool = False,
 ) -> None:
     _emit_warnings(envelope, context.metadata, ctx.quiet, api)
     _emit_catalog_health_summary(context, api)
@@ -677,7 +695,8 @@ def _emit_run_output(
         )
         if not api:
             typer.echo(f"Wrote output to {context.output_file}", err=True)
-    _emit_stdout(payload, result_text, context.output_format, api)
+    if not streamed:
+        _emit_stdout(payload, result_text, context.output_format, api)
 
 
 def _failed_completion_exit_code(envelope: CompletionEnvelope) -> ExitCode:
@@ -687,17 +706,65 @@ def _failed_completion_exit_code(envelope: CompletionEnvelope) -> ExitCode:
     return ExitCode.PROVIDER_ERROR
 
 
-def _execute_prompt(context: RunContext) -> tuple[CompletionEnvelope, RunOutcomePayload]:
-    """Execute the prompt for the given context and build the success payload."""
-    user_input = str(context.variables.get("input_text", ""))
-    request = RenderRequest(
+def _render_request(context: RunContext) -> RenderRequest:
+    return RenderRequest(
         instruction_key=context.prompt_key,
-        user_input=user_input,
+        user_input=str(context.variables.get("input_text", "")),
         variables=context.variables,
         intent=context.intent,
         model=context.model_override,
     )
-    envelope = context.service.generate(request)
+
+
+def _execute_prompt(context: RunContext) -> tuple[CompletionEnvelope, RunOutcomePayload]:
+    """Execute the prompt for the given context and build the success payload."""
+    envelope = context.service.generate(_render_request(context))
+    payload = _build_success_payload(
+        envelope=envelope,
+        metadata=context.metadata,
+        config_meta=context.config_meta,
+        trace_id=context.trace_id,
+    )
+    return envelope, payload
+
+
+def _start_stream(context: RunContext) -> CompletionStream:
+    """Open a streaming completion (rendering, safety gate, and provider connect happen here)."""
+    generate_stream = getattr(context.service, "generate_stream", None)
+    if not callable(generate_stream):
+        raise ValueError("The configured GenAI service does not support --stream.")
+    return generate_stream(_render_request(context))
+
+
+def _drain_stream(
+    context: RunContext,
+    stream: CompletionStream,
+) -> tuple[CompletionEnvelope, RunOutcomePayload]:
+    """Echo deltas to stdout (and the output file) as they arrive, then build the payload.
+
+    The output file grows while the completion streams; on success
+    `_emit_run_output` rewrites it with the usual provenance header. A failed
+    or interrupted stream removes the partial file.
+    """
+    partial = None
+    if context.output_file is not None:
+        context.output_file.parent.mkdir(parents=True, exist_ok=True)
+        partial = context.output_file.open("w", encoding="utf-8")
+    completed = False
+    try:
+        for delta in stream:
+            typer.echo(delta, nl=False)
+            if partial is not None:
+                partial.write(delta)
+                partial.flush()
+        typer.echo("")
+        envelope = stream.envelope
+        completed = envelope.outcome is not CompletionOutcomeStatus.FAILED
+    finally:
+        if partial is not None:
+            partial.close()
+            if not completed and context.output_file is not None:
+                context.output_file.unlink(missing_ok=True)
     payload = _build_success_payload(
         envelope=envelope,
         metadata=context.metadata,
@@ -726,8 +793,8 @@ def _validate_run_options(
     max_tokens: int | None,
     no_max_tokens_limit: bool,
 ) -> None:
-    if streaming:
-        raise ValueError("Streaming output is not implemented yet.")
+    if streaming and ctx.api:
+        raise ValueError("--stream is not supported with --api; API output is a single JSON document.")
     if max_tokens is not None and no_max_tokens_limit:
         raise ValueError("--max-tokens and --no-max-tokens-limit cannot be used together.")
     if top_p is not None:
@@ -788,6 +855,7 @@ def run_prompt(
     format: OutputFormat | None = TnhGenCLIOptions.FORMAT,
     no_provenance: bool = TnhGenCLIOptions.NO_PROVENANCE,
     streaming: bool = TnhGenCLIOptions.STREAMING,
+    cache: bool | None = TnhGenCLIOptions.CACHE,
 ) -> None:
     """Execute a prompt with variable substitution and AI processing.
 
@@ -809,7 +877,8 @@ def run_prompt(
         output_file: Optional file to write the rendered text to.
         format: Output format for stdout.
         no_provenance: Whether to omit provenance header in written files.
-        streaming: Whether to request streaming (not yet implemented).
+        streaming: Whether to write completion text as it arrives (human mode only).
+        cache: Whether to consult the on-disk completion cache (None keeps settings default).
     """
     trace_id = uuid4().hex
 
@@ -841,12 +910,18 @@ def run_prompt(
                 output_format=format,
                 no_provenance=no_provenance,
                 trace_id=trace_id,
+                completion_cache=cache,
             )
 
-            # Execute prompt and build response payload
-            envelope, payload = _execute_prompt(context)
+            if streaming:
+                stream = _start_stream(context)
+            else:
+                # Execute prompt and build response payload
+                envelope, payload = _execute_prompt(context)
 
-        _emit_run_output(context, envelope, payload, ctx.api)
+        if streaming:
+            envelope, payload = _drain_stream(context, stream)
+        _emit_run_output(context, envelope, payload, ctx.api, streamed=streaming)
 
     except SafetyBlocked as exc:
         budget_details = _budget_block_details(exc)
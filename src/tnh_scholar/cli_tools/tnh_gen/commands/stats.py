@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from pathlib import Path
+from uuid import uuid4
+
+import typer
+
+from tnh_scholar.cli_tools.tnh_gen.errors import exit_with_error
+from tnh_scholar.cli_tools.tnh_gen.output.formatter import render_output
+from tnh_scholar.cli_tools.tnh_gen.output.policy import (
+    resolve_output_format,
+    validate_global_format,
+)
+from tnh_scholar.cli_tools.tnh_gen.state import OutputFormat, ctx
+from tnh_scholar.cli_tools.tnh_gen.types import StatsPayload, StatsSpanPayload, StatsUsagePayload
+from tnh_scholar.gen_ai_service.infra.metrics import default_metrics_path
+from tnh_scholar.gen_ai_service.infra.usage import (
+    MetricsSummary,
+    UsageTotals,
+    load_metrics_records,
+    summarize_metrics,
+)
+
+
+def _default_metrics_file() -> Path:
+    """Resolve the metrics file the service exports to (`METRICS_PATH` or the cache default)."""
+    from tnh_scholar.gen_ai_service.config.settings import GenAISettings
+
+    return GenAISettings().metrics_path or default_metrics_path()
+
+
+def _usage_payload(totals: UsageTotals) -> StatsUsagePayload:
+    return {
+        "requests": totals.requests,
+        "cache_hits": totals.cache_hits,
+        "cache_hit_rate": round(totals.cache_hit_rate, 4),
+        "tokens_in": totals.tokens_in,
+        "tokens_out": totals.tokens_out,
+        "cost_usd": round(totals.cost_usd, 6),
+        "retries": totals.retries,
+    }
+
+
+def _build_payload(path: Path, summary: MetricsSummary, trace_id: str) -> StatsPayload:
+    spans: dict[str, StatsSpanPayload] = {
+        name: {
+            "count": stats.count,
+            "errors": stats.errors,
+            "total_s": round(stats.total_s, 6),
+            "mean_s": round(stats.mean_s, 6),
+            "p50_s": round(stats.p50_s, 6),
+            "p95_s": round(stats.p95_s, 6),
+            "max_s": round(stats.max_s, 6),
+        }
+        for name, stats in summary.spans.items()
+    }
+    return {
+        "file": str(path),
+        "spans": spans,
+        "usage": _usage_payload(summary.usage),
+        "usage_by_model": {key: _usage_payload(totals) for key, totals in summary.usage_by_model.items()},
+        "trace_id": trace_id,
+    }
+
+
+def _render_text(payload: StatsPayload) -> str:
+    usage = payload["usage"]
+    lines = [
+        f"metrics: {payload['file']}",
+        f"requests {usage['requests']}  cache hits {usage['cache_hits']} "
+        f"({usage['cache_hit_rate']:.0%})  retries {usage['retries']}",
+        f"tokens in {usage['tokens_in']}  out {usage['tokens_out']}  cost ${usage['cost_usd']:.4f}",
+    ]
+    if payload["spans"]:
+        lines.append("")
+        lines.append(
+            f"{'span':<24}{'count':>7}{'errors':>8}{'mean_s':>10}{'p50_s':>10}{'p95_s':>10}{'max_s':>10}"
+        )
+        for name, stats in payload["spans"].items():
+            lines.append(
+                f"{name:<24}{stats['count']:>7}{stats['errors']:>8}{stats['mean_s']:>10.3f}"
+                f"{stats['p50_s']:>10.3f}{stats['p95_s']:>10.3f}{stats['max_s']:>10.3f}"
+            )
+    return "\n".join(lines)
+
+
+def stats(
+    file: Path | None = typer.Option(
+        None,
+        "--file",
+        help="Metrics JSONL file (defaults to METRICS_PATH or the user cache directory).",
+    ),
+    format: OutputFormat | None = typer.Option(
+        None,
+        "--format",
+        help="Output format: json (requires --api), yaml, or text (human-only).",
+        case_sensitive=False,
+    ),
+):
+    """Summarize recorded GenAI spans, latency, tokens, and cost.
+
+    Metrics are written when the service runs with `METRICS_ENABLED=true`.
+
+    Args:
+        file: Optional metrics file override.
+        format: Optional output format override (json or yaml).
+    """
+    trace_id = uuid4().hex
+    try:
+        validate_global_format(ctx.api, format or ctx.output_format)
+        path = file or _default_metrics_file()
+        if not path.exists():
+            raise FileNotFoundError(f"No metrics file at {path}; enable METRICS_ENABLED to record metrics.")
+        payload = _build_payload(path, summarize_metrics(load_metrics_records(path)), trace_id)
+
+        fmt = resolve_output_format(
+            api=ctx.api,
+            format_override=format or ctx.output_format,
+            default_format=OutputFormat.json if ctx.api else OutputFormat.text,
+        )
+        if fmt == OutputFormat.text:
+            typer.echo(_render_text(payload))
+        else:
+            typer.echo(render_output(payload, fmt))
+    except Exception as exc:  # noqa: BLE001
+        exit_with_error(exc, trace_id=trace_id, format_override=format)
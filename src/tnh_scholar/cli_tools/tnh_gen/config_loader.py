@@ -22,14 +22,16 @@ class CLIConfig(BaseModel):
     default_reasoning_effort: str | None = None
     api_key: str | None = None
     cli_path: str | None = None
+    prompt_catalog_persistent_index: bool = False
+    prompt_catalog_index_path: Path | None = None
 
-    @field_validator("prompt_catalog_dir", mode="before")
+    @field_validator("prompt_catalog_dir", "prompt_catalog_index_path", mode="before")
     @classmethod
     def _coerce_path(cls, value: Any) -> Any:
-        """Normalize prompt catalog value into a Path when provided.
+        """Normalize prompt catalog paths into a Path when provided.
 
         Args:
-            value: Raw value provided for the prompt catalog directory.
+            value: Raw value provided for the prompt catalog directory or index path.
 
         Returns:
             Either the original value or a coerced Path.
@@ -143,6 +145,8 @@ def load_config(
         "default_reasoning_effort": settings.default_reasoning_effort,
         "api_key": settings.openai_api_key,
         "cli_path": None,
+        "prompt_catalog_persistent_index": settings.prompt_catalog_persistent_index,
+        "prompt_catalog_index_path": settings.prompt_catalog_index_path,
     }
     sources: list[str] = ["defaults+env"]
     config_files: list[str] = []
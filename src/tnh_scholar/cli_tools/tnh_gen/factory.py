@@ -20,6 +20,7 @@ class ServiceOverrides:
     output_token_limit_mode: OutputTokenLimitMode | None = None
     temperature: float | None = None
     reasoning_effort: str | None = None
+    completion_cache: bool | None = None
 
 
 def cli_config_to_settings_kwargs(cli_config: CLIConfig, overrides: ServiceOverrides) -> SettingsKwargs:
@@ -53,6 +54,8 @@ def _apply_service_overrides(payload: SettingsKwargs, overrides: ServiceOverride
     if overrides.output_token_limit_mode is not None:
         payload["default_output_token_limit_mode"] = overrides.output_token_limit_mode
     payload["default_reasoning_effort"] = overrides.reasoning_effort
+    if overrides.completion_cache is not None:
+        payload["completion_cache_enabled"] = overrides.completion_cache
     # explicit model override stored in RenderRequest, not settings, but keep for completeness
     if overrides.model is not None:
         payload["default_model"] = overrides.model
@@ -13,6 +13,7 @@ from dotenv import find_dotenv, load_dotenv
 from tnh_scholar.cli_tools.tnh_gen.commands import config as config_cmd
 from tnh_scholar.cli_tools.tnh_gen.commands import list as list_cmd
 from tnh_scholar.cli_tools.tnh_gen.commands import run as run_cmd
+from tnh_scholar.cli_tools.tnh_gen.commands.stats import stats
 from tnh_scholar.cli_tools.tnh_gen.commands.version import version
 from tnh_scholar.cli_tools.tnh_gen.state import OutputFormat, ctx
 
@@ -112,6 +113,7 @@ app.add_typer(list_cmd.app, name="list")
 app.add_typer(run_cmd.app, name="run")
 app.add_typer(config_cmd.app, name="config")
 app.command()(version)
+app.command()(stats)
 
 
 def main() -> None:
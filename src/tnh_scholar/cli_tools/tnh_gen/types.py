@@ -17,6 +17,8 @@ ConfigKey = Literal[
     "default_reasoning_effort",
     "api_key",
     "cli_path",
+    "prompt_catalog_persistent_index",
+    "prompt_catalog_index_path",
 ]
 
 
@@ -27,8 +29,11 @@ class ConfigData(TypedDict, total=False):
     max_input_chars: int | None
     default_temperature: float | None
     default_reasoning_effort: str | None
+    completion_cache_enabled: bool
     api_key: str | None
     cli_path: str | None
+    prompt_catalog_persistent_index: bool
+    prompt_catalog_index_path: str | Path | None
 
 
 class ConfigMeta(TypedDict):
@@ -46,6 +51,8 @@ class ConfigValuePayload(TypedDict):
     default_reasoning_effort: NotRequired[str | None]
     api_key: NotRequired[str | None]
     cli_path: NotRequired[str | None]
+    prompt_catalog_persistent_index: NotRequired[bool]
+    prompt_catalog_index_path: NotRequired[str | Path | None]
 
 
 class ConfigShowPayload(TypedDict):
@@ -228,3 +235,31 @@ class SettingsKwargs(TypedDict, total=False):
     default_max_output_tokens: int
     default_output_token_limit_mode: OutputTokenLimitMode
     default_reasoning_effort: str | None
+
+
+class StatsSpanPayload(TypedDict):
+    count: int
+    errors: int
+    total_s: float
+    mean_s: float
+    p50_s: float
+    p95_s: float
+    max_s: float
+
+
+class StatsUsagePayload(TypedDict):
+    requests: int
+    cache_hits: int
+    cache_hit_rate: float
+    tokens_in: int
+    tokens_out: int
+    cost_usd: float
+    retries: int
+
+
+class StatsPayload(TypedDict):
+    file: str
+    spans: dict[str, StatsSpanPayload]
+    usage: StatsUsagePayload
+    usage_by_model: dict[str, StatsUsagePayload]
+    trace_id: str
@@ -11,6 +11,7 @@ Connected modules:
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Union
@@ -50,13 +51,20 @@ POLICY = SimpleCompletionPolicy()
 
 # Global service instance (initialized on first use)
 _service: Optional[GenAIService] = None
+_service_lock = threading.Lock()
 
 
 def _get_service() -> GenAIService:
-    """Get or initialize the global GenAIService instance."""
+    """Get or initialize the global GenAIService instance.
+
+    Concurrent first calls (e.g. section or translation workers) share one
+    instance, and with it one rate limiter pool and completion cache.
+    """
     global _service
     if _service is None:
-        _service = GenAIService()
+        with _service_lock:
+            if _service is None:
+                _service = GenAIService()
     return _service
 
 
@@ -72,8 +80,9 @@ def simple_completion(
     Simple completion interface compatible with legacy openai_interface usage.
 
     This is a migration adapter that provides a simple API similar to the legacy
-    run_immediate_completion_simple() function. It uses the OpenAI client directly,
-    bypassing the pattern catalog to allow drop-in replacement during migration.
+    run_immediate_completion_simple() function. It sends the request through
+    `GenAIService.call_provider`, bypassing the pattern catalog to allow drop-in
+    replacement during migration while still sharing the service's rate limiter.
 
     NOTE: This bypasses GenAIService's pattern catalog. It's intentional for migration
     to allow replacing legacy calls without first moving prompts to the catalog.
@@ -114,9 +123,8 @@ def simple_completion(
     """
     from tnh_scholar.gen_ai_service.models.transport import ProviderRequest, ProviderStatus
 
-    # Get or create OpenAI client from service (reuse existing setup)
+    # Reuse the shared service so every caller draws from one rate limiter pool
     service = _get_service()
-    client = service.openai_client
 
     # Build messages
     messages = []
@@ -137,8 +145,8 @@ def simple_completion(
     )
 
     try:
-        # Call OpenAI client directly
-        response = client.generate(provider_request)
+        # Rate-limited provider call (no catalog, safety gate, or cache)
+        response = service.call_provider(provider_request)
 
         # Check status
         if response.status != ProviderStatus.OK:
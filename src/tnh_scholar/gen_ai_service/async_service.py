@@ -0,0 +1,121 @@
+"""async_service.py: Asyncio GenAIService Orchestrator.
+
+Extends GenAIService with an asyncio entry point so callers can keep many
+provider calls in flight at once. Preparation (catalog → policy → router →
+safety gate) and finalization (provenance, completion mapping, JSON contract)
+are shared with the synchronous service; only the provider call is awaited.
+
+Connected modules:
+  - service.GenAIService
+  - providers.openai_client.AsyncOpenAIClient
+  - config.settings.GenAISettings (max_concurrent_requests)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Sequence
+
+from tnh_scholar.gen_ai_service.config.settings import GenAISettings
+from tnh_scholar.gen_ai_service.infra.tracer import span
+from tnh_scholar.gen_ai_service.models.domain import CompletionEnvelope, RenderRequest
+from tnh_scholar.gen_ai_service.models.transport import ProviderResponse
+from tnh_scholar.gen_ai_service.providers.openai_client import AsyncOpenAIClient
+from tnh_scholar.gen_ai_service.service import GenAIService
+
+__all__ = [
+    "AsyncGenAIService",
+]
+
+
+class AsyncGenAIService(GenAIService):
+    """GenAIService with bounded-concurrency async generation.
+
+    Usage:
+        service = AsyncGenAIService()
+        envelopes = asyncio.run(service.generate_many(requests, max_concurrency=12))
+    """
+
+    def __init__(self, settings: GenAISettings | None = None):
+        super().__init__(settings)
+        self.async_openai_client: AsyncOpenAIClient = AsyncOpenAIClient(
+            self.settings.openai_api_key,
+            None,
+        )
+
+    async def generate_async(self, request: RenderRequest) -> CompletionEnvelope:
+        """Await a single completion through the standard service pipeline."""
+        with span("genai.generate", instruction_key=request.instruction_key):
+            return await self._generate_async(request)
+
+    async def _generate_async(self, request: RenderRequest) -> CompletionEnvelope:
+        prepared = self._prepare_call(request)
+        if cached := self._cached_response(prepared):
+            return self._finalize_cached(prepared, cached)
+        selection = prepared.selection
+        with span("genai.rate_limit", model=selection.model):
+            rate_limit = await self.rate_limits.acquire_async(
+                selection.provider,
+                selection.model,
+                prepared.safety_report.prompt_tokens,
+            )
+
+        started = datetime.now()
+        with span("genai.provider_call", provider=selection.provider, model=selection.model) as call:
+            if selection.provider == "openai":
+                response: ProviderResponse = await self.async_openai_client.generate(
+                    prepared.provider_request
+                )
+            else:
+                raise NotImplementedError(selection.provider)
+            call.set(attempts=response.attempts)
+        finished = datetime.now()
+        self._store_response(prepared, response)
+
+        return self._finalize_call(
+            prepared,
+            response,
+            started_at=started,
+            finished_at=finished,
+            rate_limit=rate_limit,
+        )
+
+    async def generate_many(
+        self,
+        requests: Sequence[RenderRequest],
+        *,
+        max_concurrency: int | None = None,
+    ) -> list[CompletionEnvelope]:
+        """Generate completions for all requests with at most `max_concurrency` in flight.
+
+        Args:
+            requests: Render requests to dispatch.
+            max_concurrency: Concurrency bound; defaults to
+                `settings.max_concurrent_requests`.
+
+        Returns:
+            Envelopes in the same order as `requests`.
+
+        Raises:
+            ValueError: If the effective `max_concurrency` is less than 1.
+            The first exception raised by any request (e.g. SafetyBlocked,
+            ProviderError); requests still pending are cancelled.
+        """
+        limit = max_concurrency if max_concurrency is not None else self.settings.max_concurrent_requests
+        if limit < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {limit}")
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _bounded(request: RenderRequest) -> CompletionEnvelope:
+            async with semaphore:
+                return await self.generate_async(request)
+
+        tasks = [asyncio.ensure_future(_bounded(request)) for request in requests]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -0,0 +1,193 @@
+"""Batch Runner.
+
+Drives a provider batch job end to end: upload a chat-completions JSONL file,
+create the batch, poll with exponential backoff until it reaches a terminal
+state, then download the output/error files and map each line back to its
+request by `custom_id`. Results are returned in input-file order.
+
+Responses are mapped through `OpenAIAdapter.from_openai_response`, so batch
+items carry the same `ProviderResponse` envelope as synchronous calls.
+
+Connected modules:
+  - providers.base.BatchProviderClient
+  - providers.openai_batch_client / providers.local_batch_client
+  - journal_processing.journal_process.start_batch_with_retries
+  - ai_text_processing.openai_process_interface
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+from openai.types.chat import ChatCompletion
+from pydantic import ValidationError as PydanticValidationError
+
+from tnh_scholar.gen_ai_service.config.settings import GenAISettings
+from tnh_scholar.gen_ai_service.models.batch import BatchItemResult, BatchJob, BatchStatus
+from tnh_scholar.gen_ai_service.models.errors import BatchJobFailed, ProviderError
+from tnh_scholar.gen_ai_service.models.transport import ProviderRequest
+from tnh_scholar.gen_ai_service.providers.base import BatchProviderClient
+from tnh_scholar.gen_ai_service.providers.openai_adapter import OpenAIAdapter, chat_request_kwargs
+from tnh_scholar.gen_ai_service.providers.openai_batch_client import OpenAIBatchClient
+from tnh_scholar.logging_config import get_logger
+
+__all__ = [
+    "BatchRunner",
+    "batch_request_line",
+    "write_batch_file",
+]
+
+logger = get_logger(__name__)
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+
+def batch_request_line(custom_id: str, request: ProviderRequest) -> dict[str, Any]:
+    """Build one chat-completions batch line from a `ProviderRequest`."""
+    openai_request = OpenAIAdapter().to_openai_request(request)
+    body = chat_request_kwargs(openai_request)
+    if isinstance(openai_request.response_format, Mapping):
+        body["response_format"] = dict(openai_request.response_format)
+    body = {key: value for key, value in body.items() if value is not None}
+    return {"custom_id": custom_id, "method": "POST", "url": CHAT_COMPLETIONS_ENDPOINT, "body": body}
+
+
+def write_batch_file(lines: Iterable[Mapping[str, Any]], path: Path) -> Path:
+    """Write batch request lines as JSONL and return the path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        for line in lines:
+            json.dump(line, handle, ensure_ascii=False)
+            handle.write("\n")
+    return path
+
+
+class BatchRunner:
+    """Submit, poll, and collect a provider batch job.
+
+    Args:
+        client: Provider batch seam (OpenAI or local stand-in).
+        poll_interval: Initial seconds between status polls.
+        max_poll_interval: Upper bound for the backed-off poll interval.
+        backoff: Multiplier applied to the poll interval after each poll.
+        timeout: Seconds to wait for a terminal status before giving up; the
+            batch is then cancelled so a resubmission is not billed twice.
+    """
+
+    def __init__(
+        self,
+        client: BatchProviderClient,
+        *,
+        poll_interval: float = 10.0,
+        max_poll_interval: float = 300.0,
+        backoff: float = 1.5,
+        timeout: float = 24 * 3600,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self._sleep = sleep
+        self._clock = clock
+        self._adapter = OpenAIAdapter()
+
+    @classmethod
+    def from_settings(cls, settings: GenAISettings | None = None, **kwargs: Any) -> "BatchRunner":
+        """Build a runner backed by the OpenAI Batch API."""
+        settings = settings or GenAISettings()
+        return cls(OpenAIBatchClient(settings.openai_api_key, settings.openai_org), **kwargs)
+
+    def submit(self, jsonl_path: Path, *, description: str = "") -> BatchJob:
+        file_id = self.client.upload_batch_file(Path(jsonl_path))
+        job = self.client.create_batch(file_id, endpoint=CHAT_COMPLETIONS_ENDPOINT, description=description)
+        logger.info(f"Submitted batch {job.id} for '{description or jsonl_path}' (input file {file_id})")
+        return job
+
+    def wait(self, job: BatchJob) -> BatchJob:
+        """Poll until `job` is terminal; raises BatchJobFailed unless it completed.
+
+        On timeout the remote batch is cancelled before raising.
+        """
+        deadline = self._clock() + self.timeout
+        interval = self.poll_interval
+        while not job.status.is_terminal:
+            if self._clock() >= deadline:
+                self._cancel(job)
+                raise BatchJobFailed(
+                    f"Batch {job.id} did not finish within {self.timeout}s (status {job.status.value})"
+                )
+            self._sleep(interval)
+            interval = min(interval * self.backoff, self.max_poll_interval)
+            job = self.client.retrieve_batch(job.id)
+            logger.debug(
+                f"Batch {job.id}: {job.status.value} "
+                f"({job.request_counts.completed}/{job.request_counts.total} done, "
+                f"{job.request_counts.failed} failed)"
+            )
+        if job.status is not BatchStatus.COMPLETED:
+            detail = f": {'; '.join(job.errors)}" if job.errors else ""
+            raise BatchJobFailed(f"Batch {job.id} ended with status {job.status.value}{detail}")
+        return job
+
+    def _cancel(self, job: BatchJob) -> None:
+        try:
+            cancelled = self.client.cancel_batch(job.id)
+        except ProviderError as exc:
+            logger.warning(f"Could not cancel timed-out batch {job.id}: {exc}")
+            return
+        logger.info(f"Cancelled timed-out batch {job.id} (status {cancelled.status.value})")
+
+    def collect(self, job: BatchJob, custom_ids: list[str]) -> list[BatchItemResult]:
+        """Download output/error files and return one result per custom_id, in order."""
+        results: dict[str, BatchItemResult] = {}
+        for file_id in (job.output_file_id, job.error_file_id):
+            if file_id is None:
+                continue
+            for line in self.client.download_file(file_id).splitlines():
+                if line.strip():
+                    item = self._parse_output_line(json.loads(line))
+                    results[item.custom_id] = item
+        return [
+            results.get(custom_id, BatchItemResult(custom_id=custom_id, error="missing from batch output"))
+            for custom_id in custom_ids
+        ]
+
+    def run(self, jsonl_path: Path, *, description: str = "") -> list[BatchItemResult]:
+        """Submit `jsonl_path`, wait for completion, and return results in input order."""
+        custom_ids = _read_custom_ids(Path(jsonl_path))
+        job = self.wait(self.submit(jsonl_path, description=description))
+        return self.collect(job, custom_ids)
+
+    def _parse_output_line(self, line: Mapping[str, Any]) -> BatchItemResult:
+        custom_id = str(line.get("custom_id"))
+        if error := line.get("error"):
+            message = error.get("message") if isinstance(error, Mapping) else error
+            return BatchItemResult(custom_id=custom_id, error=str(message))
+        response = line.get("response") or {}
+        status_code = response.get("status_code")
+        body = response.get("body")
+        if status_code != 200 or not isinstance(body, Mapping):
+            return BatchItemResult(custom_id=custom_id, error=f"HTTP {status_code}: {body}")
+        try:
+            completion = ChatCompletion.model_validate(body)
+        except PydanticValidationError as exc:
+            return BatchItemResult(custom_id=custom_id, error=f"Unreadable completion body: {exc}")
+        provider_response = self._adapter.from_openai_response(
+            completion,
+            model=completion.model,
+            provider=self.client.provider,
+            attempts=1,
+        )
+        return BatchItemResult(custom_id=custom_id, response=provider_response)
+
+
+def _read_custom_ids(jsonl_path: Path) -> list[str]:
+    with jsonl_path.open("r", encoding="utf-8") as handle:
+        return [str(json.loads(line)["custom_id"]) for line in handle if line.strip()]
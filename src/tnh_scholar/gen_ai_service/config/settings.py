@@ -11,7 +11,7 @@ and adapters.
 
 Connected modules:
   - service.GenAIService
-  - infra.rate_limit, infra.retry_policy
+  - infra.rate_limit, infra.retry_policy, infra.metrics
   - providers.base.ProviderClient
 """
 
@@ -64,6 +64,24 @@ class GenAISettings(BaseSettings):
     default_seed: int | None = None
     max_input_chars: int = 120_000
     max_dollars: float = 0.30
+    # Upper bound on provider calls in flight for AsyncGenAIService.generate_many
+    max_concurrent_requests: int = Field(default=8, ge=1)
+    # Provider registry `rate_limits` tier to enforce locally (e.g. "tier_1"); None disables
+    rate_limit_tier: str | None = None
+
+    # Opt-in on-disk prompt catalog index (see prompt_system.transport.catalog_index)
+    prompt_catalog_persistent_index: bool = False
+    prompt_catalog_index_path: Path | None = None  # defaults to the user cache dir
+
+    # Opt-in on-disk completion cache (see infra.completion_cache)
+    completion_cache_enabled: bool = False
+    completion_cache_path: Path | None = None  # defaults to the user cache dir
+    completion_cache_max_bytes: int = Field(default=256 * 1024 * 1024, ge=1)
+    completion_cache_ttl_s: float | None = Field(default=30 * 24 * 3600, gt=0)
+
+    # Opt-in JSONL export of spans and usage records (see infra.metrics, `tnh-gen stats`)
+    metrics_enabled: bool = False
+    metrics_path: Path | None = None  # defaults to the user cache dir
     registry_staleness_warn: bool = True
     registry_staleness_threshold_days: int = 90
 
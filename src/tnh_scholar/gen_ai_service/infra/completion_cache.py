@@ -0,0 +1,200 @@
+"""Completion Cache.
+
+Opt-in, content-addressed on-disk cache of provider responses. Entries are
+keyed on the prompt `Fingerprint` (prompt bytes, variables, user input) plus
+the resolved provider, model, and request parameters, so a rerun of the same
+pipeline over the same transcript reuses completions instead of re-paying
+for them.
+
+Storage is a single SQLite file (stdlib `sqlite3`). Eviction is least-recently
+used once the stored payload size exceeds `max_bytes`; entries older than
+`ttl_s` are treated as misses and dropped on access.
+
+Only successful, plain-text provider responses are cached; failures and
+responses carrying SDK-parsed Pydantic objects are always re-requested.
+
+Connected modules:
+  - service.GenAIService
+  - infra.tracking.fingerprint
+  - config.settings.GenAISettings (completion_cache_*)
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from platformdirs import user_cache_dir
+from pydantic import ValidationError as PydanticValidationError
+
+from tnh_scholar.gen_ai_service.infra.tracking.fingerprint import sha256_bytes
+from tnh_scholar.gen_ai_service.models.domain import Fingerprint
+from tnh_scholar.gen_ai_service.models.transport import ProviderRequest, ProviderResponse, ProviderStatus
+from tnh_scholar.logging_config import get_logger
+
+__all__ = [
+    "CacheStats",
+    "CompletionCache",
+    "completion_cache_key",
+    "default_completion_cache_path",
+]
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS completions (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS completions_accessed_at ON completions (accessed_at);
+"""
+
+
+def default_completion_cache_path() -> Path:
+    """Default cache location under the per-user cache directory."""
+    return Path(user_cache_dir("tnh-scholar")) / "genai" / "completions.sqlite3"
+
+
+def completion_cache_key(fingerprint: Fingerprint, request: ProviderRequest) -> str:
+    """Build a deterministic cache key from a fingerprint and provider request params."""
+    response_format = request.response_format
+    if isinstance(response_format, type):
+        response_format_key: object = f"{response_format.__module__}.{response_format.__qualname__}"
+    else:
+        response_format_key = response_format
+    material = {
+        "fingerprint": fingerprint.model_dump(exclude={"prompt_base_path"}),
+        "provider": request.provider,
+        "model": request.model,
+        "temperature": request.temperature,
+        "max_output_tokens": request.max_output_tokens,
+        "seed": request.seed,
+        "reasoning_effort": request.reasoning_effort,
+        "response_format": response_format_key,
+    }
+    canonical = json.dumps(material, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return sha256_bytes(canonical.encode("utf-8"))
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss/eviction counters for one cache instance."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+class CompletionCache:
+    """SQLite-backed LRU + TTL cache of `ProviderResponse`s."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_s: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self.stats = CacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> ProviderResponse | None:
+        """Return the cached response for `key`, or None on miss/expiry."""
+        now = self._clock()
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT payload, created_at FROM completions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            payload, created_at = row
+            if self.ttl_s is not None and now - created_at > self.ttl_s:
+                conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+                self.stats.misses += 1
+                return None
+            conn.execute("UPDATE completions SET accessed_at = ? WHERE key = ?", (now, key))
+        try:
+            response = ProviderResponse.model_validate_json(payload)
+        except PydanticValidationError:
+            logger.warning(f"Discarding unreadable completion cache entry {key}")
+            self.delete(key)
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return response
+
+    def put(self, key: str, response: ProviderResponse) -> bool:
+        """Store a response if it is cacheable; returns whether it was stored."""
+        if not self.is_cacheable(response):
+            return False
+        payload = response.model_dump_json()
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return False
+        now = self._clock()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO completions (key, payload, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, size, now, now),
+            )
+            self.stats.evictions += self._evict(conn)
+        self.stats.stores += 1
+        return True
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM completions")
+
+    def total_bytes(self) -> int:
+        with self._lock, self._connect() as conn:
+            return int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM completions").fetchone()[0])
+
+    def __len__(self) -> int:
+        with self._lock, self._connect() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM completions").fetchone()[0])
+
+    @staticmethod
+    def is_cacheable(response: ProviderResponse) -> bool:
+        payload = response.payload
+        return response.status is ProviderStatus.OK and payload is not None and payload.parsed is None
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Delete least-recently-accessed rows until the cache fits in max_bytes."""
+        total = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM completions").fetchone()[0])
+        if total <= self.max_bytes:
+            return 0
+        evicted = 0
+        rows = conn.execute("SELECT key, size FROM completions ORDER BY accessed_at ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        return evicted
+
+    def _connect(self) -> closing[sqlite3.Connection]:
+        # Short-lived autocommit connections keep the cache safe across threads and processes.
+        return closing(sqlite3.connect(self.path, timeout=30.0, isolation_level=None))
@@ -3,7 +3,196 @@
 Aggregates operational metrics (latency, throughput, errors).
 Adapters report metrics via a common interface for monitoring and dashboards.
 
+`MetricsRegistry` is the in-process aggregator: labelled counters and
+histograms (count/sum/min/max). Structured records (spans from
+`infra.tracer`, per-call usage from `infra.usage`) are also forwarded to any
+attached `MetricsSink`; `JsonlMetricsExporter` appends them to a JSONL file
+that `tnh-gen stats` summarizes across runs.
+
 Connected modules:
   - infra.tracer
+  - infra.usage
   - providers.*_adapter
 """
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Protocol
+
+from platformdirs import user_cache_dir
+
+from tnh_scholar.logging_config import get_logger
+
+__all__ = [
+    "HistogramSummary",
+    "JsonlMetricsExporter",
+    "MetricsRegistry",
+    "MetricsSink",
+    "MetricsSnapshot",
+    "default_metrics_path",
+    "get_metrics",
+    "set_metrics",
+]
+
+logger = get_logger(__name__)
+
+LabelKey = tuple[tuple[str, str], ...]
+MetricKey = tuple[str, LabelKey]
+MetricRecord = Mapping[str, Any]
+
+
+def default_metrics_path() -> Path:
+    """Default JSONL metrics location under the per-user cache directory."""
+    return Path(user_cache_dir("tnh-scholar")) / "genai" / "metrics.jsonl"
+
+
+class MetricsSink(Protocol):
+    """Receives structured metric records (spans, usage)."""
+
+    def emit(self, record: MetricRecord) -> None: ...
+
+
+@dataclass
+class HistogramSummary:
+    """Running count/sum/min/max for one histogram series."""
+
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = float("-inf")
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time copy of registry series, keyed `name{label=value,...}`."""
+
+    counters: dict[str, float]
+    histograms: dict[str, HistogramSummary]
+
+
+class MetricsRegistry:
+    """Thread-safe in-process counters, histograms, and record fan-out."""
+
+    def __init__(self) -> None:
+        self._counters: dict[MetricKey, float] = {}
+        self._histograms: dict[MetricKey, HistogramSummary] = {}
+        self._sinks: list[MetricsSink] = []
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1.0, **labels: object) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: object) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._histograms.setdefault(key, HistogramSummary()).observe(value)
+
+    def counter_value(self, name: str, **labels: object) -> float:
+        with self._lock:
+            return self._counters.get((name, _label_key(labels)), 0.0)
+
+    def histogram(self, name: str, **labels: object) -> HistogramSummary | None:
+        with self._lock:
+            summary = self._histograms.get((name, _label_key(labels)))
+            return None if summary is None else HistogramSummary(**vars(summary))
+
+    def emit(self, record: MetricRecord) -> None:
+        """Forward a structured record to every sink; sink failures are logged, not raised."""
+        with self._lock:
+            sinks = list(self._sinks)
+        for sink in sinks:
+            try:
+                sink.emit(record)
+            except Exception as exc:  # noqa: BLE001 - metrics must never break a call
+                logger.warning(f"Metrics sink {sink!r} failed: {exc}")
+
+    def add_sink(self, sink: MetricsSink) -> None:
+        with self._lock:
+            if sink not in self._sinks:
+                self._sinks.append(sink)
+
+    def remove_sink(self, sink: MetricsSink) -> None:
+        with self._lock:
+            if sink in self._sinks:
+                self._sinks.remove(sink)
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            return MetricsSnapshot(
+                counters={_series_name(key): value for key, value in self._counters.items()},
+                histograms={
+                    _series_name(key): HistogramSummary(**vars(summary))
+                    for key, summary in self._histograms.items()
+                },
+            )
+
+    def reset(self) -> None:
+        """Clear all series (sinks stay attached)."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+class JsonlMetricsExporter:
+    """Appends metric records to a JSONL file, one record per line."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def emit(self, record: MetricRecord) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, JsonlMetricsExporter) and other.path == self.path
+
+    def __hash__(self) -> int:
+        return hash(self.path)
+
+    def __repr__(self) -> str:
+        return f"JsonlMetricsExporter({str(self.path)!r})"
+
+
+def _label_key(labels: Mapping[str, object]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items() if value is not None))
+
+
+def _series_name(key: MetricKey) -> str:
+    name, labels = key
+    if not labels:
+        return name
+    return f"{name}{{{','.join(f'{k}={v}' for k, v in labels)}}}"
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _registry
+
+
+def set_metrics(registry: MetricsRegistry) -> MetricsRegistry:
+    """Replace the process-wide registry (tests, embedding apps); returns the previous one."""
+    global _registry
+    previous, _registry = _registry, registry
+    return previous
@@ -1,9 +1,224 @@
 """Rate Limiting Infrastructure.
 
-Implements global or provider-specific rate-limiting policies using
-token bucket or exponential backoff strategies.
+Implements provider/model-scoped rate limiting with paired token buckets that
+meter requests-per-minute and tokens-per-minute. Limits come from the
+`rate_limits` tiers declared in the provider registry JSONC files; the active
+tier is selected by `GenAISettings.rate_limit_tier`.
+
+Callers never fail on a local limit: `acquire()` reserves capacity and blocks
+(or `acquire_async()` awaits) until the reservation is due. Reservations are
+debited immediately, so concurrent callers queue in arrival order without
+holding the lock while they wait. Prompt tokens are metered up front (the
+count already produced by `safety_gate.pre_check`); completion tokens are
+settled after the response via `settle()`.
 
 Connected modules:
   - providers.*_adapter
   - service.GenAIService
+  - config.registry (rate_limits tiers)
 """
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from tnh_scholar.exceptions import ConfigurationError
+from tnh_scholar.gen_ai_service.config.registry import get_registry_loader
+from tnh_scholar.gen_ai_service.models.registry import RateLimitTier
+from tnh_scholar.logging_config import get_logger
+
+__all__ = [
+    "RateLimiter",
+    "RateLimiterPool",
+    "TokenBucket",
+]
+
+logger = get_logger(__name__)
+
+Clock = Callable[[], float]
+_SECONDS_PER_MINUTE = 60.0
+
+
+class TokenBucket:
+    """Continuously refilling token bucket that supports advance reservations.
+
+    The balance may go negative: a reservation that exceeds the available
+    capacity is granted immediately and the caller is told how long to wait
+    before the reserved capacity is actually available.
+    """
+
+    def __init__(self, capacity: float, refill_per_s: float, *, clock: Clock = time.monotonic) -> None:
+        if capacity <= 0 or refill_per_s <= 0:
+            raise ValueError("TokenBucket capacity and refill rate must be positive")
+        self.capacity = float(capacity)
+        self.refill_per_s = float(refill_per_s)
+        self._clock = clock
+        self._balance = float(capacity)
+        self._updated = clock()
+
+    @classmethod
+    def per_minute(cls, limit: int, *, clock: Clock = time.monotonic) -> "TokenBucket":
+        return cls(limit, limit / _SECONDS_PER_MINUTE, clock=clock)
+
+    @property
+    def balance(self) -> float:
+        self._refill()
+        return self._balance
+
+    def reserve(self, amount: float) -> float:
+        """Debit `amount` and return the seconds until that capacity is available."""
+        self._refill()
+        self._balance -= amount
+        if self._balance >= 0:
+            return 0.0
+        return -self._balance / self.refill_per_s
+
+    def debit(self, amount: float) -> None:
+        """Debit usage that was already consumed (no wait is implied)."""
+        self._refill()
+        self._balance -= amount
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._balance = min(self.capacity, self._balance + elapsed * self.refill_per_s)
+        self._updated = now
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute governor for one provider/model."""
+
+    def __init__(
+        self,
+        limits: RateLimitTier,
+        *,
+        scope: str = "",
+        clock: Clock = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.limits = limits
+        self.scope = scope
+        self._requests = TokenBucket.per_minute(limits.requests_per_minute, clock=clock)
+        self._tokens = TokenBucket.per_minute(limits.tokens_per_minute, clock=clock)
+        self._lock = threading.Lock()
+        self._sleep = sleep
+
+    def reserve(self, tokens: int) -> float:
+        """Reserve one request plus `tokens` and return the required wait in seconds."""
+        with self._lock:
+            request_wait = self._requests.reserve(1)
+            token_wait = self._tokens.reserve(max(0, tokens))
+        return max(request_wait, token_wait)
+
+    def acquire(self, tokens: int) -> float:
+        """Block until one request carrying `tokens` prompt tokens may be sent.
+
+        Returns:
+            Seconds spent waiting (0.0 when capacity was immediately available).
+        """
+        wait_s = self.reserve(tokens)
+        if wait_s > 0:
+            self._log_wait(wait_s, tokens)
+            self._sleep(wait_s)
+        return wait_s
+
+    async def acquire_async(self, tokens: int) -> float:
+        """Asyncio variant of `acquire()`; awaits instead of blocking the thread."""
+        wait_s = self.reserve(tokens)
+        if wait_s > 0:
+            self._log_wait(wait_s, tokens)
+            await asyncio.sleep(wait_s)
+        return wait_s
+
+    def settle(self, tokens: int | None) -> None:
+        """Debit tokens reported after the call (e.g. completion tokens)."""
+        if not tokens:
+            return
+        with self._lock:
+            self._tokens.debit(tokens)
+
+    def _log_wait(self, wait_s: float, tokens: int) -> None:
+        logger.debug(f"Rate limit [{self.scope}]: waiting {wait_s:.2f}s for 1 request / {tokens} tokens")
+
+
+@dataclass(frozen=True)
+class RateLimitAcquisition:
+    """Outcome of a limiter acquisition, surfaced in `policy_applied`."""
+
+    tier: str
+    waited_s: float
+
+
+class RateLimiterPool:
+    """Lazily builds one `RateLimiter` per (provider, model) from registry tiers.
+
+    A pool with `tier=None` is disabled: acquisitions return immediately and no
+    registry lookup occurs.
+    """
+
+    def __init__(
+        self,
+        tier: str | None,
+        *,
+        tier_lookup: Callable[[str, str], RateLimitTier] | None = None,
+        clock: Clock = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.tier = tier
+        self._tier_lookup = tier_lookup or _registry_rate_limit_tier
+        self._clock = clock
+        self._sleep = sleep
+        self._limiters: dict[tuple[str, str], RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.tier is not None
+
+    def limiter_for(self, provider: str, model: str) -> RateLimiter | None:
+        if self.tier is None:
+            return None
+        key = (provider, model)
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limits = self._tier_lookup(provider, self.tier)
+                limiter = RateLimiter(
+                    limits,
+                    scope=f"{provider}/{model}",
+                    clock=self._clock,
+                    sleep=self._sleep,
+                )
+                self._limiters[key] = limiter
+        return limiter
+
+    def acquire(self, provider: str, model: str, tokens: int) -> RateLimitAcquisition | None:
+        limiter = self.limiter_for(provider, model)
+        if limiter is None or self.tier is None:
+            return None
+        return RateLimitAcquisition(tier=self.tier, waited_s=limiter.acquire(tokens))
+
+    async def acquire_async(self, provider: str, model: str, tokens: int) -> RateLimitAcquisition | None:
+        limiter = self.limiter_for(provider, model)
+        if limiter is None or self.tier is None:
+            return None
+        return RateLimitAcquisition(tier=self.tier, waited_s=await limiter.acquire_async(tokens))
+
+    def settle(self, provider: str, model: str, tokens: int | None) -> None:
+        if limiter := self.limiter_for(provider, model):
+            limiter.settle(tokens)
+
+
+def _registry_rate_limit_tier(provider: str, tier: str) -> RateLimitTier:
+    registry = get_registry_loader().get_provider(provider)
+    limits = registry.rate_limits.get(tier)
+    if limits is None:
+        available = ", ".join(sorted(registry.rate_limits)) or "none"
+        raise ConfigurationError(
+            f"Rate limit tier '{tier}' not found in {provider} registry. Available: {available}"
+        )
+    return limits
@@ -3,8 +3,129 @@
 Provides decorators or context managers for distributed trace spans,
 enabling per-request observability across adapters and orchestrators.
 
+`span()` times a block with `perf_counter`, links it to the enclosing span
+through a `ContextVar`, records its duration in the `genai.span.duration_s`
+histogram, and emits a span record to the registry's sinks. Nesting survives
+asyncio tasks, `asyncio.to_thread`, and `utils.ordered_map` workers, which all
+run in a copy of the caller's context; a bare `Thread` or
+`ThreadPoolExecutor.submit` starts without a parent span.
+
+Usage:
+    with span("genai.provider_call", model=model) as current:
+        response = client.generate(request)
+        current.set(attempts=response.attempts)
+
 Connected modules:
   - infra.metrics
   - infra.usage
   - service.GenAIService
 """
+
+from __future__ import annotations
+
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from tnh_scholar.gen_ai_service.infra.metrics import MetricsRegistry, get_metrics
+
+__all__ = [
+    "SPAN_DURATION_METRIC",
+    "Span",
+    "current_span",
+    "record_span",
+    "span",
+]
+
+SPAN_DURATION_METRIC = "genai.span.duration_s"
+
+_current_span: ContextVar["Span | None"] = ContextVar("genai_current_span", default=None)
+
+
+@dataclass
+class Span:
+    """One timed unit of work."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    started_at: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes (e.g. attempts, tokens) to the span record."""
+        self.attributes.update(attributes)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def record_span(
+    name: str,
+    duration_s: float,
+    *,
+    parent: Span | None = None,
+    status: str = "ok",
+    registry: MetricsRegistry | None = None,
+    **attributes: Any,
+) -> None:
+    """Record a span measured outside a `with` block (e.g. work spread across generator yields)."""
+    finished = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent else None,
+        started_at=time.time() - duration_s,
+        attributes=dict(attributes),
+    )
+    _record(registry or get_metrics(), finished, duration_s, status)
+
+
+@contextmanager
+def span(name: str, *, registry: MetricsRegistry | None = None, **attributes: Any) -> Iterator[Span]:
+    """Time the enclosed block as a child of the current span."""
+    registry = registry or get_metrics()
+    parent = _current_span.get()
+    current = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent else None,
+        started_at=time.time(),
+        attributes=dict(attributes),
+    )
+    token = _current_span.set(current)
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        yield current
+    except BaseException as exc:
+        status = "error"
+        current.set(error=type(exc).__name__)
+        raise
+    finally:
+        duration_s = time.perf_counter() - start
+        _current_span.reset(token)
+        _record(registry, current, duration_s, status)
+
+
+def _record(registry: MetricsRegistry, finished: Span, duration_s: float, status: str) -> None:
+    registry.observe(SPAN_DURATION_METRIC, duration_s, span=finished.name, status=status)
+    registry.emit(
+        {
+            "type": "span",
+            "name": finished.name,
+            "trace_id": finished.trace_id,
+            "span_id": finished.span_id,
+            "parent_id": finished.parent_id,
+            "started_at": finished.started_at,
+            "duration_s": duration_s,
+            "status": status,
+            "attributes": finished.attributes,
+        }
+    )
@@ -3,8 +3,181 @@
 Tracks token, cost, and duration metrics for each request/response pair.
 May integrate with external logging or billing systems.
 
+`record_usage()` updates the `genai.*` counters on the metrics registry and
+emits a `usage` record to its sinks. `load_metrics_records()` and
+`summarize_metrics()` read an exported JSONL file back for `tnh-gen stats`.
+
 Connected modules:
   - infra.metrics
+  - infra.tracer
   - pattern_catalog.fingerprint
   - service.GenAIService
 """
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from tnh_scholar.gen_ai_service.infra.metrics import MetricsRegistry, get_metrics
+from tnh_scholar.gen_ai_service.infra.tracer import current_span
+from tnh_scholar.gen_ai_service.models.transport import ProviderUsage
+from tnh_scholar.logging_config import get_logger
+
+__all__ = [
+    "MetricsSummary",
+    "SpanStats",
+    "UsageTotals",
+    "load_metrics_records",
+    "record_usage",
+    "summarize_metrics",
+]
+
+logger = get_logger(__name__)
+
+
+def record_usage(
+    *,
+    provider: str,
+    model: str,
+    usage: ProviderUsage | None,
+    attempts: int | None,
+    cost: float | None,
+    cache_hit: bool = False,
+    registry: MetricsRegistry | None = None,
+) -> None:
+    """Account one finalized call: requests, tokens, dollars, cache hits, retries."""
+    registry = registry or get_metrics()
+    tokens_in = (usage.tokens_in or 0) if usage is not None else 0
+    tokens_out = (usage.tokens_out or 0) if usage is not None else 0
+    retries = max((attempts or 1) - 1, 0)
+    labels = {"provider": provider, "model": model}
+
+    registry.increment("genai.requests", **labels)
+    if cache_hit:
+        registry.increment("genai.cache_hits", **labels)
+    else:
+        registry.increment("genai.tokens_in", tokens_in, **labels)
+        registry.increment("genai.tokens_out", tokens_out, **labels)
+        if cost is not None:
+            registry.increment("genai.cost_usd", cost, **labels)
+    if retries:
+        registry.increment("genai.retries", retries, **labels)
+
+    span = current_span()
+    registry.emit(
+        {
+            "type": "usage",
+            "trace_id": span.trace_id if span else None,
+            "provider": provider,
+            "model": model,
+            "tokens_in": 0 if cache_hit else tokens_in,
+            "tokens_out": 0 if cache_hit else tokens_out,
+            "cost_usd": 0.0 if cache_hit else cost,
+            "cache_hit": cache_hit,
+            "retries": retries,
+        }
+    )
+
+
+def load_metrics_records(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield records from an exported JSONL metrics file, skipping malformed lines."""
+    with Path(path).open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed metrics line {line_number} in {path}")
+                continue
+            if isinstance(record, dict):
+                yield record
+
+
+@dataclass
+class SpanStats:
+    """Latency distribution for one span name."""
+
+    count: int
+    errors: int
+    total_s: float
+    mean_s: float
+    p50_s: float
+    p95_s: float
+    max_s: float
+
+
+@dataclass
+class UsageTotals:
+    """Summed usage across records."""
+
+    requests: int = 0
+    cache_hits: int = 0
+    tokens_in: int = 0
+    tokens_out: int = 0
+    cost_usd: float = 0.0
+    retries: int = 0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        return self.cache_hits / self.requests if self.requests else 0.0
+
+
+@dataclass
+class MetricsSummary:
+    """Aggregated view of a metrics file."""
+
+    spans: dict[str, SpanStats] = field(default_factory=dict)
+    usage: UsageTotals = field(default_factory=UsageTotals)
+    usage_by_model: dict[str, UsageTotals] = field(default_factory=dict)
+
+
+def summarize_metrics(records: Iterable[dict[str, Any]]) -> MetricsSummary:
+    """Fold span and usage records into per-span latency stats and usage totals."""
+    durations: dict[str, list[float]] = {}
+    errors: dict[str, int] = {}
+    summary = MetricsSummary()
+    for record in records:
+        kind = record.get("type")
+        if kind == "span":
+            name = str(record.get("name"))
+            durations.setdefault(name, []).append(float(record.get("duration_s", 0.0)))
+            if record.get("status") == "error":
+                errors[name] = errors.get(name, 0) + 1
+        elif kind == "usage":
+            model_key = f"{record.get('provider')}:{record.get('model')}"
+            _add_usage(summary.usage, record)
+            _add_usage(summary.usage_by_model.setdefault(model_key, UsageTotals()), record)
+
+    for name, values in sorted(durations.items()):
+        values.sort()
+        total = sum(values)
+        summary.spans[name] = SpanStats(
+            count=len(values),
+            errors=errors.get(name, 0),
+            total_s=total,
+            mean_s=total / len(values),
+            p50_s=_percentile(values, 50),
+            p95_s=_percentile(values, 95),
+            max_s=values[-1],
+        )
+    return summary
+
+
+def _add_usage(totals: UsageTotals, record: dict[str, Any]) -> None:
+    totals.requests += 1
+    totals.cache_hits += int(bool(record.get("cache_hit")))
+    totals.tokens_in += int(record.get("tokens_in") or 0)
+    totals.tokens_out += int(record.get("tokens_out") or 0)
+    totals.cost_usd += float(record.get("cost_usd") or 0.0)
+    totals.retries += int(record.get("retries") or 0)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
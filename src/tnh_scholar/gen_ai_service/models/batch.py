@@ -0,0 +1,72 @@
+"""Batch Models.
+
+Transport-level models for provider batch jobs (upload JSONL → submit → poll →
+download). These mirror the OpenAI Batch API lifecycle while staying
+provider-agnostic so a local stand-in client can implement the same contract.
+
+Connected modules:
+  - providers.base.BatchProviderClient
+  - providers.openai_batch_client / providers.local_batch_client
+  - batch_runner.BatchRunner
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .transport import ProviderResponse
+
+
+class BatchStatus(str, Enum):
+    VALIDATING = "validating"
+    IN_PROGRESS = "in_progress"
+    FINALIZING = "finalizing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    EXPIRED = "expired"
+    CANCELLING = "cancelling"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_terminal(self) -> bool:
+        return self in (
+            BatchStatus.COMPLETED,
+            BatchStatus.FAILED,
+            BatchStatus.EXPIRED,
+            BatchStatus.CANCELLED,
+        )
+
+
+class BatchRequestCounts(BaseModel):
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+
+
+class BatchJob(BaseModel):
+    """Provider batch job snapshot."""
+
+    id: str
+    status: BatchStatus
+    input_file_id: str
+    output_file_id: Optional[str] = None
+    error_file_id: Optional[str] = None
+    request_counts: BatchRequestCounts = BatchRequestCounts()
+    errors: list[str] = []
+
+
+class BatchItemResult(BaseModel):
+    """Result for one batch request, mapped back by `custom_id`."""
+
+    custom_id: str
+    response: Optional[ProviderResponse] = None
+    error: Optional[str] = None
+
+    @property
+    def text(self) -> str | None:
+        if self.response is None or self.response.payload is None:
+            return None
+        return self.response.payload.text
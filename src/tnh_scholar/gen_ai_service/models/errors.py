@@ -42,3 +42,7 @@ class RoutingError(TnhScholarError):
 
 class ProviderError(TnhScholarError):
     """Raised when a provider returns an invalid or unexpected response."""
+
+
+class BatchJobFailed(ProviderError):
+    """Raised when a provider batch job ends failed, expired, cancelled, or times out."""
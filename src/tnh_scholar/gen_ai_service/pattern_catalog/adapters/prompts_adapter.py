@@ -57,7 +57,19 @@ class PromptsAdapter:
         catalog: PromptCatalogPort | None = None,
         renderer: PromptRendererPort | None = None,
         validator: PromptValidatorPort | None = None,
+        persistent_index: bool = False,
+        index_path: Path | None = None,
     ):
+        """
+        Args:
+            prompts_base: Root directory of the prompt catalog.
+            catalog: Optional catalog override (the filesystem catalog if None).
+            renderer: Optional renderer override.
+            validator: Optional validator override.
+            persistent_index: Reuse parsed prompts across processes via an
+                on-disk index (see prompt_system.transport.catalog_index).
+            index_path: Index file location (user cache dir if None).
+        """
         self._base = Path(prompts_base)
 
         render_policy = PromptRenderPolicy()
@@ -76,6 +88,8 @@ class PromptsAdapter:
             repository_path=self._base,
             enable_git_refresh=False,
             validation_on_load=True,
+            persistent_index=persistent_index,
+            index_path=index_path,
         )
         self._catalog = catalog or FilesystemPromptCatalog(
             config=catalog_config,
@@ -116,6 +130,11 @@ class PromptsAdapter:
         prompt = self._catalog.get(prompt_key)
         return prompt.metadata
 
+    def close(self) -> None:
+        """Flush catalog state that is written lazily (e.g. the persistent index)."""
+        if close := getattr(self._catalog, "close", None):
+            close()
+
     def catalog_health(self) -> CatalogHealth:
         """Expose aggregated prompt catalog health."""
         return self._catalog.catalog_health()
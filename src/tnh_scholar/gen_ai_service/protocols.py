@@ -8,6 +8,7 @@ from tnh_scholar.gen_ai_service.models.domain import (
     RenderedPrompt,
     RenderRequest,
 )
+from tnh_scholar.gen_ai_service.streaming import CompletionStream
 from tnh_scholar.prompt_system.domain.models import PromptMetadata
 
 
@@ -31,3 +32,11 @@ class GenAIServiceProtocol(Protocol):
     def generate(self, request: RenderRequest) -> CompletionEnvelope:
         """Generate completion from prompt and request."""
         ...
+
+
+class StreamingGenAIServiceProtocol(GenAIServiceProtocol, Protocol):
+    """GenAIService that can also stream completion text as it is generated."""
+
+    def generate_stream(self, request: RenderRequest) -> CompletionStream:
+        """Start a streaming completion; the envelope is available once drained."""
+        ...
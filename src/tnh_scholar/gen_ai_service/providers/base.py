@@ -1,7 +1,9 @@
 """Base Provider Protocols.
 
 Defines ProviderClient and related Protocols that standardize
-`generate()` or `complete()` signatures across AI providers.
+`generate()` or `complete()` signatures across AI providers, plus the
+streaming seam used by `GenAIService.generate_stream` and the batch-job seam
+used by `batch_runner.BatchRunner`.
 
 Connected modules:
   - providers.openai_adapter
@@ -10,10 +12,33 @@ Connected modules:
 """
 
 # providers/base.py
+from pathlib import Path
 from typing import Protocol
 
+from tnh_scholar.gen_ai_service.models.batch import BatchJob
 from tnh_scholar.gen_ai_service.models.transport import ProviderRequest, ProviderResponse
+from tnh_scholar.gen_ai_service.providers.streaming import ProviderStream
 
 
 class ProviderClient(Protocol):
     def generate(self, request: ProviderRequest) -> ProviderResponse: ...
+
+
+class StreamingProviderClient(ProviderClient, Protocol):
+    def generate_stream(self, request: ProviderRequest) -> ProviderStream: ...
+
+
+class BatchProviderClient(Protocol):
+    """Provider seam for file-based batch jobs (OpenAI Batch API shape)."""
+
+    provider: str
+
+    def upload_batch_file(self, path: Path) -> str: ...
+
+    def create_batch(self, input_file_id: str, *, endpoint: str, description: str = "") -> BatchJob: ...
+
+    def retrieve_batch(self, batch_id: str) -> BatchJob: ...
+
+    def cancel_batch(self, batch_id: str) -> BatchJob: ...
+
+    def download_file(self, file_id: str) -> str: ...
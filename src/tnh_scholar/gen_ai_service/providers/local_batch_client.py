@@ -0,0 +1,150 @@
+"""Local Batch Client.
+
+In-process stand-in for the OpenAI Batch API. Implements the same
+`BatchProviderClient` contract by answering each JSONL request body with a
+caller-supplied responder and emitting OpenAI-shaped output lines, so
+`BatchRunner` and its callers can be exercised offline (tests, dry runs).
+
+Connected modules:
+  - providers.base.BatchProviderClient
+  - batch_runner.BatchRunner
+"""
+
+from __future__ import annotations
+
+import json
+from itertools import count
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+from tnh_scholar.gen_ai_service.models.batch import BatchJob, BatchRequestCounts, BatchStatus
+
+BatchResponder = Callable[[Mapping[str, Any]], str]
+
+
+class LocalBatchClient:
+    """Runs batches synchronously in memory.
+
+    Args:
+        responder: Maps a request `body` (chat-completions payload) to the
+            assistant text. Raising an exception marks that request failed.
+        polls_until_complete: Number of `retrieve_batch` calls that report
+            `in_progress` before the batch completes (exercises polling).
+    """
+
+    provider = "local"
+
+    def __init__(self, responder: BatchResponder, *, polls_until_complete: int = 0) -> None:
+        self._responder = responder
+        self._polls_until_complete = polls_until_complete
+        self._ids = count(1)
+        self._files: dict[str, str] = {}
+        self._jobs: dict[str, BatchJob] = {}
+        self._pending_polls: dict[str, int] = {}
+        self.submitted_bodies: list[Mapping[str, Any]] = []
+        self.cancelled_ids: list[str] = []
+
+    def upload_batch_file(self, path: Path) -> str:
+        file_id = f"file-local-{next(self._ids)}"
+        self._files[file_id] = Path(path).read_text(encoding="utf-8")
+        return file_id
+
+    def create_batch(self, input_file_id: str, *, endpoint: str, description: str = "") -> BatchJob:
+        batch_id = f"batch-local-{next(self._ids)}"
+        output_lines, error_lines = self._run(self._files[input_file_id])
+        output_file_id = self._store_lines(output_lines)
+        error_file_id = self._store_lines(error_lines)
+        self._jobs[batch_id] = BatchJob(
+            id=batch_id,
+            status=BatchStatus.COMPLETED,
+            input_file_id=input_file_id,
+            output_file_id=output_file_id,
+            error_file_id=error_file_id,
+            request_counts=BatchRequestCounts(
+                total=len(output_lines) + len(error_lines),
+                completed=len(output_lines),
+                failed=len(error_lines),
+            ),
+        )
+        self._pending_polls[batch_id] = self._polls_until_complete
+        return self._jobs[batch_id].model_copy(update={"status": BatchStatus.VALIDATING})
+
+    def retrieve_batch(self, batch_id: str) -> BatchJob:
+        job = self._jobs[batch_id]
+        if self._pending_polls[batch_id] > 0:
+            self._pending_polls[batch_id] -= 1
+            return job.model_copy(update={"status": BatchStatus.IN_PROGRESS})
+        return job
+
+    def cancel_batch(self, batch_id: str) -> BatchJob:
+        """Cancel a batch still reporting `in_progress`; finished batches are returned unchanged."""
+        if self._pending_polls[batch_id] > 0:
+            self._pending_polls[batch_id] = 0
+            self._jobs[batch_id] = self._jobs[batch_id].model_copy(
+                update={"status": BatchStatus.CANCELLED, "output_file_id": None, "error_file_id": None}
+            )
+            self.cancelled_ids.append(batch_id)
+        return self._jobs[batch_id]
+
+    def download_file(self, file_id: str) -> str:
+        return self._files[file_id]
+
+    def _run(self, jsonl_text: str) -> tuple[list[str], list[str]]:
+        output_lines: list[str] = []
+        error_lines: list[str] = []
+        for line in jsonl_text.splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            body = request.get("body", {})
+            self.submitted_bodies.append(body)
+            try:
+                text = self._responder(body)
+            except Exception as exc:
+                error_lines.append(_error_line(request["custom_id"], str(exc)))
+                continue
+            output_lines.append(_output_line(request["custom_id"], body, text))
+        return output_lines, error_lines
+
+    def _store_lines(self, lines: list[str]) -> str | None:
+        if not lines:
+            return None
+        file_id = f"file-local-{next(self._ids)}"
+        self._files[file_id] = "\n".join(lines) + "\n"
+        return file_id
+
+
+def _output_line(custom_id: str, body: Mapping[str, Any], text: str) -> str:
+    completion = {
+        "id": f"chatcmpl-{custom_id}",
+        "object": "chat.completion",
+        "created": 0,
+        "model": body.get("model", "local"),
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": text},
+            }
+        ],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+    return json.dumps(
+        {
+            "id": f"batch-req-{custom_id}",
+            "custom_id": custom_id,
+            "response": {"status_code": 200, "request_id": custom_id, "body": completion},
+            "error": None,
+        }
+    )
+
+
+def _error_line(custom_id: str, message: str) -> str:
+    return json.dumps(
+        {
+            "id": f"batch-req-{custom_id}",
+            "custom_id": custom_id,
+            "response": None,
+            "error": {"code": "local_error", "message": message},
+        }
+    )
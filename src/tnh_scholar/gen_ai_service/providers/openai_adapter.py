@@ -31,7 +31,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Mapping, Optional, cast
 
-from openai.types.chat.chat_completion import ChatCompletion
+from openai.types.chat.chat_completion import ChatCompletion, Choice
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
+from openai.types.chat.chat_completion_message import ChatCompletionMessage
 from openai.types.chat.chat_completion_message_param import (
     ChatCompletionMessageParam,
 )
@@ -67,6 +69,25 @@ class OpenAIChatCompletionRequest(BaseModel):
     response_format: Optional[type[BaseModel] | Mapping[str, Any]] = None
 
 
+def chat_request_kwargs(openai_request: OpenAIChatCompletionRequest) -> Dict[str, Any]:
+    """Keyword arguments for `chat.completions.create` or a batch request body.
+
+    Unset temperature and reasoning effort are omitted. `response_format` is
+    left to the caller because its encoding depends on the endpoint.
+    """
+    request_kwargs: Dict[str, Any] = dict(
+        model=openai_request.model,
+        messages=openai_request.messages,
+        max_completion_tokens=openai_request.max_completion_tokens,
+        seed=openai_request.seed,
+    )
+    if openai_request.temperature is not None:
+        request_kwargs["temperature"] = openai_request.temperature
+    if openai_request.reasoning_effort is not None:
+        request_kwargs["reasoning_effort"] = openai_request.reasoning_effort
+    return request_kwargs
+
+
 @dataclass(frozen=True)
 class ContentExtractionResult:
     payload: TextPayload | None
@@ -513,6 +534,59 @@ class OpenAIAdapter:
             )
 
 
+class OpenAIStreamAccumulator:
+    """Assembles `stream=True` chat chunks into a `ChatCompletion` for `from_openai_response`.
+
+    Only choice 0 is tracked. Usage arrives on the final chunk when the request
+    sets `stream_options={"include_usage": True}`.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._id = ""
+        self._model = ""
+        self._created = 0
+        self._finish_reason: str | None = None
+        self._usage: Any = None
+        self.chunk_count = 0
+
+    def add(self, chunk: ChatCompletionChunk) -> str | None:
+        """Record one chunk; returns its text delta, if any."""
+        self.chunk_count += 1
+        self._id = self._id or getattr(chunk, "id", "") or ""
+        self._model = self._model or getattr(chunk, "model", "") or ""
+        self._created = self._created or getattr(chunk, "created", 0) or 0
+        if (usage := getattr(chunk, "usage", None)) is not None:
+            self._usage = usage
+        for choice in getattr(chunk, "choices", None) or []:
+            if getattr(choice, "index", 0) != 0:
+                continue
+            if (finish_reason := getattr(choice, "finish_reason", None)) is not None:
+                self._finish_reason = finish_reason
+            delta = getattr(getattr(choice, "delta", None), "content", None)
+            if delta:
+                self._parts.append(delta)
+                return delta
+        return None
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def to_chat_completion(self) -> ChatCompletion:
+        # model_construct: a truncated stream may lack a finish_reason the SDK model would require.
+        message = ChatCompletionMessage.model_construct(role="assistant", content=self.text)
+        choice = Choice.model_construct(index=0, message=message, finish_reason=self._finish_reason)
+        return ChatCompletion.model_construct(
+            id=self._id,
+            choices=[choice] if self.chunk_count else [],
+            created=self._created,
+            model=self._model,
+            object="chat.completion",
+            usage=self._usage,
+        )
+
+
 # 🔒 Compatibility Checklist (update when bumping OpenAI SDK or models):
 # [ ] Update finish_reason_map if new reasons appear
 # [ ] Add/adjust guards for choices/usage schema drift
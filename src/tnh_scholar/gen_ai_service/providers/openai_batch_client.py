@@ -0,0 +1,88 @@
+"""OpenAI Batch Client.
+
+Implements `BatchProviderClient` over the OpenAI Files + Batches APIs:
+upload a JSONL request file, create a batch against `/v1/chat/completions`,
+poll its status, cancel it, and download the output/error files.
+
+Connected modules:
+  - providers.base.BatchProviderClient
+  - models.batch
+  - batch_runner.BatchRunner
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from openai import OpenAI
+
+from tnh_scholar.gen_ai_service.models.batch import BatchJob, BatchRequestCounts, BatchStatus
+from tnh_scholar.gen_ai_service.models.errors import ProviderError
+
+BATCH_COMPLETION_WINDOW = "24h"
+
+
+class OpenAIBatchClient:
+    provider = "openai"
+
+    def __init__(self, api_key: str | None, organization: str | None):
+        self._client = OpenAI(api_key=api_key, organization=organization)
+
+    def upload_batch_file(self, path: Path) -> str:
+        try:
+            with Path(path).open("rb") as handle:
+                uploaded = self._client.files.create(file=handle, purpose="batch")
+        except Exception as e:
+            raise ProviderError(f"Failed to upload batch file {path}: {e}") from e
+        return str(uploaded.id)
+
+    def create_batch(self, input_file_id: str, *, endpoint: str, description: str = "") -> BatchJob:
+        try:
+            batch = self._client.batches.create(
+                input_file_id=input_file_id,
+                endpoint=endpoint,  # type: ignore[arg-type]
+                completion_window=BATCH_COMPLETION_WINDOW,
+                metadata={"description": description} if description else None,
+            )
+        except Exception as e:
+            raise ProviderError(f"Failed to create batch for file {input_file_id}: {e}") from e
+        return _batch_job_from_sdk(batch)
+
+    def retrieve_batch(self, batch_id: str) -> BatchJob:
+        try:
+            batch = self._client.batches.retrieve(batch_id)
+        except Exception as e:
+            raise ProviderError(f"Failed to retrieve batch {batch_id}: {e}") from e
+        return _batch_job_from_sdk(batch)
+
+    def cancel_batch(self, batch_id: str) -> BatchJob:
+        try:
+            batch = self._client.batches.cancel(batch_id)
+        except Exception as e:
+            raise ProviderError(f"Failed to cancel batch {batch_id}: {e}") from e
+        return _batch_job_from_sdk(batch)
+
+    def download_file(self, file_id: str) -> str:
+        try:
+            return str(self._client.files.content(file_id).text)
+        except Exception as e:
+            raise ProviderError(f"Failed to download batch file {file_id}: {e}") from e
+
+
+def _batch_job_from_sdk(batch: Any) -> BatchJob:
+    counts = getattr(batch, "request_counts", None)
+    errors = getattr(getattr(batch, "errors", None), "data", None) or []
+    return BatchJob(
+        id=batch.id,
+        status=BatchStatus(batch.status),
+        input_file_id=batch.input_file_id,
+        output_file_id=getattr(batch, "output_file_id", None),
+        error_file_id=getattr(batch, "error_file_id", None),
+        request_counts=BatchRequestCounts(
+            total=getattr(counts, "total", 0) or 0,
+            completed=getattr(counts, "completed", 0) or 0,
+            failed=getattr(counts, "failed", 0) or 0,
+        ),
+        errors=[str(getattr(error, "message", error)) for error in errors],
+    )
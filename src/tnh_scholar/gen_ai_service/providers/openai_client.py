@@ -1,10 +1,11 @@
 import logging
-from typing import cast
+from typing import Iterator, cast
 
-from openai import OpenAI
-from openai.types.chat import ChatCompletion
+from openai import AsyncOpenAI, OpenAI, Stream
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from pydantic import BaseModel
 from tenacity import (
+    AsyncRetrying,
     Retrying,
     before_sleep_log,
     retry_if_exception,
@@ -12,10 +13,16 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
+from tnh_scholar.gen_ai_service.infra.tracer import span
 from tnh_scholar.gen_ai_service.models.errors import ProviderError
 from tnh_scholar.gen_ai_service.models.transport import ProviderRequest, ProviderResponse
 from tnh_scholar.gen_ai_service.providers.base import ProviderClient
-from tnh_scholar.gen_ai_service.providers.openai_adapter import OpenAIAdapter
+from tnh_scholar.gen_ai_service.providers.openai_adapter import (
+    OpenAIAdapter,
+    OpenAIStreamAccumulator,
+    chat_request_kwargs,
+)
+from tnh_scholar.gen_ai_service.providers.streaming import ProviderStream
 from tnh_scholar.logging_config import get_logger
 
 
@@ -46,12 +53,16 @@ class OpenAIClient(ProviderClient):
 
     @staticmethod
     def _call_with_retries(retry_caller: Retrying, func, *args, **kwargs):
-        """Run `func(*args, **kwargs)` under Tenacity and return (result, attempts)."""
+        """Run `func(*args, **kwargs)` under Tenacity and return (result, attempts).
+
+        Each attempt is timed as a `genai.provider_attempt` span, so retries and
+        their per-attempt latency and errors appear in the metrics export.
+        """
         last_attempt = None
         result = None
         for attempt in retry_caller:
             last_attempt = attempt
-            with last_attempt:
+            with last_attempt, _attempt_span(attempt):
                 result = func(*args, **kwargs)
         attempts = last_attempt.retry_state.attempt_number if last_attempt else 0
         return result, attempts
@@ -59,28 +70,15 @@ class OpenAIClient(ProviderClient):
     def _create_retry_caller(self):
         return Retrying(
             stop=stop_after_attempt(2),  # exactly one retry (2 total attempts)
-            wait=wait_exponential_jitter(initial=0.25, max=1.0),
+            wait=_wait_for_retry_after,
             retry=retry_if_exception(self._is_retryable_exception),
             reraise=True,
             before_sleep=before_sleep_log(get_logger(__name__), logging.WARNING),
         )
 
     def _chat_create(self, openai_request) -> ChatCompletion:
-        request_kwargs = dict(
-            model=openai_request.model,
-            messages=openai_request.messages,
-            max_completion_tokens=openai_request.max_completion_tokens,
-            seed=openai_request.seed,
-        )
-        if openai_request.temperature is not None:
-            request_kwargs["temperature"] = openai_request.temperature
-        if openai_request.reasoning_effort is not None:
-            request_kwargs["reasoning_effort"] = openai_request.reasoning_effort
-
-        if isinstance(openai_request.response_format, type) and issubclass(
-            openai_request.response_format,
-            BaseModel,
-        ):
+        request_kwargs = chat_request_kwargs(openai_request)
+        if _uses_parsed_response_format(openai_request):
             return cast(
                 ChatCompletion,
                 self._client.beta.chat.completions.parse(
@@ -123,3 +121,171 @@ class OpenAIClient(ProviderClient):
         except Exception as e:
             # Surface as ProviderError for upstream handling
             raise ProviderError(str(e)) from e
+
+    def _chat_stream_create(self, openai_request) -> Stream[ChatCompletionChunk]:
+        request_kwargs = chat_request_kwargs(openai_request)
+        if openai_request.response_format is not None:
+            request_kwargs["response_format"] = openai_request.response_format
+        return self._client.chat.completions.create(
+            stream=True,
+            stream_options={"include_usage": True},
+            **request_kwargs,
+        )
+
+    def generate_stream(self, request: ProviderRequest) -> ProviderStream:
+        """
+        Open a streaming chat completion and return its text deltas.
+
+        Opening the stream is retried like `generate`; once deltas start
+        arriving a failure is raised as ProviderError without retrying, since
+        part of the output has already been delivered.
+        """
+        try:
+            openai_request = self._adapter.to_openai_request(request)
+            if _uses_parsed_response_format(openai_request):
+                raise ProviderError("Streaming does not support Pydantic response_format models.")
+            raw_stream, attempts = self._call_with_retries(
+                self._retry_caller,
+                self._chat_stream_create,
+                openai_request,
+            )
+        except ProviderError:
+            raise
+        except Exception as e:
+            raise ProviderError(str(e)) from e
+
+        accumulator = OpenAIStreamAccumulator()
+
+        def _deltas() -> Iterator[str]:
+            try:
+                for chunk in raw_stream:
+                    if delta := accumulator.add(chunk):
+                        yield delta
+            except Exception as e:
+                raise ProviderError(str(e)) from e
+
+        return ProviderStream(
+            _deltas(),
+            finish=lambda: self._adapter.from_openai_response(
+                accumulator.to_chat_completion(),
+                model=openai_request.model,
+                provider=self.PROVIDER,
+                attempts=attempts,
+            ),
+            close=getattr(raw_stream, "close", None),
+        )
+
+
+class AsyncOpenAIClient:
+    """Asyncio counterpart of `OpenAIClient` backed by `openai.AsyncOpenAI`.
+
+    Shares request shaping, retry classification, and response mapping with the
+    synchronous client so both paths produce identical `ProviderResponse`s.
+    """
+
+    PROVIDER = OpenAIClient.PROVIDER
+
+    def __init__(self, api_key: str | None, organization: str | None):
+        self._client = AsyncOpenAI(api_key=api_key, organization=organization)
+        self._adapter = OpenAIAdapter()
+        import openai
+
+        self.sdk_version = getattr(openai, "__version__", None)
+
+    def _create_retry_caller(self) -> AsyncRetrying:
+        # A fresh controller per call: AsyncRetrying keeps per-run state.
+        return AsyncRetrying(
+            stop=stop_after_attempt(2),
+            wait=_wait_for_retry_after,
+            retry=retry_if_exception(OpenAIClient._is_retryable_exception),
+            reraise=True,
+            before_sleep=before_sleep_log(get_logger(__name__), logging.WARNING),
+        )
+
+    async def _chat_create(self, openai_request) -> ChatCompletion:
+        request_kwargs = chat_request_kwargs(openai_request)
+        if _uses_parsed_response_format(openai_request):
+            return cast(
+                ChatCompletion,
+                await self._client.beta.chat.completions.parse(
+                    response_format=openai_request.response_format,
+                    **request_kwargs,
+                ),
+            )
+        if openai_request.response_format is not None:
+            request_kwargs["response_format"] = openai_request.response_format
+
+        return cast(
+            ChatCompletion,
+            await self._client.chat.completions.create(**request_kwargs),
+        )
+
+    async def generate(self, request: ProviderRequest) -> ProviderResponse:
+        """Async variant of `OpenAIClient.generate` with the same retry and error semantics."""
+        try:
+            openai_request = self._adapter.to_openai_request(request)
+
+            raw_response = None
+            attempts = 0
+            async for attempt in self._create_retry_caller():
+                with attempt, _attempt_span(attempt):
+                    raw_response = await self._chat_create(openai_request)
+                attempts = attempt.retry_state.attempt_number
+
+            if raw_response is None:
+                raise ProviderError("OpenAI API call returned no response.")
+
+            return self._adapter.from_openai_response(
+                raw_response,
+                model=openai_request.model,
+                provider=self.PROVIDER,
+                attempts=attempts,
+            )
+
+        except Exception as e:
+            raise ProviderError(str(e)) from e
+
+
+_BACKOFF_WAIT = wait_exponential_jitter(initial=0.25, max=1.0)
+_MAX_RETRY_AFTER_S = 60.0
+
+
+def _attempt_span(attempt):
+    return span(
+        "genai.provider_attempt",
+        provider=OpenAIClient.PROVIDER,
+        attempt=attempt.retry_state.attempt_number,
+    )
+
+
+def _retry_after_seconds(exc: BaseException | None) -> float | None:
+    """Read a provider `Retry-After` hint (seconds) from an SDK exception, if present."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    raw = headers.get("retry-after-ms")
+    scale = 1000.0
+    if raw is None:
+        raw = headers.get("retry-after")
+        scale = 1.0
+    try:
+        return min(float(raw) / scale, _MAX_RETRY_AFTER_S) if raw is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _wait_for_retry_after(retry_state) -> float:
+    """Honor provider Retry-After on 429s; otherwise fall back to jittered backoff."""
+    backoff = _BACKOFF_WAIT(retry_state)
+    outcome = retry_state.outcome
+    exc = outcome.exception() if outcome is not None else None
+    retry_after = _retry_after_seconds(exc)
+    return max(backoff, retry_after) if retry_after is not None else backoff
+
+
+def _uses_parsed_response_format(openai_request) -> bool:
+    return isinstance(openai_request.response_format, type) and issubclass(
+        openai_request.response_format,
+        BaseModel,
+    )
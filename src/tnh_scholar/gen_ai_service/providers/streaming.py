@@ -0,0 +1,54 @@
+"""Provider Streams.
+
+`ProviderStream` is what streaming provider clients return: an iterable of
+text deltas in arrival order whose assembled `ProviderResponse` (text, usage,
+finish reason) becomes available once iteration completes.
+
+Connected modules:
+  - providers.openai_client.OpenAIClient.generate_stream
+  - streaming.CompletionStream
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterator
+
+from tnh_scholar.gen_ai_service.models.transport import ProviderResponse
+
+__all__ = [
+    "ProviderStream",
+]
+
+
+class ProviderStream:
+    """Single-use iterator of text deltas with a final `ProviderResponse`."""
+
+    def __init__(
+        self,
+        deltas: Iterator[str],
+        finish: Callable[[], ProviderResponse],
+        close: Callable[[], None] | None = None,
+    ) -> None:
+        self._deltas = deltas
+        self._finish = finish
+        self._close = close
+        self._response: ProviderResponse | None = None
+        self._started = False
+
+    def __iter__(self) -> Iterator[str]:
+        if self._started:
+            raise RuntimeError("ProviderStream can only be iterated once")
+        self._started = True
+        try:
+            yield from self._deltas
+        finally:
+            if self._close is not None:
+                self._close()
+        self._response = self._finish()
+
+    @property
+    def response(self) -> ProviderResponse:
+        """The assembled response; raises until the stream has been fully consumed."""
+        if self._response is None:
+            raise RuntimeError("ProviderStream has not been fully consumed")
+        return self._response
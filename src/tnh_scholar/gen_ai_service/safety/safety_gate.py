@@ -12,6 +12,7 @@ Connected modules:
 from dataclasses import dataclass
 from typing import List, Sequence
 
+from tnh_scholar.exceptions import ConfigurationError
 from tnh_scholar.gen_ai_service.config.output_tokens import (
     OutputTokenLimitMode,
     resolve_output_token_limit,
@@ -55,6 +56,14 @@ def _estimate_cost(
     return float(input_cost + output_cost)
 
 
+def usage_cost(provider: str, model: str, tokens_in: int, tokens_out: int) -> float | None:
+    """Dollar cost of reported usage, or None when the model has no registry pricing."""
+    try:
+        return _estimate_cost(provider, model, tokens_in, tokens_out)
+    except ConfigurationError:
+        return None
+
+
 def _pricing_for_model(provider: str, model: str, *, use_cache: bool) -> ModelPricing:
     registry = get_registry_loader().get_provider(provider)
     model_info = get_model_info(provider, model)
@@ -10,20 +10,33 @@ Connected modules:
   - pattern_catalog.catalog.PatternCatalog
   - providers.openai_adapter.OpenAIAdapter
   - infra.issue_handler.IssueHandler (runtime validation & error hints)
+  - infra.tracer / infra.usage (spans and usage accounting)
 """
 
 import copy
 import json
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 from jsonschema.exceptions import ValidationError as JsonSchemaValidationError
 
 from tnh_scholar.exceptions import ConfigurationError
-from tnh_scholar.gen_ai_service.config.params_policy import apply_policy
+from tnh_scholar.gen_ai_service.config.params_policy import ResolvedParams, apply_policy
 from tnh_scholar.gen_ai_service.config.settings import GenAISettings
+from tnh_scholar.gen_ai_service.infra.completion_cache import (
+    CompletionCache,
+    completion_cache_key,
+    default_completion_cache_path,
+)
 from tnh_scholar.gen_ai_service.infra.issue_handler import IssueHandler
+from tnh_scholar.gen_ai_service.infra.metrics import JsonlMetricsExporter, default_metrics_path, get_metrics
+from tnh_scholar.gen_ai_service.infra.rate_limit import RateLimitAcquisition, RateLimiterPool
+from tnh_scholar.gen_ai_service.infra.tracer import Span, record_span, span
 from tnh_scholar.gen_ai_service.infra.tracking.provenance import build_provenance
+from tnh_scholar.gen_ai_service.infra.usage import record_usage
 from tnh_scholar.gen_ai_service.mappers.completion_mapper import (
     PolicyApplied,
     provider_to_completion,
@@ -34,6 +47,7 @@ from tnh_scholar.gen_ai_service.models.domain import (
     CompletionOutcomeStatus,
     CompletionResult,
     FailureReason,
+    Fingerprint,
     RenderRequest,
 )
 from tnh_scholar.gen_ai_service.models.transport import ProviderRequest, ProviderResponse
@@ -41,8 +55,11 @@ from tnh_scholar.gen_ai_service.pattern_catalog.adapters.prompts_adapter import
 from tnh_scholar.gen_ai_service.protocols import PromptCatalogProtocol
 from tnh_scholar.gen_ai_service.providers.openai_adapter import OpenAIAdapter
 from tnh_scholar.gen_ai_service.providers.openai_client import OpenAIClient
+from tnh_scholar.gen_ai_service.providers.streaming import ProviderStream
 from tnh_scholar.gen_ai_service.routing.model_router import select_provider_and_model
 from tnh_scholar.gen_ai_service.safety import safety_gate
+from tnh_scholar.gen_ai_service.streaming import CompletionStream
+from tnh_scholar.gen_ai_service.utils.token_utils import token_count_messages
 from tnh_scholar.prompt_system.domain.models import PromptMetadata, PromptOutputMode
 from tnh_scholar.prompt_system.service.contract_schema import (
     PromptContractSchemaResolver,
@@ -51,6 +68,18 @@ from tnh_scholar.prompt_system.service.contract_schema import (
 )
 
 
+@dataclass(frozen=True)
+class PreparedCall:
+    """Provider-ready request plus the pre-dispatch context needed to finalize it."""
+
+    fingerprint: Fingerprint
+    selection: ResolvedParams
+    safety_report: safety_gate.SafetyReport
+    resolved_schema: ResolvedPromptContractSchema | None
+    provider_request: ProviderRequest
+    cache_key: str | None = None
+
+
 class GenAIService:
     # Note for V1 we are defaulting to limited provenance info.
 
@@ -66,15 +95,123 @@ class GenAIService:
             prompts_base = IssueHandler.no_prompt_catalog()
         if prompts_base is None:
             raise RuntimeError("GenAIService could not determine a prompt catalog directory")
-        self.catalog: PromptCatalogProtocol = PromptsAdapter(prompts_base=prompts_base)
+        self.catalog: PromptCatalogProtocol = PromptsAdapter(
+            prompts_base=prompts_base,
+            persistent_index=self.settings.prompt_catalog_persistent_index,
+            index_path=self.settings.prompt_catalog_index_path,
+        )
         self.openai_adapter = OpenAIAdapter()
+        self.rate_limits = RateLimiterPool(self.settings.rate_limit_tier)
+        self.completion_cache: CompletionCache | None = _build_completion_cache(self.settings)
+        _attach_metrics_exporter(self.settings)
         self._schema_resolver = PromptContractSchemaResolver.for_prompt_directory(prompts_base)
 
     def generate(self, request: RenderRequest) -> CompletionEnvelope:
+        with span("genai.generate", instruction_key=request.instruction_key):
+            return self._generate(request)
+
+    def _generate(self, request: RenderRequest) -> CompletionEnvelope:
+        prepared = self._prepare_call(request)
+        if cached := self._cached_response(prepared):
+            return self._finalize_cached(prepared, cached)
+        selection = prepared.selection
+        with span("genai.rate_limit", model=selection.model):
+            rate_limit = self.rate_limits.acquire(
+                selection.provider,
+                selection.model,
+                prepared.safety_report.prompt_tokens,
+            )
+
+        started = datetime.now()
+        with span("genai.provider_call", provider=selection.provider, model=selection.model) as call:
+            if selection.provider == "openai":
+                response: ProviderResponse = self.openai_client.generate(prepared.provider_request)
+            else:
+                # (Anthropic skeleton later)
+                raise NotImplementedError(selection.provider)
+            call.set(attempts=response.attempts)
+        finished = datetime.now()
+        self._store_response(prepared, response)
+
+        return self._finalize_call(
+            prepared,
+            response,
+            started_at=started,
+            finished_at=finished,
+            rate_limit=rate_limit,
+        )
+
+    def generate_stream(self, request: RenderRequest) -> CompletionStream:
+        """Start a streaming completion.
+
+        Catalog rendering, the safety gate, rate limiting, and opening the
+        provider stream happen before this returns, so their errors raise
+        here. Iterate the result for text deltas; its `envelope` is finalized
+        (usage, finish reason, JSON contract) once the stream is exhausted.
+        Cache hits replay the stored text as a single delta.
+        """
+        with span("genai.generate_stream", instruction_key=request.instruction_key) as parent:
+            prepared = self._prepare_call(request)
+            if cached := self._cached_response(prepared):
+                envelope = self._finalize_cached(prepared, cached)
+                return CompletionStream.completed(cached.payload.text if cached.payload else "", envelope)
+            selection = prepared.selection
+            with span("genai.rate_limit", model=selection.model):
+                rate_limit = self.rate_limits.acquire(
+                    selection.provider,
+                    selection.model,
+                    prepared.safety_report.prompt_tokens,
+                )
+
+            started = datetime.now()
+            if selection.provider != "openai":
+                raise NotImplementedError(selection.provider)
+            provider_stream = self.openai_client.generate_stream(prepared.provider_request)
+
+        def _finalize() -> CompletionEnvelope:
+            response = provider_stream.response
+            self._store_response(prepared, response)
+            return self._finalize_call(
+                prepared,
+                response,
+                started_at=started,
+                finished_at=datetime.now(),
+                rate_limit=rate_limit,
+            )
+
+        return CompletionStream(_timed_deltas(provider_stream, parent, selection.model), _finalize)
+
+    def call_provider(self, provider_request: ProviderRequest) -> ProviderResponse:
+        """Send an already-built provider request through the shared rate limiter.
+
+        For callers that bypass the prompt catalog (`adapters.simple_completion`):
+        no rendering, safety gate, completion cache, or JSON contract is applied,
+        but the call shares this service's RPM/TPM limiter with `generate` and
+        records the same spans and usage metrics.
+        """
+        provider = provider_request.provider
+        model = provider_request.model
+        if provider != "openai":
+            raise NotImplementedError(provider)
+        with span("genai.call_provider", provider=provider, model=model):
+            prompt_tokens = token_count_messages(provider_request.messages, model=model)
+            with span("genai.rate_limit", model=model):
+                self.rate_limits.acquire(provider, model, prompt_tokens)
+            with span("genai.provider_call", provider=provider, model=model) as call:
+                response = self.openai_client.generate(provider_request)
+                call.set(attempts=response.attempts)
+            if response.usage is not None:
+                self.rate_limits.settle(provider, model, response.usage.tokens_out)
+            _record_usage(provider, model, response, cache_hit=False)
+        return response
+
+    def _prepare_call(self, request: RenderRequest) -> PreparedCall:
+        """Run catalog → policy → router → safety gate and build the provider request."""
         prompt_metadata = self.catalog.introspect(request.instruction_key)
         resolved_schema = self._resolve_json_schema(prompt_metadata)
         # Adapter / catalog returns a RenderedPrompt and a Fingerprint (per ADR-A12)
-        rendered, fingerprint = self.catalog.render(request)
+        with span("genai.render"):
+            rendered, fingerprint = self.catalog.render(request)
 
         # Resolve params strictly via policy → router (no literals)
         base_params = apply_policy(
@@ -91,12 +228,13 @@ class GenAIService:
         )
         # selection contains: provider, model, temperature, max_output_tokens, seed
 
-        safety_report = safety_gate.pre_check(
-            rendered,
-            selection,
-            self.settings,
-            prompt_metadata=prompt_metadata,
-        )
+        with span("genai.safety_gate"):
+            safety_report = safety_gate.pre_check(
+                rendered,
+                selection,
+                self.settings,
+                prompt_metadata=prompt_metadata,
+            )
 
         provider_request = ProviderRequest(
             provider=selection.provider,
@@ -112,32 +250,71 @@ class GenAIService:
                 provider=selection.provider,
             ),
         )
+        return PreparedCall(
+            fingerprint=fingerprint,
+            selection=selection,
+            safety_report=safety_report,
+            resolved_schema=resolved_schema,
+            provider_request=provider_request,
+            cache_key=(
+                completion_cache_key(fingerprint, provider_request)
+                if self.completion_cache is not None
+                else None
+            ),
+        )
 
-        started = datetime.now()
-        if selection.provider == "openai":
-            response: ProviderResponse = self.openai_client.generate(provider_request)
-        else:
-            # (Anthropic skeleton later)
-            raise NotImplementedError(selection.provider)
-        finished = datetime.now()
+    def _cached_response(self, prepared: PreparedCall) -> ProviderResponse | None:
+        if self.completion_cache is None or prepared.cache_key is None:
+            return None
+        return self.completion_cache.get(prepared.cache_key)
+
+    def _store_response(self, prepared: PreparedCall, response: ProviderResponse) -> None:
+        if self.completion_cache is None or prepared.cache_key is None:
+            return
+        self.completion_cache.put(prepared.cache_key, response)
+
+    def _finalize_cached(self, prepared: PreparedCall, response: ProviderResponse) -> CompletionEnvelope:
+        """Finalize a cache hit without touching the provider or rate limiter."""
+        now = datetime.now()
+        return self._finalize_call(prepared, response, started_at=now, finished_at=now, cache_hit=True)
 
+    def _finalize_call(
+        self,
+        prepared: PreparedCall,
+        response: ProviderResponse,
+        *,
+        started_at: datetime,
+        finished_at: datetime,
+        rate_limit: RateLimitAcquisition | None = None,
+        cache_hit: bool = False,
+    ) -> CompletionEnvelope:
+        """Map a provider response into a contract-checked CompletionEnvelope."""
+        selection = prepared.selection
+        if response.usage is not None and not cache_hit:
+            self.rate_limits.settle(selection.provider, selection.model, response.usage.tokens_out)
         provenance = build_provenance(
-            fingerprint=fingerprint,
+            fingerprint=prepared.fingerprint,
             provider=selection.provider,
             model=selection.model,
             sdk_version=getattr(self.openai_client, "sdk_version", None),
-            started_at=started,
-            finished_at=finished,
+            started_at=started_at,
+            finished_at=finished_at,
             attempt_count=response.attempts,
         )
+        _record_usage(selection.provider, selection.model, response, cache_hit=cache_hit)
 
         envelope = provider_to_completion(
             response,
             provenance=provenance,
-            policy_applied=_build_policy_applied(selection.routing_reason, safety_report),
-            warnings=list(safety_report.warnings),
+            policy_applied=_build_policy_applied(
+                selection.routing_reason,
+                prepared.safety_report,
+                rate_limit,
+                _cache_policy(self.completion_cache, cache_hit),
+            ),
+            warnings=list(prepared.safety_report.warnings),
         )
-        return self._apply_json_contract(envelope, resolved_schema)
+        return self._apply_json_contract(envelope, prepared.resolved_schema)
 
     def _resolve_json_schema(
         self,
@@ -174,6 +351,8 @@ class GenAIService:
 def _build_policy_applied(
     routing_reason: str | None,
     safety_report: safety_gate.SafetyReport,
+    rate_limit: RateLimitAcquisition | None = None,
+    cache_policy: PolicyApplied | None = None,
 ) -> PolicyApplied:
     """Construct a PolicyApplied dict while filtering out None values."""
     policy: PolicyApplied = {
@@ -185,9 +364,85 @@ def _build_policy_applied(
     }
     if routing_reason is not None:
         policy["routing_reason"] = routing_reason
+    if rate_limit is not None:
+        policy["rate_limit_tier"] = rate_limit.tier
+        policy["rate_limit_wait_s"] = round(rate_limit.waited_s, 3)
+    if cache_policy:
+        policy.update(cache_policy)
     return policy
 
 
+def _cache_policy(cache: CompletionCache | None, hit: bool) -> PolicyApplied | None:
+    if cache is None:
+        return None
+    return {
+        "cache": "hit" if hit else "miss",
+        "cache_hits": cache.stats.hits,
+        "cache_misses": cache.stats.misses,
+    }
+
+
+def _timed_deltas(provider_stream: ProviderStream, parent: Span, model: str) -> Iterator[str]:
+    """Pass deltas through, recording a `genai.provider_stream` span with time to first delta."""
+    start = time.perf_counter()
+    first_delta_s: float | None = None
+    status = "ok"
+    try:
+        for delta in provider_stream:
+            if first_delta_s is None:
+                first_delta_s = time.perf_counter() - start
+            yield delta
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        record_span(
+            "genai.provider_stream",
+            time.perf_counter() - start,
+            parent=parent,
+            status=status,
+            model=model,
+            time_to_first_delta_s=first_delta_s,
+        )
+
+
+def _record_usage(provider: str, model: str, response: ProviderResponse, *, cache_hit: bool) -> None:
+    usage = response.usage
+    cost = None
+    if usage is not None and not cache_hit:
+        cost = safety_gate.usage_cost(
+            provider,
+            model,
+            usage.tokens_in or 0,
+            usage.tokens_out or 0,
+        )
+    record_usage(
+        provider=provider,
+        model=model,
+        usage=usage,
+        attempts=response.attempts,
+        cost=cost,
+        cache_hit=cache_hit,
+    )
+
+
+def _attach_metrics_exporter(settings: GenAISettings) -> None:
+    """Export spans/usage to JSONL when enabled; the registry ignores duplicate exporters."""
+    if not settings.metrics_enabled:
+        return
+    get_metrics().add_sink(JsonlMetricsExporter(settings.metrics_path or default_metrics_path()))
+
+
+def _build_completion_cache(settings: GenAISettings) -> CompletionCache | None:
+    if not settings.completion_cache_enabled:
+        return None
+    return CompletionCache(
+        settings.completion_cache_path or default_completion_cache_path(),
+        max_bytes=settings.completion_cache_max_bytes,
+        ttl_s=settings.completion_cache_ttl_s,
+    )
+
+
 def _response_format_for_schema(
     *,
     resolved_schema: ResolvedPromptContractSchema | None,
@@ -0,0 +1,63 @@
+"""streaming.py: Streaming completion handle.
+
+`GenAIService.generate_stream` returns a `CompletionStream`: iterate it for
+text deltas as the provider produces them, then read `envelope` for the same
+contract-checked `CompletionEnvelope` that `generate` would have returned
+(usage, finish reason, provenance, policy_applied).
+
+Usage:
+    stream = service.generate_stream(request)
+    for delta in stream:
+        sys.stdout.write(delta)
+    envelope = stream.envelope
+
+Connected modules:
+  - service.GenAIService.generate_stream
+  - providers.streaming.ProviderStream
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable, Iterator
+
+from tnh_scholar.gen_ai_service.models.domain import CompletionEnvelope
+
+__all__ = [
+    "CompletionStream",
+]
+
+
+class CompletionStream:
+    """Single-use iterator of completion text deltas with a final envelope."""
+
+    def __init__(self, deltas: Iterable[str], finalize: Callable[[], CompletionEnvelope]) -> None:
+        self._deltas = deltas
+        self._finalize = finalize
+        self._envelope: CompletionEnvelope | None = None
+        self._started = False
+
+    @classmethod
+    def completed(cls, text: str, envelope: CompletionEnvelope) -> CompletionStream:
+        """A stream that replays an already finished completion as a single delta."""
+        return cls([text] if text else [], lambda: envelope)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._started:
+            raise RuntimeError("CompletionStream can only be iterated once")
+        self._started = True
+        yield from self._deltas
+        self._envelope = self._finalize()
+
+    @property
+    def envelope(self) -> CompletionEnvelope:
+        """The finalized envelope; raises until every delta has been consumed."""
+        if self._envelope is None:
+            raise RuntimeError("CompletionStream has not been fully consumed")
+        return self._envelope
+
+    def collect(self) -> CompletionEnvelope:
+        """Drain any remaining deltas and return the envelope."""
+        if not self._started:
+            for _ in self:
+                pass
+        return self.envelope
@@ -1,5 +1,5 @@
 """Utilities for GenAI service."""
 
-from .token_utils import token_count, token_count_file, token_count_messages
+from .token_utils import token_count, token_count_file, token_count_many, token_count_messages
 
-__all__ = ["token_count", "token_count_file", "token_count_messages"]
+__all__ = ["token_count", "token_count_file", "token_count_many", "token_count_messages"]
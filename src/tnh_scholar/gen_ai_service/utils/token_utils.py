@@ -10,6 +10,9 @@ Connected modules:
 
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
@@ -53,6 +56,9 @@ class _FallbackEncoding:
     def encode(self, text: str) -> list[int]:
         return [ord(char) for char in text] if text else []
 
+    def encode_batch(self, texts: list[str], num_threads: int = 8) -> list[list[int]]:
+        return [self.encode(text) for text in texts]
+
 
 @dataclass(frozen=True)
 class FormattingPolicy:
@@ -186,6 +192,119 @@ class EncodingProvider:
         return self._policy.default_encoding
 
 
+@dataclass(frozen=True)
+class TokenCounterStats:
+    """Memo hit/miss counters for a `TokenCounter`."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class TokenCounter:
+    """Memoizing text token counter with a batch API.
+
+    Counts are memoized in a bounded LRU keyed by (model, BLAKE2 digest of the
+    text), so the same transcript or section counted from several call sites
+    (segment sizing, max-token sizing, safety gate) is tokenized once.
+    `count_many` tokenizes all memo misses with tiktoken's multi-threaded
+    `encode_batch`.
+    """
+
+    def __init__(
+        self,
+        encoding_provider: EncodingProvider,
+        *,
+        maxsize: int = 8192,
+        num_threads: int = 8,
+    ) -> None:
+        self._encoding_provider = encoding_provider
+        self._maxsize = maxsize
+        self._num_threads = num_threads
+        self._memo: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def count(self, text: str, model: str = DEFAULT_TOKEN_MODEL) -> int:
+        if not text:
+            return 0
+        key = self._key(text, model)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        count = len(self._encoding_provider.get_encoding(model).encode(text))
+        self._store(key, count)
+        return count
+
+    def count_many(self, texts: Sequence[str], model: str = DEFAULT_TOKEN_MODEL) -> list[int]:
+        """Count tokens for each text, batching memo misses through `encode_batch`."""
+        counts: list[int] = [0] * len(texts)
+        pending: dict[tuple[str, bytes], list[int]] = {}
+        for index, text in enumerate(texts):
+            if not text:
+                continue
+            key = self._key(text, model)
+            cached = self._lookup(key)
+            if cached is not None:
+                counts[index] = cached
+            else:
+                pending.setdefault(key, []).append(index)
+
+        if pending:
+            keys = list(pending)
+            batch = [texts[pending[key][0]] for key in keys]
+            for key, tokens in zip(keys, self._encode_batch(batch, model), strict=True):
+                self._store(key, len(tokens))
+                for index in pending[key]:
+                    counts[index] = len(tokens)
+        return counts
+
+    def stats(self) -> TokenCounterStats:
+        with self._lock:
+            return TokenCounterStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._memo),
+                maxsize=self._maxsize,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memo.clear()
+            self._hits = self._misses = 0
+
+    def _encode_batch(self, texts: list[str], model: str) -> list[list[int]]:
+        encoding = self._encoding_provider.get_encoding(model)
+        encode_batch = getattr(encoding, "encode_batch", None)
+        if encode_batch is None:
+            return [encoding.encode(text) for text in texts]
+        return encode_batch(texts, num_threads=self._num_threads)
+
+    @staticmethod
+    def _key(text: str, model: str) -> tuple[str, bytes]:
+        digest = hashlib.blake2b(text.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+        return model, digest
+
+    def _lookup(self, key: tuple[str, bytes]) -> int | None:
+        with self._lock:
+            count = self._memo.get(key)
+            if count is None:
+                self._misses += 1
+                return None
+            self._memo.move_to_end(key)
+            self._hits += 1
+            return count
+
+    def _store(self, key: tuple[str, bytes], count: int) -> None:
+        with self._lock:
+            self._memo[key] = count
+            self._memo.move_to_end(key)
+            while len(self._memo) > self._maxsize:
+                self._memo.popitem(last=False)
+
+
 class MessageContentRenderer:
     """Converts structured message content into deterministic text."""
 
@@ -310,10 +429,12 @@ class MessageTokenCounter:
         encoding_provider: EncodingProvider,
         renderer: MessageContentRenderer,
         policy_registry: ModelPolicyRegistry,
+        token_counter: TokenCounter | None = None,
     ) -> None:
         self._encoding_provider = encoding_provider
         self._renderer = renderer
         self._policies = policy_registry
+        self._token_counter = token_counter or TokenCounter(encoding_provider)
 
     def count(self, messages: MessageSequence, model: str) -> int:
         if not messages:
@@ -325,17 +446,17 @@ class MessageTokenCounter:
 
         for message in messages:
             num_tokens += policy.tokens_per_message
-            num_tokens += self._count_content_tokens(message, encoding)
+            num_tokens += self._count_content_tokens(message, model)
             num_tokens += len(encoding.encode(self._role_text(message)))
             num_tokens += self._count_name_tokens(message, encoding, policy.tokens_per_name)
 
         return num_tokens
 
-    def _count_content_tokens(self, message: Message, encoding: _EncodingLike) -> int:
+    def _count_content_tokens(self, message: Message, model: str) -> int:
         if not message.content:
             return 0
         normalized = self._renderer.render(message.content)
-        return len(encoding.encode(normalized))
+        return self._token_counter.count(normalized, model)
 
     def _role_text(self, message: Message) -> str:
         return str(message.role)
@@ -392,6 +513,7 @@ class CompletionBudgetEstimator:
 
 
 _encoding_provider = EncodingProvider()
+_token_counter = TokenCounter(_encoding_provider)
 _content_renderer = MessageContentRenderer()
 _policy_registry = ModelPolicyRegistry(
     context_limit_resolver=RegistryContextLimitResolver(FALLBACK_CONTEXT_LIMIT),
@@ -401,6 +523,7 @@ _message_counter = MessageTokenCounter(
     encoding_provider=_encoding_provider,
     renderer=_content_renderer,
     policy_registry=_policy_registry,
+    token_counter=_token_counter,
 )
 _completion_estimator = CompletionBudgetEstimator(
     policy_registry=_policy_registry,
@@ -419,7 +542,26 @@ def token_count(text: str, model: str = DEFAULT_TOKEN_MODEL) -> int:
     Returns:
         int: Number of tokens in the text
     """
-    return _encoding_provider.count_text(text, model)
+    return _token_counter.count(text, model)
+
+
+def token_count_many(texts: Sequence[str], model: str = DEFAULT_TOKEN_MODEL) -> list[int]:
+    """
+    Count tokens for several texts at once.
+
+    Args:
+        texts: Texts to count tokens in
+        model: Model to use for encoding (default: gpt-4o)
+
+    Returns:
+        list[int]: Token count per text, in input order
+    """
+    return _token_counter.count_many(texts, model)
+
+
+def get_token_counter() -> TokenCounter:
+    """Return the shared memoizing counter used by the module-level helpers."""
+    return _token_counter
 
 
 def token_count_file(file_path: Union[str, Path], model: str = DEFAULT_TOKEN_MODEL) -> int:
@@ -461,7 +603,10 @@ def estimate_max_completion_tokens(
 
 
 __all__ = [
+    "TokenCounter",
+    "get_token_counter",
     "token_count",
+    "token_count_many",
     "token_count_file",
     "token_count_messages",
     "estimate_max_completion_tokens",
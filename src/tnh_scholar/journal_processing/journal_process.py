@@ -1,6 +1,8 @@
 import json
 import logging
 import re
+import tempfile
+import time
 from datetime import datetime
 from math import floor
 from pathlib import Path
@@ -8,6 +10,8 @@ from types import SimpleNamespace
 from typing import Any, Callable, List, Sequence, TypedDict, cast
 
 from tnh_scholar.gen_ai_service.adapters.simple_completion import simple_completion
+from tnh_scholar.gen_ai_service.batch_runner import BatchRunner, write_batch_file
+from tnh_scholar.gen_ai_service.models.errors import ProviderError
 from tnh_scholar.gen_ai_service.utils.token_utils import token_count
 from tnh_scholar.utils.file_utils import read_str_from_file
 from tnh_scholar.xml_processing import (
@@ -170,6 +174,11 @@ def create_jsonl_file_for_batch(
     return resolved_output
 
 
+def _batch_runner(poll_interval: float, timeout: float) -> BatchRunner:
+    """Build the batch runner used by `start_batch_with_retries` (patched in tests)."""
+    return BatchRunner.from_settings(poll_interval=poll_interval, timeout=timeout)
+
+
 def start_batch_with_retries(
     jsonl_file: Path,
     description: str = "",
@@ -179,54 +188,75 @@ def start_batch_with_retries(
     timeout: int = 3600,
 ) -> list[str]:
     """
-    Simulate the legacy batch runner using sequential simple_completion calls.
-
-    The parameters mirror the old interface so callers remain unchanged, but the
-    implementation now iterates through the JSONL requests locally.
+    Run a JSONL request file through the provider Batch API and return texts in input order.
+
+    Batches that fail, expire, or time out (timed-out batches are cancelled by
+    the runner first), and transient provider errors while uploading, polling,
+    or downloading, trigger a resubmission; when only some requests fail, just
+    those requests are resubmitted. Resubmission files are written to a
+    temporary directory that is removed afterwards. Gives up after
+    `max_retries` resubmissions.
     """
-    logger.info(
-        "Running sequential batch for '%s' using %s",
-        description,
-        jsonl_file,
-    )
-    responses: list[str] = []
-    try:
-        with jsonl_file.open("r", encoding="utf-8") as handle:
-            for line_no, line in enumerate(handle, start=1):
-                if not line.strip():
-                    continue
-                payload = json.loads(line)
-                body = payload.get("body", {})
-                request_model = body.get("model", DEFAULT_JOURNAL_MODEL)
-                messages = body.get("messages", [])
-                max_tokens = body.get("max_tokens") or body.get("max_completion_tokens")
-                if not max_tokens:
-                    max_tokens = _get_model_settings(request_model)["max_tokens"]
-                system_message, user_message = _extract_message_parts(messages)
-                response = simple_completion(
-                    system_message=system_message,
-                    user_message=user_message,
-                    model=request_model,
-                    max_tokens=max_tokens,
-                )
-                responses.append(response)
-                logger.debug("Processed request %s from batch file", line_no)
+    runner = _batch_runner(poll_interval, timeout)
+    request_lines = _read_batch_lines(jsonl_file)
+    label = description or jsonl_file
+    # Resubmission files are scratch data; keep them out of the caller's directory
+    with tempfile.TemporaryDirectory(prefix="tnh-batch-retry-") as retry_dir:
+        responses = _run_batch_attempts(
+            runner, jsonl_file, request_lines, description, max_retries, retry_delay, Path(retry_dir)
+        )
+    if responses is None:
+        logger.error("Batch '%s' did not complete after %s retries", label, max_retries)
+        raise RuntimeError(f"Failed to complete batch '{label}' after {max_retries} retries")
 
-    except Exception as exc:
-        logger.error(
-            "Failed to process batch '%s' from %s",
+    logger.info("Batch for '%s' completed with %s responses.", label, len(responses))
+    return [responses[line["custom_id"]] for line in request_lines]
+
+
+def _run_batch_attempts(
+    runner: BatchRunner,
+    jsonl_file: Path,
+    request_lines: list[dict[str, Any]],
+    description: str,
+    max_retries: int,
+    retry_delay: int,
+    retry_dir: Path,
+) -> dict[str, str] | None:
+    """Run and resubmit until every request has a response; None if retries run out."""
+    responses: dict[str, str] = {}
+    pending_file = jsonl_file
+    for attempt in range(max_retries + 1):
+        logger.info(
+            "Running batch for '%s' using %s (attempt %s)",
             description or jsonl_file,
-            jsonl_file,
-            exc_info=True,
+            pending_file,
+            attempt + 1,
         )
-        raise RuntimeError("Failed to process batch sequentially") from exc
-
-    logger.info(
-        "Sequential batch for '%s' completed with %s responses.",
-        description or jsonl_file,
-        len(responses),
-    )
-    return responses
+        try:
+            results = runner.run(pending_file, description=description)
+        except ProviderError as exc:
+            # Failed/expired/timed-out batches and transient upload/poll/download errors alike
+            logger.warning("Batch attempt %s for '%s' failed: %s", attempt + 1, description, exc)
+        else:
+            for item in results:
+                if item.text is not None:
+                    responses[item.custom_id] = item.text
+                else:
+                    logger.warning("Batch request %s failed: %s", item.custom_id, item.error)
+
+        pending = [line for line in request_lines if line["custom_id"] not in responses]
+        if not pending:
+            return responses
+        if attempt < max_retries:
+            pending_file = retry_dir / f"{jsonl_file.stem}.retry{attempt + 1}.jsonl"
+            write_batch_file(pending, pending_file)
+            time.sleep(retry_delay)
+    return None
+
+
+def _read_batch_lines(jsonl_file: Path) -> list[dict[str, Any]]:
+    with jsonl_file.open("r", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
 
 
 # logger setup function
@@ -2,8 +2,9 @@ import re
 from collections.abc import MutableMapping
 from copy import deepcopy
 from datetime import date, datetime
+from itertools import chain
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Union, cast
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Union, cast
 
 import yaml
 from pydantic_core import core_schema
@@ -19,6 +20,8 @@ JsonValue = Union[str, int, float, bool, list, dict, None]
 
 logger = get_child_logger(__name__)
 
+_FRONTMATTER_CLOSE = re.compile(r"---\s*")
+
 
 def safe_yaml_load(yaml_str: str, *, context: str = "unknown") -> dict:
     try:
@@ -40,8 +43,17 @@ class Metadata(MutableMapping):
     Flexible metadata container that behaves like a dict while ensuring
     JSON serializability. Designed for AI processing pipelines where schema
     flexibility is prioritized over structure.
+
+    `snapshot()` returns a copy-on-write view: both instances share one dict
+    until either is modified. Nested values (lists, dicts) are shared too, so
+    mutators here replace them rather than modifying them in place.
+    `frozen()` returns a read-only snapshot; like the sharing, its immutability
+    is shallow and does not extend into nested values.
     """
 
+    _shared: bool = False
+    _frozen: bool = False
+
     # Type processors at class level
     _type_processors = {
         Path: lambda p: path_as_str(p),
@@ -51,6 +63,7 @@ class Metadata(MutableMapping):
 
     def __init__(self, data: Optional[Union[Dict[str, Any], "Metadata"]] = None) -> None:
         self._data: Dict[str, JsonValue] = {}
+        self._shared = False
         if data is not None:
             raw_data = data._data if isinstance(data, Metadata) else data
             processed_data = {k: self._process_value(v) for k, v in raw_data.items()}
@@ -73,11 +86,36 @@ class Metadata(MutableMapping):
 
     def __setitem__(self, key: str, value: Any) -> None:
         """Process and set value, ensuring JSON serializability."""
+        self._own_data()
         self._data[key] = self._process_value(value)
 
     def __delitem__(self, key: str) -> None:
+        self._own_data()
         del self._data[key]
 
+    def _own_data(self) -> None:
+        """Detach from a shared snapshot before the first write."""
+        if self._frozen:
+            raise TypeError("Metadata is frozen; modify a snapshot() or copy() instead.")
+        if self._shared:
+            self._data = dict(self._data)
+            self._shared = False
+
+    def snapshot(self) -> "Metadata":
+        """Return a copy that shares this instance's data until either side is modified. O(1)."""
+        clone = Metadata()
+        clone._data = self._data
+        clone._shared = self._shared = True
+        return clone
+
+    def frozen(self) -> "Metadata":
+        """Return a read-only snapshot of this instance. O(1)."""
+        if self._frozen:
+            return self
+        clone = self.snapshot()
+        clone._frozen = True
+        return clone
+
     def __iter__(self) -> Iterator[str]:
         return iter(self._data)
 
@@ -101,6 +139,7 @@ class Metadata(MutableMapping):
 
     def __ior__(self, other: Union[Mapping[str, JsonValue], "Metadata"]) -> "Metadata":
         if isinstance(other, (Metadata, Mapping)):
+            self._own_data()
             self._data |= other._data if isinstance(other, Metadata) else other
             return self
         return NotImplemented
@@ -197,8 +236,8 @@ class Metadata(MutableMapping):
         history = self.get(TNH_METADATA_PROCESS_FIELD, [])
         if not isinstance(history, list):
             history = []
-        history.append(process_metadata.to_dict())  # Store as dict for serialization
-        self[TNH_METADATA_PROCESS_FIELD] = history
+        # Store as dict for serialization; build a new list since snapshots share it
+        self[TNH_METADATA_PROCESS_FIELD] = [*history, process_metadata.to_dict()]
 
     @property
     def process_history(self) -> List[Dict[str, Any]]:
@@ -255,6 +294,31 @@ class Frontmatter:
                 return Metadata(), content
         return Metadata(), content
 
+    @classmethod
+    def extract_from_lines(cls, lines: Iterable[str]) -> tuple[Metadata, Iterator[str]]:
+        """Streaming counterpart of `extract` for an iterable of newline-terminated lines.
+
+        Only the frontmatter block (plus the first content line) is buffered; the
+        returned iterator yields the remaining content lines, so
+        `"".join(content)` equals the content `extract` would return for the
+        joined text.
+        """
+        source = iter(lines)
+        head: List[str] = []
+        for line in source:
+            head.append(line)
+            if not head[0].startswith("---"):
+                break
+            if len(head) > 2 and _FRONTMATTER_CLOSE.fullmatch(line.rstrip("\n")):
+                # Trailing blank lines are part of the closing delimiter; keep one content line.
+                for tail in source:
+                    head.append(tail)
+                    if tail.strip():
+                        break
+                break
+        metadata, content = cls.extract("".join(head))
+        return metadata, chain(re.findall(r"[^\n]*\n|[^\n]+$", content), source)
+
     @classmethod
     def extract_from_file(cls, file: Path) -> tuple[Metadata, str]:
         """Adapter-level convenience wrapper that reads from disk then parses."""
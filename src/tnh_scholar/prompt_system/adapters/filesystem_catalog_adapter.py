@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import atexit
 import builtins
+import os
+import weakref
 from pathlib import Path
 
 from pydantic import ValidationError
@@ -19,13 +22,35 @@ from ..domain.protocols import PromptCatalogPort
 from ..mappers.prompt_mapper import PromptMapper
 from ..service.loader import PromptLoader
 from ..transport.cache import CacheTransport, InMemoryCacheTransport
+from ..transport.catalog_index import PromptCatalogIndex
 from ..transport.filesystem import FilesystemTransport
 from ..transport.models import PromptFileRequest
 from .frontmatter_fallback import extract_best_effort_body
 
+# Minimum spacing between index rewrites triggered by individual `get()` misses
+INDEX_SAVE_INTERVAL_S = 5.0
+
+# Indexed catalogs not yet closed; flushed at interpreter exit so debounced
+# entries are not lost by callers that never call `close()`
+_UNCLOSED_INDEXED_CATALOGS: weakref.WeakSet[FilesystemPromptCatalog] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_indexed_catalogs() -> None:
+    for catalog in list(_UNCLOSED_INDEXED_CATALOGS):
+        catalog.close()
+
 
 class FilesystemPromptCatalog(PromptCatalogPort):
-    """Filesystem-backed catalog for offline/packaged distributions."""
+    """Filesystem-backed catalog for offline/packaged distributions.
+
+    With `config.persistent_index` (or an explicit `index`), parsed prompts and
+    their catalog issues are reused across processes for files whose
+    mtime/size or content hash are unchanged. `list()` writes the index once;
+    entries added by `get()` misses are written at most every
+    `INDEX_SAVE_INTERVAL_S` seconds, and any remainder on `close()` (called
+    automatically at interpreter exit for catalogs that were never closed).
+    """
 
     _EXPECTED_FRONTMATTER = (
         "Expected prompt envelope keys include prompt_id/key, name, version, description, "
@@ -40,6 +65,7 @@ class FilesystemPromptCatalog(PromptCatalogPort):
         loader: PromptLoader,
         cache: CacheTransport[Prompt] | None = None,
         transport: FilesystemTransport | None = None,
+        index: PromptCatalogIndex | None = None,
     ):
         self._config = config
         self._mapper = mapper
@@ -47,6 +73,15 @@ class FilesystemPromptCatalog(PromptCatalogPort):
         self._cache = cache or InMemoryCacheTransport(default_ttl_s=config.cache_ttl_s)
         self._transport = transport or FilesystemTransport(mapper)
         self._health = CatalogHealth()
+        self._index = index
+        if index is None and config.persistent_index:
+            self._index = PromptCatalogIndex.for_root(
+                config.repository_path,
+                validation_on_load=config.validation_on_load,
+                path=config.index_path,
+            )
+        if self._index is not None:
+            _UNCLOSED_INDEXED_CATALOGS.add(self)
 
     def get(self, key: str) -> Prompt:
         cache_key = self._make_cache_key(key)
@@ -54,31 +89,75 @@ class FilesystemPromptCatalog(PromptCatalogPort):
             return cached
 
         file_path = self._mapper.to_file_request(key, self._config.repository_path)
-        request = PromptFileRequest(path=file_path, commit_sha=None)
-        file_resp = self._transport.read_file(request)
-        prompt = self._load_prompt_from_content(key, file_resp.content, health=self._health)
+        prompt = self._load_prompt_file(key, file_path, health=self._health)
         self._cache.set(cache_key, prompt, ttl_s=self._config.cache_ttl_s)
+        if self._index is not None:
+            self._index.save(min_interval_s=INDEX_SAVE_INTERVAL_S)
         return prompt
 
+    def close(self) -> None:
+        """Write any index entries still pending from debounced `get()` saves."""
+        _UNCLOSED_INDEXED_CATALOGS.discard(self)
+        if self._index is not None:
+            self._index.save()
+
     def list(self) -> list[PromptMetadata]:
         files = self._transport.list_files(self._config.repository_path, pattern="**/*.md")
         health = CatalogHealth()
         prompts = []
+        seen: set[str] = set()
         for path in files:
             if self._should_ignore_path(path):
                 continue
             key = self._mapper.to_key_from_path(path, self._config.repository_path)
-            request = PromptFileRequest(
-                path=path,
-                commit_sha=None,
-            )
-            file_resp = self._transport.read_file(request)
-            prompt = self._load_prompt_from_content(key, file_resp.content, health=health)
+            seen.add(self._index_path_for(path))
+            prompt = self._load_prompt_file(key, path, health=health)
             self._cache.set(self._make_cache_key(key), prompt, ttl_s=self._config.cache_ttl_s)
             prompts.append(prompt)
         self._health = health
+        if self._index is not None:
+            self._index.prune(seen)
+            self._index.save()
         return [p.metadata for p in prompts]
 
+    def _load_prompt_file(self, key: str, path: Path, *, health: CatalogHealth) -> Prompt:
+        """Load one prompt file, reusing the persistent index entry when the file is unchanged."""
+        if self._index is None:
+            file_resp = self._transport.read_file(PromptFileRequest(path=path, commit_sha=None))
+            return self._load_prompt_from_content(key, file_resp.content, health=health)
+
+        index_path = self._index_path_for(path)
+        stat = os.stat(path)
+        entry = self._index.lookup(index_path, stat)
+        content: str | None = None
+        if entry is None:
+            content = self._transport.read_file(PromptFileRequest(path=path, commit_sha=None)).content
+            entry = self._index.lookup_by_content(index_path, stat, content)
+        if entry is not None and self._is_reusable(entry.prompt):
+            health.errors.extend(entry.errors)
+            health.warnings.extend(entry.warnings)
+            return entry.prompt
+
+        if content is None:
+            content = self._transport.read_file(PromptFileRequest(path=path, commit_sha=None)).content
+        file_health = CatalogHealth()
+        prompt = self._load_prompt_from_content(key, content, health=file_health)
+        self._index.store(index_path, stat, content=content, prompt=prompt, health=file_health)
+        health.errors.extend(file_health.errors)
+        health.warnings.extend(file_health.warnings)
+        return prompt
+
+    def _is_reusable(self, prompt: Prompt) -> bool:
+        # Schema-backed contracts depend on files outside the prompt; always revalidate those.
+        contract = prompt.metadata.output_contract
+        return not (self._config.validation_on_load and contract is not None and contract.schema_ref)
+
+    def _index_path_for(self, path: Path) -> str:
+        try:
+            return path.resolve().relative_to(self._config.repository_path.resolve()).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
     def _load_prompt_from_content(
         self,
         key: str,
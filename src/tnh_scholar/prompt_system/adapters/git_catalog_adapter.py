@@ -127,17 +127,19 @@ class GitPromptCatalog(PromptCatalogPort):
         return list(warnings)
 
     def list(self) -> list[PromptMetadata]:
-        files = self._transport.list_files(pattern="**/*.md")
+        files = [
+            path
+            for path in self._transport.list_files(pattern="**/*.md")
+            if not self._should_ignore_path(path)
+        ]
+        keys = [self._mapper.to_key_from_path(path, self._config.repository_path) for path in files]
+        file_resps = self._transport.read_files_at_commit([self._build_file_request(key) for key in keys])
+        commit = self._transport.get_current_commit()
         health = CatalogHealth()
         prompts = []
-        for path in files:
-            if self._should_ignore_path(path):
-                continue
-            key = self._mapper.to_key_from_path(path, self._config.repository_path)
-            file_req = self._build_file_request(key)
-            file_resp = self._transport.read_file_at_commit(file_req)
+        for key, file_resp in zip(keys, file_resps, strict=True):
             prompt = self._load_prompt_from_content(key, file_resp.content, health=health)
-            self._cache.set(self._make_cache_key(key), prompt, ttl_s=self._config.cache_ttl_s)
+            self._cache.set(self._cache_key(key, commit), prompt, ttl_s=self._config.cache_ttl_s)
             prompts.append(prompt)
         self._health = health
         return [p.metadata for p in prompts]
@@ -155,7 +157,10 @@ class GitPromptCatalog(PromptCatalogPort):
         return self._health.model_copy(deep=True)
 
     def _make_cache_key(self, prompt_key: str) -> str:
-        commit = self._transport.get_current_commit()
+        return self._cache_key(prompt_key, self._transport.get_current_commit())
+
+    @staticmethod
+    def _cache_key(prompt_key: str, commit: str) -> str:
         return f"{prompt_key}@{commit[:8]}"
 
     def _fallback_metadata(self, key: str, *, reason: str) -> PromptMetadata:
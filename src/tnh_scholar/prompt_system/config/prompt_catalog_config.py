@@ -12,6 +12,8 @@ class PromptCatalogConfig(BaseModel):
     enable_git_refresh: bool = True
     cache_ttl_s: int = 300
     validation_on_load: bool = True
+    persistent_index: bool = False
+    index_path: Path | None = None  # defaults to the user cache dir when persistent_index is set
 
 
 class GitTransportConfig(BaseModel):
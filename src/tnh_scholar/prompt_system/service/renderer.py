@@ -2,11 +2,12 @@
 
 from typing import Any
 
-from jinja2 import Environment, StrictUndefined, TemplateSyntaxError, Undefined
+from jinja2 import TemplateSyntaxError
 
 from ..config.policy import PromptRenderPolicy
 from ..domain.models import Message, Prompt, RenderedPrompt, RenderParams
 from ..domain.protocols import PromptRendererPort
+from .template_cache import CompiledTemplateCache, TemplatePolicy, get_template_cache
 
 
 class PromptRenderer(PromptRendererPort):
@@ -16,22 +17,24 @@ class PromptRenderer(PromptRendererPort):
         self,
         policy: PromptRenderPolicy,
         settings_defaults: dict[str, Any] | None = None,
+        template_cache: CompiledTemplateCache | None = None,
     ):
         self._policy = policy
         self._settings_defaults = settings_defaults or {}
+        self._template_cache = template_cache or get_template_cache()
 
     def render(self, prompt: Prompt, params: RenderParams) -> RenderedPrompt:
         """Render prompt with templating and precedence rules."""
         merged_vars = self._merge_variables(prompt, params)
-        env = Environment(
-            undefined=StrictUndefined if params.strict_undefined else Undefined,
+        template_policy = TemplatePolicy(
+            strict_undefined=params.strict_undefined,
             trim_blocks=not params.preserve_whitespace,
             lstrip_blocks=not params.preserve_whitespace,
         )
 
         try:
-            template = env.from_string(prompt.template)
-            system_content = template.render(**merged_vars)
+            compiled = self._template_cache.get(prompt.template, template_policy)
+            system_content = compiled.template.render(**merged_vars)
         except TemplateSyntaxError as exc:
             raise ValueError(f"Invalid prompt template: {exc}") from exc
 
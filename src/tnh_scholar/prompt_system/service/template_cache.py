@@ -0,0 +1,139 @@
+"""Compiled Jinja template cache.
+
+Shared by `PromptRenderer` and `ai_text_processing.prompts.Prompt` so a
+template is parsed and compiled once per process instead of once per render.
+Entries are keyed by the SHA-256 of the template source plus the rendering
+policy (undefined handling, whitespace control, autoescape); each policy gets
+its own long-lived `jinja2.Environment`.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from jinja2 import Environment, StrictUndefined, Template, Undefined
+from jinja2.meta import find_undeclared_variables
+
+DEFAULT_TEMPLATE_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True)
+class TemplatePolicy:
+    """Environment options that change how a template compiles."""
+
+    strict_undefined: bool = True
+    trim_blocks: bool = True
+    lstrip_blocks: bool = True
+    autoescape: bool = False
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A compiled template and the variables it references."""
+
+    template: Template
+    undeclared_variables: frozenset[str]
+
+
+@dataclass(frozen=True)
+class TemplateCacheStats:
+    """Snapshot of cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CompiledTemplateCache:
+    """Thread-safe bounded LRU of compiled Jinja templates."""
+
+    def __init__(self, maxsize: int = DEFAULT_TEMPLATE_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, TemplatePolicy], CompiledTemplate] = OrderedDict()
+        self._environments: dict[TemplatePolicy, Environment] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, source: str, policy: TemplatePolicy) -> CompiledTemplate:
+        """Return the compiled template for `source`, compiling it on a miss.
+
+        Raises:
+            jinja2.TemplateSyntaxError: If the template is invalid (never cached).
+        """
+        key = (hashlib.sha256(source.encode("utf-8")).hexdigest(), policy)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+            env = self._environment(policy)
+
+        # Compile outside the lock; a concurrent miss on the same key just compiles twice.
+        ast = env.parse(source)
+        entry = CompiledTemplate(
+            template=env.from_string(ast),
+            undeclared_variables=frozenset(find_undeclared_variables(ast)),
+        )
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return entry
+
+    def stats(self) -> TemplateCacheStats:
+        with self._lock:
+            return TemplateCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self._maxsize,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _environment(self, policy: TemplatePolicy) -> Environment:
+        env = self._environments.get(policy)
+        if env is None:
+            env = Environment(
+                undefined=StrictUndefined if policy.strict_undefined else Undefined,
+                trim_blocks=policy.trim_blocks,
+                lstrip_blocks=policy.lstrip_blocks,
+                autoescape=policy.autoescape,
+            )
+            self._environments[policy] = env
+        return env
+
+
+_shared_cache = CompiledTemplateCache()
+
+
+def get_template_cache() -> CompiledTemplateCache:
+    """Process-wide cache shared by all prompt renderers."""
+    return _shared_cache
+
+
+def template_cache_stats() -> TemplateCacheStats:
+    """Stats for the process-wide template cache."""
+    return _shared_cache.stats()
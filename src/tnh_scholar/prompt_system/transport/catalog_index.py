@@ -0,0 +1,218 @@
+"""Persistent on-disk index for filesystem prompt catalogs.
+
+Stores, per prompt file, the parsed `Prompt`, the catalog issues produced while
+loading it, its content hash, and the mtime/size observed when it was indexed.
+A fresh process can then answer `list()`/`get()` for unchanged files without
+re-reading, frontmatter-parsing, or schema-validating them.
+
+Staleness rules:
+
+- Matching mtime/size is trusted only when the file was already older than
+  the entry by `RACY_WINDOW_NS` (the "racy git" problem: a file rewritten
+  within the filesystem timestamp granularity can keep its mtime).
+- Otherwise the file is re-read and its content hash compared; a match reuses
+  the entry and refreshes the recorded stat.
+
+The index lives in a single JSON document under the user cache directory,
+written atomically through a uniquely named temp file; unreadable or
+incompatible documents are discarded. Rewrites are debounced
+(`save(min_interval_s=...)`) so loading prompts one at a time does not rewrite
+the whole document per prompt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from platformdirs import user_cache_dir
+from pydantic import BaseModel, Field
+from pydantic import ValidationError as PydanticValidationError
+
+from tnh_scholar.logging_config import get_child_logger
+
+from ..domain.models import CatalogHealth, CatalogIssue, Prompt
+
+logger = get_child_logger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class CatalogIndexEntry(BaseModel):
+    """Indexed state for one prompt file."""
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    indexed_at_ns: int
+    prompt: Prompt
+    errors: list[CatalogIssue] = Field(default_factory=list)
+    warnings: list[CatalogIssue] = Field(default_factory=list)
+
+    def health(self) -> CatalogHealth:
+        return CatalogHealth(errors=list(self.errors), warnings=list(self.warnings))
+
+
+class CatalogIndexDocument(BaseModel):
+    """Serialized index document for one catalog root."""
+
+    format_version: int = INDEX_FORMAT_VERSION
+    root: str
+    validation_on_load: bool
+    entries: dict[str, CatalogIndexEntry] = Field(default_factory=dict)
+
+
+def default_catalog_index_path(root: Path) -> Path:
+    """Index file for `root` under the per-user cache directory."""
+    digest = hashlib.sha256(str(root.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(user_cache_dir("tnh-scholar")) / "prompt_catalog" / f"{digest}.json"
+
+
+def hash_content(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class PromptCatalogIndex:
+    """Load/lookup/store/save for a persistent prompt catalog index."""
+
+    def __init__(self, path: Path, *, root: Path, validation_on_load: bool):
+        self.path = Path(path)
+        self._root = str(root.resolve())
+        self._validation_on_load = validation_on_load
+        self._document = self._load()
+        self._dirty = False
+        self._last_saved = float("-inf")
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_root(
+        cls,
+        root: Path,
+        *,
+        validation_on_load: bool,
+        path: Path | None = None,
+    ) -> PromptCatalogIndex:
+        return cls(path or default_catalog_index_path(root), root=root, validation_on_load=validation_on_load)
+
+    def lookup(self, relative_path: str, stat: os.stat_result) -> CatalogIndexEntry | None:
+        """Return the entry if `stat` proves the file unchanged since it was indexed."""
+        entry = self._document.entries.get(relative_path)
+        if entry is None or entry.mtime_ns != stat.st_mtime_ns or entry.size != stat.st_size:
+            return None
+        if stat.st_mtime_ns + RACY_WINDOW_NS > entry.indexed_at_ns:
+            return None
+        return entry
+
+    def lookup_by_content(
+        self,
+        relative_path: str,
+        stat: os.stat_result,
+        content: str,
+    ) -> CatalogIndexEntry | None:
+        """Return the entry if `content` hashes to the indexed value, refreshing its stat."""
+        entry = self._document.entries.get(relative_path)
+        if entry is None or entry.content_hash != hash_content(content):
+            return None
+        if entry.mtime_ns != stat.st_mtime_ns or entry.size != stat.st_size:
+            with self._lock:
+                self._document.entries[relative_path] = entry.model_copy(
+                    update={
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "indexed_at_ns": time.time_ns(),
+                    }
+                )
+                self._dirty = True
+        return entry
+
+    def store(
+        self,
+        relative_path: str,
+        stat: os.stat_result,
+        *,
+        content: str,
+        prompt: Prompt,
+        health: CatalogHealth,
+    ) -> None:
+        entry = CatalogIndexEntry(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=hash_content(content),
+            indexed_at_ns=time.time_ns(),
+            prompt=prompt,
+            errors=list(health.errors),
+            warnings=list(health.warnings),
+        )
+        with self._lock:
+            self._document.entries[relative_path] = entry
+            self._dirty = True
+
+    def prune(self, keep: set[str]) -> None:
+        """Drop entries for files that no longer exist."""
+        with self._lock:
+            stale = set(self._document.entries) - keep
+            for relative_path in stale:
+                del self._document.entries[relative_path]
+            self._dirty = self._dirty or bool(stale)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def save(self, min_interval_s: float = 0.0) -> None:
+        """
+        Atomically persist the index if it changed; failures are logged, not raised.
+
+        Args:
+            min_interval_s: Skip the write (leaving the index dirty) if the last
+                write was less than this many seconds ago.
+        """
+        with self._lock:
+            if not self._dirty or time.monotonic() - self._last_saved < min_interval_s:
+                return
+            try:
+                self._write(self._document.model_dump_json())
+            except OSError as exc:
+                logger.warning(f"Could not write prompt catalog index {self.path}: {exc}")
+                return
+            self._dirty = False
+            self._last_saved = time.monotonic()
+
+    def _write(self, payload: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per writer, so concurrent threads or processes never share a temp file
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, self.path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def __len__(self) -> int:
+        return len(self._document.entries)
+
+    def _load(self) -> CatalogIndexDocument:
+        empty = CatalogIndexDocument(root=self._root, validation_on_load=self._validation_on_load)
+        try:
+            raw = self.path.read_text(encoding="utf-8")
+        except OSError:
+            return empty
+        try:
+            document = CatalogIndexDocument.model_validate_json(raw)
+        except PydanticValidationError:
+            logger.info(f"Discarding unreadable prompt catalog index {self.path}")
+            return empty
+        if (
+            document.format_version != INDEX_FORMAT_VERSION
+            or document.root != self._root
+            or document.validation_on_load != self._validation_on_load
+        ):
+            return empty
+        return document
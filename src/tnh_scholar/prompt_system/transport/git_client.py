@@ -3,24 +3,47 @@
 from __future__ import annotations
 
 import subprocess
+from collections.abc import Sequence
 from pathlib import Path
 
 from ..config.prompt_catalog_config import GitTransportConfig
 from ..mappers.prompt_mapper import PromptMapper
 from ..transport.models import GitRefreshResponse, PromptFileRequest, PromptFileResponse
 
+HeadSignature = tuple[object, ...]
+
 
 class GitTransportClient:
-    """Minimal git transport operations."""
+    """Minimal git transport operations.
+
+    The HEAD commit is memoized in memory and re-resolved only when `.git/HEAD`
+    or the ref it points to changes on disk (or after `pull_latest`), so cache
+    key construction does not spawn `git rev-parse` on every lookup.
+    """
 
     def __init__(self, config: GitTransportConfig, mapper: PromptMapper):
         self._config = config
         self._mapper = mapper
+        self._git_dirs: tuple[Path, Path] | None = None
+        self._head_signature: HeadSignature | None = None
+        self._head_commit: str | None = None
 
     def get_current_commit(self) -> str:
-        return self._run_git(["rev-parse", "HEAD"], cwd=self._config.repository_path).strip()
+        signature = self._head_file_signature()
+        if signature is not None and signature == self._head_signature and self._head_commit:
+            return self._head_commit
+        commit = self._run_git(["rev-parse", "HEAD"], cwd=self._config.repository_path).strip()
+        self._head_signature = signature
+        self._head_commit = commit
+        return commit
+
+    def invalidate_head(self) -> None:
+        """Forget the memoized HEAD commit (next lookup re-resolves it)."""
+        self._head_signature = None
+        self._head_commit = None
 
     def pull_latest(self) -> GitRefreshResponse:
+        self.invalidate_head()
         if not self._config.auto_pull:
             return GitRefreshResponse(
                 current_commit=self.get_current_commit(),
@@ -33,6 +56,7 @@ class GitTransportClient:
             cwd=self._config.repository_path,
             timeout=self._config.pull_timeout_s,
         )
+        self.invalidate_head()
         return GitRefreshResponse(
             current_commit=self.get_current_commit(),
             branch=self._current_branch(),
@@ -41,12 +65,25 @@ class GitTransportClient:
         )
 
     def read_file_at_commit(self, request: PromptFileRequest) -> PromptFileResponse:
-        if request.commit_sha:
-            spec = f"{request.commit_sha}:{request.path}"
-            content = self._run_git(["show", spec], cwd=self._config.repository_path)
-        else:
-            content = request.path.read_text(encoding="utf-8")
+        return self.read_files_at_commit([request])[0]
+
+    def read_files_at_commit(self, requests: Sequence[PromptFileRequest]) -> list[PromptFileResponse]:
+        """Read several prompt files, in request order.
+
+        Commit-pinned requests are resolved through a single `git cat-file --batch`
+        process; unpinned requests read the working tree directly.
+        """
+        pinned = [request for request in requests if request.commit_sha]
+        blobs = self._cat_file_batch([self._blob_spec(request) for request in pinned]) if pinned else []
+        pinned_contents = iter(blobs)
+        return [
+            self._file_response(
+                next(pinned_contents) if request.commit_sha else request.path.read_text(encoding="utf-8")
+            )
+            for request in requests
+        ]
 
+    def _file_response(self, content: str) -> PromptFileResponse:
         metadata_raw, _ = self._mapper._split_frontmatter(content)
         return PromptFileResponse(
             content=content,
@@ -71,6 +108,85 @@ class GitTransportClient:
         except RuntimeError:
             return []
 
+    def _blob_spec(self, request: PromptFileRequest) -> str:
+        path = request.path
+        if path.is_absolute():
+            path = path.relative_to(self._config.repository_path)
+        # "./" makes the path relative to cwd (the catalog root) rather than the repo top level.
+        return f"{request.commit_sha}:./{path.as_posix()}"
+
+    def _cat_file_batch(self, specs: list[str]) -> list[str]:
+        result = subprocess.run(
+            ["git", "cat-file", "--batch"],
+            cwd=self._config.repository_path,
+            input="".join(f"{spec}\n" for spec in specs).encode("utf-8"),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False,
+        )
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"git cat-file --batch failed: {stderr}")
+
+        output = result.stdout
+        contents: list[str] = []
+        pos = 0
+        for spec in specs:
+            header_end = output.index(b"\n", pos)
+            header = output[pos:header_end].decode("utf-8", errors="replace")
+            pos = header_end + 1
+            if header.endswith(" missing") or header.endswith(" ambiguous"):
+                raise RuntimeError(f"git cat-file --batch failed: {spec} {header.rsplit(' ', 1)[-1]}")
+            size = int(header.rsplit(" ", 1)[-1])
+            contents.append(output[pos : pos + size].decode("utf-8"))
+            pos += size + 1  # blob content is followed by a newline
+        return contents
+
+    def _head_file_signature(self) -> HeadSignature | None:
+        """Cheap fingerprint of HEAD state: HEAD contents plus stat of the ref it names."""
+        git_dirs = self._resolve_git_dirs()
+        if git_dirs is None:
+            return None
+        git_dir, common_dir = git_dirs
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        if not head.startswith("ref: "):
+            return (head,)
+        ref = head[len("ref: ") :]
+        return (
+            head,
+            self._stat_key(git_dir / ref),
+            self._stat_key(common_dir / ref),
+            self._stat_key(common_dir / "packed-refs"),
+        )
+
+    def _resolve_git_dirs(self) -> tuple[Path, Path] | None:
+        if self._git_dirs is None:
+            try:
+                output = self._run_git(
+                    ["rev-parse", "--absolute-git-dir", "--git-common-dir"],
+                    cwd=self._config.repository_path,
+                )
+            except RuntimeError:
+                return None
+            git_dir_raw, common_dir_raw = output.splitlines()[:2]
+            git_dir = Path(git_dir_raw)
+            common_dir = Path(common_dir_raw)
+            if not common_dir.is_absolute():
+                common_dir = (self._config.repository_path / common_dir).resolve()
+            self._git_dirs = (git_dir, common_dir)
+        return self._git_dirs
+
+    @staticmethod
+    def _stat_key(path: Path) -> tuple[int, int, int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
     def _run_git(self, args: list[str], cwd: Path, timeout: float | None = None) -> str:
         result = subprocess.run(
             ["git", *args],
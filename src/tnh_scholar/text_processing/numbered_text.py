@@ -1,13 +1,23 @@
+import io
 import re
+from array import array
 from dataclasses import dataclass
+from itertools import accumulate, chain
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Match, NamedTuple, Optional, Set
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Match, NamedTuple, Optional, Sequence
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict
 
-from tnh_scholar.utils.file_utils import read_str_from_file, write_str_to_file
+from tnh_scholar.utils.file_utils import iter_lines_from_file, write_str_to_file
 from tnh_scholar.utils.math_utils import fraction_to_percent
 
+# Non-blank lines inspected by `NumberedText.from_stream` to detect numbering.
+NUMBERING_PROBE_LINES = 64
+
+# Characters other than "\n" that str.splitlines() treats as line boundaries.
+_OTHER_LINE_BREAKS = re.compile("[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
 
 class NumberedFormat(NamedTuple):
     is_numbered: bool
@@ -65,8 +75,14 @@ class NumberedText:
         - Blank line handling: After number removal, blank lines become empty strings
         - Example: "1: foo\\n2:\\n3: bar" → lines=[' foo', '', ' bar']
 
+    Storage:
+        Lines are held as one "\n"-joined buffer plus an array of line start
+        offsets, so memory is roughly a single copy of the text. `content` is the
+        buffer itself, segments are single slices of it (no per-line joins), and
+        numbered renderings are produced on demand rather than stored.
+
     Attributes:
-        lines (List[str]): List of text lines (do not modify after construction)
+        lines (List[str]): Text lines, materialized on access as a new list
         start (int): Starting line number (do not modify after construction)
         separator (str): Separator between line number and content (do not modify after construction)
 
@@ -220,9 +236,12 @@ class NumberedText:
             ['1: 1. First item', '2: 2. Second item']
         """
 
-        self.lines: List[str] = []  # Declare lines here
         self.start: int = start  # Declare start with its type
         self.separator: str = separator  # and separator
+        self._buffer: str = ""
+        # line i occupies _buffer[_offsets[i] : _offsets[i + 1] - 1]; empty text has no lines
+        self._offsets: array = array("q", [0])
+        self._token_prefix: Dict[str, List[int]] = {}  # lazily built per tokenizer model
 
         if not isinstance(content, str):
             raise ValueError("NumberedText requires string input.")
@@ -242,22 +261,91 @@ class NumberedText:
 
             # Extract content by removing number and separator
             pattern = re.compile(rf"^\d+{re.escape(format_info.separator)}")  # type: ignore
-            self.lines = []
-
-            for line in content.splitlines():
-                if line.strip():
-                    self.lines.append(pattern.sub("", line))
-                else:
-                    self.lines.append(line)
+            lines = [pattern.sub("", line) if line.strip() else line for line in content.splitlines()]
+            self._set_buffer("\n".join(lines))
         else:
-            self.lines = content.splitlines()
+            self._set_buffer(_normalize_line_breaks(content))
             self.start = start
             self.separator = separator
 
+    def _set_buffer(self, buffer: str) -> None:
+        """Store the joined text and index its line start offsets."""
+        self._buffer = buffer
+        offsets = array("q", [0])
+        find = buffer.find
+        pos = find("\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = find("\n", pos + 1)
+        offsets.append(len(buffer) + 1)
+        self._offsets = offsets
+
+    def _line_at(self, index: int) -> str:
+        """Line at 0-based `index`."""
+        if not 0 <= index < self.size:
+            raise IndexError(f"NumberedText: line index out of range: {index + self.start}")
+        return self._buffer[self._offsets[index] : self._offsets[index + 1] - 1]
+
+    def _slice(self, start: int, stop: int) -> Optional[str]:
+        """Joined lines for 0-based [start, stop) with list-slice semantics; None if the range is empty."""
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if start >= stop:
+            return None
+        return self._buffer[self._offsets[start] : self._offsets[stop] - 1]
+
+    def _iter_lines(self, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        buffer, offsets = self._buffer, self._offsets
+        for index in range(start, self.size if stop is None else stop):
+            yield buffer[offsets[index] : offsets[index + 1] - 1]
+
     @classmethod
     def from_file(cls, path: Path, **kwargs) -> "NumberedText":
-        """Create a NumberedText instance from a file."""
-        return cls(read_str_from_file(Path(path)), **kwargs)
+        """Create a NumberedText instance from a file, streamed line by line (see `from_stream`)."""
+        path = Path(path)
+        return cls.from_stream(lambda: iter_lines_from_file(path), **kwargs)
+
+    @classmethod
+    def from_stream(
+        cls, open_lines: Callable[[], Iterator[str]], start: int = 1, separator: str = ":"
+    ) -> "NumberedText":
+        """
+        Build a NumberedText from newline-terminated lines in a single pass.
+
+        Equivalent to ``NumberedText("".join(open_lines()), ...)`` without holding
+        the raw text, a split line list, and the stripped lines at the same time:
+        numbering is detected from the first `NUMBERING_PROBE_LINES` non-blank
+        lines and verified as the rest streams in, while the buffer and line
+        offsets are built. `open_lines` is called a second time only when a later
+        line breaks the detected numbering, to re-read the text as unnumbered.
+
+        Args:
+            open_lines: Factory returning a fresh iterator over the text's lines.
+            start: Starting line number (used only if content isn't already numbered)
+            separator: Separator between line numbers and content (only if content isn't numbered)
+        """
+        doc = cls("", start=start, separator=separator)
+        lines = open_lines()
+        try:
+            probe = list(_take_probe(lines))
+            format_info = get_numbered_format("".join(probe))
+            if format_info.is_numbered:
+                doc.start = format_info.start_num  # type: ignore
+                doc.separator = format_info.separator  # type: ignore
+            built = _StreamBuilder(format_info).feed(chain(probe, lines))
+        finally:
+            _close(lines)
+
+        if built is None:  # numbering broke after the probe; re-read as plain text
+            lines = open_lines()
+            try:
+                built = _StreamBuilder(NumberedFormat(False)).feed(lines)
+            finally:
+                _close(lines)
+            doc.start = start
+            doc.separator = separator
+        assert built is not None
+        doc._buffer, doc._offsets = built
+        return doc
 
     def _format_line(self, line_num: int, line: str) -> str:
         return f"{line_num}{self.separator}{line}"
@@ -275,19 +363,19 @@ class NumberedText:
 
     def __str__(self) -> str:
         """Return the numbered text representation."""
-        return "\n".join(self._format_line(i, line) for i, line in enumerate(self.lines, self.start))
+        return "\n".join(self._format_line(i, line) for i, line in enumerate(self._iter_lines(), self.start))
 
     def __len__(self) -> int:
         """Return the number of lines."""
-        return len(self.lines)
+        return self.size
 
     def __iter__(self) -> Iterator[tuple[int, str]]:
         """Iterate over (line_number, line_content) pairs."""
-        return iter((i, line) for i, line in enumerate(self.lines, self.start))
+        return enumerate(self._iter_lines(), self.start)
 
     def __getitem__(self, index: int) -> str:
         """Get line content by line number (1-based indexing)."""
-        return self.lines[self._to_internal_index(index)]
+        return self._line_at(self._to_internal_index(index))
 
     def get_line(self, line_num: int) -> str:
         """Get content of specified line number."""
@@ -308,7 +396,8 @@ class NumberedText:
             start: Inclusive start line (1-based external indexing).
             end: Exclusive end line (1-based; not included), matching Python slicing semantics.
         """
-        return self.lines[self._to_internal_index(start) : self._to_internal_index(end)]
+        segment = self._slice(self._to_internal_index(start), self._to_internal_index(end))
+        return [] if segment is None else segment.split("\n")
 
     def get_lines(self, start: int, end: int) -> List[str]:
         """Deprecated: use get_lines_exclusive; end index remains exclusive."""
@@ -333,7 +422,7 @@ class NumberedText:
             raise IndexError(f"End index {end} is past last line {self.end}")
         if start > end:
             raise IndexError(f"Start index {start} must be less than or equal to end index {end}")
-        return "\n".join(self.get_lines_exclusive(start, end + 1))
+        return self._slice(self._to_internal_index(start), self._to_internal_index(end + 1)) or ""
 
     def iter_segments(
         self, segment_size: int, min_segment_size: Optional[int] = None
@@ -378,54 +467,56 @@ class NumberedText:
         return self._SectionBoundaryValidator(self, section_start_lines).run()
 
     class _SectionBoundaryValidator:
-        """Stateful validator to keep the main validate_section_boundaries loop simple."""
+        """Vectorized validator over the sorted start-line array.
+
+        In-bounds starts form one contiguous run of the sorted array (out-of-bounds
+        starts sort below or above it), located with two ``searchsorted`` calls;
+        gaps and overlaps come from a single ``np.diff`` over that run. Errors are
+        reported in sorted order.
+        """
 
         def __init__(self, owner: "NumberedText", section_start_lines: List[int]) -> None:
             self.owner = owner
             self.section_start_lines = section_start_lines
-            self.errors: List[SectionValidationError] = []
-            self.prev_start: Optional[int] = None
-            self.first_valid_seen = False
 
         def run(self) -> List[SectionValidationError]:
+            owner = self.owner
             if not self.section_start_lines:
-                return self.owner._errors_for_no_sections()
-
-            sorted_with_idx = sorted(enumerate(self.section_start_lines), key=lambda t: t[1])
-
-            for section_index, (input_idx, start_line) in enumerate(sorted_with_idx):
-                if self.owner._is_out_of_bounds(start_line):
-                    self.errors.append(self.owner._error_out_of_bounds(section_index, input_idx, start_line))
-                    continue
-
-                if not self.first_valid_seen:
-                    self._handle_first(section_index, input_idx, start_line)
-                    continue
-
-                self._handle_body(section_index, input_idx, start_line)
-
-            if not self.first_valid_seen and self.owner.size > 0:
-                first_idx, first_start = sorted_with_idx[0]
-                self.errors.append(self.owner._error_first_gap(0, first_idx, first_start, no_in_bounds=True))
-
-            return self.errors
-
-        def _handle_first(self, section_index: int, input_idx: int, start_line: int) -> None:
-            self.errors.extend(self.owner._errors_for_first_section(section_index, input_idx, start_line))
-            self.first_valid_seen = True
-            self.prev_start = start_line
-
-        def _handle_body(self, section_index: int, input_idx: int, start_line: int) -> None:
-            assert self.prev_start is not None
-            if start_line <= self.prev_start:
-                self.errors.append(
-                    self.owner._error_overlap(section_index, input_idx, self.prev_start, start_line)
-                )
-            elif start_line > self.prev_start + 1:
-                self.errors.append(
-                    self.owner._error_gap(section_index, input_idx, self.prev_start, start_line)
-                )
-            self.prev_start = start_line
+                return owner._errors_for_no_sections()
+
+            starts = np.asarray(self.section_start_lines, dtype=np.int64)
+            order = np.argsort(starts, kind="stable")
+            sorted_starts = starts[order]
+            first = int(np.searchsorted(sorted_starts, owner.start, side="left"))
+            stop = int(np.searchsorted(sorted_starts, owner.end, side="right"))
+            input_idx = order.tolist()
+            start_lines = sorted_starts.tolist()
+
+            def out_of_bounds(positions: range) -> List[SectionValidationError]:
+                return [
+                    owner._error_out_of_bounds(pos, input_idx[pos], start_lines[pos]) for pos in positions
+                ]
+
+            errors = out_of_bounds(range(first))
+            if first < stop:
+                errors.extend(self._body_errors(first, input_idx, start_lines, sorted_starts[first:stop]))
+            errors.extend(out_of_bounds(range(max(first, stop), len(start_lines))))
+            if first >= stop and owner.size > 0:
+                errors.append(owner._error_first_gap(0, input_idx[0], start_lines[0], no_in_bounds=True))
+            return errors
+
+        def _body_errors(
+            self, first: int, input_idx: List[int], start_lines: List[int], valid_starts: np.ndarray
+        ) -> List[SectionValidationError]:
+            owner = self.owner
+            errors = owner._errors_for_first_section(first, input_idx[first], start_lines[first])
+            step = np.diff(valid_starts)
+            breaks = np.flatnonzero(step != 1)
+            for k, overlap in zip(breaks.tolist(), (step[breaks] <= 0).tolist(), strict=True):
+                pos = first + k + 1
+                error = owner._error_overlap if overlap else owner._error_gap
+                errors.append(error(pos, input_idx[pos], start_lines[pos - 1], start_lines[pos]))
+            return errors
 
     def _is_out_of_bounds(self, start_line: int) -> bool:
         return start_line < self.start or start_line > self.end
@@ -512,115 +603,119 @@ class NumberedText:
         return self._CoverageReporter(self, section_start_lines).run()
 
     class _CoverageReporter:
-        """Stateful coverage reporter to keep main method concise."""
+        """Run-length coverage over the sorted start-line array.
+
+        Section ``i`` spans ``[start_i, max(start_{i+1} - 1, start_i)]`` (the last
+        in-bounds section runs to ``self.end`` or to the line before the next,
+        out-of-bounds, start). Consecutive spans touch, so covered lines form a
+        single run from the first in-bounds start to the running maximum end, and
+        overlaps are starts at or below the previous running maximum.
+        """
 
         def __init__(self, owner: "NumberedText", section_start_lines: List[int]) -> None:
             self.owner = owner
             self.section_start_lines = section_start_lines
-            self.covered: Set[int] = set()
-            self.overlaps: List[Dict[str, Any]] = []
-            self.gaps: List[tuple[int, int]] = []
-            self.sorted_starts = sorted(section_start_lines)
-            self.prev_valid_start: Optional[int] = None
 
         def run(self) -> Dict[str, Any]:
-            if self.owner.size == 0:
-                return self._empty_report()
+            owner = self.owner
+            if owner.size == 0:
+                return self._report(0, [], [])
             if not self.section_start_lines:
-                return self._no_sections_report()
-
-            self._seed_initial_gap()
-            self._walk_sections()
-            self._fill_gaps_from_coverage()
-            self._merge_gaps()
-
-            covered_lines = len(self.covered)
-            coverage_pct = fraction_to_percent(covered_lines, self.owner.size)
+                return self._report(0, [(owner.start, owner.end)], [])
+
+            starts = np.sort(np.asarray(self.section_start_lines, dtype=np.int64))
+            ends = np.empty_like(starts)
+            ends[:-1] = starts[1:] - 1
+            ends[-1] = owner.end
+            np.maximum(ends, starts, out=ends)
+
+            valid = np.flatnonzero((starts >= owner.start) & (starts <= owner.end))
+            if not valid.size:
+                return self._report(0, [(owner.start, owner.end)], [])
+
+            valid_starts = starts[valid]
+            reach = np.maximum.accumulate(ends[valid])
+            covered_lines = int(reach[-1] - valid_starts[0] + 1)
+            return self._report(
+                covered_lines,
+                self._gaps(valid_starts),
+                self._overlaps(valid, valid_starts, ends[valid], reach),
+            )
 
+        def _report(
+            self, covered_lines: int, gaps: List[tuple[int, int]], overlaps: List[Dict[str, Any]]
+        ) -> Dict[str, Any]:
+            size = self.owner.size
             return {
-                "total_lines": self.owner.size,
+                "total_lines": size,
                 "covered_lines": covered_lines,
-                "coverage_pct": coverage_pct,
-                "gaps": self.gaps,
-                "overlaps": self.overlaps,
+                "coverage_pct": fraction_to_percent(covered_lines, size) if size else 0.0,
+                "gaps": gaps,
+                "overlaps": overlaps,
             }
 
-        def _empty_report(self) -> Dict[str, Any]:
-            return {"total_lines": 0, "covered_lines": 0, "coverage_pct": 0.0, "gaps": [], "overlaps": []}
+        def _gaps(self, valid_starts: np.ndarray) -> List[tuple[int, int]]:
+            gaps: List[tuple[int, int]] = []
+            first = int(valid_starts[0])
+            if first > self.owner.start:
+                gaps.append((self.owner.start, first - 1))
+            split = np.flatnonzero(np.diff(valid_starts) > 1)
+            gap_starts = (valid_starts[split] + 1).tolist()
+            gap_ends = (valid_starts[split + 1] - 1).tolist()
+            gaps.extend(zip(gap_starts, gap_ends, strict=True))
+            return gaps
+
+        def _overlaps(
+            self, valid: np.ndarray, valid_starts: np.ndarray, valid_ends: np.ndarray, reach: np.ndarray
+        ) -> List[Dict[str, Any]]:
+            hits = np.flatnonzero(valid_starts[1:] <= reach[:-1]) + 1
+            return [
+                {
+                    "section_index": int(valid[k]),
+                    "lines": list(range(int(valid_starts[k]), int(min(valid_ends[k], reach[k - 1])) + 1)),
+                }
+                for k in hits.tolist()
+            ]
+
+    def token_prefix_sums(
+        self,
+        model: Optional[str] = None,
+        counter: Optional[Callable[[Sequence[str], str], List[int]]] = None,
+    ) -> List[int]:
+        """
+        Cumulative per-line token counts: entry ``i`` is the token total of the first ``i`` lines.
 
-        def _no_sections_report(self) -> Dict[str, Any]:
-            return {
-                "total_lines": self.owner.size,
-                "covered_lines": 0,
-                "coverage_pct": 0.0,
-                "gaps": [(self.owner.start, self.owner.end)],
-                "overlaps": [],
-            }
+        Built once per model (lines are tokenized in a single batch) and cached on
+        the instance. Lines are counted independently, so sums exclude the newline
+        joins and may differ slightly from tokenizing the joined text.
 
-        def _seed_initial_gap(self) -> None:
-            first_valid_start = next(
-                (s for s in self.sorted_starts if self.owner.start <= s <= self.owner.end),
-                None,
-            )
-            if first_valid_start is None:
-                self.gaps.append((self.owner.start, self.owner.end))
-            elif first_valid_start > self.owner.start:
-                self.gaps.append((self.owner.start, first_valid_start - 1))
-
-        def _walk_sections(self) -> None:
-            for i, start in enumerate(self.sorted_starts):
-                if start < self.owner.start or start > self.owner.end:
-                    continue
-
-                end = self._compute_end(i, start)
-                self._maybe_add_gap_between_sections(start)
-                self._update_overlaps_and_coverage(i, start, end)
-                self.prev_valid_start = start
-
-        def _compute_end(self, index: int, start: int) -> int:
-            end = self.sorted_starts[index + 1] - 1 if index < len(self.sorted_starts) - 1 else self.owner.end
-            return max(end, start)
-
-        def _maybe_add_gap_between_sections(self, start: int) -> None:
-            if self.prev_valid_start is None:
-                return
-            expected_start = self.prev_valid_start + 1
-            if start > expected_start:
-                self.gaps.append((expected_start, start - 1))
-
-        def _update_overlaps_and_coverage(self, section_index: int, start: int, end: int) -> None:
-            section_lines = set(range(start, end + 1))
-            if overlap_lines := self.covered & section_lines:
-                self.overlaps.append({"section_index": section_index, "lines": sorted(overlap_lines)})
-            self.covered.update(section_lines)
-
-        def _fill_gaps_from_coverage(self) -> None:
-            all_lines = set(range(self.owner.start, self.owner.end + 1))
-            gap_lines = sorted(all_lines - self.covered)
-            if not gap_lines:
-                return
-            gap_start = gap_lines[0]
-            gap_end = gap_lines[0]
-            for line in gap_lines[1:]:
-                if line == gap_end + 1:
-                    gap_end = line
-                else:
-                    self.gaps.append((gap_start, gap_end))
-                    gap_start = gap_end = line
-            self.gaps.append((gap_start, gap_end))
-
-        def _merge_gaps(self) -> None:
-            if not self.gaps:
-                return
-            self.gaps = sorted(self.gaps)
-            merged: List[tuple[int, int]] = []
-            for start, end in self.gaps:
-                if not merged or start > merged[-1][1] + 1:
-                    merged.append((start, end))
-                else:
-                    prev_start, prev_end = merged[-1]
-                    merged[-1] = (prev_start, max(prev_end, end))
-            self.gaps = merged
+        Args:
+            model: Tokenizer model name (defaults to the GenAI token counting default).
+            counter: Batch counter ``(lines, model) -> counts``; defaults to
+                ``gen_ai_service.utils.token_utils.token_count_many``.
+        """
+        if counter is None or model is None:
+            from tnh_scholar.gen_ai_service.utils.token_utils import DEFAULT_TOKEN_MODEL, token_count_many
+
+            model = model or DEFAULT_TOKEN_MODEL
+            counter = counter or token_count_many
+        prefix = self._token_prefix.get(model)
+        if prefix is None:
+            prefix = [0, *accumulate(counter(self.lines, model))]
+            self._token_prefix[model] = prefix
+        return prefix
+
+    def token_count_lines(self, start: int, end: int, model: Optional[str] = None) -> int:
+        """
+        Tokens in lines ``start..end`` (1-based, inclusive), in O(1) after the first call.
+
+        Raises:
+            IndexError: If the range falls outside the document.
+        """
+        if start < self.start or end > self.end or start > end + 1:
+            raise IndexError(f"Line range {start}-{end} is outside {self.start}-{self.end}")
+        prefix = self.token_prefix_sums(model)
+        return prefix[end - self.start + 1] - prefix[start - self.start]
 
     def save(self, path: Path, numbered: bool = True) -> None:
         """
@@ -630,13 +725,18 @@ class NumberedText:
             path: Output file path
             numbered: Whether to save with line numbers (default: True)
         """
-        content = str(self) if numbered else "\n".join(self.lines)
+        content = str(self) if numbered else self.content
         write_str_to_file(path, content)
 
+    @property
+    def lines(self) -> List[str]:
+        """Text lines as a new list (the backing store is the joined buffer)."""
+        return self._buffer.split("\n") if self.size else []
+
     @property
     def content(self) -> str:
         """Get original text without line numbers."""
-        return "\n".join(self.lines)
+        return self._buffer
 
     @property
     def numbered_content(self) -> str:
@@ -646,7 +746,7 @@ class NumberedText:
     @property
     def size(self) -> int:
         """Get the number of lines."""
-        return len(self.lines)
+        return len(self._offsets) - 1
 
     @property
     def numbered_lines(self) -> List[str]:
@@ -666,11 +766,77 @@ class NumberedText:
             - Maintains consistent formatting with separator
             - Useful for processing or displaying individual numbered lines
         """
-        return [f"{i}{self.separator}{line}" for i, line in enumerate(self.lines, self.start)]
+        return [f"{i}{self.separator}{line}" for i, line in enumerate(self._iter_lines(), self.start)]
 
     @property
     def end(self) -> int:
-        return self.start + len(self.lines) - 1
+        return self.start + self.size - 1
+
+
+def _take_probe(lines: Iterator[str]) -> Iterator[str]:
+    """Yield lines until `NUMBERING_PROBE_LINES` non-blank lines have been seen."""
+    seen = 0
+    for line in lines:
+        yield line
+        if line.strip():
+            seen += 1
+            if seen >= NUMBERING_PROBE_LINES:
+                return
+
+
+def _close(lines: Iterator[str]) -> None:
+    close = getattr(lines, "close", None)
+    if callable(close):
+        close()
+
+
+class _StreamBuilder:
+    """Accumulates streamed lines into a NumberedText buffer and offset index."""
+
+    def __init__(self, format_info: NumberedFormat) -> None:
+        self.numbered = format_info.is_numbered
+        self.separator = format_info.separator or ""
+        self.expected = format_info.start_num or 0
+        self.out = io.StringIO()
+        self.offsets = array("q", [0])
+        self.position = 0
+
+    def feed(self, chunks: Iterable[str]) -> Optional[tuple[str, array]]:
+        """Consume all chunks; None if a numbered line is out of sequence."""
+        any_line = False
+        for chunk in chunks:
+            if _OTHER_LINE_BREAKS.search(chunk):
+                lines: Iterable[str] = chunk.splitlines()
+            else:
+                lines = (chunk[:-1] if chunk.endswith("\n") else chunk,)
+            for line in lines:
+                if self.numbered and line.strip():
+                    prefix = f"{self.expected}{self.separator}"
+                    if not line.startswith(prefix):
+                        return None
+                    line = line[len(prefix) :]
+                    self.expected += 1
+                self._append(line, any_line)
+                any_line = True
+        if not any_line:
+            return "", array("q", [0])
+        self.offsets.append(self.position + 1)
+        return self.out.getvalue(), self.offsets
+
+    def _append(self, line: str, separate: bool) -> None:
+        if separate:
+            self.out.write("\n")
+            self.position += 1
+            self.offsets.append(self.position)
+        self.out.write(line)
+        self.position += len(line)
+
+
+def _normalize_line_breaks(content: str) -> str:
+    """Return `"\\n".join(content.splitlines())` without splitting when content only uses "\\n"."""
+    if _OTHER_LINE_BREAKS.search(content):
+        return "\n".join(content.splitlines())
+    return content[:-1] if content.endswith("\n") else content
 
 
 def get_numbered_format(text: str) -> NumberedFormat:
@@ -1,3 +1,4 @@
+from .concurrency_utils import ByteBudget, OrderedResult, ordered_map
 from .file_utils import (
     copy_files_with_regex,
     ensure_directory_exists,
@@ -23,6 +24,9 @@ from .user_io_utils import get_user_confirmation
 from .validate import check_ocr_env, check_openai_env
 
 __all__ = [
+    "ByteBudget",
+    "OrderedResult",
+    "ordered_map",
     "copy_files_with_regex",
     "ensure_directory_exists",
     "ensure_directory_writable",
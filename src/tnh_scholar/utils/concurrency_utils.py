@@ -0,0 +1,156 @@
+"""Bounded, order-preserving concurrent map.
+
+`ordered_map` runs a blocking function (typically a provider round-trip) over
+an iterable in a thread pool and yields results in input order as soon as the
+ordered prefix is complete. At most `max_pending` items are submitted ahead of
+the consumer, so long inputs are not materialized up front and an abandoned
+generator leaves little work behind. Each item runs in a copy of the
+submitting thread's `contextvars` context, so context-local state such as the
+enclosing trace span is visible to workers.
+
+`ByteBudget` adds a size-based bound for payloads whose cost varies per item
+(e.g. sliced audio): the producer acquires an item's size before handing it to
+the pool and the worker releases it once the payload is no longer needed.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class OrderedResult(Generic[T, R]):
+    """Outcome for one input item; exactly one of `value`/`error` is meaningful."""
+
+    index: int
+    item: T
+    value: Optional[R] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ByteBudget:
+    """Blocking counter that caps the bytes held by in-flight work items.
+
+    An item larger than the whole budget is admitted once nothing else is in
+    flight, so a single oversized item cannot deadlock the producer.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, size: int) -> None:
+        """Block until `size` more bytes fit in the budget, then reserve them."""
+        with self._condition:
+            self._condition.wait_for(lambda: not self._in_flight or self._in_flight + size <= self.max_bytes)
+            self._in_flight += size
+
+    def release(self, size: int) -> None:
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - size)
+            self._condition.notify_all()
+
+
+def ordered_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_workers: int,
+    max_pending: Optional[int] = None,
+    capture_errors: bool = True,
+    thread_name_prefix: str = "ordered-map",
+) -> Iterator[OrderedResult[T, R]]:
+    """Apply `func` to each item with up to `max_workers` threads, yielding in input order.
+
+    Args:
+        func: Function applied to each item.
+        items: Input items; consumed lazily.
+        max_workers: Worker threads. 1 runs inline in the caller's thread.
+        max_pending: Items submitted ahead of the consumer (default: 2 * max_workers).
+        capture_errors: Report exceptions on the `OrderedResult` instead of raising.
+        thread_name_prefix: Thread name prefix for the pool.
+
+    Raises:
+        ValueError: If `max_workers` or `max_pending` is less than 1.
+        Exception: The first failure, when `capture_errors` is False.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    window = max_pending or 2 * max_workers
+    if window < 1:
+        raise ValueError(f"max_pending must be >= 1, got {max_pending}")
+
+    if max_workers == 1:
+        for index, item in enumerate(items):
+            yield _run_inline(func, index, item, capture_errors)
+        return
+    yield from _pooled(func, items, max_workers, window, capture_errors, thread_name_prefix)
+
+
+def _pooled(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    window: int,
+    capture_errors: bool,
+    thread_name_prefix: str,
+) -> Iterator[OrderedResult[T, R]]:
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+    pending: deque[tuple[int, T, Future[R]]] = deque()
+    source = enumerate(items)
+
+    def _submit_next() -> bool:
+        for index, item in source:
+            pending.append((index, item, executor.submit(copy_context().run, func, item)))
+            return True
+        return False
+
+    try:
+        while len(pending) < window and _submit_next():
+            pass
+        while pending:
+            index, item, future = pending.popleft()
+            result = _collect(future, index, item, capture_errors)
+            _submit_next()
+            yield result
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_inline(func: Callable[[T], R], index: int, item: T, capture_errors: bool) -> OrderedResult[T, R]:
+    try:
+        return OrderedResult(index=index, item=item, value=func(item))
+    except Exception as exc:
+        if not capture_errors:
+            raise
+        return OrderedResult(index=index, item=item, error=exc)
+
+
+def _collect(future: Future[R], index: int, item: T, capture_errors: bool) -> OrderedResult[T, R]:
+    try:
+        return OrderedResult(index=index, item=item, value=future.result())
+    except Exception as exc:
+        if not capture_errors:
+            raise
+        return OrderedResult(index=index, item=item, error=exc)
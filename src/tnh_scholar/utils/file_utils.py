@@ -165,6 +165,15 @@ def read_str_from_file(file_path: Path) -> str:
         return file.read()
 
 
+def iter_lines_from_file(file_path: Path) -> Generator[str, None, None]:
+    """Yield the lines of a text file (newlines kept) without reading it all at once.
+
+    The file is closed when the generator is exhausted or closed.
+    """
+    with open(file_path, "r", encoding="utf-8") as file:
+        yield from file
+
+
 def write_str_to_file(file_path: PathLike, text: str, overwrite: bool = False):
     """Writes text to a file with file locking.
 
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pycountry
 from langdetect import LangDetectException, detect
 
@@ -5,6 +7,8 @@ from tnh_scholar.logging_config import get_child_logger
 
 logger = get_child_logger(__name__)
 
+DEFAULT_SAMPLE_WORDS = 30
+
 
 def get_language_code_from_text(text: str) -> str:
     """
@@ -25,8 +29,16 @@ def get_language_code_from_text(text: str) -> str:
     if not text or text.isspace():
         raise ValueError("Input text cannot be empty")
 
-    sample = _get_sample_text(text)
+    return detect_language_code(_get_sample_text(text))
+
 
+@lru_cache(maxsize=512)
+def detect_language_code(sample: str) -> str:
+    """
+    Detect the ISO 639-1 code of an already-sampled text, memoized by sample.
+
+    Returns 'un' when langdetect cannot decide.
+    """
     try:
         return str(detect(sample))
     except LangDetectException:
@@ -45,7 +57,7 @@ def get_language_from_code(code: str) -> str:
     return "Unknown"
 
 
-def _get_sample_text(text: str, words_per_sample: int = 30) -> str:
+def _get_sample_text(text: str, words_per_sample: int = DEFAULT_SAMPLE_WORDS) -> str:
     """
     Get text samples from beginning, 1/3 point, and 2/3 point.
     Each sample starts at nearest word boundary and contains ~N words.
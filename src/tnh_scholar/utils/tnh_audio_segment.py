@@ -63,6 +63,23 @@ class TNHAudioSegment:
     def empty() -> "TNHAudioSegment":
         return TNHAudioSegment(_AudioSegment.empty())
 
+    @staticmethod
+    def from_raw(data: bytes, sample_width: int, frame_rate: int, channels: int) -> "TNHAudioSegment":
+        """Wrap raw little-endian PCM frames (no header) as a segment."""
+        return TNHAudioSegment(
+            _AudioSegment(data=data, sample_width=sample_width, frame_rate=frame_rate, channels=channels)
+        )
+
+    @property
+    def raw_data(self) -> bytes:
+        """The PCM frames of this segment."""
+        return self._segment.raw_data
+
+    @property
+    def pcm_format(self) -> tuple[int, int, int]:
+        """``(sample_width, frame_rate, channels)`` of the PCM frames."""
+        return self._segment.sample_width, self._segment.frame_rate, self._segment.channels
+
     def __getitem__(self, key: int | slice) -> "TNHAudioSegment":
         return TNHAudioSegment(self._segment[key])  # type: ignore
 
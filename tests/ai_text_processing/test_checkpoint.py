@@ -0,0 +1,150 @@
+import pytest
+
+from tnh_scholar.ai_text_processing.ai_text_processing import SectionProcessor, TextProcessor
+from tnh_scholar.ai_text_processing.checkpoint import ProcessingCheckpoint, checkpoint_key
+from tnh_scholar.ai_text_processing.line_translator import TRANSCRIPT_SEGMENT_MARKER, LineTranslator
+from tnh_scholar.ai_text_processing.prompts import Prompt
+from tnh_scholar.ai_text_processing.text_object import SectionObject, SectionRange, TextObject
+from tnh_scholar.metadata.metadata import Metadata
+from tnh_scholar.text_processing import NumberedText
+
+
+class _CountingProcessor(TextProcessor):
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+        self.inputs: list[str] = []
+
+    def process_text(self, input_str, instructions, response_format=None, **kwargs):
+        if input_str == self.fail_on:
+            raise RuntimeError("connection reset")
+        self.inputs.append(input_str)
+        return input_str.upper()
+
+
+class _EchoTranslator(TextProcessor):
+    def __init__(self):
+        self.calls = 0
+
+    def process_text(self, input_str, instructions, response_format=None, **kwargs):
+        self.calls += 1
+        segment = input_str.split(TRANSCRIPT_SEGMENT_MARKER)[1].strip()
+        return f"{TRANSCRIPT_SEGMENT_MARKER}\n{segment.upper()}\n{TRANSCRIPT_SEGMENT_MARKER}"
+
+
+def _sectioned_text() -> TextObject:
+    num_text = NumberedText("\n".join(["alpha", "beta", "gamma", "delta"]))
+    sections = [SectionObject(f"Section {i}", SectionRange(i, i), None) for i in range(1, 5)]
+    return TextObject(
+        num_text=num_text, language="en", metadata=Metadata(), sections=sections, validate_on_init=False
+    )
+
+
+def _prompt() -> Prompt:
+    return Prompt(name="upper", instructions="Process {{ section_title }}", allow_empty_vars=True)
+
+
+def _open(tmp_path, text: TextObject, resume: bool) -> ProcessingCheckpoint:
+    return ProcessingCheckpoint.for_run(
+        text, step="sections", prompt_name="upper", model="m", root=tmp_path, resume=resume
+    )
+
+
+def test_resumed_section_run_skips_completed_sections(tmp_path):
+    text = _sectioned_text()
+    failing = SectionProcessor(
+        _CountingProcessor(fail_on="gamma"), _prompt(), {}, checkpoint=_open(tmp_path, text, resume=False)
+    )
+    with pytest.raises(RuntimeError):
+        list(failing.process_sections(text))
+
+    processor = _CountingProcessor()
+    resumed = SectionProcessor(processor, _prompt(), {}, checkpoint=_open(tmp_path, text, resume=True))
+    sections = list(resumed.process_sections(text))
+
+    assert processor.inputs == ["gamma", "delta"]
+    assert [s.processed_str for s in sections] == ["ALPHA", "BETA", "GAMMA", "DELTA"]
+    assert [s.metadata for s in sections] == [{"section_number": i} for i in range(1, 5)]
+
+
+def test_fresh_run_discards_previous_checkpoint(tmp_path):
+    text = _sectioned_text()
+    list(
+        SectionProcessor(
+            _CountingProcessor(), _prompt(), {}, checkpoint=_open(tmp_path, text, False)
+        ).process_sections(text)
+    )
+
+    processor = _CountingProcessor()
+    list(
+        SectionProcessor(processor, _prompt(), {}, checkpoint=_open(tmp_path, text, False)).process_sections(
+            text
+        )
+    )
+
+    assert processor.inputs == ["alpha", "beta", "gamma", "delta"]
+
+
+def test_stale_and_truncated_entries_are_ignored(tmp_path):
+    checkpoint = ProcessingCheckpoint(tmp_path / "run.jsonl", resume=False)
+    checkpoint.put("section-1", {"processed_str": "old"}, fingerprint="abc")
+    with checkpoint.path.open("a", encoding="utf-8") as handle:
+        handle.write('{"unit": "section-2", "finger')
+
+    reopened = ProcessingCheckpoint(tmp_path / "run.jsonl")
+
+    assert len(reopened) == 1
+    assert reopened.get("section-1", fingerprint="abc") == {"processed_str": "old"}
+    assert reopened.get("section-1", fingerprint="changed") is None
+
+
+def test_units_written_after_truncated_tail_survive_next_resume(tmp_path):
+    path = tmp_path / "run.jsonl"
+    checkpoint = ProcessingCheckpoint(path, resume=False)
+    checkpoint.put("a", {"processed_str": "A"})
+    checkpoint.put("b", {"processed_str": "B"})
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])  # crash while writing "b"
+
+    resumed = ProcessingCheckpoint(path)
+    assert resumed.get("b") is None
+    resumed.put("b", {"processed_str": "B2"})
+    resumed.put("c", {"processed_str": "C"})
+
+    reopened = ProcessingCheckpoint(path)
+    assert [reopened.get(unit) for unit in ("a", "b", "c")] == [
+        {"processed_str": "A"},
+        {"processed_str": "B2"},
+        {"processed_str": "C"},
+    ]
+
+
+def test_checkpoint_key_tracks_content_prompt_and_model():
+    text = TextObject.from_str("one\ntwo", language="en")
+    other = TextObject.from_str("one\nthree", language="en")
+    key = checkpoint_key(text, step="translation", prompt_name="p", model="m")
+
+    assert key == checkpoint_key(text, step="translation", prompt_name="p", model="m")
+    assert key != checkpoint_key(other, step="translation", prompt_name="p", model="m")
+    assert key != checkpoint_key(text, step="translation", prompt_name="q", model="m")
+    assert key != checkpoint_key(text, step="translation", prompt_name="p", model="n")
+
+
+def test_translation_resume_reuses_segments(tmp_path):
+    text = TextObject.from_str("\n".join(f"line {i}" for i in range(1, 16)), language="en")
+    pattern = Prompt(name="translate", instructions="Translate", allow_empty_vars=True)
+
+    def _run(processor: TextProcessor, resume: bool) -> TextObject:
+        checkpoint = ProcessingCheckpoint.for_run(
+            text, step="translation", prompt_name="translate", model="m", root=tmp_path, resume=resume
+        )
+        translator = LineTranslator(processor, pattern, context_lines=1, checkpoint=checkpoint)
+        return translator.translate_text(text, "en", segment_size=5)
+
+    first = _EchoTranslator()
+    expected = _run(first, resume=False).content
+    second = _EchoTranslator()
+    resumed = _run(second, resume=True).content
+
+    assert first.calls == 3
+    assert second.calls == 0
+    assert resumed == expected
@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+from tnh_scholar.ai_text_processing.ai_text_processing import TextProcessor
+from tnh_scholar.ai_text_processing.line_translator import (
+    TRANSCRIPT_SEGMENT_MARKER,
+    LineTranslator,
+)
+from tnh_scholar.ai_text_processing.prompts import Prompt
+from tnh_scholar.ai_text_processing.text_object import TextObject
+
+
+class _NumberingProcessor(TextProcessor):
+    """Echoes the transcript segment upper-cased, optionally mangling the first attempt."""
+
+    def __init__(self, bad_first: set[int] | None = None, delay: float = 0.0):
+        self.bad_first = set(bad_first or ())
+        self.delay = delay
+        self.calls: list[int] = []
+        self.threads: set[str] = set()
+        self._lock = threading.Lock()
+
+    def process_text(self, input_str, instructions, response_format=None, **kwargs):
+        segment = input_str.split(TRANSCRIPT_SEGMENT_MARKER)[1].strip()
+        first_line = int(segment.split(":", 1)[0])
+        with self._lock:
+            self.calls.append(first_line)
+            self.threads.add(threading.current_thread().name)
+            mangle = first_line in self.bad_first
+            self.bad_first.discard(first_line)
+        time.sleep(self.delay)
+        if mangle:
+            segment = "no line numbers here"
+        return f"{TRANSCRIPT_SEGMENT_MARKER}\n{segment.upper()}\n{TRANSCRIPT_SEGMENT_MARKER}"
+
+
+def _translator(processor: TextProcessor, max_workers: int) -> LineTranslator:
+    pattern = Prompt(name="translate", instructions="Translate", allow_empty_vars=True)
+    return LineTranslator(processor, pattern, context_lines=1, max_workers=max_workers)
+
+
+def _text(lines: int) -> TextObject:
+    return TextObject.from_str("\n".join(f"line {i}" for i in range(1, lines + 1)), language="en")
+
+
+def test_parallel_translation_preserves_line_order():
+    processor = _NumberingProcessor(delay=0.01)
+    text = _text(20)
+
+    result = _translator(processor, max_workers=4).translate_text(text, "en", segment_size=5)
+
+    assert result.content == "\n".join(f"LINE {i}" for i in range(1, 21))
+    assert len(processor.threads) > 1
+
+
+def test_only_failing_segments_are_retried():
+    processor = _NumberingProcessor(bad_first={6})
+    text = _text(15)
+
+    result = _translator(processor, max_workers=3).translate_text(text, "en", segment_size=5)
+
+    assert result.content == "\n".join(f"LINE {i}" for i in range(1, 16))
+    assert sorted(processor.calls) == [1, 6, 6, 11]
+
+
+def test_max_workers_must_be_positive():
+    with pytest.raises(ValueError):
+        _translator(_NumberingProcessor(), max_workers=0)
@@ -0,0 +1,111 @@
+import pytest
+
+from tnh_scholar.ai_text_processing.ai_text_processing import SectionParser, TextProcessor
+from tnh_scholar.ai_text_processing.prompts import Prompt
+from tnh_scholar.ai_text_processing.section_planner import SectionPlanner
+from tnh_scholar.ai_text_processing.text_object import AIResponse, LogicalSection, TextObject
+from tnh_scholar.text_processing import NumberedText
+from tnh_scholar.text_processing.match_section import MatchObject, SectionConfig
+
+
+def _word_counter(lines, model):
+    return [len(line.split()) for line in lines]
+
+
+def _planner(target_tokens: int, config: SectionConfig | None = None) -> SectionPlanner:
+    return SectionPlanner(
+        target_tokens=target_tokens, config=config, token_model="words", counter=_word_counter
+    )
+
+
+def _section_tokens(num_text: NumberedText, starts: list[int]) -> list[int]:
+    edges = [*starts, num_text.end + 1]
+    return [
+        sum(len(num_text[line].split()) for line in range(begin, end))
+        for begin, end in zip(edges, edges[1:], strict=False)
+    ]
+
+
+def test_plan_balances_tokens_across_sections():
+    num_text = NumberedText("\n".join("one two three four five" for _ in range(40)))
+
+    starts = [section.start_line for section in _planner(50).plan(num_text)]
+
+    assert starts[0] == 1
+    assert len(starts) == 4
+    assert _section_tokens(num_text, starts) == [50, 50, 50, 50]
+
+
+def test_markers_always_start_sections():
+    lines = ["# Intro", *["word word word word"] * 5, "# Part Two", *["word word word word"] * 5]
+    config = SectionConfig(name="headers", patterns=[MatchObject(type="markdown_header", level=1)])
+
+    sections = _planner(1000, config).plan(NumberedText("\n".join(lines)))
+
+    assert [section.start_line for section in sections] == [1, 7]
+    assert [section.title for section in sections] == ["Intro", "Part Two"]
+
+
+def test_breaks_prefer_paragraph_starts():
+    paragraph = ["alpha beta gamma delta"] * 4
+    lines = [*paragraph, "", *paragraph, "", *paragraph, "", *paragraph]
+    num_text = NumberedText("\n".join(lines))
+
+    starts = [section.start_line for section in _planner(32).plan(num_text)]
+
+    assert starts == [1, 11]
+    assert num_text[starts[1] - 1] == ""
+
+
+def test_apply_sets_sections_covering_text():
+    text = TextObject.from_str("\n".join(f"line {i} has a few words" for i in range(1, 31)), language="en")
+
+    result = _planner(60).apply(text)
+
+    assert len(result.sections) == 3
+    assert result.sections[0].section_range.start == 1
+    assert result.content == text.content
+
+
+def test_outline_is_much_shorter_than_text():
+    num_text = NumberedText("\n".join(" ".join(["word"] * 20) for _ in range(100)))
+
+    outline = _planner(800).outline(num_text)
+
+    assert len(outline) < len(num_text.numbered_content) / 5
+    assert outline.splitlines()[0].startswith("1:")
+
+
+def test_invalid_target_rejected():
+    with pytest.raises(ValueError):
+        SectionPlanner(target_tokens=0)
+
+
+class _RecordingScanner(TextProcessor):
+    def __init__(self):
+        self.inputs: list[str] = []
+
+    def process_text(self, input_str, instructions, response_format=None, **kwargs):
+        self.inputs.append(input_str)
+        return AIResponse(
+            document_summary="summary",
+            document_metadata="title: test",
+            key_concepts="",
+            narrative_context="",
+            language="en",
+            sections=[LogicalSection(start_line=1, title="All")],
+        )
+
+
+def test_section_parser_sends_planner_outline():
+    scanner = _RecordingScanner()
+    parser = SectionParser(
+        scanner, Prompt(name="sections", instructions="Find sections", allow_empty_vars=True)
+    )
+    text = TextObject.from_str("\n".join(" ".join(["word"] * 20) for _ in range(100)), language="en")
+    planner = _planner(200)
+
+    result = parser.find_sections(text, section_count_target=2, planner=planner)
+
+    assert scanner.inputs == [planner.outline(text.num_text)]
+    assert len(result.sections) == 1
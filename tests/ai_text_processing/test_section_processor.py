@@ -0,0 +1,85 @@
+import threading
+import time
+
+import pytest
+
+from tnh_scholar.ai_text_processing.ai_text_processing import SectionProcessor, TextProcessor
+from tnh_scholar.ai_text_processing.prompts import Prompt
+from tnh_scholar.ai_text_processing.text_object import SectionObject, SectionRange, TextObject
+from tnh_scholar.metadata.metadata import Metadata
+from tnh_scholar.text_processing import NumberedText
+
+
+class _RecordingProcessor(TextProcessor):
+    def __init__(self, fail_on: str | None = None, delays: dict[str, float] | None = None):
+        self.fail_on = fail_on
+        self.delays = delays or {}
+        self.threads: set[str] = set()
+        self._lock = threading.Lock()
+
+    def process_text(self, input_str, instructions, response_format=None, **kwargs):
+        with self._lock:
+            self.threads.add(threading.current_thread().name)
+        time.sleep(self.delays.get(input_str, 0.0))
+        if input_str == self.fail_on:
+            raise RuntimeError("provider unavailable")
+        return f"{instructions}:{input_str.upper()}"
+
+
+def _text_object() -> TextObject:
+    num_text = NumberedText("\n".join(["alpha", "beta", "gamma", "delta"]))
+    sections = [SectionObject(f"Section {i}", SectionRange(i, i), None) for i in range(1, 5)]
+    return TextObject(
+        num_text=num_text, language="en", metadata=Metadata(), sections=sections, validate_on_init=False
+    )
+
+
+def _prompt() -> Prompt:
+    return Prompt(name="upper", instructions="Process {{ section_title }}", allow_empty_vars=True)
+
+
+def test_concurrent_sections_yield_in_document_order():
+    processor = _RecordingProcessor(delays={"alpha": 0.05})
+    section_processor = SectionProcessor(processor, _prompt(), {}, max_workers=4)
+
+    results = list(section_processor.process_sections(_text_object()))
+
+    assert [result.title for result in results] == [f"Section {i}" for i in range(1, 5)]
+    assert results[0].processed_str == "Process Section 1:ALPHA"
+    assert results[3].metadata == {"section_number": 4}
+    assert all(name.startswith("section-processor") for name in processor.threads)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_section_failure_raises_by_default(max_workers):
+    processor = _RecordingProcessor(fail_on="beta")
+    section_processor = SectionProcessor(processor, _prompt(), {}, max_workers=max_workers)
+
+    with pytest.raises(RuntimeError, match="provider unavailable"):
+        list(section_processor.process_sections(_text_object()))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_captured_section_failure_is_reported_not_raised(max_workers):
+    processor = _RecordingProcessor(fail_on="beta")
+    section_processor = SectionProcessor(
+        processor, _prompt(), {}, max_workers=max_workers, capture_errors=True
+    )
+
+    results = list(section_processor.process_sections(_text_object()))
+
+    assert len(results) == 4
+    assert results[1].error == "RuntimeError: provider unavailable"
+    assert results[1].processed_str == ""
+    assert results[2].error is None
+
+
+def test_concurrent_paragraphs_skip_blank_lines():
+    text = TextObject(num_text=NumberedText("one\n\ntwo"), language="en", metadata=Metadata())
+    prompt = Prompt(name="para", instructions="P", allow_empty_vars=True)
+    section_processor = SectionProcessor(_RecordingProcessor(), prompt, {}, max_workers=2)
+
+    results = list(section_processor.process_paragraphs(text))
+
+    assert [result.metadata["paragraph_number"] for result in results] == [1, 3]
+    assert [result.processed_str for result in results] == ["P:ONE", "P:TWO"]
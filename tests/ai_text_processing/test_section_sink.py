@@ -0,0 +1,114 @@
+import json
+import tracemalloc
+
+import pytest
+
+from tnh_scholar.ai_text_processing.ai_text_processing import ProcessedSection
+from tnh_scholar.ai_text_processing.section_sink import (
+    JSONLSectionSink,
+    TextSectionSink,
+    XMLDocumentSink,
+    write_sections,
+)
+
+
+def _sections(count: int, size: int = 10):
+    for i in range(1, count + 1):
+        yield ProcessedSection(
+            title=f"Section {i}",
+            original_str="o" * size,
+            processed_str=f"<section>{'é' * size}{i}</section>",
+            metadata={"section_number": i},
+        )
+
+
+def test_xml_sink_wraps_document_and_indexes_offsets(tmp_path):
+    path = tmp_path / "out.xml"
+
+    with XMLDocumentSink(path) as sink:
+        index = write_sections(_sections(3), sink)
+
+    data = path.read_bytes()
+    assert data.decode("utf-8").startswith("<document>\n")
+    assert data.decode("utf-8").endswith("</document>\n")
+    assert [record.title for record in index] == ["Section 1", "Section 2", "Section 3"]
+    second = data[index[1].offset : index[1].offset + index[1].length].decode("utf-8")
+    assert second == f"<section>{'é' * 10}2</section>\n"
+
+
+def test_sections_are_flushed_before_close(tmp_path):
+    path = tmp_path / "out.txt"
+    sink = TextSectionSink(path)
+
+    sink.write(next(_sections(1)))
+
+    assert path.read_text(encoding="utf-8") == f"<section>{'é' * 10}1</section>"
+    sink.close()
+    assert path.read_text(encoding="utf-8").endswith("\n")
+
+
+def test_jsonl_sink_records_errors_and_optional_original(tmp_path):
+    path = tmp_path / "out.jsonl"
+    failed = ProcessedSection(title="Bad", original_str="raw", processed_str="", error="RuntimeError: boom")
+
+    with JSONLSectionSink(path, include_original=True) as sink:
+        write_sections([*_sections(1), failed], sink)
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert records[0]["metadata"] == {"section_number": 1}
+    assert records[1] == {
+        "title": "Bad",
+        "metadata": {},
+        "error": "RuntimeError: boom",
+        "processed_str": "",
+        "original_str": "raw",
+    }
+    assert sink.index[1].error == "RuntimeError: boom"
+
+
+@pytest.mark.parametrize("sink_class", [TextSectionSink, XMLDocumentSink])
+def test_failed_section_raises_by_default(tmp_path, sink_class):
+    failed = ProcessedSection(title="Bad", original_str="raw", processed_str="", error="RuntimeError: boom")
+
+    with sink_class(tmp_path / "out") as sink:
+        with pytest.raises(ValueError, match="Section 'Bad' failed"):
+            write_sections([*_sections(1), failed], sink)
+
+    assert [record.title for record in sink.index] == ["Section 1"]
+
+
+def test_allowed_failures_leave_visible_markers(tmp_path):
+    failed = ProcessedSection(title="Bad", original_str="raw", processed_str="", error="RuntimeError: a--b")
+
+    with TextSectionSink(tmp_path / "out.txt", allow_errors=True) as text_sink:
+        write_sections([*_sections(1), failed], text_sink)
+    with XMLDocumentSink(tmp_path / "out.xml", allow_errors=True) as xml_sink:
+        write_sections([failed], xml_sink)
+
+    text = (tmp_path / "out.txt").read_text(encoding="utf-8")
+    assert text.endswith("\n\n[FAILED SECTION: Bad: RuntimeError: a--b]\n")
+    assert (tmp_path / "out.xml").read_text(encoding="utf-8") == (
+        "<document>\n<!-- FAILED SECTION: Bad: RuntimeError: a- -b -->\n</document>\n"
+    )
+    assert xml_sink.index[0].error == "RuntimeError: a--b"
+
+
+def test_existing_file_requires_overwrite(tmp_path):
+    path = tmp_path / "out.xml"
+    path.write_text("keep", encoding="utf-8")
+
+    with pytest.raises(FileExistsError):
+        XMLDocumentSink(path)
+    assert path.read_text(encoding="utf-8") == "keep"
+
+
+def test_memory_stays_flat_with_document_length(tmp_path):
+    def peak(count: int) -> int:
+        tracemalloc.start()
+        with TextSectionSink(tmp_path / f"out-{count}.txt", overwrite=True) as sink:
+            write_sections(_sections(count, size=20_000), sink)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak_bytes
+
+    assert peak(200) < peak(20) * 2
@@ -436,3 +436,115 @@ def test_merge_metadata_handles_non_list_provenance_and_none_input():
     obj.merge_metadata(Metadata({"new": 1}), source="src")
     assert isinstance(obj.metadata["_provenance"], list)
     obj.merge_metadata(None)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "---\ntitle: Talk\n---\n\nLine one\nLine two\n",
+        "---\ntitle: Talk\n---\nLine one",
+        "---\n---\nnot frontmatter\n",
+        "plain\ntext\n",
+        "---\nunterminated: true\nstill content\n",
+    ],
+)
+def test_from_text_file_streams_like_from_str(tmp_path: Path, text: str):
+    path = tmp_path / "doc.md"
+    path.write_text(text, encoding="utf-8")
+
+    streamed = TextObject.from_text_file(path)
+    expected = TextObject.from_str(text)
+
+    assert streamed.num_text.lines == expected.num_text.lines
+    assert streamed.metadata.to_dict() == expected.metadata.to_dict()
+
+
+def test_language_is_detected_lazily_from_a_bounded_sample(monkeypatch: pytest.MonkeyPatch):
+    samples: list[str] = []
+
+    def _detect(sample: str) -> str:
+        samples.append(sample)
+        return "vi"
+
+    monkeypatch.setattr(text_module, "detect_language_code", _detect)
+    lines = [f"dong {i} " + "chu " * 10 for i in range(3000)]
+    obj = TextObject(NumberedText("\n".join(lines)))
+    transformed = obj.transform(data_str="replacement text")
+
+    assert samples == []
+    assert transformed.language == "vi"
+    assert obj.language == "vi"
+    assert len(samples) == 2
+    assert "dong 0" in samples[0] and "dong 1000" in samples[0] and "dong 2000" in samples[0]
+    assert len(samples[0].split()) <= 3 * TextObject.language_sample_words + 2
+
+
+def test_language_detection_is_memoized_by_sample(monkeypatch: pytest.MonkeyPatch):
+    from tnh_scholar.utils import lang
+
+    calls: list[str] = []
+    monkeypatch.setattr(lang, "detect", lambda sample: calls.append(sample) or "en")
+    lang.detect_language_code.cache_clear()
+
+    text = "The quick brown fox\njumps over the lazy dog"
+    first = TextObject(NumberedText(text)).language
+    second = TextObject(NumberedText(text)).language
+    lang.detect_language_code.cache_clear()
+
+    assert first == second == "en"
+    assert len(calls) == 1
+
+
+def test_empty_text_language_raises_on_access():
+    obj = TextObject(NumberedText(""))
+
+    with pytest.raises(ValueError):
+        _ = obj.language
+
+
+def test_transform_shares_sections_and_metadata_copy_on_write():
+    from tnh_scholar.metadata.metadata import ProcessMetadata
+
+    sections = [SectionObject(f"s{i}", SectionRange(i, i + 1), None) for i in range(1, 4)]
+    original = TextObject(
+        NumberedText("a\nb\nc"),
+        language="en",
+        sections=sections,
+        metadata=Metadata({"stage": "initial", "tags": ["x"]}),
+        validate_on_init=False,
+    )
+    original.metadata.add_process_info(ProcessMetadata(step="punctuate", processor="test"))
+
+    updated = original.transform(process_metadata=ProcessMetadata(step="translate", processor="test"))
+    unchanged = original.transform()
+    merged = original.transform(metadata=Metadata({"stage": "translated"}))
+
+    assert updated.sections is original.sections
+    assert unchanged.metadata._data is original.metadata._data
+    assert [p["step"] for p in updated.metadata.process_history] == ["punctuate", "translate"]
+    assert [p["step"] for p in original.metadata.process_history] == ["punctuate"]
+    assert merged.metadata["stage"] == "translated"
+    assert original.metadata["stage"] == "initial"
+    with pytest.raises(AttributeError):
+        sections[0].title = "renamed"  # type: ignore[misc]
+
+
+def test_transformed_objects_cannot_alter_shared_sections_or_section_metadata():
+    section_meta = Metadata({"topic": "breath"})
+    sections = [SectionObject("s1", SectionRange(1, 2), section_meta)]
+    original = TextObject(NumberedText("a"), language="en", sections=sections)
+    updated = original.transform()
+
+    sections.append(SectionObject("s2", SectionRange(2, 3), None))
+    section_meta["topic"] = "walking"
+
+    assert isinstance(updated.sections, tuple)
+    assert len(original.sections) == 1
+    with pytest.raises(AttributeError):
+        updated.sections.append(sections[1])  # type: ignore[attr-defined]
+    assert original.sections[0].metadata["topic"] == "breath"
+    with pytest.raises(TypeError):
+        updated.sections[0].metadata["topic"] = "sitting"
+    editable = updated.sections[0].metadata.snapshot()
+    editable["topic"] = "sitting"
+    assert original.sections[0].metadata["topic"] == "breath"
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+
+from tnh_scholar.audio_processing.diarization.audio import AudioHandler, AudioHandlerConfig
+from tnh_scholar.audio_processing.diarization.audio.handler import (
+    _concatenate_audio_parts,
+    render_audio_parts,
+)
+from tnh_scholar.audio_processing.diarization.models import DiarizationChunk, DiarizedSegment
+from tnh_scholar.utils import TimeMs
+from tnh_scholar.utils import TNHAudioSegment as AudioSegment
+
+
+def _audio(duration_ms: int, frame_rate: int = 16000) -> AudioSegment:
+    frames = frame_rate * duration_ms // 1000
+    return AudioSegment.from_raw(bytes(i % 253 for i in range(2 * frames)), 2, frame_rate, 1)
+
+
+def _segment(start: int, end: int, gap_before: bool = False, spacing_time: int = 0) -> DiarizedSegment:
+    return DiarizedSegment(
+        speaker="SPEAKER_00",
+        start=TimeMs(start),
+        end=TimeMs(end),
+        audio_map_start=None,
+        gap_before=gap_before,
+        spacing_time=TimeMs(spacing_time),
+    )
+
+
+def _chunk() -> DiarizationChunk:
+    segments = [
+        _segment(100, 400),
+        _segment(500, 900),  # real audio fills the 100 ms gap
+        _segment(2000, 2300, gap_before=True, spacing_time=250),
+        _segment(2300, 2600),
+        _segment(2900, 9000, gap_before=True, spacing_time=33),  # runs past the end of the audio
+    ]
+    return DiarizationChunk(start_time=100, end_time=9000, segments=segments)
+
+
+@pytest.mark.parametrize("frame_rate", [16000, 44100, 8000])
+def test_planned_assembly_matches_concatenation(frame_rate: int) -> None:
+    handler = AudioHandler()
+    base_audio = _audio(3000, frame_rate)
+    parts = handler._plan_segments(_chunk(), base_audio)
+
+    rendered = render_audio_parts(parts)
+    concatenated = _concatenate_audio_parts(parts)
+
+    assert rendered.raw_data == concatenated.raw_data
+    assert rendered.pcm_format == concatenated.pcm_format
+
+
+def test_assembly_offsets_follow_slices_and_silences() -> None:
+    chunk = _chunk()
+
+    assembled = AudioHandler()._assemble_segments(chunk, _audio(3000))
+
+    assert [segment.audio_map_start for segment in chunk.segments] == [0, 400, 1050, 1350, 1683]
+    assert len(assembled) == 1783
+
+
+def test_silence_all_intervals_replaces_real_gaps() -> None:
+    chunk = _chunk()
+    handler = AudioHandler(AudioHandlerConfig(silence_all_intervals=True))
+
+    handler._assemble_segments(chunk, _audio(3000))
+
+    assert chunk.segments[1].audio_map_start == 300
+
+
+def test_empty_plan_renders_empty_audio() -> None:
+    assert len(render_audio_parts([])) == 0
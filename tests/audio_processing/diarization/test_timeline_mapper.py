@@ -0,0 +1,82 @@
+import pytest
+
+from tnh_scholar.audio_processing.diarization.models import DiarizationChunk, DiarizedSegment
+from tnh_scholar.audio_processing.diarization.timeline_mapper import TimelineMapper, _MappedSegmentIndex
+from tnh_scholar.audio_processing.timed_object.timed_text import Granularity, TimedText, TimedTextUnit
+from tnh_scholar.utils import TimeMs
+
+
+def _segment(speaker: str, start: int, end: int, audio_map_start: int) -> DiarizedSegment:
+    return DiarizedSegment(
+        speaker=speaker,
+        start=TimeMs(start),
+        end=TimeMs(end),
+        audio_map_start=audio_map_start,
+        gap_before=False,
+        spacing_time=TimeMs(0),
+    )
+
+
+def _word(start: int, end: int) -> TimedTextUnit:
+    return TimedTextUnit(text="w", start_ms=start, end_ms=end, granularity=Granularity.WORD)
+
+
+def _chunk(segments: list[DiarizedSegment]) -> DiarizationChunk:
+    return DiarizationChunk(start_time=0, end_time=segments[-1].end, segments=segments)
+
+
+def test_remap_uses_overlapping_and_nearest_segments() -> None:
+    # Mapped: A [0, 1000], B [1200, 2200]; original: A at 5000, B at 9000
+    segments = [_segment("A", 5000, 6000, 0), _segment("B", 9000, 10000, 1200)]
+    words = TimedText(words=[_word(100, 300), _word(1050, 1100), _word(1120, 1180), _word(1500, 1600)])
+
+    remapped = TimelineMapper().remap(words, _chunk(segments))
+
+    assert [(w.start_ms, w.end_ms, w.speaker) for w in remapped.words] == [
+        (5100, 5300, "A"),
+        (6050, 6100, "A"),  # gap nearer A's end (50 ms vs 100 ms)
+        (8920, 8980, "B"),  # gap nearer B's start (20 ms vs 120 ms)
+        (9300, 9400, "B"),
+    ]
+
+
+def test_index_breaks_ties_by_segment_order() -> None:
+    first = _segment("first", 0, 500, 100)
+    second = _segment("second", 0, 500, 100)
+    longer = _segment("longer", 0, 1000, 0)
+    index = _MappedSegmentIndex([longer, first, second])
+
+    assert index.overlapping(150, 200) == [longer, first, second]
+    assert index.latest_ending_by(700) is first
+    assert index.earliest_starting_from(50) is first
+    assert index.earliest_starting_from(2000) is None
+    assert index.latest_ending_by(10) is None
+
+
+def test_index_finds_overlaps_hidden_behind_long_segment() -> None:
+    long_segment = _segment("long", 0, 5000, 0)
+    short_segments = [_segment(f"s{i}", 0, 100, 1000 * i) for i in range(1, 4)]
+    index = _MappedSegmentIndex([*short_segments, long_segment])
+
+    assert index.overlapping(2050, 2060) == [short_segments[1], long_segment]
+    assert index.overlapping(2500, 2600) == [long_segment]
+    assert index.overlapping(6000, 6100) == []
+
+
+def test_index_overlaps_match_a_scan_when_an_early_segment_spans_the_chunk() -> None:
+    spanning = _segment("span", 0, 200_000, 0)
+    short_segments = [_segment(f"s{i}", 0, 150, 200 * i) for i in range(1, 1000)]
+    segments = [spanning, *short_segments]
+    index = _MappedSegmentIndex(segments)
+
+    for start in range(0, 201_000, 317):
+        end = start + 40
+        expected = [s for s in segments if s.mapped_start <= end and s.mapped_end >= start]
+        assert index.overlapping(start, end) == expected
+
+
+def test_remap_rejects_empty_segments() -> None:
+    chunk = DiarizationChunk(start_time=0, end_time=0, segments=[])
+
+    with pytest.raises(ValueError, match="empty chunk segments"):
+        TimelineMapper().remap(TimedText(words=[_word(0, 10)]), chunk)
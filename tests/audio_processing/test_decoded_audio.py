@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import shutil
+import wave
+from pathlib import Path
+
+import pytest
+
+from tnh_scholar.audio_processing.decoded_audio import DecodedAudio, _read_pcm_layout
+from tnh_scholar.audio_processing.diarization.audio.handler import AudioHandler
+from tnh_scholar.audio_processing.diarization.models import DiarizationChunk, DiarizedSegment
+from tnh_scholar.utils import TimeMs
+from tnh_scholar.utils import TNHAudioSegment as AudioSegment
+
+
+def _write_ramp_wav(path: Path, channels: int = 1, sample_width: int = 2, frame_rate: int = 16000) -> None:
+    frame_count = frame_rate * 2 + 7  # not a whole number of milliseconds
+    frame = bytes(range(channels * sample_width))
+    frames = b"".join(bytes((b + i) % 256 for b in frame) for i in range(frame_count))
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(sample_width)
+        wav_file.setframerate(frame_rate)
+        wav_file.writeframes(frames)
+
+
+SLICES = [(0, 500), (123, 1877), (1990, 5000), (-300, None), (None, 10), (700, 600), (2000, 2001)]
+
+
+@pytest.mark.parametrize(
+    ("channels", "sample_width", "frame_rate"), [(1, 2, 16000), (2, 2, 44100), (1, 4, 22050)]
+)
+def test_slices_match_pydub(tmp_path: Path, channels: int, sample_width: int, frame_rate: int) -> None:
+    audio_file = tmp_path / "ramp.wav"
+    _write_ramp_wav(audio_file, channels, sample_width, frame_rate)
+    loaded = AudioSegment.from_file(audio_file, format="wav")
+
+    with DecodedAudio.open(audio_file) as source:
+        assert len(source) == len(loaded)
+        for start, end in SLICES:
+            assert source[start:end].raw.raw_data == loaded[start:end].raw.raw_data, (start, end)
+            assert source[start:end].raw.frame_rate == frame_rate
+
+
+def test_audio_handler_uses_shared_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    audio_file = tmp_path / "talk.wav"
+    _write_ramp_wav(audio_file)
+    segments = [
+        DiarizedSegment(
+            speaker="A",
+            start=TimeMs(100),
+            end=TimeMs(600),
+            audio_map_start=None,
+            gap_before=False,
+            spacing_time=0,
+        ),
+        DiarizedSegment(
+            speaker="B",
+            start=TimeMs(900),
+            end=TimeMs(1500),
+            audio_map_start=None,
+            gap_before=False,
+            spacing_time=0,
+        ),
+    ]
+    expected = AudioHandler().build_audio_chunk(
+        DiarizationChunk(start_time=100, end_time=1500, segments=segments), audio_file
+    )
+
+    handler = AudioHandler()
+    monkeypatch.setattr(handler, "_load_audio", lambda _path: pytest.fail("source should not be re-decoded"))
+    with DecodedAudio.open(audio_file) as source:
+        chunk = DiarizationChunk(start_time=100, end_time=1500, segments=segments)
+        built = handler.build_audio_chunk(chunk, audio_file, source=source)
+
+    assert built.data.getvalue() == expected.data.getvalue()
+
+
+def test_non_pcm16_input_is_not_mapped_directly(tmp_path: Path) -> None:
+    fake_mp3 = tmp_path / "talk.mp3"
+    fake_mp3.write_bytes(b"ID3" + bytes(64))
+
+    assert _read_pcm_layout(fake_mp3) is None
+
+    eight_bit = tmp_path / "eight_bit.wav"
+    _write_ramp_wav(eight_bit, sample_width=1)
+    assert _read_pcm_layout(eight_bit) is None
+
+
+def test_close_removes_decoded_temp_file(tmp_path: Path) -> None:
+    audio_file = tmp_path / "ramp.wav"
+    _write_ramp_wav(audio_file)
+    decoded = tmp_path / "decoded.wav"
+    shutil.copy(audio_file, decoded)
+    layout = _read_pcm_layout(decoded)
+    assert layout is not None
+
+    source = DecodedAudio(decoded, layout, temp_file=True)
+    source.close()
+
+    assert not decoded.exists()
+    assert audio_file.exists()
+    with pytest.raises(ValueError):
+        source[0:10]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 import wave
 from io import BytesIO
 from pathlib import Path
@@ -628,3 +630,74 @@ def test_multilingual_service_logs_when_skipping_malformed_failed_block(
     assert getattr(warning_record, "segment_start_ms") == 1000
     assert getattr(warning_record, "translation_skipped") is True
     assert getattr(warning_record, "error_message") == "upstream returned malformed subtitle content"
+
+
+class ConcurrentTranscriptionService:
+    """Answers later blocks first and records the peak number of concurrent calls."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def transcribe_segment(self, request: SegmentTranscriptionRequest) -> SegmentTranscriptionResult:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.05 if request.source_language == "en" else 0.01)
+            return FakeTranscriptionService().transcribe_segment(request)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_multilingual_service_transcribes_blocks_concurrently_in_order(tmp_path: Path) -> None:
+    audio_file = tmp_path / "sample.wav"
+    _write_silent_wav(audio_file)
+    transcription_service = ConcurrentTranscriptionService()
+    service = MultilingualTranscriptionService(
+        transcription_service=transcription_service,
+        segmentation_service=MixedRoutingSegmentationService(),
+        translation_service_factory=lambda _request: RecordingTranslationService(),
+    )
+    request = MultilingualTranscriptionRequest(
+        audio_file=audio_file,
+        provider=TranscriptionProvider.WHISPER,
+        target_language="en",
+        use_speaker_blocks=True,
+        max_block_workers=3,
+    )
+
+    artifact = service.generate_subtitles(request)
+
+    english_index = artifact.final_english_srt.index("HELLO")
+    vi_index = artifact.final_english_srt.index("EN:vi")
+    fallback_index = artifact.final_english_srt.index("FALLBACK ENGLISH")
+    assert english_index < vi_index < fallback_index
+    assert transcription_service.peak > 1
+
+
+def test_multilingual_service_caps_inflight_block_audio(tmp_path: Path) -> None:
+    audio_file = tmp_path / "sample.wav"
+    _write_silent_wav(audio_file)
+    transcription_service = ConcurrentTranscriptionService()
+    service = MultilingualTranscriptionService(
+        transcription_service=transcription_service,
+        segmentation_service=MixedRoutingSegmentationService(),
+        translation_service_factory=lambda _request: RecordingTranslationService(),
+    )
+    # Each 500 ms block is 16000 bytes of 16 kHz mono PCM; only one fits at a time
+    request = MultilingualTranscriptionRequest(
+        audio_file=audio_file,
+        provider=TranscriptionProvider.WHISPER,
+        target_language="en",
+        use_speaker_blocks=True,
+        max_block_workers=3,
+        max_inflight_audio_bytes=20000,
+    )
+
+    artifact = service.generate_subtitles(request)
+
+    assert "FALLBACK ENGLISH" in artifact.final_english_srt
+    assert transcription_service.peak == 1
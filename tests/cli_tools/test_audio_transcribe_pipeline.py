@@ -1,11 +1,18 @@
+import threading
+import time
+from importlib import import_module
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 from tnh_scholar.cli_tools.audio_transcribe.transcription_pipeline import (
+    RequestThrottle,
     TranscriptionPipeline,
 )
 
+pipeline_module = import_module("tnh_scholar.cli_tools.audio_transcribe.transcription_pipeline")
+
 
 def test_pipeline_skips_diarization_for_assemblyai(tmp_path: Path) -> None:
     audio_path = tmp_path / "sample.mp3"
@@ -21,3 +28,76 @@ def test_pipeline_skips_diarization_for_assemblyai(tmp_path: Path) -> None:
     pipeline._transcribe_full_audio = lambda: ["ok"]
 
     assert pipeline.run() == ["ok"]
+
+
+class _FakeTranscript:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class _SlowService:
+    """Finishes early chunks last so ordering comes from the pipeline, not timing."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio, options):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.01 * (5 - audio))
+            if audio == 2:
+                raise RuntimeError("provider timeout")
+            return _FakeTranscript(f"text {audio}")
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _chunk(data):
+    return SimpleNamespace(audio=SimpleNamespace(data=data) if data is not None else None)
+
+
+def test_transcribe_chunks_concurrently_preserves_order(tmp_path: Path, monkeypatch) -> None:
+    audio_path = tmp_path / "sample.mp3"
+    audio_path.write_bytes(b"fake-audio")
+    service = _SlowService()
+    monkeypatch.setattr(
+        pipeline_module.TranscriptionServiceFactory, "create_service", lambda provider: service
+    )
+    pipeline = TranscriptionPipeline(
+        audio_file=audio_path,
+        output_dir=tmp_path,
+        transcriber="assemblyai",
+        save_diarization=False,
+        max_workers=4,
+    )
+    chunks = [_chunk(0), _chunk(1), _chunk(None), _chunk(2), _chunk(3)]
+
+    records = pipeline._transcribe_chunks(chunks)
+
+    assert [record["chunk"] for record in records] == [chunks[0], chunks[1], chunks[3], chunks[4]]
+    assert [record["transcript"] for record in records] == ["text 0", "text 1", None, "text 3"]
+    assert [record["error"] for record in records] == [None, None, "provider timeout", None]
+    assert service.peak > 1
+
+
+def test_pipeline_rejects_invalid_worker_count(tmp_path: Path) -> None:
+    audio_path = tmp_path / "sample.mp3"
+    audio_path.write_bytes(b"fake-audio")
+
+    with pytest.raises(ValueError, match="max_workers"):
+        TranscriptionPipeline(audio_file=audio_path, output_dir=tmp_path, max_workers=0)
+
+
+def test_request_throttle_waits_once_burst_is_spent() -> None:
+    waits: list[float] = []
+    throttle = RequestThrottle(requests_per_minute=2, sleep=waits.append)
+
+    assert throttle.wait() == 0.0
+    assert throttle.wait() == 0.0
+    assert throttle.wait() == pytest.approx(30.0, abs=0.1)
+    assert waits == [pytest.approx(30.0, abs=0.1)]
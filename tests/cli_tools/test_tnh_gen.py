@@ -28,6 +28,7 @@ from tnh_scholar.gen_ai_service.models.domain import (
 )
 from tnh_scholar.gen_ai_service.models.errors import SafetyBlocked
 from tnh_scholar.gen_ai_service.pattern_catalog.adapters.prompts_adapter import PromptsAdapter
+from tnh_scholar.gen_ai_service.streaming import CompletionStream
 from tnh_scholar.prompt_system.domain.models import PromptMetadata
 
 runner = CliRunner(mix_stderr=False)
@@ -202,6 +203,24 @@ def test_list_prompts_outputs_json(tmp_path, monkeypatch):
     assert payload["prompts"][0]["tags"] == ["guidance", "study"]
 
 
+def test_list_prompts_honors_persistent_index_settings(tmp_path, monkeypatch, isolated_user_cache_dir):
+    prompt_dir = _write_prompt(tmp_path)
+    index_path = tmp_path / "index" / "catalog.json"
+    monkeypatch.setenv("TNH_PROMPT_DIR", prompt_dir)
+    monkeypatch.setenv("TNH_GEN_CONFIG_HOME", str(tmp_path / "config-home"))
+
+    assert runner.invoke(tnh_gen.app, ["list", "--keys-only"]).exit_code == 0
+    assert not index_path.exists()
+    assert not isolated_user_cache_dir.exists()
+
+    monkeypatch.setenv("PROMPT_CATALOG_PERSISTENT_INDEX", "true")
+    monkeypatch.setenv("PROMPT_CATALOG_INDEX_PATH", str(index_path))
+    result = runner.invoke(tnh_gen.app, ["list", "--keys-only"])
+
+    assert result.exit_code == 0, result.output
+    assert "daily" in index_path.read_text(encoding="utf-8")
+
+
 def test_list_keys_only(tmp_path, monkeypatch):
     prompt_dir = _write_prompt(tmp_path)
     monkeypatch.setenv("TNH_PROMPT_DIR", prompt_dir)
@@ -413,6 +432,20 @@ class _StubService:
         )
 
 
+class _StreamingStubService(_StubService):
+    def __init__(self, metadata: PromptMetadata):
+        super().__init__(metadata)
+        self.streamed_deltas: list[str] = []
+
+    def generate_stream(self, request):
+        def _deltas():
+            for delta in ("generated", " ", "text"):
+                self.streamed_deltas.append(delta)
+                yield delta
+
+        return CompletionStream(_deltas(), lambda: self.generate(request))
+
+
 class _IncompleteStubService:
     def __init__(self, metadata: PromptMetadata):
         self.last_request: Any = None
@@ -1562,6 +1595,7 @@ def test_run_defaults_reasoning_to_high(tmp_path, monkeypatch):
         no_max_tokens_limit,
         temperature,
         reasoning_effort,
+        completion_cache=None,
     ):  # noqa: ANN001
         captured["reasoning_effort"] = reasoning_effort
         return stub_service
@@ -1615,6 +1649,7 @@ def test_run_reasoning_max_alias_and_none_disable(tmp_path, monkeypatch):
         no_max_tokens_limit,
         temperature,
         reasoning_effort,
+        completion_cache=None,
     ):  # noqa: ANN001
         captured.append(reasoning_effort)
         return stub_service
@@ -1668,6 +1703,7 @@ def test_run_no_max_tokens_limit_passes_flag_to_initializer(tmp_path, monkeypatc
         no_max_tokens_limit,
         temperature,
         reasoning_effort,
+        completion_cache=None,
     ):  # noqa: ANN001
         captured["no_max_tokens_limit"] = no_max_tokens_limit
         return stub_service
@@ -1695,6 +1731,113 @@ def test_run_no_max_tokens_limit_passes_flag_to_initializer(tmp_path, monkeypatc
     assert captured["no_max_tokens_limit"] is True
 
 
+def test_run_cache_flag_passes_toggle_to_initializer(tmp_path, monkeypatch):
+    prompt_dir = _write_prompt(tmp_path)
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("file-input", encoding="utf-8")
+
+    metadata = PromptMetadata(
+        key="daily",
+        name="Daily Guidance",
+        version="1.0.0",
+        description="Daily guidance prompt for testing.",
+        role="study-plan",
+        required_variables=["audience"],
+        optional_variables=[],
+        default_variables={},
+        tags=["guidance"],
+    )
+    stub_service = _StubService(metadata)
+    captured: list[bool | None] = []
+
+    def fake_initialize_service(*_args, completion_cache=None, **_kwargs):  # noqa: ANN001
+        captured.append(completion_cache)
+        return stub_service
+
+    monkeypatch.setenv("TNH_PROMPT_DIR", prompt_dir)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("TNH_GEN_CONFIG_HOME", str(tmp_path / "config-home"))
+    monkeypatch.setattr(run_module, "_initialize_service", fake_initialize_service)
+
+    base_args = ["run", "--prompt", "daily", "--input-file", str(input_file), "--var", "audience=students"]
+    for extra in ([], ["--cache"], ["--no-cache"]):
+        result = runner.invoke(tnh_gen.app, base_args + extra)
+        assert result.exit_code == 0, result.output
+
+    assert captured == [None, True, False]
+
+
+def _daily_metadata() -> PromptMetadata:
+    return PromptMetadata(
+        key="daily",
+        name="Daily Guidance",
+        version="1.0.0",
+        description="Daily guidance prompt for testing.",
+        role="study-plan",
+        required_variables=["audience"],
+        optional_variables=[],
+        default_variables={},
+        tags=["guidance"],
+    )
+
+
+def test_run_stream_echoes_deltas_and_writes_file(tmp_path, monkeypatch):
+    prompt_dir = _write_prompt(tmp_path)
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("file-input", encoding="utf-8")
+    stub_service = _StreamingStubService(_daily_metadata())
+
+    monkeypatch.setenv("TNH_PROMPT_DIR", prompt_dir)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("TNH_GEN_CONFIG_HOME", str(tmp_path / "config-home"))
+    monkeypatch.setattr(run_module, "_initialize_service", lambda *_, **__: stub_service)
+
+    output_file = tmp_path / "out" / "streamed.md"
+    result = runner.invoke(
+        tnh_gen.app,
+        [
+            "run",
+            "--stream",
+            "--prompt",
+            "daily",
+            "--input-file",
+            str(input_file),
+            "--var",
+            "audience=students",
+            "--output-file",
+            str(output_file),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert stub_service.streamed_deltas == ["generated", " ", "text"]
+    assert result.stdout == "generated text\n"
+    written = output_file.read_text(encoding="utf-8")
+    assert written.startswith("---")
+    assert written.endswith("generated text")
+
+
+def test_run_stream_rejected_in_api_mode(tmp_path, monkeypatch):
+    prompt_dir = _write_prompt(tmp_path)
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("file-input", encoding="utf-8")
+    stub_service = _StreamingStubService(_daily_metadata())
+
+    monkeypatch.setenv("TNH_PROMPT_DIR", prompt_dir)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("TNH_GEN_CONFIG_HOME", str(tmp_path / "config-home"))
+    monkeypatch.setattr(run_module, "_initialize_service", lambda *_, **__: stub_service)
+
+    result = runner.invoke(
+        tnh_gen.app,
+        ["--api", "run", "--stream", "--prompt", "daily", "--input-file", str(input_file)],
+    )
+
+    assert result.exit_code != 0
+    assert "--stream is not supported with --api" in result.stdout
+    assert stub_service.streamed_deltas == []
+
+
 def test_run_human_mode_rejects_json_format(tmp_path, monkeypatch):
     prompt_dir = _write_prompt(tmp_path)
     input_file = tmp_path / "input.txt"
@@ -2064,6 +2207,57 @@ def test_version_format_json_without_api_is_rejected():
     assert "trace_id=" in result.stderr
 
 
+def _write_metrics_file(tmp_path: Path) -> Path:
+    records = [
+        {"type": "span", "name": "genai.generate", "duration_s": 1.5, "status": "ok"},
+        {"type": "span", "name": "genai.generate", "duration_s": 0.5, "status": "error"},
+        {
+            "type": "usage",
+            "provider": "openai",
+            "model": "gpt-5-mini",
+            "tokens_in": 100,
+            "tokens_out": 40,
+            "cost_usd": 0.002,
+            "cache_hit": False,
+            "retries": 1,
+        },
+    ]
+    path = tmp_path / "metrics.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n", encoding="utf-8")
+    return path
+
+
+def test_stats_api_outputs_span_and_usage_summary(tmp_path):
+    metrics_file = _write_metrics_file(tmp_path)
+
+    result = runner.invoke(tnh_gen.app, ["--api", "stats", "--file", str(metrics_file)])
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    assert payload["spans"]["genai.generate"]["count"] == 2
+    assert payload["spans"]["genai.generate"]["errors"] == 1
+    assert payload["usage"]["tokens_in"] == 100
+    assert payload["usage"]["retries"] == 1
+    assert payload["usage_by_model"]["openai:gpt-5-mini"]["requests"] == 1
+
+
+def test_stats_human_outputs_text_table(tmp_path):
+    metrics_file = _write_metrics_file(tmp_path)
+
+    result = runner.invoke(tnh_gen.app, ["stats", "--file", str(metrics_file)])
+
+    assert result.exit_code == 0, result.output
+    assert "genai.generate" in result.stdout
+    assert "tokens in 100" in result.stdout
+
+
+def test_stats_missing_file_reports_error(tmp_path):
+    result = runner.invoke(tnh_gen.app, ["stats", "--file", str(tmp_path / "absent.jsonl")])
+
+    assert result.exit_code != 0
+    assert "METRICS_ENABLED" in result.stdout
+
+
 def test_legacy_prompt_allows_auto_input_text_variable():
     metadata = PromptMetadata(
         key="legacy",
@@ -451,14 +451,22 @@ def test_emit_warnings_outputs_to_stderr(capsys):
     assert "[warn]" in captured.err
 
 
-def test_validate_run_options_streaming_and_top_p(capsys):
-    with pytest.raises(ValueError):
+def test_validate_run_options_streaming_and_top_p(capsys, monkeypatch):
+    monkeypatch.setattr(ctx, "api", True)
+    with pytest.raises(ValueError, match="--stream is not supported with --api"):
         run_module._validate_run_options(
             streaming=True,
             top_p=None,
             max_tokens=None,
             no_max_tokens_limit=False,
         )
+    monkeypatch.setattr(ctx, "api", False)
+    run_module._validate_run_options(
+        streaming=True,
+        top_p=None,
+        max_tokens=None,
+        no_max_tokens_limit=False,
+    )
 
     run_module._validate_run_options(
         streaming=False,
@@ -724,6 +732,7 @@ def test_factory_payload_and_protocol_coverage(tmp_path):
         output_token_limit_mode=OutputTokenLimitMode.MODEL_MAX,
         temperature=0.1,
         reasoning_effort="medium",
+        completion_cache=False,
     )
     payload = factory_module.cli_config_to_settings_kwargs(cli_config, overrides)
 
@@ -736,6 +745,7 @@ def test_factory_payload_and_protocol_coverage(tmp_path):
     assert payload["default_max_output_tokens"] == 9
     assert payload["default_output_token_limit_mode"] is OutputTokenLimitMode.MODEL_MAX
     assert payload["default_reasoning_effort"] == "medium"
+    assert payload["completion_cache_enabled"] is False
 
     result = factory_module.ServiceFactory.create_genai_service(
         SimpleNamespace(),
@@ -0,0 +1,24 @@
+from pathlib import Path
+
+import pytest
+
+# Modules that default their on-disk state to `platformdirs.user_cache_dir`
+_USER_CACHE_MODULES = (
+    "tnh_scholar.prompt_system.transport.catalog_index",
+    "tnh_scholar.gen_ai_service.infra.completion_cache",
+    "tnh_scholar.gen_ai_service.infra.metrics",
+    "tnh_scholar.ai_text_processing.checkpoint",
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_user_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep default cache locations (catalog index, completion cache, ...) under `tmp_path`."""
+    cache_root = tmp_path / "user-cache"
+
+    def _user_cache_dir(appname: str | None = None, *args: object, **kwargs: object) -> str:
+        return str(cache_root / (appname or ""))
+
+    for module in _USER_CACHE_MODULES:
+        monkeypatch.setattr(f"{module}.user_cache_dir", _user_cache_dir)
+    return cache_root
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+from textwrap import dedent
+
+import pytest
+
+from tnh_scholar.gen_ai_service import async_service as async_service_module
+from tnh_scholar.gen_ai_service import service as service_module
+from tnh_scholar.gen_ai_service.async_service import AsyncGenAIService
+from tnh_scholar.gen_ai_service.config.output_tokens import OutputTokenLimitPolicy
+from tnh_scholar.gen_ai_service.config.params_policy import ResolvedParams
+from tnh_scholar.gen_ai_service.config.settings import GenAISettings
+from tnh_scholar.gen_ai_service.models.domain import RenderRequest
+from tnh_scholar.gen_ai_service.models.errors import ProviderError
+from tnh_scholar.gen_ai_service.models.transport import (
+    FinishReason,
+    ProviderRequest,
+    ProviderResponse,
+    ProviderStatus,
+    ProviderUsage,
+    TextPayload,
+)
+
+
+class DummyOpenAIClient:
+    def __init__(self, api_key: str | None, organization: str | None):
+        self.sdk_version = "openai-sdk-test"
+
+    def generate(self, request: ProviderRequest) -> ProviderResponse:
+        raise AssertionError("sync client must not be used by the async path")
+
+
+class DummyAsyncOpenAIClient:
+    def __init__(self, api_key: str | None, organization: str | None):
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.fail_on: str | None = None
+
+    async def generate(self, request: ProviderRequest) -> ProviderResponse:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        user_text = str(request.messages[0].content)
+        try:
+            # Later requests finish first to prove ordering is by input, not completion.
+            await asyncio.sleep(0.01 / (1 + int(user_text.split("-")[-1])))
+            if user_text == self.fail_on:
+                raise ProviderError(f"boom: {user_text}")
+            return ProviderResponse(
+                provider="openai",
+                model=request.model,
+                status=ProviderStatus.OK,
+                payload=TextPayload(text=f"echo {user_text}", finish_reason=FinishReason.STOP),
+                usage=ProviderUsage(tokens_in=10, tokens_out=2, tokens_total=12),
+            )
+        finally:
+            self.in_flight -= 1
+
+
+def _build_service(tmp_path, monkeypatch: pytest.MonkeyPatch) -> AsyncGenAIService:
+    prompt_dir = tmp_path / "prompts"
+    prompt_dir.mkdir()
+    prompt_dir.joinpath("echo.md").write_text(
+        dedent(
+            """\
+            ---
+            key: echo
+            name: echo
+            version: 1.0.0
+            description: Echo prompt for testing.
+            role: test
+            ---
+            Echo the input.
+            """
+        )
+    )
+    params = ResolvedParams(
+        provider="openai",
+        model="gpt-5-mini",
+        temperature=0.2,
+        output_token_limit=OutputTokenLimitPolicy(capped_tokens=64),
+    )
+    monkeypatch.setattr(service_module, "apply_policy", lambda *_, **__: params)
+    monkeypatch.setattr(service_module, "select_provider_and_model", lambda *_, **__: params)
+    monkeypatch.setattr(service_module, "OpenAIClient", DummyOpenAIClient)
+    monkeypatch.setattr(async_service_module, "AsyncOpenAIClient", DummyAsyncOpenAIClient)
+    monkeypatch.setenv("TNH_PROMPT_DIR", str(prompt_dir))
+    monkeypatch.setenv("OPENAI_API_KEY", "unit-test-key")
+    return AsyncGenAIService(settings=GenAISettings(_env_file=None))
+
+
+def _requests(count: int) -> list[RenderRequest]:
+    return [RenderRequest(instruction_key="echo", user_input=f"section-{i}") for i in range(count)]
+
+
+def test_generate_many_preserves_input_order_and_bounds_concurrency(tmp_path, monkeypatch):
+    service = _build_service(tmp_path, monkeypatch)
+    client: DummyAsyncOpenAIClient = service.async_openai_client  # type: ignore[assignment]
+
+    envelopes = asyncio.run(service.generate_many(_requests(12), max_concurrency=4))
+
+    assert [env.result.text for env in envelopes if env.result] == [f"echo section-{i}" for i in range(12)]
+    assert all(env.outcome.value == "succeeded" for env in envelopes)
+    assert envelopes[0].policy_applied["effective_max_output_tokens"] == 64
+    assert 1 < client.peak_in_flight <= 4
+
+
+def test_generate_many_defaults_to_settings_concurrency(tmp_path, monkeypatch):
+    monkeypatch.setenv("MAX_CONCURRENT_REQUESTS", "2")
+    service = _build_service(tmp_path, monkeypatch)
+    client: DummyAsyncOpenAIClient = service.async_openai_client  # type: ignore[assignment]
+
+    asyncio.run(service.generate_many(_requests(6)))
+
+    assert service.settings.max_concurrent_requests == 2
+    assert client.peak_in_flight == 2
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_generate_many_rejects_non_positive_concurrency(tmp_path, monkeypatch, max_concurrency):
+    service = _build_service(tmp_path, monkeypatch)
+
+    with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+        asyncio.run(service.generate_many(_requests(2), max_concurrency=max_concurrency))
+
+
+def test_generate_many_propagates_provider_errors(tmp_path, monkeypatch):
+    service = _build_service(tmp_path, monkeypatch)
+    client: DummyAsyncOpenAIClient = service.async_openai_client  # type: ignore[assignment]
+    client.fail_on = "section-3"
+
+    with pytest.raises(ProviderError, match="section-3"):
+        asyncio.run(service.generate_many(_requests(6), max_concurrency=3))
+
+
+def test_generate_many_applies_registry_rate_limit_tier(tmp_path, monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_TIER", "tier_2")
+    service = _build_service(tmp_path, monkeypatch)
+
+    envelopes = asyncio.run(service.generate_many(_requests(3)))
+
+    assert service.rate_limits.enabled
+    assert all(env.policy_applied["rate_limit_tier"] == "tier_2" for env in envelopes)
+    assert all(env.policy_applied["rate_limit_wait_s"] == 0.0 for env in envelopes)
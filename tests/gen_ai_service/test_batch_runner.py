@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tnh_scholar.gen_ai_service.batch_runner import BatchRunner, batch_request_line, write_batch_file
+from tnh_scholar.gen_ai_service.models.batch import BatchJob, BatchStatus
+from tnh_scholar.gen_ai_service.models.domain import Message, Role
+from tnh_scholar.gen_ai_service.models.errors import BatchJobFailed
+from tnh_scholar.gen_ai_service.models.transport import ProviderRequest, ProviderStatus
+from tnh_scholar.gen_ai_service.providers.local_batch_client import LocalBatchClient
+
+
+def _request(text: str) -> ProviderRequest:
+    return ProviderRequest(
+        provider="openai",
+        model="gpt-4o",
+        system="sys",
+        messages=[Message(role=Role.user, content=text)],
+        temperature=0.2,
+        max_output_tokens=64,
+    )
+
+
+def _write_requests(tmp_path, *texts: str):
+    lines = [batch_request_line(f"request-{idx}", _request(text)) for idx, text in enumerate(texts, start=1)]
+    return write_batch_file(lines, tmp_path / "batch.jsonl")
+
+
+def _echo(body) -> str:
+    return body["messages"][-1]["content"].upper()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_batch_request_line_uses_chat_completions_shape():
+    line = batch_request_line("request-1", _request("hello"))
+
+    assert line["custom_id"] == "request-1"
+    assert line["url"] == "/v1/chat/completions"
+    assert line["body"]["messages"] == [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": "hello"},
+    ]
+    assert line["body"]["max_completion_tokens"] == 64
+    assert "seed" not in line["body"]
+
+
+def test_run_returns_results_in_input_order(tmp_path):
+    path = _write_requests(tmp_path, "one", "two", "three")
+    clock = _Clock()
+    runner = BatchRunner(LocalBatchClient(_echo), poll_interval=1, sleep=clock.sleep, clock=clock)
+
+    results = runner.run(path)
+
+    assert [item.custom_id for item in results] == ["request-1", "request-2", "request-3"]
+    assert [item.text for item in results] == ["ONE", "TWO", "THREE"]
+    assert results[0].response is not None
+    assert results[0].response.status is ProviderStatus.OK
+    assert results[0].response.provider == "local"
+
+
+def test_wait_polls_with_backoff_until_complete(tmp_path):
+    path = _write_requests(tmp_path, "one")
+    clock = _Clock()
+    client = LocalBatchClient(_echo, polls_until_complete=3)
+    runner = BatchRunner(
+        client, poll_interval=2, backoff=2, max_poll_interval=5, sleep=clock.sleep, clock=clock
+    )
+
+    runner.run(path)
+
+    assert clock.sleeps == [2, 4, 5, 5]
+
+
+def test_per_request_errors_are_reported_without_failing_batch(tmp_path):
+    path = _write_requests(tmp_path, "ok", "boom")
+
+    def responder(body):
+        if body["messages"][-1]["content"] == "boom":
+            raise RuntimeError("exploded")
+        return "fine"
+
+    runner = BatchRunner(LocalBatchClient(responder), poll_interval=0, sleep=lambda _s: None)
+
+    ok, failed = runner.run(path)
+
+    assert ok.text == "fine"
+    assert failed.text is None
+    assert failed.error == "exploded"
+
+
+def test_wait_raises_on_failed_batch():
+    class FailingClient(LocalBatchClient):
+        def retrieve_batch(self, batch_id: str) -> BatchJob:
+            return BatchJob(id=batch_id, status=BatchStatus.EXPIRED, input_file_id="f", errors=["too slow"])
+
+    runner = BatchRunner(FailingClient(_echo), poll_interval=0, sleep=lambda _s: None)
+    job = BatchJob(id="batch-1", status=BatchStatus.IN_PROGRESS, input_file_id="f")
+
+    with pytest.raises(BatchJobFailed, match="expired: too slow"):
+        runner.wait(job)
+
+
+def test_wait_raises_on_timeout(tmp_path):
+    path = _write_requests(tmp_path, "one")
+    clock = _Clock()
+    client = LocalBatchClient(_echo, polls_until_complete=100)
+    runner = BatchRunner(client, poll_interval=10, timeout=25, sleep=clock.sleep, clock=clock)
+
+    with pytest.raises(BatchJobFailed, match="did not finish"):
+        runner.run(path)
+    assert len(client.cancelled_ids) == 1
+
+
+def test_collect_marks_missing_results(tmp_path):
+    path = _write_requests(tmp_path, "one")
+    client = LocalBatchClient(_echo)
+    runner = BatchRunner(client, poll_interval=0, sleep=lambda _s: None)
+    job = runner.wait(runner.submit(path))
+
+    results = runner.collect(job, ["request-1", "request-404"])
+
+    assert results[0].text == "ONE"
+    assert results[1].error == "missing from batch output"
+    assert json.loads(path.read_text().splitlines()[0])["custom_id"] == "request-1"
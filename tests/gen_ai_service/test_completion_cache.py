@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from tnh_scholar.gen_ai_service.infra.completion_cache import CompletionCache, completion_cache_key
+from tnh_scholar.gen_ai_service.models.domain import Fingerprint, Message, Role
+from tnh_scholar.gen_ai_service.models.transport import (
+    FinishReason,
+    ProviderRequest,
+    ProviderResponse,
+    ProviderStatus,
+    ProviderUsage,
+    TextPayload,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fingerprint(user_hash: str = "sha256:user") -> Fingerprint:
+    return Fingerprint(
+        prompt_key="daily",
+        prompt_name="daily",
+        prompt_base_path="/prompts",
+        prompt_content_hash="sha256:prompt",
+        variables_hash="sha256:vars",
+        user_string_hash=user_hash,
+    )
+
+
+def _request(**overrides) -> ProviderRequest:
+    payload = dict(
+        provider="openai",
+        model="gpt-5-mini",
+        messages=[Message(role=Role.user, content="hello")],
+        temperature=0.2,
+        max_output_tokens=64,
+    )
+    payload.update(overrides)
+    return ProviderRequest(**payload)
+
+
+def _response(text: str = "cached text") -> ProviderResponse:
+    return ProviderResponse(
+        provider="openai",
+        model="gpt-5-mini",
+        status=ProviderStatus.OK,
+        payload=TextPayload(text=text, finish_reason=FinishReason.STOP),
+        usage=ProviderUsage(tokens_in=5, tokens_out=3, tokens_total=8),
+    )
+
+
+def test_cache_key_tracks_fingerprint_and_params_but_not_base_path():
+    base = completion_cache_key(_fingerprint(), _request())
+
+    moved = _fingerprint().model_copy(update={"prompt_base_path": "/elsewhere"})
+    assert completion_cache_key(moved, _request()) == base
+    assert completion_cache_key(_fingerprint("sha256:other"), _request()) != base
+    assert completion_cache_key(_fingerprint(), _request(model="gpt-5")) != base
+    assert completion_cache_key(_fingerprint(), _request(temperature=0.7)) != base
+    assert completion_cache_key(_fingerprint(), _request(seed=3)) != base
+
+
+def test_cache_round_trips_responses_and_counts_hits(tmp_path):
+    cache = CompletionCache(tmp_path / "cache.sqlite3")
+
+    assert cache.get("k") is None
+    assert cache.put("k", _response())
+    cached = cache.get("k")
+
+    assert cached == _response()
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.stores) == (1, 1, 1)
+    # A second instance sees the persisted entry.
+    assert CompletionCache(tmp_path / "cache.sqlite3").get("k") == _response()
+
+
+def test_cache_expires_entries_after_ttl(tmp_path):
+    clock = _Clock()
+    cache = CompletionCache(tmp_path / "cache.sqlite3", ttl_s=60, clock=clock)
+    cache.put("k", _response())
+
+    clock.now += 61
+
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used_when_over_budget(tmp_path):
+    clock = _Clock()
+    entry_size = len(_response("a").model_dump_json().encode("utf-8"))
+    cache = CompletionCache(tmp_path / "cache.sqlite3", max_bytes=entry_size * 2, clock=clock)
+
+    cache.put("a", _response("a"))
+    clock.now += 1
+    cache.put("b", _response("b"))
+    clock.now += 1
+    assert cache.get("a") is not None  # refresh "a" so "b" is now least recent
+    clock.now += 1
+    cache.put("c", _response("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats.evictions == 1
+    assert cache.total_bytes() <= entry_size * 2
+
+
+def test_cache_skips_failed_and_parsed_responses(tmp_path):
+    class Parsed(BaseModel):
+        value: int
+
+    cache = CompletionCache(tmp_path / "cache.sqlite3")
+    failed = _response().model_copy(update={"status": ProviderStatus.FAILED, "payload": None})
+    parsed = _response().model_copy(
+        update={"payload": TextPayload(text="{}", parsed=Parsed(value=1))},
+    )
+
+    assert not cache.put("failed", failed)
+    assert not cache.put("parsed", parsed)
+    assert len(cache) == 0
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from textwrap import dedent
+
+import pytest
+from tenacity import Retrying, retry_if_exception, stop_after_attempt
+
+from tnh_scholar.gen_ai_service import service as service_module
+from tnh_scholar.gen_ai_service.config.output_tokens import OutputTokenLimitPolicy
+from tnh_scholar.gen_ai_service.config.params_policy import ResolvedParams
+from tnh_scholar.gen_ai_service.config.settings import GenAISettings
+from tnh_scholar.gen_ai_service.infra.metrics import (
+    JsonlMetricsExporter,
+    MetricsRegistry,
+    set_metrics,
+)
+from tnh_scholar.gen_ai_service.infra.tracer import SPAN_DURATION_METRIC, current_span, span
+from tnh_scholar.gen_ai_service.infra.usage import (
+    load_metrics_records,
+    record_usage,
+    summarize_metrics,
+)
+from tnh_scholar.gen_ai_service.models.domain import Message, RenderRequest, Role
+from tnh_scholar.gen_ai_service.models.transport import (
+    FinishReason,
+    ProviderRequest,
+    ProviderResponse,
+    ProviderStatus,
+    ProviderUsage,
+    TextPayload,
+)
+from tnh_scholar.gen_ai_service.providers.openai_client import OpenAIClient
+from tnh_scholar.gen_ai_service.service import GenAIService
+from tnh_scholar.utils.concurrency_utils import ordered_map
+
+
+class _ListSink:
+    def __init__(self) -> None:
+        self.records: list[dict] = []
+
+    def emit(self, record) -> None:
+        self.records.append(dict(record))
+
+
+@pytest.fixture
+def registry():
+    fresh = MetricsRegistry()
+    previous = set_metrics(fresh)
+    yield fresh
+    set_metrics(previous)
+
+
+def test_registry_counters_and_histograms_are_labelled():
+    registry = MetricsRegistry()
+
+    registry.increment("genai.requests", model="a")
+    registry.increment("genai.requests", 2, model="a")
+    registry.increment("genai.requests", model="b")
+    registry.observe("latency", 0.5, model="a")
+    registry.observe("latency", 1.5, model="a")
+
+    assert registry.counter_value("genai.requests", model="a") == 3
+    assert registry.counter_value("genai.requests", model="b") == 1
+    histogram = registry.histogram("latency", model="a")
+    assert histogram is not None
+    assert (histogram.count, histogram.min, histogram.max, histogram.mean) == (2, 0.5, 1.5, 1.0)
+    assert registry.snapshot().counters["genai.requests{model=a}"] == 3
+
+    registry.reset()
+    assert registry.counter_value("genai.requests", model="a") == 0
+
+
+def test_failing_sink_does_not_break_emit():
+    class _Broken:
+        def emit(self, record) -> None:
+            raise OSError("disk full")
+
+    registry = MetricsRegistry()
+    sink = _ListSink()
+    registry.add_sink(_Broken())
+    registry.add_sink(sink)
+
+    registry.emit({"type": "usage"})
+
+    assert sink.records == [{"type": "usage"}]
+
+
+def test_spans_nest_and_record_errors(registry):
+    sink = _ListSink()
+    registry.add_sink(sink)
+
+    with span("outer", job="x") as outer:
+        with span("inner") as inner:
+            assert current_span() is inner
+        with pytest.raises(ValueError):
+            with span("failing"):
+                raise ValueError("boom")
+    assert current_span() is None
+
+    by_name = {record["name"]: record for record in sink.records}
+    assert by_name["inner"]["parent_id"] == outer.span_id
+    assert by_name["inner"]["trace_id"] == by_name["outer"]["trace_id"]
+    assert by_name["outer"]["parent_id"] is None
+    assert by_name["outer"]["attributes"] == {"job": "x"}
+    assert by_name["failing"]["status"] == "error"
+    assert by_name["failing"]["attributes"]["error"] == "ValueError"
+    assert registry.histogram(SPAN_DURATION_METRIC, span="failing", status="error") is not None
+
+
+def test_concurrent_async_spans_keep_separate_parents(registry):
+    sink = _ListSink()
+    registry.add_sink(sink)
+
+    async def _task(name: str) -> None:
+        with span(name):
+            await asyncio.sleep(0)
+            with span(f"{name}.child"):
+                await asyncio.sleep(0)
+
+    async def _main() -> None:
+        await asyncio.gather(_task("a"), _task("b"))
+
+    asyncio.run(_main())
+
+    by_name = {record["name"]: record for record in sink.records}
+    assert by_name["a.child"]["parent_id"] == by_name["a"]["span_id"]
+    assert by_name["b.child"]["parent_id"] == by_name["b"]["span_id"]
+    assert by_name["a"]["trace_id"] != by_name["b"]["trace_id"]
+
+
+def test_spans_in_ordered_map_workers_keep_parent(registry):
+    sink = _ListSink()
+    registry.add_sink(sink)
+
+    def _call(index: int) -> None:
+        with span(f"call-{index}"):
+            pass
+
+    with span("batch") as parent:
+        list(ordered_map(_call, range(3), max_workers=3, capture_errors=False))
+
+    children = [record for record in sink.records if record["name"].startswith("call-")]
+    assert len(children) == 3
+    assert all(record["parent_id"] == parent.span_id for record in children)
+    assert all(record["trace_id"] == parent.trace_id for record in children)
+
+
+def test_openai_client_records_a_span_per_attempt(registry, monkeypatch):
+    sink = _ListSink()
+    registry.add_sink(sink)
+    client = OpenAIClient(api_key="test-key", organization=None)
+    client._retry_caller = Retrying(
+        stop=stop_after_attempt(2),
+        retry=retry_if_exception(OpenAIClient._is_retryable_exception),
+        reraise=True,
+    )
+    calls: list[int] = []
+
+    class APIConnectionError(Exception):
+        pass
+
+    def _chat_create(openai_request):
+        calls.append(1)
+        if len(calls) == 1:
+            raise APIConnectionError("reset")
+        return "raw"
+
+    monkeypatch.setattr(client, "_chat_create", _chat_create)
+    monkeypatch.setattr(client._adapter, "from_openai_response", lambda raw, **kwargs: kwargs)
+    request = ProviderRequest(
+        provider="openai",
+        model="gpt-5-mini",
+        messages=[Message(role=Role.user, content="hi")],
+        temperature=0.2,
+        max_output_tokens=32,
+    )
+
+    with span("call") as parent:
+        assert client.generate(request)["attempts"] == 2
+
+    attempts = [record for record in sink.records if record["name"] == "genai.provider_attempt"]
+    assert [record["attributes"]["attempt"] for record in attempts] == [1, 2]
+    assert [record["status"] for record in attempts] == ["error", "ok"]
+    assert attempts[0]["attributes"]["error"] == "APIConnectionError"
+    assert all(record["parent_id"] == parent.span_id for record in attempts)
+
+
+def test_exported_records_summarize(tmp_path, registry):
+    path = tmp_path / "metrics.jsonl"
+    registry.add_sink(JsonlMetricsExporter(path))
+    registry.add_sink(JsonlMetricsExporter(path))  # duplicate exporters are ignored
+
+    for _ in range(3):
+        with span("genai.generate"):
+            record_usage(
+                provider="openai",
+                model="gpt-5-mini",
+                usage=ProviderUsage(tokens_in=10, tokens_out=4),
+                attempts=2,
+                cost=0.01,
+            )
+    record_usage(provider="openai", model="gpt-5-mini", usage=None, attempts=1, cost=None, cache_hit=True)
+    path.open("a", encoding="utf-8").write("not json\n")
+
+    summary = summarize_metrics(load_metrics_records(path))
+
+    assert summary.spans["genai.generate"].count == 3
+    assert summary.usage.requests == 4
+    assert summary.usage.cache_hits == 1
+    assert summary.usage.tokens_in == 30
+    assert summary.usage.retries == 3
+    assert summary.usage.cost_usd == pytest.approx(0.03)
+    assert registry.counter_value("genai.cache_hits", provider="openai", model="gpt-5-mini") == 1
+
+
+class _DummyOpenAIClient:
+    def __init__(self, api_key: str | None, organization: str | None):
+        self.sdk_version = "openai-sdk-test"
+
+    def generate(self, request: ProviderRequest) -> ProviderResponse:
+        return ProviderResponse(
+            provider="openai",
+            model=request.model,
+            status=ProviderStatus.OK,
+            attempts=2,
+            payload=TextPayload(text="ok", finish_reason=FinishReason.STOP),
+            usage=ProviderUsage(tokens_in=12, tokens_out=3, tokens_total=15),
+        )
+
+
+def test_service_exports_spans_and_usage(tmp_path, monkeypatch: pytest.MonkeyPatch, registry):
+    prompt_dir = tmp_path / "prompts"
+    prompt_dir.mkdir()
+    prompt_dir.joinpath("daily.md").write_text(
+        dedent(
+            """\
+            ---
+            key: daily
+            name: daily
+            version: 1.0.0
+            description: Daily guidance prompt for testing.
+            role: study-plan
+            required_variables: []
+            optional_variables: []
+            default_variables: {}
+            ---
+            Offer help.
+            """
+        )
+    )
+    params = ResolvedParams(
+        provider="openai",
+        model="gpt-5-mini",
+        temperature=0.2,
+        output_token_limit=OutputTokenLimitPolicy(capped_tokens=128),
+    )
+    monkeypatch.setattr(service_module, "apply_policy", lambda *_, **__: params)
+    monkeypatch.setattr(service_module, "select_provider_and_model", lambda *_, **__: params)
+    monkeypatch.setattr(service_module, "OpenAIClient", _DummyOpenAIClient)
+    monkeypatch.setenv("TNH_PROMPT_DIR", str(prompt_dir))
+    monkeypatch.setenv("OPENAI_API_KEY", "unit-test-key")
+    metrics_path = tmp_path / "metrics.jsonl"
+
+    service = GenAIService(
+        settings=GenAISettings(_env_file=None, metrics_enabled=True, metrics_path=metrics_path)
+    )
+    service.generate(RenderRequest(instruction_key="daily", user_input="hello"))
+
+    records = [json.loads(line) for line in metrics_path.read_text(encoding="utf-8").splitlines()]
+    spans = {record["name"]: record for record in records if record["type"] == "span"}
+    assert {"genai.generate", "genai.render", "genai.safety_gate", "genai.provider_call"} <= set(spans)
+    assert spans["genai.provider_call"]["parent_id"] == spans["genai.generate"]["span_id"]
+    assert spans["genai.provider_call"]["attributes"]["attempts"] == 2
+    (usage,) = [record for record in records if record["type"] == "usage"]
+    assert usage["tokens_in"] == 12
+    assert usage["retries"] == 1
+    assert usage["trace_id"] == spans["genai.generate"]["trace_id"]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 
+from tnh_scholar.gen_ai_service.models.domain import Message, Role
+from tnh_scholar.gen_ai_service.models.transport import ProviderRequest
 from tnh_scholar.gen_ai_service.providers.openai_client import OpenAIClient
 
 
@@ -53,3 +56,85 @@ def test_openai_client_keeps_temperature_for_gpt54_requests():
 
     assert captured["temperature"] == 0.2
     assert "reasoning_effort" not in captured
+
+
+def test_async_openai_client_retries_and_reports_attempts(monkeypatch):
+    from tnh_scholar.gen_ai_service.providers.openai_client import AsyncOpenAIClient
+
+    client = AsyncOpenAIClient(api_key="test-key", organization=None)
+    calls: list[dict[str, object]] = []
+
+    class RateLimitError(Exception):
+        status_code = 429
+
+    async def _create(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise RateLimitError("slow down")
+        return "raw-completion"
+
+    client._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=_create)))
+    captured: dict[str, object] = {}
+
+    def _from_openai_response(raw, *, model, provider, attempts):
+        captured.update(raw=raw, model=model, provider=provider, attempts=attempts)
+        return "mapped-response"
+
+    monkeypatch.setattr(client._adapter, "from_openai_response", _from_openai_response)
+    request = ProviderRequest(
+        provider="openai",
+        model="gpt-5.4",
+        messages=[Message(role=Role.user, content="Return ACK")],
+        temperature=0.2,
+        max_output_tokens=64,
+    )
+
+    result = asyncio.run(client.generate(request))
+
+    assert result == "mapped-response"
+    assert len(calls) == 2
+    assert captured == {"raw": "raw-completion", "model": "gpt-5.4", "provider": "openai", "attempts": 2}
+
+
+def _chunk(content=None, finish_reason=None, usage=None):
+    choices = [] if content is None and finish_reason is None else [
+        SimpleNamespace(index=0, delta=SimpleNamespace(content=content), finish_reason=finish_reason)
+    ]
+    return SimpleNamespace(id="chatcmpl-1", model="gpt-5-mini", created=1, choices=choices, usage=usage)
+
+
+def test_openai_client_generate_stream_yields_deltas_then_assembles_response():
+    from openai.types.completion_usage import CompletionUsage
+
+    client = OpenAIClient(api_key="test-key", organization=None)
+    captured: dict[str, object] = {}
+    chunks = [
+        _chunk("Hello"),
+        _chunk(", world"),
+        _chunk(finish_reason="stop"),
+        _chunk(usage=CompletionUsage(prompt_tokens=7, completion_tokens=3, total_tokens=10)),
+    ]
+
+    def _create(**kwargs):
+        captured.update(kwargs)
+        return iter(chunks)
+
+    client._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=_create)))
+    request = ProviderRequest(
+        provider="openai",
+        model="gpt-5-mini",
+        messages=[Message(role=Role.user, content="hi")],
+        temperature=0.2,
+        max_output_tokens=32,
+    )
+
+    stream = client.generate_stream(request)
+    deltas = list(stream)
+
+    assert captured["stream"] is True
+    assert captured["stream_options"] == {"include_usage": True}
+    assert deltas == ["Hello", ", world"]
+    response = stream.response
+    assert response.payload is not None and response.payload.text == "Hello, world"
+    assert response.payload.finish_reason.value == "stop"
+    assert response.usage is not None and response.usage.tokens_out == 3
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from tnh_scholar.exceptions import ConfigurationError
+from tnh_scholar.gen_ai_service.infra.rate_limit import RateLimiter, RateLimiterPool, TokenBucket
+from tnh_scholar.gen_ai_service.models.registry import RateLimitTier
+from tnh_scholar.gen_ai_service.providers.openai_client import _retry_after_seconds
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_reservations_queue_beyond_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket.per_minute(60, clock=clock)  # 1 token / second
+
+    assert bucket.reserve(60) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0)
+    assert bucket.reserve(1) == pytest.approx(2.0)
+
+    clock.now = 10.0
+    assert bucket.balance == pytest.approx(8.0)
+
+
+def test_rate_limiter_blocks_on_request_budget():
+    clock = FakeClock()
+    limiter = RateLimiter(
+        RateLimitTier(requests_per_minute=2, tokens_per_minute=1_000_000),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    waits = [limiter.acquire(10) for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(30.0)
+    # The fourth caller queued behind the third one: its wait is measured from t=30.
+    assert waits[3] == pytest.approx(30.0)
+    assert clock.now == pytest.approx(60.0)
+
+
+def test_rate_limiter_meters_prompt_and_settled_tokens():
+    clock = FakeClock()
+    limiter = RateLimiter(
+        RateLimitTier(requests_per_minute=1000, tokens_per_minute=600),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    assert limiter.acquire(400) == 0.0
+    limiter.settle(200)  # completion tokens exhaust the remaining budget
+    wait_s = limiter.acquire(100)
+
+    assert wait_s == pytest.approx(10.0)  # 100 tokens at 10 tokens/second
+
+
+def test_rate_limiter_async_acquire_awaits(monkeypatch):
+    clock = FakeClock()
+    slept: list[float] = []
+
+    async def _fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", _fake_sleep)
+    limiter = RateLimiter(RateLimitTier(requests_per_minute=1, tokens_per_minute=100), clock=clock)
+
+    async def _run() -> list[float]:
+        return [await limiter.acquire_async(1), await limiter.acquire_async(1)]
+
+    waits = asyncio.run(_run())
+
+    assert waits == [0.0, pytest.approx(60.0)]
+    assert slept == [pytest.approx(60.0)]
+
+
+def test_rate_limiter_pool_scopes_by_provider_and_model():
+    lookups: list[tuple[str, str]] = []
+
+    def _lookup(provider: str, tier: str) -> RateLimitTier:
+        lookups.append((provider, tier))
+        return RateLimitTier(requests_per_minute=10, tokens_per_minute=100)
+
+    pool = RateLimiterPool("tier_1", tier_lookup=_lookup)
+
+    first = pool.limiter_for("openai", "gpt-5-mini")
+    assert pool.limiter_for("openai", "gpt-5-mini") is first
+    assert pool.limiter_for("openai", "gpt-5") is not first
+    assert lookups == [("openai", "tier_1"), ("openai", "tier_1")]
+
+    acquisition = pool.acquire("openai", "gpt-5-mini", 5)
+    assert acquisition is not None and acquisition.tier == "tier_1"
+
+
+def test_rate_limiter_pool_disabled_without_tier():
+    pool = RateLimiterPool(None, tier_lookup=lambda *_: pytest.fail("no lookup when disabled"))
+
+    assert not pool.enabled
+    assert pool.acquire("openai", "gpt-5-mini", 10_000) is None
+
+
+def test_rate_limiter_pool_reads_registry_tiers():
+    pool = RateLimiterPool("tier_2")
+
+    limiter = pool.limiter_for("openai", "gpt-5-mini")
+
+    assert limiter is not None
+    assert limiter.limits.requests_per_minute == 5000
+    assert limiter.limits.tokens_per_minute == 450000
+
+
+def test_rate_limiter_pool_rejects_unknown_tier():
+    pool = RateLimiterPool("tier_99")
+
+    with pytest.raises(ConfigurationError, match="tier_99"):
+        pool.limiter_for("openai", "gpt-5-mini")
+
+
+def test_retry_after_hint_is_read_from_sdk_exception():
+    exc = SimpleNamespace(response=SimpleNamespace(headers={"retry-after": "7"}))
+    exc_ms = SimpleNamespace(response=SimpleNamespace(headers={"retry-after-ms": "1500"}))
+
+    assert _retry_after_seconds(exc) == 7.0
+    assert _retry_after_seconds(exc_ms) == 1.5
+    assert _retry_after_seconds(SimpleNamespace()) is None
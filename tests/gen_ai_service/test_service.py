@@ -23,6 +23,7 @@ from tnh_scholar.gen_ai_service.models.transport import (
     ProviderUsage,
     TextPayload,
 )
+from tnh_scholar.gen_ai_service.providers.streaming import ProviderStream
 from tnh_scholar.gen_ai_service.service import GenAIService
 
 
@@ -40,6 +41,12 @@ class DummyOpenAIClient:
             raise AssertionError("test must set DummyOpenAIClient.response")
         return self.response
 
+    def generate_stream(self, request: ProviderRequest) -> ProviderStream:
+        response = self.generate(request)
+        text = response.payload.text if response.payload else ""
+        midpoint = len(text) // 2
+        return ProviderStream(iter([text[:midpoint], text[midpoint:]]), lambda: response)
+
 
 def _write_prompt(tmp_path):
     prompt_dir = tmp_path / "prompts"
@@ -164,3 +171,111 @@ def test_missing_api_key_raises_configuration_error(tmp_path, monkeypatch: pytes
 
     with pytest.raises(ConfigurationError, match="Missing required API key: OPENAI_API_KEY"):
         GenAIService(settings=settings)
+
+
+def test_completion_cache_reuses_provider_response(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    prompt_dir = _write_prompt(tmp_path)
+    policy_params = ResolvedParams(
+        provider="openai",
+        model="gpt-5-mini",
+        temperature=0.2,
+        output_token_limit=OutputTokenLimitPolicy(capped_tokens=128),
+    )
+    monkeypatch.setattr(service_module, "apply_policy", lambda *_, **__: policy_params)
+    monkeypatch.setattr(service_module, "select_provider_and_model", lambda *_, **__: policy_params)
+    monkeypatch.setattr(service_module, "OpenAIClient", DummyOpenAIClient)
+    monkeypatch.setenv("TNH_PROMPT_DIR", str(prompt_dir))
+    monkeypatch.setenv("OPENAI_API_KEY", "unit-test-key")
+
+    settings = GenAISettings(
+        _env_file=None,
+        completion_cache_enabled=True,
+        completion_cache_path=tmp_path / "cache" / "completions.sqlite3",
+    )
+    service = GenAIService(settings=settings)
+    dummy_client: DummyOpenAIClient = service.openai_client  # type: ignore[assignment]
+    dummy_client.response = ProviderResponse(
+        provider="openai",
+        model=policy_params.model,
+        status=ProviderStatus.OK,
+        payload=TextPayload(text="Cached completion", finish_reason=FinishReason.STOP),
+        usage=ProviderUsage(tokens_in=10, tokens_out=5, tokens_total=15),
+    )
+    request = RenderRequest(
+        instruction_key="daily",
+        user_input="Where should I begin?",
+        variables={"audience": "practitioners"},
+    )
+
+    first = service.generate(request)
+    second = service.generate(request)
+    changed = service.generate(request.model_copy(update={"user_input": "Something else"}))
+
+    assert len(dummy_client.requests) == 2
+    assert first.policy_applied["cache"] == "miss"
+    assert second.policy_applied["cache"] == "hit"
+    assert second.policy_applied["cache_hits"] == 1
+    assert changed.policy_applied["cache"] == "miss"
+    assert second.result is not None and second.result.text == "Cached completion"
+    assert second.provenance.fingerprint == first.provenance.fingerprint
+
+
+def test_completion_cache_disabled_by_default(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    prompt_dir = _write_prompt(tmp_path)
+    monkeypatch.setattr(service_module, "OpenAIClient", DummyOpenAIClient)
+    monkeypatch.setenv("TNH_PROMPT_DIR", str(prompt_dir))
+    monkeypatch.setenv("OPENAI_API_KEY", "unit-test-key")
+
+    service = GenAIService(settings=GenAISettings(_env_file=None))
+
+    assert service.completion_cache is None
+
+
+def test_generate_stream_yields_deltas_and_finalizes_envelope(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    prompt_dir = _write_prompt(tmp_path)
+    policy_params = ResolvedParams(
+        provider="openai",
+        model="gpt-5-mini",
+        temperature=0.2,
+        output_token_limit=OutputTokenLimitPolicy(capped_tokens=128),
+    )
+    monkeypatch.setattr(service_module, "apply_policy", lambda *_, **__: policy_params)
+    monkeypatch.setattr(service_module, "select_provider_and_model", lambda *_, **__: policy_params)
+    monkeypatch.setattr(service_module, "OpenAIClient", DummyOpenAIClient)
+    monkeypatch.setenv("TNH_PROMPT_DIR", str(prompt_dir))
+    monkeypatch.setenv("OPENAI_API_KEY", "unit-test-key")
+
+    settings = GenAISettings(
+        _env_file=None,
+        completion_cache_enabled=True,
+        completion_cache_path=tmp_path / "cache" / "completions.sqlite3",
+    )
+    service = GenAIService(settings=settings)
+    dummy_client: DummyOpenAIClient = service.openai_client  # type: ignore[assignment]
+    dummy_client.response = ProviderResponse(
+        provider="openai",
+        model=policy_params.model,
+        status=ProviderStatus.OK,
+        payload=TextPayload(text="Streamed completion", finish_reason=FinishReason.STOP),
+        usage=ProviderUsage(tokens_in=10, tokens_out=5, tokens_total=15),
+    )
+    request = RenderRequest(
+        instruction_key="daily",
+        user_input="Where should I begin?",
+        variables={"audience": "practitioners"},
+    )
+
+    stream = service.generate_stream(request)
+    with pytest.raises(RuntimeError):
+        _ = stream.envelope
+    deltas = list(stream)
+    replay = service.generate_stream(request)
+
+    assert deltas == ["Streamed ", "completion"]
+    assert stream.envelope.result is not None
+    assert stream.envelope.result.text == "Streamed completion"
+    assert stream.envelope.policy_applied["cache"] == "miss"
+    assert list(replay) == ["Streamed completion"]
+    assert replay.envelope.policy_applied["cache"] == "hit"
+    assert len(dummy_client.requests) == 1
+
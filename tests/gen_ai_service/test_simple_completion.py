@@ -1,18 +1,27 @@
 from __future__ import annotations
 
 import importlib
+import threading
+import time
 from types import SimpleNamespace
 
 import pytest
 from pydantic import BaseModel
 
+from tnh_scholar.gen_ai_service import service as service_module
 from tnh_scholar.gen_ai_service.adapters.simple_completion import simple_completion
+from tnh_scholar.gen_ai_service.config.settings import GenAISettings
+from tnh_scholar.gen_ai_service.infra.metrics import MetricsRegistry, set_metrics
+from tnh_scholar.gen_ai_service.infra.rate_limit import RateLimiterPool
+from tnh_scholar.gen_ai_service.models.registry import RateLimitTier
 from tnh_scholar.gen_ai_service.models.transport import (
     FinishReason,
     ProviderResponse,
     ProviderStatus,
+    ProviderUsage,
     TextPayload,
 )
+from tnh_scholar.gen_ai_service.service import GenAIService
 
 simple_completion_module = importlib.import_module("tnh_scholar.gen_ai_service.adapters.simple_completion")
 
@@ -33,7 +42,7 @@ class StructuredOutput(BaseModel):
 
 def _setup_stub(monkeypatch: pytest.MonkeyPatch, response: ProviderResponse) -> DummyClient:
     dummy_client = DummyClient(response)
-    dummy_service = SimpleNamespace(openai_client=dummy_client)
+    dummy_service = SimpleNamespace(call_provider=dummy_client.generate)
     monkeypatch.setattr(simple_completion_module, "_get_service", lambda: dummy_service)
     return dummy_client
 
@@ -114,3 +123,99 @@ def test_simple_completion_requires_parsed_payload(monkeypatch: pytest.MonkeyPat
             user_message="User",
             response_model=StructuredOutput,
         )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _install_service(tmp_path, monkeypatch: pytest.MonkeyPatch, attempts: int = 1) -> GenAIService:
+    response = ProviderResponse(
+        provider="openai",
+        model="gpt-test",
+        status=ProviderStatus.OK,
+        payload=TextPayload(text="ok", finish_reason=FinishReason.STOP),
+        usage=ProviderUsage(tokens_in=5, tokens_out=3, tokens_total=8),
+        attempts=attempts,
+    )
+    monkeypatch.setattr(service_module, "OpenAIClient", lambda *_: DummyClient(response))
+    monkeypatch.setenv("TNH_PROMPT_DIR", str(tmp_path))
+    monkeypatch.setenv("OPENAI_API_KEY", "unit-test-key")
+    service = GenAIService(settings=GenAISettings(_env_file=None))
+    monkeypatch.setattr(simple_completion_module, "_get_service", lambda: service)
+    return service
+
+
+def test_simple_completion_waits_on_service_rate_limiter(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    service = _install_service(tmp_path, monkeypatch)
+    clock = FakeClock()
+    service.rate_limits = RateLimiterPool(
+        "tier_1",
+        tier_lookup=lambda *_: RateLimitTier(requests_per_minute=2, tokens_per_minute=1_000_000),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    results = [simple_completion(system_message="System", user_message="User") for _ in range(3)]
+
+    assert results == ["ok", "ok", "ok"]
+    assert clock.sleeps == [pytest.approx(30.0)]
+    assert len(service.openai_client.requests) == 3  # type: ignore[attr-defined]
+
+
+def test_simple_completion_records_spans_and_usage(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    registry = MetricsRegistry()
+    previous = set_metrics(registry)
+    records: list[dict] = []
+    registry.add_sink(SimpleNamespace(emit=lambda record: records.append(dict(record))))
+    try:
+        _install_service(tmp_path, monkeypatch, attempts=2)
+        simple_completion(system_message="System", user_message="User", model="gpt-test")
+    finally:
+        set_metrics(previous)
+
+    spans = {record["name"]: record for record in records if record["type"] == "span"}
+    assert spans["genai.provider_call"]["parent_id"] == spans["genai.call_provider"]["span_id"]
+    assert spans["genai.provider_call"]["attributes"]["attempts"] == 2
+    labels = {"provider": "openai", "model": "gpt-test"}
+    assert registry.counter_value("genai.requests", **labels) == 1
+    assert registry.counter_value("genai.tokens_out", **labels) == 3
+    assert registry.counter_value("genai.retries", **labels) == 1
+    usage = next(record for record in records if record["type"] == "usage")
+    assert usage["trace_id"] == spans["genai.call_provider"]["trace_id"]
+
+
+def test_get_service_builds_one_instance_under_concurrent_first_calls(monkeypatch: pytest.MonkeyPatch):
+    built: list[object] = []
+
+    class SlowService:
+        def __init__(self) -> None:
+            time.sleep(0.02)
+            built.append(self)
+
+    monkeypatch.setattr(simple_completion_module, "GenAIService", SlowService)
+    monkeypatch.setattr(simple_completion_module, "_service", None)
+    barrier = threading.Barrier(8)
+    services: list[object] = []
+
+    def _first_call() -> None:
+        barrier.wait()
+        services.append(simple_completion_module._get_service())
+
+    threads = [threading.Thread(target=_first_call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert all(service is built[0] for service in services)
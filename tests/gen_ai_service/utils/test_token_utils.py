@@ -188,3 +188,73 @@ def test_estimate_max_completion_tokens_with_negative_prompt_tokens():
     """Negative prompts should raise early."""
     with pytest.raises(ValueError, match="prompt_tokens must be non-negative"):
         estimate_max_completion_tokens(prompt_tokens=-1)
+
+
+class _RecordingEncoding:
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+        self.batches: list[list[str]] = []
+
+    def encode(self, text: str) -> list[int]:
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_batch(self, texts: list[str], num_threads: int = 8) -> list[list[int]]:
+        self.batches.append(list(texts))
+        return [text.split() for text in texts]
+
+
+class _StaticEncodingProvider:
+    def __init__(self, encoding: _RecordingEncoding) -> None:
+        self.encoding = encoding
+
+    def get_encoding(self, model: str) -> _RecordingEncoding:
+        return self.encoding
+
+
+def _counter(maxsize: int = 16) -> tuple[token_utils_module.TokenCounter, _RecordingEncoding]:
+    encoding = _RecordingEncoding()
+    provider = _StaticEncodingProvider(encoding)
+    return token_utils_module.TokenCounter(provider, maxsize=maxsize), encoding  # type: ignore[arg-type]
+
+
+def test_token_counter_memoizes_repeated_text():
+    counter, encoding = _counter()
+
+    assert counter.count("one two three") == 3
+    assert counter.count("one two three") == 3
+
+    assert encoding.encoded == ["one two three"]
+    stats = counter.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_token_counter_count_many_batches_misses_once():
+    counter, encoding = _counter()
+    counter.count("cached text")
+
+    counts = counter.count_many(["cached text", "a b c", "", "a b c", "d"])
+
+    assert counts == [2, 3, 0, 3, 1]
+    assert encoding.batches == [["a b c", "d"]]
+    assert counter.count("d") == 1
+    assert encoding.encoded == ["cached text"]
+
+
+def test_token_counter_evicts_least_recently_used():
+    counter, encoding = _counter(maxsize=2)
+
+    counter.count("a")
+    counter.count("b b")
+    counter.count("a")
+    counter.count("c c c")
+    counter.count("b b")
+
+    assert encoding.encoded == ["a", "b b", "c c c", "b b"]
+    assert counter.stats().size == 2
+
+
+def test_token_count_many_matches_token_count():
+    texts = ["Hello, world!", "", "A slightly longer sentence for counting."]
+
+    assert token_utils_module.token_count_many(texts) == [token_count(text) for text in texts]
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
+from tnh_scholar.gen_ai_service.batch_runner import BatchRunner
+from tnh_scholar.gen_ai_service.models.errors import ProviderError
+from tnh_scholar.gen_ai_service.providers.local_batch_client import LocalBatchClient
 from tnh_scholar.journal_processing import journal_process as jp
 
 
@@ -45,35 +50,70 @@ def test_create_jsonl_file_for_batch_writes_expected_payload(tmp_path):
     assert body["response_format"] == {"type": "json_object"}
 
 
-def test_start_batch_with_retries_calls_simple_completion(monkeypatch, tmp_path):
-    messages = [
-        [
-            {"role": "system", "content": "sys"},
-            {"role": "user", "content": "first"},
-        ],
-        [
-            {"role": "system", "content": "sys"},
-            {"role": "user", "content": "second"},
-        ],
-    ]
+def _batch_messages(*users: str) -> list[list[dict[str, str]]]:
+    return [[{"role": "system", "content": "sys"}, {"role": "user", "content": user}] for user in users]
+
+
+def _patch_runner(monkeypatch, client: LocalBatchClient) -> None:
+    monkeypatch.setattr(
+        jp,
+        "_batch_runner",
+        lambda poll_interval, timeout: BatchRunner(client, poll_interval=0, sleep=lambda _s: None),
+    )
+    monkeypatch.setattr(jp.time, "sleep", lambda _s: None)
+
+
+def test_start_batch_with_retries_uses_batch_runner(monkeypatch, tmp_path):
     jsonl_path = jp.create_jsonl_file_for_batch(
-        messages,
+        _batch_messages("first", "second"),
         output_file_path=tmp_path / "batch.jsonl",
         max_token_list=[10, 20],
     )
+    client = LocalBatchClient(lambda body: f"{body['messages'][1]['content']}-resp", polls_until_complete=2)
+    _patch_runner(monkeypatch, client)
 
-    calls: list[tuple[str, str, int]] = []
+    responses = jp.start_batch_with_retries(jsonl_path, description="unit-test")
 
-    def fake_simple_completion(*, system_message, user_message, model, max_tokens):
-        calls.append((system_message, user_message, max_tokens))
-        return f"{user_message}-resp"
+    assert responses == ["first-resp", "second-resp"]
+    assert [body["max_tokens"] for body in client.submitted_bodies] == [10, 20]
 
-    monkeypatch.setattr(jp, "simple_completion", fake_simple_completion)
 
-    responses = jp.start_batch_with_retries(jsonl_path, description="unit-test")
+def test_start_batch_with_retries_resubmits_only_failed_requests(monkeypatch, tmp_path):
+    jsonl_path = jp.create_jsonl_file_for_batch(
+        _batch_messages("first", "flaky"),
+        output_file_path=tmp_path / "batch.jsonl",
+    )
+    failures = {"flaky": 1}
 
-    assert responses == ["first-resp", "second-resp"]
-    assert calls == [("sys", "first", 10), ("sys", "second", 20)]
+    def responder(body):
+        user = body["messages"][1]["content"]
+        if failures.get(user):
+            failures[user] -= 1
+            raise RuntimeError("transient")
+        return user.upper()
+
+    client = LocalBatchClient(responder)
+    _patch_runner(monkeypatch, client)
+
+    responses = jp.start_batch_with_retries(jsonl_path, description="unit-test", max_retries=2)
+
+    assert responses == ["FIRST", "FLAKY"]
+    assert [body["messages"][1]["content"] for body in client.submitted_bodies] == ["first", "flaky", "flaky"]
+
+
+def test_start_batch_with_retries_raises_after_max_retries(monkeypatch, tmp_path):
+    jsonl_path = jp.create_jsonl_file_for_batch(
+        _batch_messages("bad"),
+        output_file_path=tmp_path / "batch.jsonl",
+    )
+
+    def responder(body):
+        raise RuntimeError("always")
+
+    _patch_runner(monkeypatch, LocalBatchClient(responder))
+
+    with pytest.raises(RuntimeError, match="after 1 retries"):
+        jp.start_batch_with_retries(jsonl_path, description="unit-test", max_retries=1)
 
 
 def test_run_immediate_chat_process_uses_simple_completion(monkeypatch):
@@ -101,3 +141,44 @@ def test_run_immediate_chat_process_uses_simple_completion(monkeypatch):
         "max_tokens": 42,
         "model": "gpt-test",
     }
+
+
+def test_start_batch_with_retries_retries_transient_provider_errors(monkeypatch, tmp_path):
+    jsonl_path = jp.create_jsonl_file_for_batch(
+        _batch_messages("first"),
+        output_file_path=tmp_path / "batch.jsonl",
+    )
+
+    class FlakyUploadClient(LocalBatchClient):
+        uploads = 0
+
+        def upload_batch_file(self, path):
+            self.uploads += 1
+            if self.uploads == 1:
+                raise ProviderError("503 from upload")
+            return super().upload_batch_file(path)
+
+    _patch_runner(monkeypatch, FlakyUploadClient(lambda body: "ok"))
+
+    assert jp.start_batch_with_retries(jsonl_path, description="unit-test", max_retries=1) == ["ok"]
+
+
+def test_start_batch_with_retries_keeps_retry_files_out_of_input_dir(monkeypatch, tmp_path):
+    jsonl_path = jp.create_jsonl_file_for_batch(
+        _batch_messages("first", "flaky"),
+        output_file_path=tmp_path / "batch.jsonl",
+    )
+    failures = {"flaky": 1}
+
+    def responder(body):
+        user = body["messages"][1]["content"]
+        if failures.get(user):
+            failures[user] -= 1
+            raise RuntimeError("transient")
+        return user
+
+    _patch_runner(monkeypatch, LocalBatchClient(responder))
+
+    jp.start_batch_with_retries(jsonl_path, description="unit-test", max_retries=1)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["batch.jsonl"]
@@ -1,15 +1,22 @@
+import os
+import threading
+import time
 from pathlib import Path
 
 import pytest
 
+from tnh_scholar.gen_ai_service.pattern_catalog.adapters.prompts_adapter import PromptsAdapter
+from tnh_scholar.prompt_system.adapters import filesystem_catalog_adapter
 from tnh_scholar.prompt_system.adapters.filesystem_catalog_adapter import (
     FilesystemPromptCatalog,
 )
 from tnh_scholar.prompt_system.config.policy import ValidationPolicy
 from tnh_scholar.prompt_system.config.prompt_catalog_config import PromptCatalogConfig
+from tnh_scholar.prompt_system.domain.models import CatalogHealth
 from tnh_scholar.prompt_system.mappers.prompt_mapper import PromptMapper
 from tnh_scholar.prompt_system.service.loader import PromptLoader
 from tnh_scholar.prompt_system.service.validator import PromptValidator
+from tnh_scholar.prompt_system.transport.catalog_index import PromptCatalogIndex
 
 
 def write_prompt(tmp_path: Path, key: str, template: str = "Hello"):
@@ -218,6 +225,93 @@ def test_filesystem_catalog_best_effort_body_uses_delimiter_fallback(tmp_path: P
     assert body == "Recovered body"
 
 
+def _indexed_catalog(prompts_dir: Path, index_path: Path) -> FilesystemPromptCatalog:
+    config = PromptCatalogConfig(repository_path=prompts_dir, persistent_index=True, index_path=index_path)
+    return FilesystemPromptCatalog(
+        config,
+        mapper=PromptMapper(),
+        loader=PromptLoader(PromptValidator(ValidationPolicy())),
+    )
+
+
+def _age_files(prompts_dir: Path, seconds: int = 60) -> None:
+    """Backdate prompt files so stat-based index reuse is not treated as racy."""
+    past = time.time() - seconds
+    for path in prompts_dir.rglob("*.md"):
+        os.utime(path, (past, past))
+
+
+def _forbid_parsing(monkeypatch) -> None:
+    def fail(self, content, source_key=None):
+        raise AssertionError(f"unexpected parse of {source_key}")
+
+    monkeypatch.setattr(PromptMapper, "to_domain_prompt", fail)
+
+
+def test_filesystem_catalog_index_reuses_unchanged_files_across_instances(tmp_path: Path, monkeypatch):
+    prompts_dir = tmp_path / "prompts"
+    index_path = tmp_path / "cache" / "index.json"
+    write_prompt(prompts_dir, "core/task/summarize", "Summarize {{who}}")
+    write_prompt(prompts_dir, "core/task/translate", "Translate {{who}}")
+    _age_files(prompts_dir)
+
+    first = sorted(m.canonical_key() for m in _indexed_catalog(prompts_dir, index_path).list())
+    assert index_path.exists()
+
+    _forbid_parsing(monkeypatch)
+    catalog = _indexed_catalog(prompts_dir, index_path)
+
+    assert sorted(m.canonical_key() for m in catalog.list()) == first
+    assert catalog.get("core/task/summarize").template.strip() == "Summarize {{who}}"
+
+
+def test_filesystem_catalog_index_reparses_changed_files(tmp_path: Path):
+    prompts_dir = tmp_path / "prompts"
+    index_path = tmp_path / "index.json"
+    write_prompt(prompts_dir, "sample", "Original")
+    _age_files(prompts_dir)
+    _indexed_catalog(prompts_dir, index_path).list()
+
+    write_prompt(prompts_dir, "sample", "Edited and longer")
+
+    prompt = _indexed_catalog(prompts_dir, index_path).get("sample")
+
+    assert prompt.template.strip() == "Edited and longer"
+
+
+def test_filesystem_catalog_index_reuses_touched_file_with_same_content(tmp_path: Path, monkeypatch):
+    prompts_dir = tmp_path / "prompts"
+    index_path = tmp_path / "index.json"
+    write_prompt(prompts_dir, "sample", "Stable")
+    _indexed_catalog(prompts_dir, index_path).list()
+
+    _age_files(prompts_dir, seconds=30)
+    _forbid_parsing(monkeypatch)
+
+    assert _indexed_catalog(prompts_dir, index_path).get("sample").template.strip() == "Stable"
+
+
+def test_filesystem_catalog_index_replays_health_and_prunes_deleted(tmp_path: Path, monkeypatch):
+    prompts_dir = tmp_path / "prompts"
+    prompts_dir.mkdir()
+    index_path = tmp_path / "index.json"
+    (prompts_dir / "legacy.md").write_text("---\n# invalid\n---\nLegacy body\n", encoding="utf-8")
+    write_prompt(prompts_dir, "gone")
+    _age_files(prompts_dir)
+    _indexed_catalog(prompts_dir, index_path).list()
+    (prompts_dir / "gone.md").unlink()
+
+    _forbid_parsing(monkeypatch)
+    catalog = _indexed_catalog(prompts_dir, index_path)
+    keys = [m.canonical_key() for m in catalog.list()]
+
+    assert keys == ["legacy"]
+    health = catalog.catalog_health()
+    assert health.error_count == 1
+    assert health.warning_count == 1
+    assert len(PromptCatalogIndex(index_path, root=prompts_dir, validation_on_load=True)) == 1
+
+
 def test_mapper_split_handles_bom_and_delimiters():
     mapper = PromptMapper()
     content = (
@@ -278,3 +372,88 @@ Hello
     assert prompt.metadata.output_contract is not None
     assert prompt.metadata.output_contract.mode.value == "text"
     assert any("output_contract" in warning for warning in prompt.metadata.warnings)
+
+
+def test_prompts_adapter_leaves_persistent_index_off_by_default(tmp_path: Path, isolated_user_cache_dir):
+    prompts_dir = tmp_path / "prompts"
+    write_prompt(prompts_dir, "sample")
+
+    PromptsAdapter(prompts_base=prompts_dir).list_all()
+
+    assert not isolated_user_cache_dir.exists()
+
+
+def test_prompts_adapter_writes_index_when_enabled(tmp_path: Path):
+    prompts_dir = tmp_path / "prompts"
+    index_path = tmp_path / "index.json"
+    write_prompt(prompts_dir, "sample")
+
+    PromptsAdapter(prompts_base=prompts_dir, persistent_index=True, index_path=index_path).list_all()
+
+    assert len(PromptCatalogIndex(index_path, root=prompts_dir, validation_on_load=True)) == 1
+
+
+def test_filesystem_catalog_index_debounces_saves_on_get(tmp_path: Path, monkeypatch):
+    prompts_dir = tmp_path / "prompts"
+    index_path = tmp_path / "index.json"
+    for name in ("one", "two", "three"):
+        write_prompt(prompts_dir, name)
+    catalog = _indexed_catalog(prompts_dir, index_path)
+    writes: list[str] = []
+    original_write = PromptCatalogIndex._write
+
+    def _record_write(self, payload: str) -> None:
+        writes.append(payload)
+        original_write(self, payload)
+
+    monkeypatch.setattr(PromptCatalogIndex, "_write", _record_write)
+
+    for name in ("one", "two", "three"):
+        catalog.get(name)
+    assert len(writes) == 1
+
+    catalog.close()
+    assert len(writes) == 2
+    assert len(PromptCatalogIndex(index_path, root=prompts_dir, validation_on_load=True)) == 3
+
+
+def test_unclosed_indexed_catalogs_are_flushed_at_exit(tmp_path: Path):
+    prompts_dir = tmp_path / "prompts"
+    index_path = tmp_path / "index.json"
+    for name in ("one", "two"):
+        write_prompt(prompts_dir, name)
+    catalog = _indexed_catalog(prompts_dir, index_path)
+    catalog.get("one")
+    catalog.get("two")  # debounced
+    assert len(PromptCatalogIndex(index_path, root=prompts_dir, validation_on_load=True)) == 1
+
+    filesystem_catalog_adapter._close_indexed_catalogs()
+
+    assert len(PromptCatalogIndex(index_path, root=prompts_dir, validation_on_load=True)) == 2
+    assert catalog not in filesystem_catalog_adapter._UNCLOSED_INDEXED_CATALOGS
+
+
+def test_catalog_index_concurrent_saves_leave_valid_document(tmp_path: Path):
+    prompts_dir = tmp_path / "prompts"
+    index_path = tmp_path / "index.json"
+    write_prompt(prompts_dir, "sample")
+    catalog = _indexed_catalog(prompts_dir, index_path)
+    prompt = catalog.get("sample")
+    index = PromptCatalogIndex(index_path, root=prompts_dir, validation_on_load=True)
+    stat = os.stat(prompts_dir / "sample.md")
+
+    def _store_and_save(worker: int) -> None:
+        for i in range(20):
+            index.store(f"w{worker}/{i}.md", stat, content="x", prompt=prompt, health=CatalogHealth())
+            index.save()
+
+    threads = [threading.Thread(target=_store_and_save, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (
+        len(PromptCatalogIndex(index_path, root=prompts_dir, validation_on_load=True)) == 81
+    )  # plus "sample"
+    assert not list(tmp_path.glob("*.tmp"))
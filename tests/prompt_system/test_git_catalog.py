@@ -12,6 +12,7 @@ from tnh_scholar.prompt_system.mappers.prompt_mapper import PromptMapper
 from tnh_scholar.prompt_system.service.loader import PromptLoader
 from tnh_scholar.prompt_system.service.validator import PromptValidator
 from tnh_scholar.prompt_system.transport.git_client import GitTransportClient
+from tnh_scholar.prompt_system.transport.models import PromptFileRequest
 
 
 def _init_git_repo(repo_path: Path) -> None:
@@ -350,3 +351,114 @@ def test_git_catalog_list_ignores_readme_markdown(tmp_path: Path):
     health = catalog.catalog_health()
     assert health.error_count == 0
     assert health.warning_count == 0
+
+
+def _commit_all(repo_path: Path, message: str) -> None:
+    subprocess.run(["git", "add", "."], cwd=repo_path, check=True)
+    subprocess.run(["git", "commit", "-m", message], cwd=repo_path, check=True, stdout=subprocess.PIPE)
+
+
+def _count_rev_parse_head(monkeypatch, transport: GitTransportClient) -> list[list[str]]:
+    calls: list[list[str]] = []
+    original = transport._run_git
+
+    def recording_run_git(args, cwd, timeout=None):
+        if args == ["rev-parse", "HEAD"]:
+            calls.append(args)
+        return original(args, cwd, timeout)
+
+    monkeypatch.setattr(transport, "_run_git", recording_run_git)
+    return calls
+
+
+def test_git_transport_memoizes_head_until_ref_changes(tmp_path: Path, monkeypatch):
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    _init_git_repo(repo_path)
+    _write_prompt(repo_path, "sample")
+    _commit_all(repo_path, "first")
+    transport = GitTransportClient(
+        config=GitTransportConfig(repository_path=repo_path, auto_pull=False),
+        mapper=PromptMapper(),
+    )
+    calls = _count_rev_parse_head(monkeypatch, transport)
+
+    first = transport.get_current_commit()
+    assert transport.get_current_commit() == first
+    assert len(calls) == 1
+
+    _write_prompt(repo_path, "sample", "Changed {{who}}")
+    _commit_all(repo_path, "second")
+
+    second = transport.get_current_commit()
+    assert second != first
+    assert (
+        second
+        == subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=repo_path, check=True, stdout=subprocess.PIPE, text=True
+        ).stdout.strip()
+    )
+    assert len(calls) == 2
+
+
+def test_git_catalog_cache_hits_do_not_spawn_rev_parse(tmp_path: Path, monkeypatch):
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    _init_git_repo(repo_path)
+    _write_prompt(repo_path, "sample")
+    _commit_all(repo_path, "add sample")
+    mapper = PromptMapper()
+    transport = GitTransportClient(
+        config=GitTransportConfig(repository_path=repo_path, auto_pull=False),
+        mapper=mapper,
+    )
+    catalog = GitPromptCatalog(
+        config=PromptCatalogConfig(repository_path=repo_path, enable_git_refresh=False),
+        transport=transport,
+        loader=PromptLoader(PromptValidator(ValidationPolicy())),
+        mapper=mapper,
+    )
+    calls = _count_rev_parse_head(monkeypatch, transport)
+
+    for _ in range(5):
+        catalog.get("sample")
+
+    assert len(calls) == 1
+
+
+def test_git_transport_reads_pinned_files_with_single_cat_file(tmp_path: Path, monkeypatch):
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    _init_git_repo(repo_path)
+    _write_prompt(repo_path, "a", "Alpha {{who}}")
+    _write_prompt(repo_path, "nested/b", "Beta {{who}}")
+    _commit_all(repo_path, "add prompts")
+    transport = GitTransportClient(
+        config=GitTransportConfig(repository_path=repo_path, auto_pull=False),
+        mapper=PromptMapper(),
+    )
+    commit = transport.get_current_commit()
+    _write_prompt(repo_path, "a", "Uncommitted {{who}}")
+
+    spawned: list[list[str]] = []
+    original_run = subprocess.run
+
+    def recording_run(cmd, *args, **kwargs):
+        spawned.append(cmd)
+        return original_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", recording_run)
+
+    responses = transport.read_files_at_commit(
+        [
+            PromptFileRequest(path=repo_path / "a.md", commit_sha=commit),
+            PromptFileRequest(path=repo_path / "nested" / "b.md", commit_sha=commit),
+            PromptFileRequest(path=repo_path / "a.md"),
+        ]
+    )
+
+    assert "Alpha" in responses[0].content
+    assert "Beta" in responses[1].content
+    assert "Uncommitted" in responses[2].content
+    assert responses[0].metadata_raw["key"] == "a"
+    assert spawned == [["git", "cat-file", "--batch"]]
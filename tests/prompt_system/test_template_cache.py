@@ -0,0 +1,105 @@
+import pytest
+from jinja2 import TemplateSyntaxError, UndefinedError
+
+from tnh_scholar.ai_text_processing.prompts import Prompt as TextPrompt
+from tnh_scholar.prompt_system.config.policy import PromptRenderPolicy
+from tnh_scholar.prompt_system.domain.models import Prompt, PromptMetadata, RenderParams
+from tnh_scholar.prompt_system.service.renderer import PromptRenderer
+from tnh_scholar.prompt_system.service.template_cache import (
+    CompiledTemplateCache,
+    TemplatePolicy,
+    get_template_cache,
+)
+
+
+def make_prompt(template: str) -> Prompt:
+    metadata = PromptMetadata(
+        key="test",
+        name="test",
+        version="1.0.0",
+        description="desc",
+        role="task",
+    )
+    return Prompt(name="test", version="1.0.0", template=template, metadata=metadata)
+
+
+def test_cache_compiles_once_per_source_and_policy():
+    cache = CompiledTemplateCache()
+    policy = TemplatePolicy()
+
+    first = cache.get("Hello {{ name }}", policy)
+    second = cache.get("Hello {{ name }}", policy)
+    cache.get("Hello {{ name }}", TemplatePolicy(strict_undefined=False))
+
+    assert first is second
+    assert first.undeclared_variables == {"name"}
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+
+
+def test_cache_policy_controls_undefined_handling():
+    cache = CompiledTemplateCache()
+
+    lenient = cache.get("[{{ missing }}]", TemplatePolicy(strict_undefined=False))
+    strict = cache.get("[{{ missing }}]", TemplatePolicy(strict_undefined=True))
+
+    assert lenient.template.render() == "[]"
+    with pytest.raises(UndefinedError):
+        strict.template.render()
+
+
+def test_cache_evicts_least_recently_used():
+    cache = CompiledTemplateCache(maxsize=2)
+    policy = TemplatePolicy()
+
+    cache.get("a", policy)
+    cache.get("b", policy)
+    cache.get("a", policy)
+    cache.get("c", policy)
+    cache.get("a", policy)
+    cache.get("b", policy)
+
+    stats = cache.stats()
+    assert stats.evictions == 2
+    assert stats.hits == 2
+    assert stats.size == 2
+
+
+def test_cache_does_not_store_invalid_templates():
+    cache = CompiledTemplateCache()
+
+    with pytest.raises(TemplateSyntaxError):
+        cache.get("{{ broken }", TemplatePolicy())
+
+    assert cache.stats().size == 0
+
+
+def test_renderer_reuses_compiled_template():
+    cache = CompiledTemplateCache()
+    renderer = PromptRenderer(PromptRenderPolicy(), template_cache=cache)
+    prompt = make_prompt("Hello {{ name }}!")
+
+    for name in ("a", "b", "c"):
+        assert renderer.render(prompt, RenderParams(variables={"name": name})).system == f"Hello {name}!"
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+
+
+def test_text_prompt_apply_template_uses_shared_cache():
+    prompt = TextPrompt(name="cache-test", instructions="Translate {{ unique_cache_field }} now.")
+    before = get_template_cache().stats()
+
+    for value in ("one", "two", "three"):
+        assert prompt.apply_template({"unique_cache_field": value}) == f"Translate {value} now."
+
+    after = get_template_cache().stats()
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 2
+
+
+def test_text_prompt_apply_template_still_reports_missing_variables():
+    prompt = TextPrompt(name="cache-test", instructions="Hi {{ needed_field }}")
+
+    with pytest.raises(ValueError, match="needed_field"):
+        prompt.apply_template({})
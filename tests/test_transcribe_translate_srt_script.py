@@ -32,6 +32,8 @@ def test_cli_build_config_sets_defaults(tmp_path: Path) -> None:
         metadata_file=None,
         chars_per_caption=42,
         use_speaker_blocks=False,
+        block_workers=1,
+        max_inflight_audio_mb=128,
         source_srt_output=None,
         translated_srt_output=None,
         skip_translation=False,
@@ -62,6 +64,8 @@ def test_cli_build_config_honors_skip_translation(tmp_path: Path) -> None:
         metadata_file=None,
         chars_per_caption=42,
         use_speaker_blocks=False,
+        block_workers=1,
+        max_inflight_audio_mb=128,
         source_srt_output=None,
         translated_srt_output=None,
         skip_translation=True,
@@ -91,6 +95,8 @@ def test_cli_build_config_preserves_explicit_translated_output(tmp_path: Path) -
         metadata_file=None,
         chars_per_caption=42,
         use_speaker_blocks=False,
+        block_workers=1,
+        max_inflight_audio_mb=128,
         source_srt_output=None,
         translated_srt_output=translated_output,
         skip_translation=False,
@@ -119,6 +125,8 @@ def test_cli_build_config_resolves_metadata_file(tmp_path: Path) -> None:
         metadata_file=metadata_file,
         chars_per_caption=42,
         use_speaker_blocks=False,
+        block_workers=1,
+        max_inflight_audio_mb=128,
         source_srt_output=None,
         translated_srt_output=None,
         skip_translation=False,
@@ -146,6 +154,8 @@ def test_cli_build_config_uses_target_language_suffix(tmp_path: Path) -> None:
         metadata_file=None,
         chars_per_caption=42,
         use_speaker_blocks=True,
+        block_workers=1,
+        max_inflight_audio_mb=128,
         source_srt_output=None,
         translated_srt_output=None,
         skip_translation=False,
@@ -174,6 +184,8 @@ def test_cli_build_config_uses_repo_sample_when_requested() -> None:
         metadata_file=None,
         chars_per_caption=42,
         use_speaker_blocks=False,
+        block_workers=1,
+        max_inflight_audio_mb=128,
         source_srt_output=None,
         translated_srt_output=None,
         skip_translation=False,
@@ -184,3 +196,34 @@ def test_cli_build_config_uses_repo_sample_when_requested() -> None:
     config = cli._build_config(args)
 
     assert config.audio_file == (Path(module.__file__).resolve().parents[1] / "tmp" / "happy-farm-day-1.mp3")
+
+
+def test_workflow_request_carries_block_concurrency_limits(tmp_path: Path, monkeypatch) -> None:
+    module = _load_script_module()
+    monkeypatch.setattr(module, "MultilingualTranscriptionService", lambda: None)
+    cli = module.SubtitleWorkflowCli()
+    audio_file = tmp_path / "sample.mp3"
+    args = Namespace(
+        audio_file=audio_file,
+        provider="whisper",
+        source_language=None,
+        target_language="en",
+        transcription_model=None,
+        translation_model=None,
+        translation_pattern=None,
+        metadata_file=None,
+        chars_per_caption=42,
+        use_speaker_blocks=True,
+        block_workers=4,
+        max_inflight_audio_mb=64,
+        source_srt_output=None,
+        translated_srt_output=None,
+        skip_translation=False,
+        debug=False,
+        use_repo_sample=False,
+    )
+
+    request = module.SubtitleWorkflow(cli._build_config(args))._build_request()
+
+    assert request.max_block_workers == 4
+    assert request.max_inflight_audio_bytes == 64 * 1024 * 1024
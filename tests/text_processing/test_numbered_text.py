@@ -283,6 +283,32 @@ def test_validate_section_boundaries_out_of_bounds_and_empty():
     assert any(e.error_type == "out_of_bounds" for e in errors)
 
 
+def test_validate_section_boundaries_mixed_errors_in_sorted_order():
+    text = NumberedText("a\nb\nc\nd\ne\nf", start=2)
+    errors = text.validate_section_boundaries([9, 4, 2, 2, 0, 3])
+    summary = [
+        (e.error_type, e.section_index, e.section_input_index, e.expected_start, e.actual_start)
+        for e in errors
+    ]
+    assert summary == [
+        ("out_of_bounds", 0, 4, 2, 0),
+        ("overlap", 2, 3, 3, 2),
+        ("out_of_bounds", 5, 0, 7, 9),
+    ]
+
+
+def test_get_coverage_report_duplicates_and_out_of_bounds_starts():
+    text = NumberedText("a\nb\nc\nd\ne\nf", start=2)
+    report = text.get_coverage_report([9, 4, 2, 2, 0, 3])
+    assert report["overlaps"] == [{"section_index": 2, "lines": [2]}]
+    assert report["gaps"] == []
+
+    report = text.get_coverage_report([5, 12])
+    assert report["gaps"] == [(2, 4)]
+    # The last in-bounds section runs up to the line before the next (out-of-bounds) start
+    assert report["covered_lines"] == 7
+
+
 def test_get_coverage_report():
     text = NumberedText("\n".join(f"line{i}" for i in range(1, 6)))
     report_full = text.get_coverage_report([1, 2, 3, 4, 5])
@@ -423,3 +449,122 @@ class TestWhitespaceAndBlankLineHandling:
         assert text.start == 1
         assert text.separator == ":"
         assert text.lines == [" foo", "", " bar"]  # Detected and extracted
+
+
+def test_token_count_lines_uses_cached_prefix_sums():
+    calls: list[list[str]] = []
+
+    def word_counter(lines, model):
+        calls.append(list(lines))
+        return [len(line.split()) for line in lines]
+
+    doc = NumberedText("one\ntwo words\n\nfour more words here", start=3)
+    prefix = doc.token_prefix_sums("test-model", counter=word_counter)
+
+    assert prefix == [0, 1, 3, 3, 7]
+    assert doc.token_count_lines(3, 6, model="test-model") == 7
+    assert doc.token_count_lines(4, 5, model="test-model") == 2
+    assert doc.token_count_lines(6, 6, model="test-model") == 4
+    assert len(calls) == 1
+
+
+def test_token_count_lines_rejects_out_of_range():
+    doc = NumberedText("a\nb")
+    doc.token_prefix_sums("test-model", counter=lambda lines, model: [1] * len(lines))
+
+    with pytest.raises(IndexError):
+        doc.token_count_lines(0, 2, model="test-model")
+    with pytest.raises(IndexError):
+        doc.token_count_lines(1, 3, model="test-model")
+
+
+def test_token_count_lines_default_counter_matches_token_utils():
+    from tnh_scholar.gen_ai_service.utils.token_utils import token_count
+
+    doc = NumberedText("Hello there\nGeneral Kenobi")
+
+    assert doc.token_count_lines(1, 2) == token_count("Hello there") + token_count("General Kenobi")
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "a\nb\nc",
+        "a\nb\n",
+        "a\n\n",
+        "\n",
+        "   ",
+        "a\r\nb\rc\n",
+        "x y\x0cz",
+        "1: foo\n2:\n3: bar\n",
+    ],
+)
+def test_buffer_backing_matches_splitlines_semantics(content):
+    doc = NumberedText(content)
+    lines = doc.lines
+    if not get_numbered_format(content).is_numbered:
+        assert lines == content.splitlines()
+
+    assert doc.size == len(lines)
+    assert doc.content == "\n".join(lines)
+    assert list(doc) == list(enumerate(lines, doc.start))
+    assert [doc[i] for i in range(doc.start, doc.end + 1)] == lines
+    for start in range(doc.start, doc.end + 1):
+        for end in range(start, doc.end + 1):
+            assert doc.get_segment(start, end) == "\n".join(lines[start - doc.start : end - doc.start + 1])
+            assert doc.get_lines_exclusive(start, end) == lines[start - doc.start : end - doc.start]
+    assert str(doc) == "\n".join(f"{i}{doc.separator}{line}" for i, line in enumerate(lines, doc.start))
+
+
+def test_line_lookup_outside_document_raises():
+    doc = NumberedText("a\nb", start=5)
+
+    assert doc[6] == "b"
+    assert doc.get_numbered_segment(5, 5) == ""
+    with pytest.raises(IndexError):
+        doc[7]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "\n",
+        "a\nb\n\n",
+        "a\x0c\nb c",
+        "1: foo\n2:\n3: bar\n",
+        "5#First\n\n6#Second",
+        "1. First item\n2. Second item",
+    ],
+)
+def test_from_file_matches_in_memory_construction(tmp_path, content):
+    path = tmp_path / "doc.txt"
+    path.write_text(content, encoding="utf-8")
+
+    streamed = NumberedText.from_file(path)
+    expected = NumberedText(content)
+
+    assert (streamed.lines, streamed.start, streamed.separator) == (
+        expected.lines,
+        expected.start,
+        expected.separator,
+    )
+    assert streamed.content == expected.content
+
+
+def test_from_stream_rereads_when_numbering_breaks_after_probe(monkeypatch):
+    from tnh_scholar.text_processing import numbered_text
+
+    monkeypatch.setattr(numbered_text, "NUMBERING_PROBE_LINES", 2)
+    content = "1: a\n2: b\n3: c\n7: d\n"
+    opened: list[int] = []
+
+    def _open():
+        opened.append(1)
+        return iter(content.splitlines(keepends=True))
+
+    doc = NumberedText.from_stream(_open)
+
+    assert len(opened) == 2
+    assert doc.lines == content.splitlines()
+    assert doc.start == 1
@@ -0,0 +1,104 @@
+import threading
+import time
+from contextvars import ContextVar
+
+import pytest
+
+from tnh_scholar.utils.concurrency_utils import ByteBudget, ordered_map
+
+
+def test_ordered_map_preserves_input_order_under_uneven_latency():
+    def _slow_first(value: int) -> int:
+        time.sleep(0.05 if value == 0 else 0.0)
+        return value * 10
+
+    results = list(ordered_map(_slow_first, range(6), max_workers=3))
+
+    assert [result.index for result in results] == list(range(6))
+    assert [result.value for result in results] == [0, 10, 20, 30, 40, 50]
+
+
+def test_ordered_map_runs_items_concurrently():
+    barrier = threading.Barrier(3, timeout=2)
+
+    def _wait(value: int) -> int:
+        barrier.wait()
+        return value
+
+    results = list(ordered_map(_wait, range(3), max_workers=3))
+
+    assert [result.value for result in results] == [0, 1, 2]
+
+
+def test_ordered_map_workers_see_callers_context():
+    request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+    token = request_id.set("req-1")
+    try:
+        results = list(ordered_map(lambda value: (value, request_id.get()), range(4), max_workers=2))
+    finally:
+        request_id.reset(token)
+
+    assert [result.value for result in results] == [(i, "req-1") for i in range(4)]
+
+
+def test_ordered_map_captures_errors_per_item():
+    def _maybe_fail(value: int) -> int:
+        if value == 1:
+            raise RuntimeError("boom")
+        return value
+
+    results = list(ordered_map(_maybe_fail, range(3), max_workers=2))
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, RuntimeError)
+    assert results[2].value == 2
+
+
+def test_ordered_map_raises_when_not_capturing():
+    def _fail(value: int) -> int:
+        raise RuntimeError(f"boom {value}")
+
+    with pytest.raises(RuntimeError, match="boom 0"):
+        list(ordered_map(_fail, range(3), max_workers=1, capture_errors=False))
+
+
+def test_ordered_map_bounds_items_submitted_ahead():
+    consumed: list[int] = []
+
+    def _source():
+        for value in range(100):
+            consumed.append(value)
+            yield value
+
+    results = ordered_map(lambda value: value, _source(), max_workers=2, max_pending=3)
+    first = next(results)
+    results.close()
+
+    assert first.value == 0
+    assert len(consumed) <= 4
+
+
+def test_byte_budget_blocks_until_released():
+    budget = ByteBudget(100)
+    budget.acquire(60)
+    acquired = threading.Event()
+
+    def _acquire():
+        budget.acquire(60)
+        acquired.set()
+
+    thread = threading.Thread(target=_acquire)
+    thread.start()
+    assert not acquired.wait(0.05)
+
+    budget.release(60)
+    assert acquired.wait(2)
+    thread.join()
+    assert budget.in_flight == 60
+
+
+def test_byte_budget_admits_oversized_item_when_idle():
+    budget = ByteBudget(10)
+    budget.acquire(50)
+
+    assert budget.in_flight == 50